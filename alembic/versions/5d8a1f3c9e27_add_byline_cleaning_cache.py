@@ -0,0 +1,52 @@
+"""add persistent byline cleaning cache
+
+Revision ID: 5d8a1f3c9e27
+Revises: 9c4e2b7a1d30
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d8a1f3c9e27"
+down_revision: Union[str, Sequence[str], None] = "9c4e2b7a1d30"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the byline_cleaning_cache table."""
+    op.create_table(
+        "byline_cleaning_cache",
+        sa.Column("cache_key", sa.String(length=64), primary_key=True),
+        sa.Column("raw_byline", sa.Text(), nullable=False),
+        sa.Column("source_name", sa.String(), nullable=True),
+        sa.Column("source_canonical_name", sa.String(), nullable=True),
+        sa.Column("cleaner_version", sa.String(), nullable=False),
+        sa.Column("result", sa.JSON(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+    )
+    op.create_index(
+        "ix_byline_cleaning_cache_cleaner_version",
+        "byline_cleaning_cache",
+        ["cleaner_version"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the byline_cleaning_cache table."""
+    op.drop_index(
+        "ix_byline_cleaning_cache_cleaner_version",
+        table_name="byline_cleaning_cache",
+    )
+    op.drop_table("byline_cleaning_cache")
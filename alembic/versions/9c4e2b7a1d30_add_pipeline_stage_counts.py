@@ -0,0 +1,308 @@
+"""add pipeline stage counters maintained by triggers
+
+Revision ID: 9c4e2b7a1d30
+Revises: 7312b1db764e
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4e2b7a1d30"
+down_revision: Union[str, Sequence[str], None] = "7312b1db764e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BUMP_FUNCTION = """
+CREATE OR REPLACE FUNCTION pipeline_stage_bump(p_stage text, p_delta bigint)
+RETURNS void AS $$
+BEGIN
+    IF p_delta IS NULL OR p_delta = 0 THEN
+        RETURN;
+    END IF;
+    INSERT INTO pipeline_stage_count_deltas (stage, delta)
+    VALUES (p_stage, p_delta);
+    IF p_delta > 0 THEN
+        PERFORM pg_notify('pipeline_work', p_stage);
+    END IF;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+CANDIDATE_LINKS_FUNCTION = """
+CREATE OR REPLACE FUNCTION pipeline_stage_candidate_links_changed()
+RETURNS trigger AS $$
+DECLARE
+    new_verification bigint := 0;
+    new_extraction bigint := 0;
+    old_verification bigint := 0;
+    old_extraction bigint := 0;
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        SELECT
+            COUNT(*) FILTER (WHERE n.status = 'discovered'),
+            COUNT(*) FILTER (
+                WHERE n.status = 'article'
+                AND NOT EXISTS (
+                    SELECT 1 FROM articles a WHERE a.candidate_link_id = n.id
+                )
+            )
+        INTO new_verification, new_extraction
+        FROM new_rows n;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        SELECT
+            COUNT(*) FILTER (WHERE o.status = 'discovered'),
+            COUNT(*) FILTER (
+                WHERE o.status = 'article'
+                AND NOT EXISTS (
+                    SELECT 1 FROM articles a WHERE a.candidate_link_id = o.id
+                )
+            )
+        INTO old_verification, old_extraction
+        FROM old_rows o;
+    END IF;
+    PERFORM pipeline_stage_bump('verification', new_verification - old_verification);
+    PERFORM pipeline_stage_bump('extraction', new_extraction - old_extraction);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+ARTICLES_FUNCTION = """
+CREATE OR REPLACE FUNCTION pipeline_stage_articles_changed()
+RETURNS trigger AS $$
+DECLARE
+    new_cleaning bigint := 0;
+    new_analysis bigint := 0;
+    new_entities bigint := 0;
+    old_cleaning bigint := 0;
+    old_analysis bigint := 0;
+    old_entities bigint := 0;
+    extraction_delta bigint := 0;
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        SELECT
+            COUNT(*) FILTER (
+                WHERE n.status = 'extracted' AND n.content IS NOT NULL
+            ),
+            COUNT(*) FILTER (
+                WHERE n.status = 'extracted' AND n.primary_label IS NULL
+            ),
+            COUNT(*) FILTER (
+                WHERE n.status IN ('extracted', 'classified')
+                AND n.content IS NOT NULL
+                AND NOT EXISTS (
+                    SELECT 1 FROM article_entities ae WHERE ae.article_id = n.id
+                )
+            )
+        INTO new_cleaning, new_analysis, new_entities
+        FROM new_rows n;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        SELECT
+            COUNT(*) FILTER (
+                WHERE o.status = 'extracted' AND o.content IS NOT NULL
+            ),
+            COUNT(*) FILTER (
+                WHERE o.status = 'extracted' AND o.primary_label IS NULL
+            ),
+            COUNT(*) FILTER (
+                WHERE o.status IN ('extracted', 'classified')
+                AND o.content IS NOT NULL
+                AND NOT EXISTS (
+                    SELECT 1 FROM article_entities ae WHERE ae.article_id = o.id
+                )
+            )
+        INTO old_cleaning, old_analysis, old_entities
+        FROM old_rows o;
+    END IF;
+
+    -- A link leaves the extraction queue with its first article and
+    -- rejoins it when its last article is deleted
+    IF TG_OP = 'INSERT' THEN
+        SELECT -COUNT(*) INTO extraction_delta
+        FROM (
+            SELECT candidate_link_id, COUNT(*) AS added
+            FROM new_rows GROUP BY candidate_link_id
+        ) n
+        JOIN candidate_links cl ON cl.id = n.candidate_link_id
+        WHERE cl.status = 'article'
+        AND (
+            SELECT COUNT(*) FROM articles a
+            WHERE a.candidate_link_id = n.candidate_link_id
+        ) = n.added;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT COUNT(*) INTO extraction_delta
+        FROM (SELECT DISTINCT candidate_link_id FROM old_rows) o
+        JOIN candidate_links cl ON cl.id = o.candidate_link_id
+        WHERE cl.status = 'article'
+        AND NOT EXISTS (
+            SELECT 1 FROM articles a
+            WHERE a.candidate_link_id = o.candidate_link_id
+        );
+    END IF;
+
+    PERFORM pipeline_stage_bump('cleaning', new_cleaning - old_cleaning);
+    PERFORM pipeline_stage_bump('analysis', new_analysis - old_analysis);
+    PERFORM pipeline_stage_bump('entity_extraction', new_entities - old_entities);
+    PERFORM pipeline_stage_bump('extraction', extraction_delta);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+ARTICLE_ENTITIES_FUNCTION = """
+CREATE OR REPLACE FUNCTION pipeline_stage_article_entities_changed()
+RETURNS trigger AS $$
+DECLARE
+    entity_delta bigint := 0;
+BEGIN
+    -- An article leaves the entity queue with its first entity and
+    -- rejoins it when its last entity is deleted
+    IF TG_OP = 'INSERT' THEN
+        SELECT -COUNT(*) INTO entity_delta
+        FROM (
+            SELECT article_id, COUNT(*) AS added
+            FROM new_rows GROUP BY article_id
+        ) n
+        JOIN articles a ON a.id = n.article_id
+        WHERE a.status IN ('extracted', 'classified')
+        AND a.content IS NOT NULL
+        AND (
+            SELECT COUNT(*) FROM article_entities ae
+            WHERE ae.article_id = n.article_id
+        ) = n.added;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT COUNT(*) INTO entity_delta
+        FROM (SELECT DISTINCT article_id FROM old_rows) o
+        JOIN articles a ON a.id = o.article_id
+        WHERE a.status IN ('extracted', 'classified')
+        AND a.content IS NOT NULL
+        AND NOT EXISTS (
+            SELECT 1 FROM article_entities ae WHERE ae.article_id = o.article_id
+        );
+    END IF;
+    PERFORM pipeline_stage_bump('entity_extraction', entity_delta);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# (table, function, events) - transition tables need one trigger per event
+TRIGGERS = [
+    (
+        "candidate_links",
+        "pipeline_stage_candidate_links_changed",
+        ("INSERT", "UPDATE", "DELETE"),
+    ),
+    ("articles", "pipeline_stage_articles_changed", ("INSERT", "UPDATE", "DELETE")),
+    (
+        "article_entities",
+        "pipeline_stage_article_entities_changed",
+        ("INSERT", "DELETE"),
+    ),
+]
+
+REFERENCING = {
+    "INSERT": "REFERENCING NEW TABLE AS new_rows",
+    "UPDATE": "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    "DELETE": "REFERENCING OLD TABLE AS old_rows",
+}
+
+
+def _trigger_name(table: str, event: str) -> str:
+    return f"pipeline_stage_{table}_{event.lower()}"
+
+
+def upgrade() -> None:
+    """Create stage counter tables and, on PostgreSQL, the triggers that
+    maintain them.
+
+    Triggers are statement-level with transition tables so a bulk UPDATE
+    writes one delta row per stage instead of one per row. Deltas go to an
+    append-only table to avoid contention on a single counter row; the
+    stage counter folds them and periodically reconciles exact counts.
+    """
+    op.create_table(
+        "pipeline_stage_counts",
+        sa.Column("stage", sa.String(), nullable=False),
+        sa.Column("pending", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("last_drift", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.Column("reconciled_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("stage"),
+    )
+    op.create_table(
+        "pipeline_stage_count_deltas",
+        sa.Column(
+            "id",
+            sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+            autoincrement=True,
+            nullable=False,
+        ),
+        sa.Column("stage", sa.String(), nullable=False),
+        sa.Column("delta", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_pipeline_stage_count_deltas_stage",
+        "pipeline_stage_count_deltas",
+        ["stage"],
+    )
+
+    if op.get_bind().dialect.name != "postgresql":
+        # SQLite falls back to exact COUNT(*) polling
+        return
+
+    for ddl in (
+        BUMP_FUNCTION,
+        CANDIDATE_LINKS_FUNCTION,
+        ARTICLES_FUNCTION,
+        ARTICLE_ENTITIES_FUNCTION,
+    ):
+        op.execute(ddl)
+
+    for table, function, events in TRIGGERS:
+        for event in events:
+            op.execute(
+                f"CREATE TRIGGER {_trigger_name(table, event)} "
+                f"AFTER {event} ON {table} {REFERENCING[event]} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION {function}()"
+            )
+
+
+def downgrade() -> None:
+    """Drop the stage counter triggers, functions and tables."""
+    if op.get_bind().dialect.name == "postgresql":
+        for table, function, events in TRIGGERS:
+            for event in events:
+                op.execute(
+                    f"DROP TRIGGER IF EXISTS {_trigger_name(table, event)} ON {table}"
+                )
+            op.execute(f"DROP FUNCTION IF EXISTS {function}()")
+        op.execute("DROP FUNCTION IF EXISTS pipeline_stage_bump(text, bigint)")
+
+    op.drop_index(
+        "ix_pipeline_stage_count_deltas_stage",
+        table_name="pipeline_stage_count_deltas",
+    )
+    op.drop_table("pipeline_stage_count_deltas")
+    op.drop_table("pipeline_stage_counts")
@@ -0,0 +1,47 @@
+"""add extraction strategy stats for per-host method routing
+
+Revision ID: a1c3e5f7b9d2
+Revises: f7a3c5e9b1d4
+Create Date: 2026-10-19 02:40:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c3e5f7b9d2"
+down_revision: Union[str, Sequence[str], None] = "f7a3c5e9b1d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store decayed per-host, per-field success counts of each method.
+
+    Written by the extraction strategy router; see
+    src/crawler/strategy_router.py.
+    """
+    op.create_table(
+        "extraction_strategy_stats",
+        sa.Column("host", sa.String(), nullable=False),
+        sa.Column("method", sa.String(), nullable=False),
+        sa.Column("field", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("successes", sa.Float(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.PrimaryKeyConstraint("host", "method", "field"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the extraction strategy stats table."""
+    op.drop_table("extraction_strategy_stats")
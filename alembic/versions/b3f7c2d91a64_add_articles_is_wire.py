@@ -0,0 +1,130 @@
+"""add trigger-maintained articles.is_wire flag for reports
+
+Revision ID: b3f7c2d91a64
+Revises: 5d8a1f3c9e27
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3f7c2d91a64"
+down_revision: Union[str, Sequence[str], None] = "5d8a1f3c9e27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SQLITE_IS_WIRE_EXPRESSION = """CASE
+    WHEN COALESCE(
+        CASE WHEN json_valid({row}metadata)
+            THEN json_extract({row}metadata, '$.byline.is_wire_content')
+        END,
+        0
+    ) != 0 THEN 1
+    WHEN {row}wire IS NULL THEN 0
+    WHEN json_valid({row}wire) = 0 THEN 1
+    WHEN COALESCE(json_extract({row}wire, '$.provider'), '') != '' THEN 1
+    ELSE 0
+END"""
+
+SQLITE_TRIGGERS = (
+    f"""
+CREATE TRIGGER IF NOT EXISTS articles_is_wire_insert
+AFTER INSERT ON articles
+BEGIN
+    UPDATE articles
+    SET is_wire = {SQLITE_IS_WIRE_EXPRESSION.format(row="NEW.")}
+    WHERE id = NEW.id;
+END
+""",
+    f"""
+CREATE TRIGGER IF NOT EXISTS articles_is_wire_update
+AFTER UPDATE OF metadata, wire ON articles
+BEGIN
+    UPDATE articles
+    SET is_wire = {SQLITE_IS_WIRE_EXPRESSION.format(row="NEW.")}
+    WHERE id = NEW.id;
+END
+""",
+)
+
+POSTGRES_IS_WIRE_FUNCTION = """
+CREATE OR REPLACE FUNCTION article_is_wire(p_metadata json, p_wire json)
+RETURNS boolean AS $$
+    SELECT COALESCE(p_metadata #>> '{byline,is_wire_content}', 'false')
+               NOT IN ('false', '0')
+        OR COALESCE(p_wire ->> 'provider', '') <> ''
+$$ LANGUAGE sql IMMUTABLE
+"""
+
+POSTGRES_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION articles_set_is_wire()
+RETURNS trigger AS $$
+BEGIN
+    NEW.is_wire := article_is_wire(NEW.metadata::json, NEW.wire::json);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    """Add articles.is_wire, backfill it and install the triggers that
+    keep it in step with the metadata and wire columns.
+
+    County reports filter on this flag (with publish_date) instead of
+    parsing both JSON columns for every row.
+    """
+    op.add_column(
+        "articles",
+        sa.Column("is_wire", sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute(POSTGRES_IS_WIRE_FUNCTION)
+        # Only rows that are wire need writing; the default covers the rest
+        op.execute(
+            "UPDATE articles SET is_wire = true "
+            "WHERE article_is_wire(metadata::json, wire::json)"
+        )
+        op.execute(POSTGRES_TRIGGER_FUNCTION)
+        op.execute(
+            "CREATE TRIGGER articles_set_is_wire "
+            "BEFORE INSERT OR UPDATE OF metadata, wire ON articles "
+            "FOR EACH ROW EXECUTE FUNCTION articles_set_is_wire()"
+        )
+    elif dialect == "sqlite":
+        op.execute(
+            "UPDATE articles SET is_wire = 1 WHERE "
+            f"({SQLITE_IS_WIRE_EXPRESSION.format(row='')}) = 1"
+        )
+        for ddl in SQLITE_TRIGGERS:
+            op.execute(ddl)
+
+    op.create_index(
+        "ix_articles_is_wire_publish_date",
+        "articles",
+        ["is_wire", "publish_date"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the is_wire triggers, functions, index and column."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP TRIGGER IF EXISTS articles_set_is_wire ON articles")
+        op.execute("DROP FUNCTION IF EXISTS articles_set_is_wire()")
+        op.execute("DROP FUNCTION IF EXISTS article_is_wire(json, json)")
+    elif dialect == "sqlite":
+        op.execute("DROP TRIGGER IF EXISTS articles_is_wire_insert")
+        op.execute("DROP TRIGGER IF EXISTS articles_is_wire_update")
+
+    op.drop_index("ix_articles_is_wire_publish_date", table_name="articles")
+    with op.batch_alter_table("articles") as batch_op:
+        batch_op.drop_column("is_wire")
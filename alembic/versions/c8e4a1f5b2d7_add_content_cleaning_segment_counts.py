@@ -0,0 +1,52 @@
+"""add content_cleaning_segment_counts
+
+Revision ID: c8e4a1f5b2d7
+Revises: b3f7c2d91a64
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c8e4a1f5b2d7"
+down_revision: Union[str, Sequence[str], None] = "b3f7c2d91a64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add exact per-session segment counts for content cleaning telemetry.
+
+    content_cleaning_segments may now hold only a sample of the rejected
+    segments; this table keeps every detection counted by pattern type and
+    outcome.
+    """
+    op.create_table(
+        "content_cleaning_segment_counts",
+        sa.Column("telemetry_id", sa.String(), nullable=False),
+        sa.Column("pattern_type", sa.String(), nullable=False),
+        sa.Column("was_removed", sa.Boolean(), nullable=False),
+        sa.Column("detection_count", sa.Integer(), nullable=False),
+        sa.Column("detailed_count", sa.Integer(), nullable=False),
+        sa.Column("total_occurrences", sa.Integer(), nullable=True),
+        sa.Column("boundary_score_sum", sa.Float(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.PrimaryKeyConstraint("telemetry_id", "pattern_type", "was_removed"),
+        sa.ForeignKeyConstraint(
+            ["telemetry_id"], ["content_cleaning_sessions.telemetry_id"]
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop content_cleaning_segment_counts."""
+    op.drop_table("content_cleaning_segment_counts")
@@ -0,0 +1,83 @@
+"""add article near-duplicate index
+
+Revision ID: e4b9d2a6c1f3
+Revises: c8e4a1f5b2d7
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b9d2a6c1f3"
+down_revision: Union[str, Sequence[str], None] = "c8e4a1f5b2d7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add MinHash signatures, clusters and LSH band buckets per article.
+
+    Rows are written incrementally by post-extraction cleaning; see
+    src/pipeline/near_duplicates.py.
+    """
+    op.create_table(
+        "article_near_duplicates",
+        sa.Column("article_id", sa.String(), nullable=False),
+        sa.Column("cluster_id", sa.String(), nullable=False),
+        sa.Column("canonical_article_id", sa.String(), nullable=False),
+        sa.Column("similarity", sa.Float(), nullable=False),
+        sa.Column("signature", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.ForeignKeyConstraint(["article_id"], ["articles.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("article_id"),
+    )
+    op.create_index(
+        "ix_article_near_duplicates_cluster_id",
+        "article_near_duplicates",
+        ["cluster_id"],
+    )
+    op.create_index(
+        "ix_article_near_duplicates_canonical_article_id",
+        "article_near_duplicates",
+        ["canonical_article_id"],
+    )
+
+    op.create_table(
+        "article_minhash_bands",
+        sa.Column("bucket", sa.BigInteger(), nullable=False),
+        sa.Column("band", sa.Integer(), nullable=False),
+        sa.Column("article_id", sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(["article_id"], ["articles.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("bucket", "band", "article_id"),
+    )
+    op.create_index(
+        "ix_article_minhash_bands_article_id",
+        "article_minhash_bands",
+        ["article_id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the near-duplicate index tables."""
+    op.drop_index(
+        "ix_article_minhash_bands_article_id", table_name="article_minhash_bands"
+    )
+    op.drop_table("article_minhash_bands")
+    op.drop_index(
+        "ix_article_near_duplicates_canonical_article_id",
+        table_name="article_near_duplicates",
+    )
+    op.drop_index(
+        "ix_article_near_duplicates_cluster_id", table_name="article_near_duplicates"
+    )
+    op.drop_table("article_near_duplicates")
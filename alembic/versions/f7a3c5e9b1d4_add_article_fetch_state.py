@@ -0,0 +1,54 @@
+"""add article fetch state for conditional re-extraction
+
+Revision ID: f7a3c5e9b1d4
+Revises: e4b9d2a6c1f3
+Create Date: 2026-10-18 23:50:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f7a3c5e9b1d4"
+down_revision: Union[str, Sequence[str], None] = "e4b9d2a6c1f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store ETag/Last-Modified and HTML/text digests per article.
+
+    Written by the ``reextract`` command; see src/pipeline/reextraction.py.
+    """
+    op.create_table(
+        "article_fetch_state",
+        sa.Column("article_id", sa.String(), nullable=False),
+        sa.Column("etag", sa.String(), nullable=True),
+        sa.Column("last_modified", sa.String(), nullable=True),
+        sa.Column("html_digest", sa.String(length=64), nullable=True),
+        sa.Column("extracted_text_hash", sa.String(length=64), nullable=True),
+        sa.Column(
+            "checked_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.Column(
+            "changed_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.Column("unchanged_checks", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["article_id"], ["articles.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("article_id"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the article fetch state table."""
+    op.drop_table("article_fetch_state")
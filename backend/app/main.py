@@ -56,6 +56,7 @@ from src.models.telemetry import (  # noqa: E402
     HttpErrorSummary,
 )
 from src.models import Source  # noqa: E402
+from src.pipeline.html_archive import get_html_archive  # noqa: E402
 from sqlalchemy import func, case, desc, and_, or_, literal  # noqa: E402
 from backend.app.telemetry import (  # noqa: E402
     verification,
@@ -1421,18 +1422,26 @@ async def generic_exception_handler(request, exc):
 # --- Snapshot ingestion API -------------------------------------------------
 
 
+# Snapshot paths of the form "archive:<digest>" point into the HTML archive
+ARCHIVE_PATH_PREFIX = "archive:"
+
+
 @app.post("/api/snapshots")
 def post_snapshot(payload: SnapshotIn):
     """Ingest a snapshot: save HTML to disk and record metadata in DB.
     Enqueue the snapshot for background DB write and return 202 with snapshot id/path.
+    When HTML_ARCHIVE_DIR is set the HTML goes into the shared HTML archive.
     """
     # Save HTML to disk immediately (fast filesystem op) and enqueue DB write
     sid = str(uuid.uuid4())
+    archive = get_html_archive()
     host_dir = BASE_DIR / "lookups" / "snapshots" / payload.host
-    host_dir.mkdir(parents=True, exist_ok=True)
     filename = f"{sid}.html"
     path = str(host_dir / filename)
-    if payload.html:
+    if payload.html and archive is not None:
+        path = ARCHIVE_PATH_PREFIX + archive.put(payload.url, payload.html)
+    elif payload.html:
+        host_dir.mkdir(parents=True, exist_ok=True)
         try:
             Path(path).write_text(payload.html, encoding="utf-8")
         except Exception:
@@ -1525,18 +1534,33 @@ def get_snapshot(sid: str):
 
 @app.get("/api/snapshots/{sid}/html")
 def get_snapshot_html(sid: str):
-    """Return the saved raw HTML for a snapshot if present."""
+    """Return the saved raw HTML for a snapshot if present.
+
+    Archived snapshots are read from the HTML archive; snapshots whose file
+    is gone fall back to the latest archived fetch of their URL.
+    """
     with db_manager.get_session() as session:
         snapshot = session.query(Snapshot).filter(Snapshot.id == sid).first()
         if not snapshot:
             raise HTTPException(status_code=404, detail="snapshot not found")
-        path = snapshot.path
-        try:
+        path = snapshot.path or ""
+        url = snapshot.url
+    archive = get_html_archive()
+    content = None
+    try:
+        if path.startswith(ARCHIVE_PATH_PREFIX):
+            if archive is not None:
+                content = archive.get(path[len(ARCHIVE_PATH_PREFIX) :])
+        else:
             content = Path(path).read_text(encoding="utf-8")
-            return HTMLResponse(content=content)
-        except Exception:
-            # failed to read the snapshot file from disk
-            raise HTTPException(status_code=500, detail="failed to read snapshot html")
+    except Exception:
+        content = None
+    if content is None and archive is not None and url:
+        content = archive.latest(url)
+    if content is None:
+        # failed to read the snapshot html from disk or the archive
+        raise HTTPException(status_code=500, detail="failed to read snapshot html")
+    return HTMLResponse(content=content)
 
 
 @app.post("/api/snapshots/{sid}/candidates")
@@ -21,7 +21,12 @@ from pathlib import Path
 
 from sqlalchemy import text
 
-from src.models.database import DatabaseManager
+from orchestration.stage_runtime import StageRuntime
+from src.models.database import (
+    DatabaseManager,
+    dispose_shared_engines,
+    engine_pool_metrics,
+)
 
 # Configuration from environment
 POLL_INTERVAL = int(os.getenv("POLL_INTERVAL", "60"))  # seconds
@@ -46,6 +51,17 @@ ENABLE_ENTITY_EXTRACTION = (
     os.getenv("ENABLE_ENTITY_EXTRACTION", "true").lower() == "true"
 )
 
+# Read pending work from trigger-maintained counters and wake on
+# LISTEN/NOTIFY instead of polling COUNT(*) (see src/services/stage_counts.py)
+STAGE_COUNTERS = os.getenv("STAGE_COUNTERS", "false").lower() == "true"
+STAGE_COUNT_RECONCILE_INTERVAL = int(
+    os.getenv("STAGE_COUNT_RECONCILE_INTERVAL", "900")
+)  # seconds
+
+# "subprocess" forks a fresh CLI process per step; "warm" reuses one
+# supervised worker process per stage (see orchestration/stage_runtime.py)
+STAGE_RUNTIME = os.getenv("STAGE_RUNTIME", "subprocess").lower()
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 CLI_MODULE = "src.cli.cli_modular"
 
@@ -58,6 +74,22 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Stage counter shared across cycles (created on first use)
+_STAGE_COUNTER = None
+
+
+def get_stage_counter():
+    """Get or create the process-wide stage counter."""
+    global _STAGE_COUNTER
+    if _STAGE_COUNTER is None:
+        from src.services.stage_counts import StageCounter
+
+        _STAGE_COUNTER = StageCounter(
+            reconcile_interval=STAGE_COUNT_RECONCILE_INTERVAL
+        )
+    return _STAGE_COUNTER
+
+
 class WorkQueue:
     """Check database for pending work."""
 
@@ -75,6 +107,19 @@ class WorkQueue:
             "entity_extraction_pending": 0,
         }
 
+        if STAGE_COUNTERS:
+            enabled = {
+                "verification": ENABLE_VERIFICATION,
+                "extraction": ENABLE_EXTRACTION,
+                "cleaning": ENABLE_CLEANING,
+                "analysis": ENABLE_ML_ANALYSIS,
+                "entity_extraction": ENABLE_ENTITY_EXTRACTION,
+            }
+            stages = [stage for stage, on in enabled.items() if on]
+            for stage, pending in get_stage_counter().get_counts(stages).items():
+                counts[f"{stage}_pending"] = pending
+            return counts
+
         with DatabaseManager() as db:
             # Count candidate_links needing verification (only if enabled)
             if ENABLE_VERIFICATION:
@@ -205,6 +250,37 @@ def run_cli_command(command: list[str], description: str) -> bool:
         return False
 
 
+# Warm stage workers (created on first use when STAGE_RUNTIME=warm)
+_STAGE_RUNTIME: StageRuntime | None = None
+
+
+def get_stage_runtime() -> StageRuntime:
+    """Get or create the process-wide warm stage runtime."""
+    global _STAGE_RUNTIME
+    if _STAGE_RUNTIME is None:
+        _STAGE_RUNTIME = StageRuntime()
+    return _STAGE_RUNTIME
+
+
+def shutdown_stage_runtime() -> None:
+    """Stop any warm stage workers."""
+    global _STAGE_RUNTIME
+    if _STAGE_RUNTIME is not None:
+        _STAGE_RUNTIME.shutdown()
+        _STAGE_RUNTIME = None
+
+
+def run_stage_command(stage: str, command: list[str], description: str) -> bool:
+    """Run a pipeline step via the configured runtime.
+
+    With ``STAGE_RUNTIME=warm`` the command is dispatched to the stage's
+    long-lived worker process; otherwise a fresh CLI subprocess is forked.
+    """
+    if STAGE_RUNTIME == "warm":
+        return get_stage_runtime().run(stage, command, description)
+    return run_cli_command(command, description)
+
+
 def process_verification(count: int) -> bool:
     """Run URL verification for discovered links."""
     if count == 0:
@@ -223,8 +299,10 @@ def process_verification(count: int) -> bool:
         "5",
     ]
 
-    return run_cli_command(
-        command, f"URL verification ({count} pending, {batches_to_run} batches)"
+    return run_stage_command(
+        "verification",
+        command,
+        f"URL verification ({count} pending, {batches_to_run} batches)",
     )
 
 
@@ -244,8 +322,10 @@ def process_extraction(count: int) -> bool:
         str(batches_to_run),
     ]
 
-    return run_cli_command(
-        command, f"Article extraction ({count} pending, {batches_to_run} batches)"
+    return run_stage_command(
+        "extraction",
+        command,
+        f"Article extraction ({count} pending, {batches_to_run} batches)",
     )
 
 
@@ -269,7 +349,9 @@ def process_analysis(count: int) -> bool:
         "local",
     ]
 
-    return run_cli_command(command, f"ML analysis ({count} pending, limit {limit})")
+    return run_stage_command(
+        "analysis", command, f"ML analysis ({count} pending, limit {limit})"
+    )
 
 
 def process_cleaning(count: int) -> bool:
@@ -287,8 +369,8 @@ def process_cleaning(count: int) -> bool:
         "extracted",
     ]
 
-    return run_cli_command(
-        command, f"Content cleaning ({count} pending, limit {limit})"
+    return run_stage_command(
+        "cleaning", command, f"Content cleaning ({count} pending, limit {limit})"
     )
 
 
@@ -419,6 +501,8 @@ def main() -> None:
     logger.info("  - Extraction batch size: %d", EXTRACTION_BATCH_SIZE)
     logger.info("  - Analysis batch size: %d", ANALYSIS_BATCH_SIZE)
     logger.info("  - Gazetteer batch size: %d", GAZETTEER_BATCH_SIZE)
+    logger.info("  - Stage runtime: %s", STAGE_RUNTIME)
+    logger.info("  - Stage counters: %s", "✅" if STAGE_COUNTERS else "❌")
     logger.info("")
     logger.info("Enabled pipeline steps:")
     logger.info("  - Discovery: %s", "✅" if ENABLE_DISCOVERY else "❌")
@@ -435,25 +519,42 @@ def main() -> None:
 
     cycle_count = 0
 
-    while True:
-        cycle_count += 1
-        logger.info("=" * 60)
-        logger.info("Processing cycle #%d", cycle_count)
-
-        try:
-            pending_work = process_cycle()
-        except KeyboardInterrupt:
-            logger.info("⏹️  Received interrupt signal, shutting down")
-            break
-        except Exception as exc:
-            logger.exception("💥 Unexpected error in main loop: %s", exc)
-            pending_work = True
-
-        # Sleep until next cycle
-        sleep_seconds = POLL_INTERVAL if pending_work else IDLE_POLL_INTERVAL
-        reason = "pending work" if pending_work else "idle"
-        logger.info("⏸️  Sleeping for %d seconds (%s)", sleep_seconds, reason)
-        time.sleep(sleep_seconds)
+    try:
+        while True:
+            cycle_count += 1
+            logger.info("=" * 60)
+            logger.info("Processing cycle #%d", cycle_count)
+
+            try:
+                pending_work = process_cycle()
+            except KeyboardInterrupt:
+                logger.info("⏹️  Received interrupt signal, shutting down")
+                break
+            except Exception as exc:
+                logger.exception("💥 Unexpected error in main loop: %s", exc)
+                pending_work = True
+
+            if _STAGE_RUNTIME is not None:
+                logger.info("Stage workers: %s", _STAGE_RUNTIME.stats())
+            for snapshot in engine_pool_metrics():
+                logger.info("Database pool: %s", snapshot)
+
+            # Sleep until next cycle
+            sleep_seconds = POLL_INTERVAL if pending_work else IDLE_POLL_INTERVAL
+            reason = "pending work" if pending_work else "idle"
+            logger.info("⏸️  Sleeping for %d seconds (%s)", sleep_seconds, reason)
+            if STAGE_COUNTERS:
+                counter = get_stage_counter()
+                counter.maintain()
+                # Returns early when a NOTIFY reports newly committed work
+                counter.wait_for_work(sleep_seconds)
+            else:
+                time.sleep(sleep_seconds)
+    finally:
+        shutdown_stage_runtime()
+        if _STAGE_COUNTER is not None:
+            _STAGE_COUNTER.close()
+        dispose_shared_engines()
 
 
 if __name__ == "__main__":
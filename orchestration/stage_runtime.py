@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""Warm, supervised stage runtime for the continuous processor.
+
+The continuous processor historically ran every pipeline step as a fresh
+``python -m src.cli.cli_modular ...`` subprocess. Each of those re-imports
+the code base and reloads StorySniffer, the ML classifier, cleaner caches
+and a database engine before doing any work.
+
+``StageRuntime`` keeps one long-lived worker process per stage instead.
+Commands are sent to the worker over a pipe and dispatched in-process
+through ``src.cli.cli_modular.main``; the worker enables
+``src.utils.stage_resources`` so heavy objects stay resident between
+cycles. A crash, hang or ``SystemExit`` inside a handler only affects that
+stage's worker, which is restarted on the next cycle.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STAGE_WORKER_START_METHOD = os.getenv("STAGE_WORKER_START_METHOD", "spawn")
+STAGE_TASK_TIMEOUT = float(os.getenv("STAGE_TASK_TIMEOUT", "0")) or None
+STAGE_WORKER_MAX_TASKS = int(os.getenv("STAGE_WORKER_MAX_TASKS", "0"))
+
+# How often the parent checks that a busy worker is still alive
+_POLL_SLICE_SECONDS = 0.5
+
+
+def run_cli_in_process(command: Sequence[str]) -> int:
+    """Dispatch a CLI command through the modular CLI in this process."""
+    from src.cli.cli_modular import main as cli_main
+
+    return cli_main(list(command))
+
+
+def _exit_code(exc: SystemExit) -> int:
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    return 1
+
+
+def _worker_main(conn, stage: str, runner: Callable[[Sequence[str]], int]) -> None:
+    """Worker loop: run each received command until told to stop."""
+    from src.utils.stage_resources import enable_stage_resources, stage_resource_stats
+
+    enable_stage_resources()
+    while True:
+        try:
+            command = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if command is None:
+            break
+
+        started = time.perf_counter()
+        try:
+            returncode = runner(command)
+        except SystemExit as exc:
+            returncode = _exit_code(exc)
+        except Exception:
+            logger.exception("Stage %s handler raised", stage)
+            returncode = 1
+        elapsed = time.perf_counter() - started
+
+        try:
+            conn.send((int(returncode or 0), elapsed, stage_resource_stats()))
+        except (BrokenPipeError, EOFError):
+            break
+    conn.close()
+
+
+@dataclass
+class StageResult:
+    """Outcome of one command dispatched to a stage worker."""
+
+    stage: str
+    returncode: int
+    elapsed: float
+    crashed: bool = False
+    timed_out: bool = False
+    resources: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not (self.crashed or self.timed_out)
+
+
+class StageWorker:
+    """A supervised worker process that runs one stage's commands."""
+
+    def __init__(
+        self,
+        stage: str,
+        *,
+        runner: Callable[[Sequence[str]], int] = run_cli_in_process,
+        start_method: str | None = None,
+        task_timeout: float | None = STAGE_TASK_TIMEOUT,
+        max_tasks: int = STAGE_WORKER_MAX_TASKS,
+    ):
+        self.stage = stage
+        self.runner = runner
+        self.task_timeout = task_timeout
+        self.max_tasks = max_tasks
+        self._context = multiprocessing.get_context(
+            start_method or STAGE_WORKER_START_METHOD
+        )
+        self._process = None
+        self._conn = None
+        self.tasks_run = 0
+        self.starts = 0
+        self.crashes = 0
+        self.timeouts = 0
+
+    @property
+    def pid(self) -> int | None:
+        return self._process.pid if self._process is not None else None
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> None:
+        """Start the worker process if it is not already running."""
+        if self.is_alive():
+            return
+        self._cleanup()
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.stage, self.runner),
+            name=f"stage-{self.stage}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self._process = process
+        self._conn = parent_conn
+        self.tasks_run = 0
+        self.starts += 1
+        if self.starts > 1:
+            logger.warning(
+                "♻️  Restarted %s stage worker (pid %s, start #%d)",
+                self.stage,
+                process.pid,
+                self.starts,
+            )
+        else:
+            logger.info("🔥 Started %s stage worker (pid %s)", self.stage, process.pid)
+
+    def run(self, command: Sequence[str]) -> StageResult:
+        """Run ``command`` in the worker, restarting it first if needed."""
+        if self.max_tasks and self.tasks_run >= self.max_tasks:
+            logger.info(
+                "Recycling %s stage worker after %d tasks", self.stage, self.tasks_run
+            )
+            self.stop()
+        self.start()
+
+        started = time.perf_counter()
+        try:
+            self._conn.send(list(command))
+        except (BrokenPipeError, EOFError, OSError):
+            return self._crashed(started)
+
+        while True:
+            remaining = None
+            if self.task_timeout is not None:
+                remaining = self.task_timeout - (time.perf_counter() - started)
+                if remaining <= 0:
+                    return self._timed_out(started)
+            wait = _POLL_SLICE_SECONDS
+            if remaining is not None:
+                wait = min(wait, remaining)
+            try:
+                if self._conn.poll(wait):
+                    returncode, elapsed, resources = self._conn.recv()
+                    break
+            except (EOFError, OSError):
+                return self._crashed(started)
+            if not self._process.is_alive():
+                return self._crashed(started)
+
+        self.tasks_run += 1
+        return StageResult(
+            stage=self.stage,
+            returncode=returncode,
+            elapsed=elapsed,
+            resources=resources,
+        )
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Ask the worker to exit, terminating it if it does not."""
+        if self._process is None:
+            return
+        if self._process.is_alive():
+            try:
+                self._conn.send(None)
+            except (BrokenPipeError, EOFError, OSError):
+                pass
+            self._process.join(timeout)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join(timeout)
+        self._cleanup()
+
+    def _cleanup(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = None
+        self._process = None
+
+    def _crashed(self, started: float) -> StageResult:
+        self._process.join(1.0)
+        exitcode = self._process.exitcode
+        self.crashes += 1
+        logger.error(
+            "💥 %s stage worker died (exit code %s); it will be restarted",
+            self.stage,
+            exitcode,
+        )
+        self._cleanup()
+        return StageResult(
+            stage=self.stage,
+            returncode=exitcode if exitcode not in (None, 0) else 1,
+            elapsed=time.perf_counter() - started,
+            crashed=True,
+        )
+
+    def _timed_out(self, started: float) -> StageResult:
+        self.timeouts += 1
+        logger.error(
+            "⏱️  %s stage worker exceeded %.0fs; terminating it",
+            self.stage,
+            self.task_timeout,
+        )
+        self._process.terminate()
+        self._process.join(5.0)
+        if self._process.is_alive():
+            self._process.kill()
+            self._process.join()
+        self._cleanup()
+        return StageResult(
+            stage=self.stage,
+            returncode=1,
+            elapsed=time.perf_counter() - started,
+            timed_out=True,
+        )
+
+
+class StageRuntime:
+    """Lazily created, reused ``StageWorker`` per pipeline stage."""
+
+    def __init__(self, worker_factory: Callable[[str], StageWorker] = StageWorker):
+        self._worker_factory = worker_factory
+        self._workers: dict[str, StageWorker] = {}
+
+    def worker(self, stage: str) -> StageWorker:
+        if stage not in self._workers:
+            self._workers[stage] = self._worker_factory(stage)
+        return self._workers[stage]
+
+    def run(self, stage: str, command: Sequence[str], description: str) -> bool:
+        """Run ``command`` on the stage's warm worker; True on success."""
+        logger.info("▶️  %s", description)
+        logger.info("🔥 Dispatching to warm %s worker: %s", stage, " ".join(command))
+        result = self.worker(stage).run(command)
+        if result.ok:
+            logger.info(
+                "✅ %s completed successfully (%.1fs)", description, result.elapsed
+            )
+        elif result.timed_out:
+            logger.error("❌ %s timed out after %.1fs", description, result.elapsed)
+        elif result.crashed:
+            logger.error(
+                "❌ %s crashed its worker (%.1fs)", description, result.elapsed
+            )
+        else:
+            logger.error(
+                "❌ %s failed with exit code %d (%.1fs)",
+                description,
+                result.returncode,
+                result.elapsed,
+            )
+        return result.ok
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {
+            stage: {
+                "pid": worker.pid,
+                "alive": worker.is_alive(),
+                "starts": worker.starts,
+                "crashes": worker.crashes,
+                "timeouts": worker.timeouts,
+                "tasks_since_start": worker.tasks_run,
+            }
+            for stage, worker in self._workers.items()
+        }
+
+    def shutdown(self) -> None:
+        for worker in self._workers.values():
+            worker.stop()
+        self._workers.clear()
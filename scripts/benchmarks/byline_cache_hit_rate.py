@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Measure memoized byline cleaning over a real byline distribution.
+
+Reads the ``author``/``source_name`` columns of ``--csv`` (by default the
+Lehigh Valley sample export, 1,108 articles with 67 distinct bylines),
+repeats them ``--repeat`` times and cleans every byline with:
+
+- ``uncached``: cache disabled, the full pipeline per article (old path)
+- ``cached``: ``clean_byline`` per article with the in-process LRU
+- ``bulk``: ``clean_bulk_bylines`` per source, deduplicating first
+- ``warm-start``: a fresh cleaner reading the persistent SQLite table
+  written by the bulk run, as a restarted worker would
+
+Telemetry is disabled so only cleaning is timed.
+
+Usage:
+    python scripts/benchmarks/byline_cache_hit_rate.py --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import logging
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import create_engine  # noqa: E402
+
+from src.models import Base, BylineCleaningCache  # noqa: E402
+from src.utils.byline_cache import BylineCache, BylineCacheStore  # noqa: E402
+from src.utils.byline_cleaner import BylineCleaner  # noqa: E402
+
+DEFAULT_CSV = (
+    Path(__file__).resolve().parents[2]
+    / "data"
+    / "samples"
+    / "penn_state_lehigh_all_articles.csv"
+)
+
+
+def _load(path: Path, repeat: int) -> list[tuple[str, str]]:
+    csv.field_size_limit(sys.maxsize)
+    with path.open(newline="") as handle:
+        rows = [
+            (row["author"], row.get("source_name") or "")
+            for row in csv.DictReader(handle)
+            if row.get("author")
+        ]
+    return rows * repeat
+
+
+def _per_article(cleaner: BylineCleaner, rows) -> list:
+    return [
+        cleaner.clean_byline(byline, return_json=True, source_name=source or None)
+        for byline, source in rows
+    ]
+
+
+def _bulk(cleaner: BylineCleaner, rows) -> list:
+    by_source: dict[str, list[int]] = defaultdict(list)
+    for index, (_byline, source) in enumerate(rows):
+        by_source[source].append(index)
+    results: list = [None] * len(rows)
+    for source, indexes in by_source.items():
+        cleaned = cleaner.clean_bulk_bylines(
+            [rows[index][0] for index in indexes],
+            return_json=True,
+            source_name=source or None,
+        )
+        for index, result in zip(indexes, cleaned, strict=True):
+            results[index] = result
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--csv", type=Path, default=DEFAULT_CSV)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    rows = _load(args.csv, args.repeat)
+    distinct = len(set(rows))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/byline_cache.db")
+        Base.metadata.create_all(engine, tables=[BylineCleaningCache.__table__])
+
+        def cleaner(cache: BylineCache) -> BylineCleaner:
+            instance = BylineCleaner(enable_telemetry=False, cache=cache)
+            # Load publication/organization names before timing
+            instance.clean_byline("By Warm Up")
+            instance.cache.clear()
+            instance.cache.hits = instance.cache.misses = 0
+            return instance
+
+        runs = [
+            ("uncached", lambda: BylineCache(0), _per_article),
+            ("cached", BylineCache, _per_article),
+            ("bulk", lambda: BylineCache(store=BylineCacheStore(engine)), _bulk),
+            (
+                "warm-start",
+                lambda: BylineCache(store=BylineCacheStore(engine)),
+                _bulk,
+            ),
+        ]
+        print(f"{len(rows)} bylines, {distinct} distinct (byline, source) pairs")
+        print(f"{'mode':<12}{'seconds':>10}{'bylines/s':>12}{'pipeline':>10}")
+        baseline = None
+        for mode, make_cache, run in runs:
+            instance = cleaner(make_cache())
+            started = time.perf_counter()
+            results = run(instance, rows)
+            elapsed = time.perf_counter() - started
+            baseline = baseline or results
+            if results != baseline:
+                print(f"{mode}: results differ from the uncached run")
+                return 1
+            # Bylines that went through the full cleaning pipeline
+            pipeline = instance.get_cache_stats()["misses"]
+            if not instance.cache.enabled:
+                pipeline = len(rows)
+            print(
+                f"{mode:<12}{elapsed:>10.3f}{len(rows) / elapsed:>12.0f}"
+                f"{pipeline:>10}"
+            )
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Measure uncached byline cleaning throughput on real bylines.
+
+Collects the distinct ``author`` values from the repository's CSV exports
+(about 1,400 real bylines, local and wire) and cleans each ``--repeat``
+times with the result cache disabled, so every call runs the full
+pipeline. Publication and organization names are loaded from
+``sources/publinks.csv`` the same way ``get_publication_names`` and
+``get_organization_names`` build them from the sources and gazetteer
+tables, so the name matching stages see production-sized sets.
+
+``--limit N`` cleans an evenly spaced sample of N bylines (the
+one-name-at-a-time matching this replaced needs seconds per byline at
+these set sizes). ``--dump`` writes every result as JSON for comparing two
+revisions.
+
+Usage:
+    python scripts/benchmarks/byline_cleaning_throughput.py --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import logging
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from src.utils.byline_cache import BylineCache  # noqa: E402
+from src.utils.byline_cleaner import BylineCleaner  # noqa: E402
+
+PUBLICATION_COMMON = {
+    "the",
+    "and",
+    "news",
+    "daily",
+    "county",
+    "city",
+    "post",
+    "times",
+    "press",
+    "herald",
+    "tribune",
+    "gazette",
+    "journal",
+    "review",
+}
+ORGANIZATION_COMMON = {
+    "the",
+    "and",
+    "of",
+    "for",
+    "at",
+    "in",
+    "on",
+    "to",
+    "center",
+    "department",
+    "office",
+    "services",
+}
+ORGANIZATION_COLUMNS = (
+    "cached_schools",
+    "cached_government",
+    "cached_healthcare",
+    "cached_businesses",
+)
+
+
+def _bylines() -> list[str]:
+    csv.field_size_limit(sys.maxsize)
+    files = subprocess.check_output(
+        ["git", "ls-files", "*.csv"], cwd=ROOT, text=True
+    ).split()
+    bylines: set[str] = set()
+    for name in files:
+        with (ROOT / name).open(newline="", errors="ignore") as handle:
+            reader = csv.DictReader(handle)
+            if reader.fieldnames and "author" in reader.fieldnames:
+                bylines.update(row["author"] for row in reader if row.get("author"))
+    return sorted(bylines)
+
+
+def _name_sets() -> tuple[set[str], set[str]]:
+    publications: set[str] = set()
+    organizations: set[str] = set()
+    with (ROOT / "sources" / "publinks.csv").open(newline="") as handle:
+        for row in csv.DictReader(handle):
+            name = (row.get("name") or "").strip().lower()
+            if name:
+                publications.add(name)
+                publications.update(
+                    word
+                    for word in name.split()
+                    if len(word) >= 3 and word not in PUBLICATION_COMMON
+                )
+            for column in ORGANIZATION_COLUMNS:
+                for org in (row.get(column) or "").split("|"):
+                    org = org.strip().lower()
+                    if len(org) < 3:
+                        continue
+                    organizations.add(org)
+                    organizations.update(
+                        word
+                        for word in org.split()
+                        if len(word) >= 4 and word not in ORGANIZATION_COMMON
+                    )
+    return publications, organizations
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--limit", type=int)
+    parser.add_argument("--dump", type=Path)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    bylines = _bylines()
+    if args.limit and args.limit < len(bylines):
+        step = len(bylines) / args.limit
+        bylines = [bylines[int(index * step)] for index in range(args.limit)]
+    publications, organizations = _name_sets()
+    cleaner = BylineCleaner(enable_telemetry=False, cache=BylineCache(0))
+    # Seed the hourly name caches instead of querying a database
+    now = time.time()
+    cleaner._publication_cache, cleaner._publication_cache_timestamp = (
+        publications,
+        now,
+    )
+    cleaner._organization_cache, cleaner._organization_cache_timestamp = (
+        organizations,
+        now,
+    )
+
+    results = []
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        results = [cleaner.clean_byline(byline, return_json=True) for byline in bylines]
+    elapsed = time.perf_counter() - started
+    total = len(bylines) * args.repeat
+
+    print(
+        f"{len(bylines)} bylines, {len(publications)} publication and "
+        f"{len(organizations)} organization names"
+    )
+    print(f"{'cleaned':>8}{'seconds':>10}{'bylines/s':>12}")
+    print(f"{total:>8}{elapsed:>10.2f}{total / elapsed:>12.0f}")
+    if args.dump:
+        args.dump.write_text(json.dumps(dict(zip(bylines, results, strict=True))))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
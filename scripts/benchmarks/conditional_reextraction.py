@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Measure how much re-extraction work conditional fetches skip.
+
+Serves ``--articles`` pages from a local HTTP server; ``--validator-rate``
+of them answer with ``ETag``/``Last-Modified`` and honour conditional
+requests, the rest always return the full page. A forced pass through
+``Reextractor`` (every page fetched and extracted, like the old
+re-extraction) records digests. Then ``--chrome-rate`` of the pages get a
+new ad/sidebar block and ``--changed-rate`` get an edited article body,
+and a normal pass reports outcomes, the fraction of articles whose
+downstream stages (byline cleaning, content-type detection, cleaning,
+entities; not run here) were skipped, and fetch plus extraction time
+against the forced pass. Politeness delays are disabled for the local
+server.
+
+Uses the real ``ContentExtractor`` for fetching and extraction against a
+temporary SQLite database.
+
+Usage:
+    python scripts/benchmarks/conditional_reextraction.py --articles 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from src.crawler import ContentExtractor  # noqa: E402
+from src.models import Article, Base, CandidateLink  # noqa: E402
+from src.pipeline.reextraction import (  # noqa: E402
+    Reextractor,
+    select_reextraction_targets,
+)
+
+WORDS = "council budget vote county school board road bond tax hearing".split()
+
+
+class Corpus:
+    """Page versions served by the local server."""
+
+    def __init__(self, count: int, validator_rate: float, rng: random.Random):
+        self.body_version = [0] * count
+        self.chrome_version = [0] * count
+        self.validators = [rng.random() < validator_rate for _ in range(count)]
+        self.modified = [time.time() - 86400] * count
+
+    def html(self, index: int) -> str:
+        rng = random.Random(index * 1000 + self.body_version[index])
+        paragraphs = "".join(
+            f"<p>{' '.join(rng.choices(WORDS, k=40))}.</p>" for _ in range(8)
+        )
+        return (
+            f"<html><head><title>County approves road bond plan {index}</title>"
+            '<meta name="author" content="Jane Doe">'
+            '<meta property="article:published_time" content="2026-10-01T10:00:00">'
+            f"</head><body><aside>ad {self.chrome_version[index]}</aside>"
+            f"<article><h1>County approves road bond plan {index}</h1>"
+            f"{paragraphs}</article></body></html>"
+        )
+
+
+def _serve(corpus: Corpus) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server naming
+            index = int(self.path.rsplit("/", 1)[-1])
+            body = corpus.html(index).encode()
+            headers = {"Content-Type": "text/html; charset=utf-8"}
+            if corpus.validators[index]:
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                headers["ETag"] = etag
+                headers["Last-Modified"] = formatdate(
+                    corpus.modified[index], usegmt=True
+                )
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    self.end_headers()
+                    return
+            self.send_response(200)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--articles", type=int, default=500)
+    parser.add_argument("--validator-rate", type=float, default=0.6)
+    parser.add_argument("--chrome-rate", type=float, default=0.2)
+    parser.add_argument("--changed-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    rng = random.Random(args.seed)
+
+    corpus = Corpus(args.articles, args.validator_rate, rng)
+    server = _serve(corpus)
+    base = f"http://127.0.0.1:{server.server_address[1]}/news"
+
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_engine(f"sqlite:///{os.path.join(workdir, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        for index in range(args.articles):
+            url = f"{base}/{index}"
+            session.add(CandidateLink(id=f"c{index}", url=url, source="bench"))
+            session.add(Article(id=f"a{index}", candidate_link_id=f"c{index}", url=url))
+        session.commit()
+
+        extractor = ContentExtractor()
+        # The local server needs no politeness delay between requests
+        extractor._apply_rate_limit = lambda *args, **kwargs: None
+
+        def run_pass(force: bool):
+            targets = select_reextraction_targets(session)
+            started = time.perf_counter()
+            stats = Reextractor(extractor, session, force=force).run(targets)
+            return stats, time.perf_counter() - started
+
+        forced, forced_seconds = run_pass(force=True)
+
+        for index in range(args.articles):
+            roll = rng.random()
+            if roll < args.changed_rate:
+                corpus.body_version[index] += 1
+                corpus.modified[index] = time.time()
+            elif roll < args.changed_rate + args.chrome_rate:
+                corpus.chrome_version[index] += 1
+                corpus.modified[index] = time.time()
+
+        conditional, conditional_seconds = run_pass(force=False)
+        session.close()
+        engine.dispose()
+    server.shutdown()
+    extractor.close_persistent_driver()
+
+    print(f"{'':<22}{'forced':>10}{'conditional':>14}")
+    for outcome in (
+        "not_modified",
+        "html_unchanged",
+        "text_unchanged",
+        "changed",
+        "failed",
+    ):
+        print(
+            f"{outcome:<22}{forced.outcomes[outcome]:>10}"
+            f"{conditional.outcomes[outcome]:>14}"
+        )
+    print(
+        f"{'downstream skipped':<22}{forced.skipped_fraction:>10.1%}"
+        f"{conditional.skipped_fraction:>14.1%}"
+    )
+    print(f"{'seconds':<22}{forced_seconds:>10.2f}{conditional_seconds:>14.2f}")
+    print(
+        f"{'ms/article':<22}{forced_seconds / args.articles * 1e3:>10.1f}"
+        f"{conditional_seconds / args.articles * 1e3:>14.1f}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
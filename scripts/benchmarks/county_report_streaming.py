@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Compare streamed and in-memory county report generation.
+
+Seeds ``--rows`` articles (10% wire, a fifth with labels and entities)
+across Boone and Callaway county sources into a temporary SQLite database,
+then runs the report for Boone in a fresh subprocess per mode and reports
+runtime and the subprocess's peak RSS:
+
+* ``stream-csv`` / ``stream-parquet`` - ``write_county_report`` in chunks
+* ``dataframe`` - ``generate_county_report`` collecting the whole report
+  before writing the CSV (the only behaviour before streaming)
+
+Usage:
+    python scripts/benchmarks/county_report_streaming.py --rows 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import resource
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.models.database import DatabaseManager  # noqa: E402
+from src.reporting.county_report import (  # noqa: E402
+    DEFAULT_CHUNK_SIZE,
+    CountyReportConfig,
+    generate_county_report,
+    write_county_report,
+)
+
+MODES = ("stream-csv", "stream-parquet", "dataframe")
+SOURCES = (("source-boone", "boone.example.com", "Boone"),)
+SOURCES += (("source-callaway", "callaway.example.com", "Callaway"),)
+CREATED = "2025-01-01 00:00:00.000000"
+
+
+def _seed(db_path: str, rows: int) -> None:
+    DatabaseManager(database_url=f"sqlite:///{db_path}").close()
+    start = datetime(2024, 1, 1)
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO sources (id, host, host_norm, county, "
+        "rss_consecutive_failures, rss_transient_failures, "
+        "no_effective_methods_consecutive, section_discovery_enabled) "
+        "VALUES (?, ?, ?, ?, 0, '[]', 0, 0)",
+        ((source_id, host, host, county) for source_id, host, county in SOURCES),
+    )
+    conn.executemany(
+        "INSERT INTO candidate_links (id, url, source, source_id, "
+        "source_county, discovered_at, status, created_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, 'extracted', ?)",
+        (
+            (
+                f"link-{index}",
+                f"https://{SOURCES[index % 2][1]}/story-{index}",
+                SOURCES[index % 2][1],
+                SOURCES[index % 2][0],
+                SOURCES[index % 2][2],
+                CREATED,
+                CREATED,
+            )
+            for index in range(rows)
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO articles (id, candidate_link_id, url, title, author, "
+        "publish_date, status, metadata, wire, primary_label, created_at, "
+        "extracted_at) VALUES (?, ?, ?, ?, ?, ?, 'cleaned', ?, ?, ?, ?, ?)",
+        (
+            (
+                f"article-{index}",
+                f"link-{index}",
+                f"https://{SOURCES[index % 2][1]}/story-{index}",
+                f"Story number {index}",
+                "Jane Doe",
+                (start + timedelta(minutes=index)).strftime("%Y-%m-%d %H:%M:%S"),
+                json.dumps({"byline": {"is_wire_content": False}}),
+                json.dumps({"provider": "AP"}) if index % 10 == 0 else None,
+                "local",
+                CREATED,
+                CREATED,
+            )
+            for index in range(rows)
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO article_labels (id, article_id, label_version, "
+        "model_version, primary_label, alternate_label, applied_at) "
+        "VALUES (?, ?, 'v1', 'bench', 'politics', 'government', ?)",
+        ((f"label-{i}", f"article-{i}", CREATED) for i in range(0, rows, 5)),
+    )
+    conn.executemany(
+        "INSERT INTO article_entities (id, article_id, entity_text, "
+        "entity_label, created_at) VALUES (?, ?, 'Columbia', 'CITY', ?)",
+        ((f"entity-{i}", f"article-{i}", CREATED) for i in range(0, rows, 5)),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _run_mode(mode: str, db_path: str, output_dir: str, chunk_size: int) -> None:
+    config = CountyReportConfig(
+        counties=["Boone"],
+        start_date=datetime(2023, 1, 1),
+        database_url=f"sqlite:///{db_path}",
+    )
+    started = time.perf_counter()
+    if mode == "dataframe":
+        rows = len(generate_county_report(config, Path(output_dir) / "report.csv"))
+    else:
+        suffix = mode.split("-", 1)[1]
+        rows = write_county_report(
+            config, Path(output_dir) / f"report.{suffix}", chunk_size=chunk_size
+        )
+    elapsed = time.perf_counter() - started
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"rows": rows, "seconds": elapsed, "peak_mb": peak_mb}))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    # Internal: run one mode against an existing database and report stats
+    parser.add_argument("--run-mode", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    parser.add_argument("--output-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    if args.run_mode:
+        _run_mode(args.run_mode, args.db, args.output_dir, args.chunk_size)
+        return 0
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, "bench.db")
+        started = time.perf_counter()
+        _seed(db_path, args.rows)
+        print(f"seeded {args.rows} articles in {time.perf_counter() - started:.1f}s")
+
+        print(f"{'mode':<16}{'rows':>10}{'seconds':>10}{'peak RSS MB':>14}")
+        for mode in args.modes:
+            completed = subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--run-mode",
+                    mode,
+                    "--db",
+                    db_path,
+                    "--output-dir",
+                    workdir,
+                    "--chunk-size",
+                    str(args.chunk_size),
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            stats = json.loads(completed.stdout.strip().splitlines()[-1])
+            print(
+                f"{mode:<16}{stats['rows']:>10}{stats['seconds']:>10.2f}"
+                f"{stats['peak_mb']:>14.0f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Compare per-article and bulk article entity persistence.
+
+Seeds ``--articles`` articles into a temporary SQLite database (or uses
+``--database-url``) and saves ``--entities`` synthetic entities for each,
+first with ``save_article_entities`` once per article (one DELETE plus one
+ORM object per entity, committed per article as the extraction pipeline
+did) and then with ``save_article_entities_bulk`` in ``--batch`` sized
+groups. Every tenth article gets no entities so sentinel rows are covered,
+and each entity list carries duplicates for the in-Python dedupe.
+
+Usage:
+    python scripts/benchmarks/entity_bulk_save.py --articles 10000 \\
+        --entities 30 --batch 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import text  # noqa: E402
+
+from src.models import Article  # noqa: E402
+from src.models.database import (  # noqa: E402
+    DatabaseManager,
+    save_article_entities,
+    save_article_entities_bulk,
+)
+
+EXTRACTOR_VERSION = "bench-v1"
+
+
+def _seed(db: DatabaseManager, count: int) -> list[str]:
+    ids = [f"bench-article-{index}" for index in range(count)]
+    with db.get_session() as session:
+        session.execute(text("DELETE FROM article_entities"))
+        session.add_all(
+            Article(
+                id=article_id,
+                candidate_link_id=f"bench-link-{index}",
+                url=f"https://bench.example.com/{index}",
+                content="Body",
+                status="extracted",
+            )
+            for index, article_id in enumerate(ids)
+        )
+        session.commit()
+    return ids
+
+
+def _entities(index: int, count: int) -> list[dict]:
+    if index % 10 == 0:
+        return []
+    entities = [
+        {
+            "text": f"Place {index}-{number}",
+            "label": ("GPE", "LOC", "FAC")[number % 3],
+            "confidence": 0.9,
+            "meta": {"start": number * 10, "end": number * 10 + 8},
+        }
+        for number in range(count)
+    ]
+    # spaCy often reports the same place more than once
+    return entities + entities[:3]
+
+
+def _stored(db: DatabaseManager) -> int:
+    with db.engine.connect() as conn:
+        return int(conn.execute(text("SELECT COUNT(*) FROM article_entities")).scalar())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--articles", type=int, default=10000)
+    parser.add_argument("--entities", type=int, default=30)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(args.database_url or f"sqlite:///{tmp}/bench.db")
+        ids = _seed(db, args.articles)
+        payload = [
+            (article_id, _entities(index, args.entities), f"hash-{index}")
+            for index, article_id in enumerate(ids)
+        ]
+
+        print(f"{'mode':<14}{'seconds':>10}{'articles/s':>12}{'rows':>10}")
+        with db.get_session() as session:
+            started = time.perf_counter()
+            for article_id, entities, text_hash in payload:
+                save_article_entities(
+                    session, article_id, entities, EXTRACTOR_VERSION, text_hash
+                )
+            elapsed = time.perf_counter() - started
+        rows = _stored(db)
+        print(
+            f"{'per-article':<14}{elapsed:>10.2f}"
+            f"{len(payload) / elapsed:>12.0f}{rows:>10}"
+        )
+
+        # Rows from the first pass are replaced, as on a re-extraction
+        with db.get_session() as session:
+            started = time.perf_counter()
+            for start in range(0, len(payload), args.batch):
+                save_article_entities_bulk(
+                    session,
+                    payload[start : start + args.batch],
+                    EXTRACTOR_VERSION,
+                )
+            elapsed = time.perf_counter() - started
+        bulk_rows = _stored(db)
+        print(
+            f"{'bulk':<14}{elapsed:>10.2f}"
+            f"{len(payload) / elapsed:>12.0f}{bulk_rows:>10}"
+        )
+        db.close()
+    return 0 if rows == bulk_rows else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Measure HTTP-stage extraction CPU time per article with per-host routing.
+
+Uses up to ``--pages`` pages from the HTML archive in ``--archive-dir``
+(default ``$HTML_ARCHIVE_DIR``). Without an archive it builds a synthetic
+corpus from ``--hosts`` publishers. On a ``--text-date-share`` of them the
+publish date only appears in a "Published ..." line, which newspaper4k
+misses and BeautifulSoup finds; the rest expose it in a meta tag both
+methods read. On a ``--flat-body-share`` of hosts the story is one block
+of text without paragraph markup in an ``<article>`` that excludes the
+headline and dateline, which both methods return verbatim. Elsewhere
+BeautifulSoup's content includes the headline and lacks newspaper4k's
+paragraph breaks, so the router keeps the default order there.
+
+Each page is run through ``ContentExtractor._extract_without_browser``
+with its stored HTML (no network, no Selenium), once with the default
+newspaper4k-then-BeautifulSoup order and once with a ``StrategyRouter``
+learning from the same pass. Reports CPU ms/article, hosts routed
+BeautifulSoup-first, and per field how often the two runs produced the
+same value.
+
+Usage:
+    python scripts/benchmarks/extraction_strategy_routing.py --pages 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.crawler import ContentExtractor  # noqa: E402
+from src.crawler.strategy_router import FIELDS, StrategyRouter  # noqa: E402
+from src.pipeline.html_archive import ARCHIVE_DIR_ENV, HtmlArchive  # noqa: E402
+
+WORDS = (
+    "council budget vote county school board road bond tax hearing mayor "
+    "sheriff library park river bridge farmers market festival grant"
+).split()
+# newspaper4k scores body text by stopword density, so paragraphs need prose
+SENTENCES = (
+    "The county council voted on the budget after a long public hearing.",
+    "Residents said they were worried about the cost of the new bridge.",
+    "The school board will meet again next month to discuss the bond.",
+    "Officials expect the road work to be finished before the festival.",
+    "The sheriff said the department is still looking for volunteers.",
+    "Farmers at the market told us that the season has been a good one.",
+)
+
+
+def _synthetic_pages(
+    count: int, hosts: int, text_date_share: float, flat_body_share: float
+):
+    text_date_hosts = int(hosts * text_date_share)
+    flat_body_hosts = int(hosts * flat_body_share)
+    start = datetime(2026, 1, 1, 6)
+    for index in range(count):
+        host = index % hosts
+        rng = random.Random(host)
+        nav = "".join(
+            f'<li><a href="/section/{rng.choice(WORDS)}-{n}">{rng.choice(WORDS)}</a></li>'
+            for n in range(60)
+        )
+        published = start + timedelta(days=index // 20, minutes=(index % 20) * 30)
+        iso = published.strftime("%Y-%m-%dT%H:%M:%S-05:00")
+        if host < text_date_hosts:
+            head = ""
+            human = published.strftime("%B %d, %Y %I:%M %p").replace(" 0", " ")
+            dateline = f"<p>Published {human}</p>"
+        else:
+            head = f'<meta property="article:published_time" content="{iso}">'
+            dateline = ""
+        rng = random.Random(index)
+        title = " ".join(rng.choices(WORDS, k=6)).capitalize()
+        blocks = [" ".join(rng.choices(SENTENCES, k=4)) for _ in range(12)]
+        if host < flat_body_hosts:
+            story = (
+                f"<h1>{title}</h1><aside>{dateline}</aside>"
+                f"<article>{' '.join(blocks)}"
+            )
+        else:
+            paragraphs = "".join(f"<p>{block}</p>" for block in blocks)
+            story = f"<article><h1>{title}</h1>{dateline}{paragraphs}"
+        html = (
+            f"<html><head><title>{title}</title>{head}"
+            '<meta name="author" content="Jane Doe"></head><body>'
+            f"<nav><ul>{nav}</ul></nav>{story}</article>"
+            f"<footer><ul>{nav}</ul></footer></body></html>"
+        )
+        yield f"https://news{host}.example/local/story-{index}", html
+
+
+def _archived_pages(root: str, count: int):
+    archive = HtmlArchive(root)
+    seen = 0
+    for _, header, _ in archive.iter_records():
+        if header.get("type") != "response" or (header.get("status") or 200) >= 400:
+            continue
+        html = archive.get(header["digest"])
+        if html:
+            yield header["url"], html
+            seen += 1
+            if seen >= count:
+                break
+    archive.close()
+
+
+def _run(extractor, corpus):
+    results = []
+    started = time.process_time()
+    for url, html in corpus:
+        result = extractor._extract_without_browser(url, html)
+        results.append(tuple(result.get(field) for field in FIELDS))
+    return results, time.process_time() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--hosts", type=int, default=40)
+    parser.add_argument("--text-date-share", type=float, default=0.5)
+    parser.add_argument("--flat-body-share", type=float, default=0.25)
+    parser.add_argument("--min-samples", type=float, default=20.0)
+    parser.add_argument("--archive-dir", default=os.getenv(ARCHIVE_DIR_ENV))
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    if args.archive_dir:
+        pages = _archived_pages(args.archive_dir, args.pages)
+        source = f"archive {args.archive_dir}"
+    else:
+        pages = _synthetic_pages(
+            args.pages, args.hosts, args.text_date_share, args.flat_body_share
+        )
+        source = f"synthetic, {args.hosts} hosts"
+    corpus = list(pages)
+
+    extractor = ContentExtractor()
+    baseline, baseline_seconds = _run(extractor, corpus)
+
+    router = extractor.enable_strategy_routing(
+        StrategyRouter(min_samples=args.min_samples, rng=random.Random(0))
+    )
+    routed, routed_seconds = _run(extractor, corpus)
+    stats = router.stats()
+
+    count = len(corpus)
+    complete = sum(all(values) for values in routed)
+    print(f"corpus                {count} pages ({source})")
+    print(f"default order         {baseline_seconds / count * 1e3:.2f} CPU ms/article")
+    print(
+        f"routed                {routed_seconds / count * 1e3:.2f} CPU ms/article "
+        f"({baseline_seconds / routed_seconds:.2f}x)"
+    )
+    print(
+        f"routes                {stats.get('bs_first', 0)} bs-first, "
+        f"{stats.get('explored', 0)} explored, {stats.get('default', 0)} default"
+    )
+    print(f"bs-first hosts        {stats['bs_first_hosts']}/{stats['hosts']}")
+    print(f"all core fields       {complete / count:.2%} (routed)")
+    for position, field in enumerate(FIELDS):
+        agree = sum(
+            a[position] == b[position] for a, b in zip(baseline, routed, strict=True)
+        )
+        print(f"{field + ' agrees':<22}{agree / count:.2%}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
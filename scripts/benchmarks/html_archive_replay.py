@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Measure HTML archive write, lookup and replay-extraction throughput.
+
+Archives ``--pages`` synthetic article pages from ``--hosts`` publishers
+(each host has its own ~30 KB page template around a unique article body)
+into a temporary ``HtmlArchive`` in batches of ``--batch``, then reports
+write throughput, compression ratio, ``latest(url)`` lookup throughput
+for ``--lookups`` random URLs, and the throughput of
+``ContentExtractor.extract_content`` replaying ``--replay`` archived pages
+(default: all of them; no network) against extracting ``--baseline`` of
+them from in-memory HTML.
+
+Usage:
+    python scripts/benchmarks/html_archive_replay.py --pages 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.crawler import ContentExtractor  # noqa: E402
+from src.pipeline.html_archive import ZSTD_AVAILABLE, HtmlArchive  # noqa: E402
+
+WORDS = (
+    "council budget vote county school board road bond tax hearing mayor "
+    "sheriff library park river bridge farmers market festival grant"
+).split()
+
+
+def _template(host: int) -> tuple[str, str]:
+    rng = random.Random(host)
+    nav = "".join(
+        f'<li><a href="/section/{rng.choice(WORDS)}-{n}">{rng.choice(WORDS)}</a></li>'
+        for n in range(120)
+    )
+    script = "".join(
+        f"window.cfg{n}={{id:{rng.randrange(10**6)},slot:'{rng.choice(WORDS)}'}};"
+        for n in range(300)
+    )
+    head = (
+        f"<html><head><script>{script}</script></head><body>"
+        f'<nav class="site-{host}"><ul>{nav}</ul></nav>'
+    )
+    foot = f"<footer>Copyright Publisher {host}. {nav[:4000]}</footer></body></html>"
+    return head, foot
+
+
+def _page(index: int, hosts: int, templates: dict) -> tuple[str, str]:
+    host = index % hosts
+    if host not in templates:
+        templates[host] = _template(host)
+    head, foot = templates[host]
+    rng = random.Random(index)
+    paragraphs = "".join(
+        f"<p>{' '.join(rng.choices(WORDS, k=45))}.</p>" for _ in range(10)
+    )
+    url = f"https://news{host}.example/local/story-{index}"
+    html = (
+        f"{head}<article><h1>County approves road bond plan {index}</h1>"
+        '<meta name="author" content="Jane Doe">'
+        '<meta property="article:published_time" content="2026-10-01T10:00:00">'
+        f"{paragraphs}</article>{foot}"
+    )
+    return url, html
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=100000)
+    parser.add_argument("--hosts", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--replay", type=int, default=0, help="0 replays all")
+    parser.add_argument("--baseline", type=int, default=2000)
+    parser.add_argument("--codec", choices=("zstd", "zlib"), default=None)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    rng = random.Random(args.seed)
+    templates: dict = {}
+
+    with tempfile.TemporaryDirectory() as workdir:
+        archive = HtmlArchive(Path(workdir) / "archive", codec=args.codec)
+
+        started = time.perf_counter()
+        for first in range(0, args.pages, args.batch):
+            batch = [
+                (*_page(index, args.hosts, templates), 200, None)
+                for index in range(first, min(first + args.batch, args.pages))
+            ]
+            archive.put_many(batch)
+        write_seconds = time.perf_counter() - started
+        stats = archive.stats()
+        index_bytes = (archive.root / "index.sqlite").stat().st_size
+
+        urls = [
+            _page(rng.randrange(args.pages), args.hosts, templates)[0]
+            for _ in range(args.lookups)
+        ]
+        started = time.perf_counter()
+        for url in urls:
+            archive.latest(url)
+        lookup_seconds = time.perf_counter() - started
+
+        extractor = ContentExtractor()
+        extractor._apply_rate_limit = lambda *args, **kwargs: None
+        baseline = [
+            _page(index, args.hosts, templates)
+            for index in rng.sample(range(args.pages), min(args.baseline, args.pages))
+        ]
+        started = time.perf_counter()
+        for url, html in baseline:
+            extractor.extract_content(url, html=html)
+        memory_seconds = time.perf_counter() - started
+
+        replay = args.replay or args.pages
+        extractor.html_archive = archive
+        extractor.archive_replay = True
+        extracted = 0
+        started = time.perf_counter()
+        for index in range(replay):
+            url = _page(index, args.hosts, templates)[0]
+            if extractor.extract_content(url).get("content"):
+                extracted += 1
+        replay_seconds = time.perf_counter() - started
+        extractor.close_persistent_driver()
+        archive.close()
+
+    raw_mb = stats["raw_bytes"] / 1e6
+    ratio = stats["raw_bytes"] / stats["stored_bytes"]
+    print(f"codec                     {archive.codec} (zstd: {ZSTD_AVAILABLE})")
+    print(f"pages archived            {stats['pages']}")
+    print(
+        f"write                     {args.pages / write_seconds:,.0f} pages/s, "
+        f"{raw_mb / write_seconds:,.1f} MB/s raw"
+    )
+    print(
+        f"stored                    {stats['stored_bytes'] / 1e6:,.1f} MB of "
+        f"{raw_mb:,.1f} MB raw ({ratio:.1f}x), index {index_bytes / 1e6:,.1f} MB"
+    )
+    print(f"latest(url) lookups       {args.lookups / lookup_seconds:,.0f}/s")
+    print(
+        f"extract from memory       {len(baseline) / memory_seconds:,.1f} pages/s "
+        f"({memory_seconds / len(baseline) * 1e3:.1f} ms/page)"
+    )
+    print(
+        f"extract replayed          {replay / replay_seconds:,.1f} pages/s "
+        f"({replay_seconds / replay * 1e3:.1f} ms/page, "
+        f"{extracted}/{replay} with content, {replay_seconds / 60:.1f} min)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Benchmark ArticleLLMPipeline throughput with a local fake LLM provider.
+
+The fake provider sleeps for a configurable latency (with jitter) and can be
+capped with per-provider concurrency/rate limits, so the run shows how
+throughput scales with ``concurrency`` and how the prompt cache behaves on a
+rerun where only a fraction of articles changed.
+
+Usage:
+    python scripts/benchmarks/llm_pipeline_throughput.py --articles 200 \\
+        --latency 0.25 --concurrency 1 4 8 16 --changed 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import types
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.services.llm import (  # noqa: E402
+    ArticleLLMPipeline,
+    LLMOrchestrator,
+    LLMSettings,
+    PromptResponseCache,
+    ProviderLimiterRegistry,
+    ProviderLimits,
+)
+from src.services.llm.providers import LLMProvider, LLMProviderResponse  # noqa: E402
+
+
+class LocalFakeProvider(LLMProvider):
+    """Provider that echoes a summary after sleeping ``latency`` seconds."""
+
+    provider_name = "local-fake"
+    model_name = "fake-1"
+    max_context_tokens = 100_000
+
+    def __init__(self, settings: LLMSettings, latency: float, jitter: float):
+        super().__init__(settings)
+        self.latency = latency
+        self.jitter = jitter
+        self.calls = 0
+
+    def is_available(self) -> bool:
+        return True
+
+    def _client_tuple(self):
+        return (None, None, None)
+
+    def generate(
+        self,
+        prompt,
+        *,
+        max_output_tokens=None,
+        temperature=None,
+        metadata=None,
+    ):
+        self.calls += 1
+        time.sleep(max(0.0, random.gauss(self.latency, self.jitter)))
+        return LLMProviderResponse(
+            provider=self.provider_name,
+            model=self.model_name,
+            content=f"Summary of {len(prompt)} characters",
+            metadata=self._decorate_metadata(metadata),
+        )
+
+
+class _Session:
+    def __init__(self, articles):
+        self._articles = articles
+
+    def execute(self, _statement):
+        return types.SimpleNamespace(scalars=lambda: iter(self._articles))
+
+    def commit(self):
+        pass
+
+
+def _articles(count: int, revision: dict[int, int]):
+    return [
+        types.SimpleNamespace(
+            id=f"bench-{index}",
+            title=f"County commission meeting {index}",
+            author="Staff",
+            publish_date=datetime(2024, 1, 1),
+            content=f"Revision {revision.get(index, 0)} of article body {index}. " * 40,
+            text=None,
+            url=f"https://bench.invalid/{index}",
+            meta={},
+        )
+        for index in range(count)
+    ]
+
+
+def _run(args, concurrency: int, cache: PromptResponseCache | None, articles):
+    settings = LLMSettings(
+        provider_order=["local-fake"],
+        provider_limits={
+            "local-fake": ProviderLimits(
+                max_concurrency=args.provider_concurrency,
+                requests_per_minute=args.provider_rpm,
+            )
+        },
+    )
+    provider = LocalFakeProvider(settings, args.latency, args.jitter)
+    orchestrator = LLMOrchestrator(
+        settings,
+        [provider],
+        limiters=ProviderLimiterRegistry.from_settings(settings),
+        cache=cache,
+    )
+    session = _Session(articles)
+    pipeline = ArticleLLMPipeline(session, orchestrator)  # type: ignore[arg-type]
+    started = time.perf_counter()
+    results = pipeline.run(concurrency=concurrency, commit_every=25)
+    elapsed = time.perf_counter() - started
+    return len(results) / elapsed, provider.calls
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--articles", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.25)
+    parser.add_argument("--jitter", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--provider-concurrency", type=int, default=None)
+    parser.add_argument("--provider-rpm", type=float, default=None)
+    parser.add_argument(
+        "--changed",
+        type=float,
+        default=0.1,
+        help="Fraction of articles modified before the cached rerun",
+    )
+    args = parser.parse_args()
+
+    articles = _articles(args.articles, {})
+    print(f"{'concurrency':>11} {'articles/sec':>13} {'provider calls':>15}")
+    for concurrency in args.concurrency:
+        rate, calls = _run(args, concurrency, None, articles)
+        print(f"{concurrency:>11} {rate:>13.1f} {calls:>15}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "llm_cache.sqlite3"
+        concurrency = max(args.concurrency)
+
+        cache = PromptResponseCache(cache_path)
+        rate, calls = _run(args, concurrency, cache, articles)
+        print(f"\nCold cache: {rate:.1f} articles/sec, {calls} provider calls")
+        cache.close()
+
+        changed = random.sample(range(args.articles), int(args.articles * args.changed))
+        rerun_articles = _articles(args.articles, dict.fromkeys(changed, 1))
+        cache = PromptResponseCache(cache_path)
+        rate, calls = _run(args, concurrency, cache, rerun_articles)
+        print(
+            f"Warm rerun ({len(changed)} changed): {rate:.1f} articles/sec, "
+            f"{calls} provider calls, hit rate {cache.stats.hit_rate:.1%}"
+        )
+        cache.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
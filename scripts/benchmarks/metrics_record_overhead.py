@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Measure per-record overhead of buffered metrics in the hot path.
+
+Times ``--records`` calls each of ``MetricsClient.record_counter``,
+``record_gauge`` and ``record_distribution`` against a
+``MetricsAggregator`` (no background flushing), single-threaded and split
+across ``--threads`` threads, then the cost of one ``collect()`` and
+Prometheus render over the resulting series.
+
+When google-cloud-monitoring is installed it also times the unbuffered
+path, which builds a ``TimeSeries`` per record and makes one
+``create_time_series`` call; the call is replaced by a sleep of
+``--rtt-ms`` to stand in for the network round trip.
+
+Usage:
+    python scripts/benchmarks/metrics_record_overhead.py --records 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.utils.metrics import MONITORING_AVAILABLE, MetricsClient  # noqa: E402
+from src.utils.metrics_aggregator import MetricsAggregator  # noqa: E402
+
+SOURCES = [f"source-{index}.example.com" for index in range(50)]
+
+
+def _record(client: MetricsClient, kind: str, count: int, offset: int = 0) -> None:
+    for index in range(offset, offset + count):
+        labels = {"source": SOURCES[index % len(SOURCES)]}
+        if kind == "counter":
+            client.record_counter("articles_extracted", 1, labels)
+        elif kind == "gauge":
+            client.record_gauge("queue_depth", float(index), labels)
+        else:
+            client.record_distribution("processing_time_seconds", 0.25, labels)
+
+
+def _time_threads(client: MetricsClient, kind: str, records: int, threads: int):
+    per_thread = records // threads
+    workers = [
+        threading.Thread(target=_record, args=(client, kind, per_thread, n))
+        for n in range(threads)
+    ]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return (time.perf_counter() - started) / (per_thread * threads)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--rtt-ms", type=float, default=20.0)
+    parser.add_argument("--unbuffered-records", type=int, default=50)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    aggregator = MetricsAggregator(background=False)
+    client = MetricsClient(enabled=False, aggregator=aggregator)
+    print(f"{'path':<34}{'ns/record':>12}")
+    for kind in ("counter", "gauge", "distribution"):
+        single = _time_threads(client, kind, args.records, 1)
+        threaded = _time_threads(client, kind, args.records, args.threads)
+        print(f"{'buffered ' + kind:<34}{single * 1e9:>12.0f}")
+        print(
+            f"{f'buffered {kind} x{args.threads} threads':<34}{threaded * 1e9:>12.0f}"
+        )
+
+    started = time.perf_counter()
+    snapshot = aggregator.collect()
+    collect_ms = (time.perf_counter() - started) * 1e3
+    started = time.perf_counter()
+    text = aggregator.render()
+    render_ms = (time.perf_counter() - started) * 1e3
+    series = len(snapshot.counters) + len(snapshot.gauges) + len(snapshot.histograms)
+    print(f"\nseries                            {series:>12}")
+    print(f"collect ms                        {collect_ms:>12.2f}")
+    print(f"collect + render ms               {render_ms:>12.2f}")
+    print(f"/metrics bytes                    {len(text):>12}")
+
+    if not MONITORING_AVAILABLE:
+        print("\nunbuffered path skipped: google-cloud-monitoring not installed")
+        return 0
+
+    unbuffered = MetricsClient(enabled=False)
+    unbuffered.enabled = True
+    unbuffered.project_name = "projects/benchmark"
+
+    class _RoundTrip:
+        def create_time_series(self, **_kwargs):
+            time.sleep(args.rtt_ms / 1e3)
+
+    unbuffered.client = _RoundTrip()
+    for kind in ("counter", "gauge", "distribution"):
+        per_record = _time_threads(unbuffered, kind, args.unbuffered_records, 1)
+        print(f"{'unbuffered ' + kind:<34}{per_record * 1e9:>12.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
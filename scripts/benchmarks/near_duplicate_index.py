@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Measure near-duplicate clustering quality and throughput.
+
+Streams ``--articles`` synthetic articles into a ``NearDuplicateIndex``
+backed by a temporary SQLite database (committing every
+``--commit-every``). About ``--duplicate-rate`` of them are syndicated
+copies of an earlier story (new header and footer, a trimmed span, a few
+substituted words); ``--follow-up-rate`` are follow-up stories that reuse
+the lead of an earlier one but are not duplicates. Every story also
+carries stock phrases shared across the corpus.
+
+Reports precision and recall of the duplicate assignments (a duplicate is
+correct when its canonical article tells the same story), insert
+throughput, and query throughput for ``--queries`` fresh copies looked up
+without being indexed.
+
+Usage:
+    python scripts/benchmarks/near_duplicate_index.py --articles 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from src.models import ArticleMinHashBand, ArticleNearDuplicate  # noqa: E402
+from src.pipeline.near_duplicates import NearDuplicateIndex  # noqa: E402
+
+VOCABULARY = [f"w{index}" for index in range(20000)]
+STOCK_PHRASES = [
+    f"the associated press contributed to this report number {index}"
+    for index in range(50)
+]
+
+
+def _story(story_id: int, words: int) -> str:
+    rng = random.Random(story_id)
+    body = rng.choices(VOCABULARY, k=words)
+    for phrase in rng.sample(STOCK_PHRASES, 2):
+        body.insert(rng.randrange(len(body)), phrase)
+    return " ".join(body)
+
+
+def _syndicated_copy(story: str, rng: random.Random) -> str:
+    words = story.split()
+    span = rng.randint(len(words) // 20, len(words) // 10)
+    start = rng.randrange(len(words) - span)
+    del words[start : start + span]
+    for _ in range(rng.randint(0, len(words) // 100)):
+        words[rng.randrange(len(words))] = rng.choice(VOCABULARY)
+    header = f"published by courier {rng.randrange(100)} staff"
+    return f"{header} {' '.join(words)} subscribe to courier {rng.randrange(100)}"
+
+
+def _follow_up(story: str, story_id: int, words: int) -> str:
+    lead = story.split()[: words * 2 // 5]
+    return " ".join(lead) + " " + _story(story_id, words - len(lead))
+
+
+def _articles(count: int, args, rng: random.Random):
+    """Yield (text, story id) pairs; story ids identify true duplicates."""
+    originals: list[int] = []
+    for index in range(count):
+        roll = rng.random()
+        if originals and roll < args.duplicate_rate:
+            story_id = rng.choice(originals[-args.window :])
+            yield _syndicated_copy(_story(story_id, args.words), rng), story_id
+        elif originals and roll < args.duplicate_rate + args.follow_up_rate:
+            earlier = rng.choice(originals[-args.window :])
+            originals.append(index)
+            yield _follow_up(_story(earlier, args.words), index, args.words), index
+        else:
+            originals.append(index)
+            yield _story(index, args.words), index
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--articles", type=int, default=1_000_000)
+    parser.add_argument("--words", type=int, default=250)
+    parser.add_argument("--duplicate-rate", type=float, default=0.3)
+    parser.add_argument("--follow-up-rate", type=float, default=0.05)
+    parser.add_argument("--window", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=10_000)
+    parser.add_argument("--commit-every", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, "near_duplicates.db")
+        engine = create_engine(f"sqlite:///{db_path}")
+        ArticleNearDuplicate.__table__.create(engine)
+        ArticleMinHashBand.__table__.create(engine)
+        session = sessionmaker(bind=engine)()
+        index = NearDuplicateIndex()
+
+        story_of: list[int] = []
+        true_positive = false_positive = false_negative = 0
+        started = time.perf_counter()
+        for article, (text, story_id) in enumerate(_articles(args.articles, args, rng)):
+            story_of.append(story_id)
+            match = index.assign(session, str(article), text)
+            is_copy = story_id != article
+            if match is not None and match.is_duplicate:
+                if story_of[int(match.canonical_article_id)] == story_id:
+                    true_positive += 1
+                else:
+                    false_positive += 1
+                    false_negative += is_copy
+            elif is_copy:
+                false_negative += 1
+            if (article + 1) % args.commit_every == 0:
+                session.commit()
+        session.commit()
+        insert_seconds = time.perf_counter() - started
+
+        queries = [
+            _syndicated_copy(_story(rng.choice(story_of), args.words), rng)
+            for _ in range(args.queries)
+        ]
+        started = time.perf_counter()
+        found = sum(
+            index.find(session, index.signature(text))[0] is not None
+            for text in queries
+        )
+        query_seconds = time.perf_counter() - started
+        db_mb = os.path.getsize(db_path) / 1e6
+        session.close()
+        engine.dispose()
+
+    precision = true_positive / max(true_positive + false_positive, 1)
+    recall = true_positive / max(true_positive + false_negative, 1)
+    print(f"articles              {args.articles:>12}")
+    print(f"true duplicates       {true_positive + false_negative:>12}")
+    print(f"precision             {precision:>12.4f}")
+    print(f"recall                {recall:>12.4f}")
+    print(f"insert articles/sec   {args.articles / insert_seconds:>12.0f}")
+    print(f"query copies/sec      {args.queries / query_seconds:>12.0f}")
+    print(f"query hit rate        {found / max(args.queries, 1):>12.4f}")
+    print(f"database MB           {db_mb:>12.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Measure offline re-extraction throughput as worker processes are added.
+
+Builds a temporary SQLite database with ``--articles`` articles and an
+HTML archive holding one synthetic page for each (per-host templates of
+about 30 KB around a unique article body), then runs
+``OfflineReextractor`` in dry-run mode with 1, 2, 4, ... up to
+``--max-workers`` processes and reports articles per second, speedup
+over one process and parallel efficiency. Content cleaning runs unless
+``--skip-cleaning`` is given.
+
+Usage:
+    python scripts/benchmarks/offline_reextraction_scaling.py --articles 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.models import Article, CandidateLink  # noqa: E402
+from src.models.database import DatabaseManager  # noqa: E402
+from src.pipeline.html_archive import HtmlArchive  # noqa: E402
+from src.pipeline.offline_reextraction import OfflineReextractor  # noqa: E402
+from src.pipeline.reextraction import select_reextraction_targets  # noqa: E402
+
+WORDS = (
+    "council budget vote county school board road bond tax hearing mayor "
+    "sheriff library park river bridge farmers market festival grant"
+).split()
+
+
+def _page(index: int, hosts: int) -> tuple[str, str]:
+    host = index % hosts
+    rng = random.Random(host)
+    nav = "".join(
+        f'<li><a href="/section/{rng.choice(WORDS)}-{n}">{rng.choice(WORDS)}</a></li>'
+        for n in range(120)
+    )
+    script = "".join(
+        f"window.cfg{n}={{id:{rng.randrange(10**6)}}};" for n in range(300)
+    )
+    rng = random.Random(index)
+    paragraphs = "".join(
+        f"<p>{' '.join(rng.choices(WORDS, k=45))}.</p>" for _ in range(10)
+    )
+    title = f"County approves road bond plan {index}"
+    html = (
+        f"<html><head><title>{title}</title><script>{script}</script>"
+        '<meta name="author" content="By Jane Doe, Staff Writer">'
+        '<meta property="article:published_time" content="2026-10-01T10:00:00">'
+        f"</head><body><nav><ul>{nav}</ul></nav><article><h1>{title}</h1>"
+        f"{paragraphs}</article><footer>{nav[:4000]}</footer></body></html>"
+    )
+    return f"https://news{host}.example/local/story-{index}", html
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--articles", type=int, default=5000)
+    parser.add_argument("--hosts", type=int, default=50)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=25)
+    parser.add_argument("--skip-cleaning", action="store_true")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_url = f"sqlite:///{Path(workdir) / 'offline.db'}"
+        db = DatabaseManager(database_url=db_url)
+        archive = HtmlArchive(Path(workdir) / "archive")
+        pages = []
+        for index in range(args.articles):
+            url, html = _page(index, args.hosts)
+            db.session.add(CandidateLink(id=f"c{index}", url=url, source="bench"))
+            db.session.add(
+                Article(id=f"a{index}", candidate_link_id=f"c{index}", url=url)
+            )
+            pages.append((url, html, 200, None))
+        db.session.commit()
+        archive.put_many(pages)
+        archive.close()
+        targets = select_reextraction_targets(db.session)
+
+        counts = []
+        workers = 1
+        while workers <= args.max_workers:
+            counts.append(workers)
+            workers *= 2
+        if counts[-1] != args.max_workers:
+            counts.append(args.max_workers)
+
+        print(f"{'workers':>8}{'articles/s':>12}{'speedup':>10}{'efficiency':>12}")
+        baseline = None
+        for workers in counts:
+            report = OfflineReextractor(
+                archive.root,
+                db.session,
+                database_url=db_url,
+                workers=workers,
+                clean=not args.skip_cleaning,
+                dry_run=True,
+                chunk_size=args.chunk_size,
+            ).run(targets)
+            rate = report.processed / report.seconds
+            baseline = baseline or rate
+            print(
+                f"{workers:>8}{rate:>12.1f}{rate / baseline:>10.2f}"
+                f"{rate / baseline / workers:>12.0%}"
+            )
+        print(f"outcomes: {dict(report.outcomes)} on {os.cpu_count()} CPUs")
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Measure persistent boilerplate removal throughput for one domain.
+
+Stores ``--patterns`` persistent patterns for a domain in a temporary SQLite
+telemetry database (a mix of long page furniture, short share/subscribe
+prompts and a few wire-credit lines), builds ``--articles`` synthetic
+articles that each carry a handful of them, and times the balanced
+cleaner's persistent-pattern stage over the batch, reporting articles/sec.
+The first article pays for loading and compiling the domain's patterns.
+
+Usage:
+    python scripts/benchmarks/persistent_pattern_removal.py --patterns 500 \\
+        --articles 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.telemetry.store import TelemetryStore  # noqa: E402
+from src.utils.content_cleaner_balanced import (  # noqa: E402
+    BalancedBoundaryContentCleaner,
+)
+from src.utils.content_cleaning_telemetry import (  # noqa: E402
+    ContentCleaningTelemetry,
+)
+
+DOMAIN = "bench.example.com"
+WORDS = (
+    "county council road budget hearing school board vote library hours "
+    "weather storm river festival parade hospital clinic sheriff office"
+).split()
+
+
+def _pattern_texts(count: int, rng: random.Random) -> list[str]:
+    texts = []
+    for index in range(count):
+        if index % 50 == 0:
+            texts.append(f"Copyright {index} The Associated Press. All rights.")
+        elif index % 5 == 0:
+            texts.append(f"Subscribe now to section {index} updates")
+        else:
+            words = " ".join(rng.choices(WORDS, k=30))
+            texts.append(f"Related coverage {index}: {words.capitalize()}.")
+    return texts
+
+
+def _seed_patterns(db_path: str, texts: list[str]) -> None:
+    telemetry = ContentCleaningTelemetry(
+        store=TelemetryStore(f"sqlite:///{db_path}", async_writes=False)
+    )
+    with telemetry.store.connection() as conn:
+        telemetry._ensure_persistent_patterns_table(conn)
+        conn.commit()
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO persistent_boilerplate_patterns (id, domain, pattern_type, "
+        "text_content, text_hash, confidence_score, occurrences_total, "
+        "removal_reason, is_active) VALUES (?, ?, 'footer', ?, ?, ?, ?, "
+        "'Recurring footer', 1)",
+        (
+            (str(uuid.uuid4()), DOMAIN, text, str(index), 0.99 - index / 1e4, 10)
+            for index, text in enumerate(texts)
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _articles(count: int, texts: list[str], rng: random.Random) -> list[str]:
+    articles = []
+    for _ in range(count):
+        paragraphs = [
+            " ".join(rng.choices(WORDS, k=60)).capitalize() + "." for _ in range(8)
+        ]
+        for text in rng.sample(texts, 4):
+            paragraphs.insert(rng.randrange(len(paragraphs) + 1), text)
+        articles.append("\n\n".join(paragraphs))
+    return articles
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--patterns", type=int, default=500)
+    parser.add_argument("--articles", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, "telemetry.db")
+        texts = _pattern_texts(args.patterns, rng)
+        _seed_patterns(db_path, texts)
+        articles = _articles(args.articles, texts, rng)
+
+        cleaner = BalancedBoundaryContentCleaner(enable_telemetry=True)
+        cleaner.telemetry = ContentCleaningTelemetry(
+            store=TelemetryStore(f"sqlite:///{db_path}", async_writes=False)
+        )
+        cleaner.telemetry.start_cleaning_session(DOMAIN, article_count=len(articles))
+
+        started = time.perf_counter()
+        removed = 0
+        for index, article in enumerate(articles):
+            result = cleaner._remove_persistent_patterns(article, DOMAIN, str(index))
+            removed += len(result["removals"])
+            if index == 0:
+                first = time.perf_counter() - started
+        elapsed = time.perf_counter() - started
+
+    print(f"patterns            {args.patterns:>10}")
+    print(f"articles            {len(articles):>10}")
+    print(f"removals            {removed:>10}")
+    print(f"first article (s)   {first:>10.3f}")
+    print(f"total (s)           {elapsed:>10.2f}")
+    print(f"articles/sec        {len(articles) / elapsed:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
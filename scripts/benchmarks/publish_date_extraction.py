@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Measure publish-date extraction time per page on a stored page corpus.
+
+Uses up to ``--pages`` pages from the HTML archive in ``--archive-dir``
+(default ``$HTML_ARCHIVE_DIR``). Without an archive it builds a synthetic
+corpus from ``--hosts`` publishers, each exposing the date one way
+(JSON-LD, one of the meta tags, ``<time>``, a "Published ..." line or a
+standalone date line under the byline) inside a large page template,
+with about 20 articles per publishing day.
+
+Pages are parsed once up front; only
+``ContentExtractor._extract_published_date`` is timed. The corpus is run
+twice: "cold" clears the parsed-date cache and the learned per-host
+strategies before every page, "warm" keeps both as a long-running
+extractor does. Reports ms/page, cache hit rate, hosts with a learned
+strategy, and agreement between the two runs.
+
+Usage:
+    python scripts/benchmarks/publish_date_extraction.py --pages 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.crawler import PUBLISH_DATE_META_SELECTORS, ContentExtractor  # noqa: E402
+from src.crawler.date_extraction import (  # noqa: E402
+    DateStrategyCache,
+    clear_parse_cache,
+    parse_cache_info,
+)
+from src.pipeline.html_archive import ARCHIVE_DIR_ENV, HtmlArchive  # noqa: E402
+
+WORDS = (
+    "council budget vote county school board road bond tax hearing mayor "
+    "sheriff library park river bridge farmers market festival grant"
+).split()
+STYLES = ("json_ld", "meta", "time_tag", "keyword_line", "date_line")
+
+
+def _date_markup(style: str, host: int, published: datetime) -> tuple[str, str]:
+    """``(head, byline)`` markup exposing ``published`` in ``style``."""
+    iso = published.strftime("%Y-%m-%dT%H:%M:%S-05:00")
+    human = published.strftime("%B %d, %Y %I:%M %p").replace(" 0", " ")
+    if style == "json_ld":
+        data = {"@type": "NewsArticle", "datePublished": iso}
+        return f'<script type="application/ld+json">{json.dumps(data)}</script>', ""
+    if style == "meta":
+        attr, value = PUBLISH_DATE_META_SELECTORS[
+            host % len(PUBLISH_DATE_META_SELECTORS)
+        ]
+        return f'<meta {attr}="{value}" content="{iso}">', ""
+    if style == "time_tag":
+        return "", f'<time datetime="{iso}">{human}</time>'
+    if style == "keyword_line":
+        return "", f"<p>By Jane Doe</p><p>Published {human}</p>"
+    return "", f"<p>By Jane Doe</p><p>{published.strftime('%B %d, %Y')}</p>"
+
+
+def _synthetic_pages(count: int, hosts: int):
+    start = datetime(2026, 1, 1, 6)
+    for index in range(count):
+        host = index % hosts
+        rng = random.Random(host)
+        nav = "".join(
+            f'<li><a href="/section/{rng.choice(WORDS)}-{n}">{rng.choice(WORDS)}</a></li>'
+            for n in range(80)
+        )
+        published = start + timedelta(days=index // 20, minutes=(index % 20) * 30)
+        head, byline = _date_markup(STYLES[host % len(STYLES)], host, published)
+        rng = random.Random(index)
+        paragraphs = "".join(
+            f"<p>{' '.join(rng.choices(WORDS, k=40))}.</p>" for _ in range(12)
+        )
+        html = (
+            f"<html><head><title>Story {index}</title>{head}</head><body>"
+            f"<nav><ul>{nav}</ul></nav><article><h1>Story {index}</h1>{byline}"
+            f"{paragraphs}</article><footer><ul>{nav}</ul></footer></body></html>"
+        )
+        yield f"https://news{host}.example/local/story-{index}", html
+
+
+def _archived_pages(root: str, count: int):
+    archive = HtmlArchive(root)
+    seen = 0
+    for _, header, _ in archive.iter_records():
+        if header.get("type") != "response" or (header.get("status") or 200) >= 400:
+            continue
+        html = archive.get(header["digest"])
+        if html:
+            yield header["url"], html
+            seen += 1
+            if seen >= count:
+                break
+    archive.close()
+
+
+def _run(extractor, corpus, warm: bool):
+    extractor.date_strategies = DateStrategyCache()
+    clear_parse_cache()
+    results = []
+    started = time.perf_counter()
+    for url, soup, html in corpus:
+        if not warm:
+            extractor.date_strategies = DateStrategyCache()
+            clear_parse_cache()
+        results.append(extractor._extract_published_date(soup, html, url))
+    return results, time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=20000)
+    parser.add_argument("--hosts", type=int, default=100)
+    parser.add_argument("--archive-dir", default=os.getenv(ARCHIVE_DIR_ENV))
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    if args.archive_dir:
+        pages = _archived_pages(args.archive_dir, args.pages)
+        source = f"archive {args.archive_dir}"
+    else:
+        pages = _synthetic_pages(args.pages, args.hosts)
+        source = f"synthetic, {args.hosts} hosts"
+    corpus = [(url, BeautifulSoup(html, "html.parser"), html) for url, html in pages]
+
+    extractor = ContentExtractor()
+    cold, cold_seconds = _run(extractor, corpus, warm=False)
+    warm, warm_seconds = _run(extractor, corpus, warm=True)
+    cache = parse_cache_info()
+    hosts = {urlparse(url).netloc.lower() for url, _, _ in corpus}
+    learned = sum(bool(extractor.date_strategies.winner(host)) for host in hosts)
+
+    pages_count = len(corpus)
+    agree = sum(a == b for a, b in zip(cold, warm, strict=True))
+    print(f"corpus                {pages_count} pages ({source})")
+    print(f"dates found           {sum(bool(value) for value in warm)}")
+    print(f"cold                  {cold_seconds / pages_count * 1e3:.3f} ms/page")
+    print(
+        f"warm                  {warm_seconds / pages_count * 1e3:.3f} ms/page "
+        f"({cold_seconds / warm_seconds:.2f}x)"
+    )
+    print(
+        f"parse cache           {cache.hits / max(1, cache.hits + cache.misses):.1%} "
+        "hits (warm)"
+    )
+    print(f"learned strategies    {learned}/{len(hosts)} hosts")
+    print(f"cold/warm agreement   {agree / pages_count:.2%}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
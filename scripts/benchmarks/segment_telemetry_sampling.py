@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Measure segment-detection telemetry volume at different rejection sample rates.
+
+Builds ``--articles`` synthetic articles for one domain in which many
+sentence fragments recur across a few articles each (so most rough
+candidates are rejected on boundary score), then for each
+``--sample-rates`` value runs the balanced cleaner's rough-candidate and
+boundary-filter stages inside a telemetry session and writes the session to
+a temporary SQLite telemetry database. Reports the segment rows kept, the
+serialized payload size, the runtime and the database size. A rate of 1.0
+records every rejection, as the cleaner did before sampling.
+
+Usage:
+    python scripts/benchmarks/segment_telemetry_sampling.py --articles 3000 \\
+        --sample-rates 1.0 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.telemetry.store import TelemetryStore  # noqa: E402
+from src.utils.content_cleaner_balanced import (  # noqa: E402
+    BalancedBoundaryContentCleaner,
+)
+from src.utils.content_cleaning_telemetry import ContentCleaningTelemetry  # noqa: E402
+
+DOMAIN = "bench.example.com"
+WORDS = (
+    "county council road budget hearing school board vote library hours "
+    "weather storm river festival parade hospital clinic sheriff office"
+).split()
+BOILERPLATE = "Subscribe to our newsletter for the latest local headlines."
+
+
+def _articles(count: int, rng: random.Random) -> list[dict]:
+    # Shared lowercase fragments score poorly on boundaries, so each one
+    # becomes a rejected candidate
+    fragments = [
+        f"and the {' '.join(rng.choices(WORDS, k=8))} item {index}."
+        for index in range(max(count // 2, 12))
+    ]
+    articles = []
+    for index in range(count):
+        sentences = [
+            " ".join(rng.choices(WORDS, k=14)).capitalize() + "." for _ in range(6)
+        ]
+        sentences += rng.sample(fragments, 12)
+        rng.shuffle(sentences)
+        sentences.append(BOILERPLATE)
+        articles.append({"id": index, "content": " ".join(sentences)})
+    return articles
+
+
+def _run(articles: list[dict], sample_rate: float, workdir: str) -> dict:
+    db_path = os.path.join(workdir, f"telemetry-{sample_rate}.db")
+    cleaner = BalancedBoundaryContentCleaner(enable_telemetry=True)
+    cleaner.telemetry = ContentCleaningTelemetry(
+        store=TelemetryStore(f"sqlite:///{db_path}", async_writes=False),
+        rejected_segment_sample_rate=sample_rate,
+    )
+    telemetry = cleaner.telemetry
+
+    started = time.perf_counter()
+    telemetry_id = telemetry.start_cleaning_session(DOMAIN, len(articles))
+    candidates = cleaner._find_rough_candidates(articles)
+    segments = cleaner._filter_with_balanced_boundaries(
+        articles, candidates, 3, telemetry_id
+    )
+    payload_bytes = len(json.dumps(telemetry._build_payload_snapshot(), default=str))
+    rows = len(telemetry.detected_segments)
+    detections = sum(c["detection_count"] for c in telemetry.segment_counts.values())
+    telemetry.finalize_cleaning_session(
+        rough_candidates_found=len(candidates),
+        segments_detected=len(segments),
+        total_removable_chars=sum(len(s["text"]) for s in segments),
+        removal_percentage=0.0,
+    )
+    elapsed = time.perf_counter() - started
+    return {
+        "detections": detections,
+        "rows": rows,
+        "payload_kb": payload_bytes / 1024,
+        "seconds": elapsed,
+        "db_kb": os.path.getsize(db_path) / 1024,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--articles", type=int, default=3000)
+    parser.add_argument("--sample-rates", type=float, nargs="+", default=[1.0, 0.01])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    articles = _articles(args.articles, random.Random(args.seed))
+    print(
+        f"{'rate':>6}{'detections':>12}{'rows kept':>11}{'payload KB':>12}"
+        f"{'seconds':>9}{'db KB':>9}"
+    )
+    with tempfile.TemporaryDirectory() as workdir:
+        for rate in args.sample_rates:
+            stats = _run(articles, rate, workdir)
+            print(
+                f"{rate:>6}{stats['detections']:>12}{stats['rows']:>11}"
+                f"{stats['payload_kb']:>12.0f}{stats['seconds']:>9.2f}"
+                f"{stats['db_kb']:>9.0f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Compare inline Selenium fallback with the pooled fallback queue.
+
+Serves ``--pages`` synthetic articles from a local HTTP server, of which
+``--js-share`` are JavaScript shells that only have content once rendered
+by a browser. A fake WebDriver stands in for Chrome and sleeps
+``--render-delay`` seconds per page. The inline run calls
+``ContentExtractor.extract_content`` for every page, rendering shells on
+the single persistent driver; the pooled run calls ``submit_extraction``
+with a ``--pool-size`` browser pool so the HTTP pages keep flowing while
+shells render in the background. Reports wall time and how long the
+HTTP-only pages took to come back.
+
+Usage:
+    python scripts/benchmarks/selenium_pool_mixed.py --pages 100 \\
+        --js-share 0.2 --render-delay 0.5 --pool-size 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import src.crawler as crawler_module  # noqa: E402
+from src.crawler import ContentExtractor  # noqa: E402
+
+BODY = " ".join(["The council approved the budget after a public hearing."] * 10)
+ARTICLE = (
+    "<html><head><title>Budget approved</title>"
+    '<meta name="author" content="Jane Reporter">'
+    '<meta property="article:published_time" content="2025-01-15T10:00:00">'
+    f"</head><body><article><h1>Budget approved</h1><p>{BODY}</p>"
+    f"<p>{BODY}</p></article></body></html>"
+)
+SHELL = "<html><head></head><body><div id='app'></div></body></html>"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802 - http.server API
+        rendered = "rendered=1" in self.path or not self.path.startswith("/js/")
+        body = (ARTICLE if rendered else SHELL).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+class _FakeDriver:
+    def __init__(self, render_delay: float):
+        self.render_delay = render_delay
+        self.page_source = ""
+
+    def get(self, url):
+        time.sleep(self.render_delay)
+        separator = "&" if "?" in url else "?"
+        with urllib.request.urlopen(f"{url}{separator}rendered=1") as response:
+            self.page_source = response.read().decode()
+
+    def find_element(self, *_args):
+        return object()
+
+    def find_elements(self, *_args):
+        return []
+
+    def execute_script(self, *_args):
+        return None
+
+    def quit(self):
+        pass
+
+
+def _fetch(url: str) -> str:
+    with urllib.request.urlopen(url) as response:
+        return response.read().decode()
+
+
+def _run_inline(urls, render_delay):
+    extractor = ContentExtractor()
+    driver = _FakeDriver(render_delay)
+    extractor.get_persistent_driver = lambda: driver
+    http_latency = []
+    started = time.perf_counter()
+    for url in urls:
+        page_started = time.perf_counter()
+        result = extractor.extract_content(url, html=_fetch(url))
+        if "/js/" not in url:
+            http_latency.append(time.perf_counter() - page_started)
+        assert result.get("content"), url
+    return time.perf_counter() - started, http_latency
+
+
+def _run_pooled(urls, render_delay, pool_size):
+    extractor = ContentExtractor()
+    extractor.enable_browser_pool(
+        pool_size, driver_factory=lambda: _FakeDriver(render_delay)
+    )
+    http_latency = []
+    futures = []
+    started = time.perf_counter()
+    try:
+        for url in urls:
+            page_started = time.perf_counter()
+            future = extractor.submit_extraction(url, html=_fetch(url))
+            if future.done():
+                http_latency.append(time.perf_counter() - page_started)
+            futures.append((url, future))
+        for url, future in futures:
+            assert future.result().get("content"), url
+        elapsed = time.perf_counter() - started
+    finally:
+        extractor.close_browser_pool()
+    return elapsed, http_latency
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--js-share", type=float, default=0.2)
+    parser.add_argument("--render-delay", type=float, default=0.5)
+    parser.add_argument("--pool-size", type=int, default=2)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    crawler_module.SELENIUM_AVAILABLE = True
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    every = max(1, round(1 / args.js_share)) if args.js_share > 0 else 0
+    urls = [
+        f"{base}/{'js' if every and index % every == 0 else 'news'}/story-{index}"
+        for index in range(args.pages)
+    ]
+
+    print(f"{'mode':<10}{'seconds':>10}{'pages/s':>10}{'http p50 ms':>13}")
+    try:
+        for mode, run in (
+            ("inline", lambda: _run_inline(urls, args.render_delay)),
+            (
+                "pooled",
+                lambda: _run_pooled(urls, args.render_delay, args.pool_size),
+            ),
+        ):
+            elapsed, latency = run()
+            print(
+                f"{mode:<10}{elapsed:>10.2f}{len(urls) / elapsed:>10.1f}"
+                f"{statistics.median(latency) * 1000:>13.1f}"
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
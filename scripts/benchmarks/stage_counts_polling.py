@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Compare exact COUNT(*) polling with trigger-maintained stage counters.
+
+Seeds ``--links`` candidate links (half verified, half of those extracted) into a
+temporary SQLite database, or uses ``--database-url``, then times
+``StageCounter.exact_counts()`` (what the continuous processor ran every
+cycle) against the counter-table read used when the triggers are
+installed. On PostgreSQL with the ``add_pipeline_stage_counts`` migration
+applied it also measures how long an idle processor takes to notice a
+newly discovered link via ``LISTEN pipeline_work``; elsewhere that column
+is reported as n/a.
+
+Usage:
+    python scripts/benchmarks/stage_counts_polling.py --links 50000 \\
+        --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import text  # noqa: E402
+
+from src.models import Article, CandidateLink  # noqa: E402
+from src.models.database import DatabaseManager  # noqa: E402
+from src.services.stage_counts import StageCounter  # noqa: E402
+
+
+def _seed(db: DatabaseManager, count: int) -> None:
+    now = datetime.utcnow()
+    with db.get_session() as session:
+        for start in range(0, count, 1000):
+            links = [
+                CandidateLink(
+                    id=str(uuid.uuid4()),
+                    url=f"https://bench.example.com/story-{index}",
+                    source="Bench",
+                    status=("discovered", "article")[index % 2],
+                    discovered_at=now,
+                )
+                for index in range(start, min(start + 1000, count))
+            ]
+            session.add_all(links)
+            session.add_all(
+                Article(
+                    candidate_link_id=link.id,
+                    url=link.url,
+                    content="Body",
+                    status="extracted",
+                )
+                for link in links[1::4]
+            )
+            session.commit()
+
+
+def _time(func, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def _wakeup_latency(db: DatabaseManager, counter: StageCounter) -> float:
+    counter.wait_for_work(0)  # open the LISTEN connection
+
+    def discover():
+        time.sleep(0.2)
+        with db.engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO candidate_links (id, url, source, status) "
+                    "VALUES (:id, :url, 'Bench', 'discovered')"
+                ),
+                {"id": str(uuid.uuid4()), "url": f"https://bench/{uuid.uuid4()}"},
+            )
+        committed.append(time.perf_counter())
+
+    committed: list[float] = []
+    thread = threading.Thread(target=discover)
+    thread.start()
+    woke = counter.wait_for_work(10)
+    noticed = time.perf_counter()
+    thread.join()
+    return (noticed - committed[0]) * 1000 if woke and committed else float("nan")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--links", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--database-url",
+        help="Existing database to measure instead of a seeded SQLite file",
+    )
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(args.database_url or f"sqlite:///{tmp}/bench.db")
+        if not args.database_url:
+            _seed(db, args.links)
+        counter = StageCounter(db)
+        live_triggers = counter.mode == "triggers"
+        if not live_triggers:
+            # Exercise the counter read path without triggers or LISTEN
+            counter._mode = "triggers"
+            counter._listener = object()
+        counter.reconcile()
+
+        poll_ms = _time(counter.exact_counts, args.repeat)
+        counter_ms = _time(counter.get_counts, args.repeat)
+        latency = f"{_wakeup_latency(db, counter):.1f}" if live_triggers else "n/a"
+        if live_triggers:
+            counter.close()
+        db.close()
+
+    print(f"{'dialect':<12}{'poll ms':>10}{'counter ms':>12}{'wake-up ms':>12}")
+    print(
+        f"{db.engine.dialect.name:<12}{poll_ms:>10.2f}"
+        f"{counter_ms:>12.2f}{latency:>12}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
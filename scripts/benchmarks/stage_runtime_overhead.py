@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Compare subprocess-per-cycle and warm stage workers for pipeline steps.
+
+Seeds ``--articles`` extracted articles into a temporary SQLite database
+and drains them with ``clean-articles --limit <batch>`` cycles, first by
+forking ``python -m src.cli.cli_modular`` per cycle (the continuous
+processor's default) and then through a warm ``StageWorker``. Reports the
+per-cycle overhead of an empty cycle and steady-state articles/minute.
+Command output is discarded in both modes.
+
+Usage:
+    python scripts/benchmarks/stage_runtime_overhead.py --articles 400 \\
+        --batch 20 --idle-cycles 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from sqlalchemy import text  # noqa: E402
+
+from orchestration.stage_runtime import (  # noqa: E402
+    StageWorker,
+    run_cli_in_process,
+)
+from src.models import Article, CandidateLink  # noqa: E402
+from src.models.database import DatabaseManager  # noqa: E402
+
+CLI_MODULE = "src.cli.cli_modular"
+BODY = (
+    "County commissioners approved the budget on Tuesday.\n\n"
+    "Subscribe to our newsletter for more local news.\n\n"
+    "The vote was 3-0 after a short public hearing."
+)
+
+
+def quiet_runner(command) -> int:
+    """Run a CLI command in-process with its console output discarded."""
+    logging.disable(logging.CRITICAL)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return run_cli_in_process(command)
+
+
+def _seed(database_url: str, count: int) -> None:
+    db = DatabaseManager(database_url)
+    with db.get_session() as session:
+        session.query(Article).delete()
+        session.query(CandidateLink).delete()
+        for index in range(count):
+            link = CandidateLink(
+                url=f"https://example.com/news/story-{index}",
+                source="Example Gazette",
+                source_name="Example Gazette",
+                status="article",
+                discovered_at=datetime.utcnow(),
+            )
+            session.add(link)
+            session.flush()
+            session.add(
+                Article(
+                    candidate_link_id=link.id,
+                    url=link.url,
+                    title=f"Story {index}",
+                    content=BODY,
+                    status="extracted",
+                    extracted_at=datetime.utcnow(),
+                )
+            )
+        session.commit()
+    db.close()
+
+
+def _pending(database_url: str) -> int:
+    db = DatabaseManager(database_url)
+    with db.get_session() as session:
+        count = session.execute(
+            text("SELECT COUNT(*) FROM articles WHERE status = 'extracted'")
+        ).scalar()
+    db.close()
+    return int(count or 0)
+
+
+def _subprocess_cycle(command: list[str]) -> None:
+    subprocess.run(
+        [sys.executable, "-m", CLI_MODULE, *command],
+        cwd=os.getcwd(),
+        env=os.environ.copy(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+
+
+def _measure(run_cycle, args, database_url: str) -> tuple[float, float]:
+    command = ["clean-articles", "--limit", str(args.batch), "--status", "extracted"]
+
+    _seed(database_url, args.articles)
+    started = time.perf_counter()
+    while _pending(database_url):
+        run_cycle(command)
+    drain_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(args.idle_cycles):
+        run_cycle(command)
+    idle_seconds = (time.perf_counter() - started) / args.idle_cycles
+
+    return idle_seconds, args.articles / drain_seconds * 60
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--articles", type=int, default=400)
+    parser.add_argument("--batch", type=int, default=20)
+    parser.add_argument("--idle-cycles", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{tmp}/bench.db"
+        os.environ["DATABASE_URL"] = database_url
+        os.environ["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [str(REPO_ROOT), os.environ.get("PYTHONPATH")])
+        )
+        # CLI commands write crawler.log into the working directory
+        os.chdir(tmp)
+
+        print(f"{'mode':<12}{'s/empty cycle':>15}{'articles/min':>15}")
+        idle, rate = _measure(_subprocess_cycle, args, database_url)
+        print(f"{'subprocess':<12}{idle:>15.3f}{rate:>15.0f}")
+
+        worker = StageWorker("cleaning", runner=quiet_runner)
+        try:
+            worker.start()
+            worker.run(["clean-articles", "--limit", "0"])  # warm-up
+            idle, rate = _measure(worker.run, args, database_url)
+        finally:
+            worker.stop()
+        print(f"{'warm worker':<12}{idle:>15.3f}{rate:>15.0f}")
+        os.chdir(REPO_ROOT)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
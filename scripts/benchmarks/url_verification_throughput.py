@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark URLVerificationService.process_batch throughput (URLs/sec).
+
+Runs the same synthetic candidate batch twice against a seeded SQLite
+database: once with ``wire_pattern_refresh_seconds=0`` (patterns reloaded
+from the database for every URL, the old per-call behaviour) and once with
+the shared compiled matcher. Status writes are stubbed out so the numbers
+reflect screening and StorySniffer cost only.
+
+Usage:
+    python scripts/benchmarks/url_verification_throughput.py --urls 5000 \\
+        --wire-fraction 0.2 --non-article-fraction 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.models import WireService  # noqa: E402
+from src.models.database import DatabaseManager  # noqa: E402
+from src.services import url_verification  # noqa: E402
+
+WIRE_URL_PATTERNS = [
+    (r"/ap-", "Associated Press"),
+    (r"/stacker/", "Stacker"),
+    (r"/reuters-", "Reuters"),
+    (r"/national/", "National Section"),
+    (r"/world/", "Wire Service"),
+    (r"/cnn-", "CNN"),
+    (r"/states-newsroom/", "States Newsroom"),
+    (r"/kff-health-news/", "KFF Health News"),
+]
+
+
+def _seed(database_url: str) -> None:
+    db = DatabaseManager(database_url)
+    with db.get_session() as session:
+        session.query(WireService).delete()
+        for priority, (pattern, name) in enumerate(WIRE_URL_PATTERNS):
+            session.add(
+                WireService(
+                    service_name=name,
+                    pattern=pattern,
+                    pattern_type="url",
+                    case_sensitive=False,
+                    priority=priority,
+                    active=True,
+                )
+            )
+        session.commit()
+
+
+def _candidates(count: int, wire_fraction: float, non_article_fraction: float):
+    rng = random.Random(29)
+    wire_paths = [pattern.strip("/") for pattern, _ in WIRE_URL_PATTERNS]
+    candidates = []
+    for index in range(count):
+        roll = rng.random()
+        if roll < wire_fraction:
+            path = f"/{rng.choice(wire_paths)}/story-{index}"
+        elif roll < wire_fraction + non_article_fraction:
+            path = rng.choice(["/photo-gallery/", "/category/", "/tag/"])
+            path += f"item-{index}"
+        else:
+            path = f"/news/local/2024/05/{index}/county-board-approves-budget"
+        candidates.append({"id": str(index), "url": f"https://example.com{path}"})
+    return candidates
+
+
+def _run(refresh: float, candidates, fake_sniffer: bool):
+    service = url_verification.URLVerificationService(
+        batch_size=len(candidates),
+        run_http_precheck=False,
+        telemetry_tracker=SimpleNamespace(),
+        wire_pattern_refresh_seconds=refresh,
+    )
+    service.update_candidate_status = lambda *_args, **_kwargs: None
+    if fake_sniffer:
+        service.sniffer = SimpleNamespace(guess=lambda url: "/news/" in url)
+
+    started = time.perf_counter()
+    metrics = service.process_batch(candidates)
+    elapsed = time.perf_counter() - started
+    return metrics, elapsed, service.wire_matcher.loads
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--urls", type=int, default=2000)
+    parser.add_argument("--wire-fraction", type=float, default=0.2)
+    parser.add_argument("--non-article-fraction", type=float, default=0.2)
+    parser.add_argument(
+        "--database-url",
+        help="Database to seed wire patterns into (default: temp SQLite file)",
+    )
+    parser.add_argument(
+        "--fake-sniffer",
+        action="store_true",
+        help="Replace StorySniffer with a trivial heuristic",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{tmp}/bench.db"
+        # URLVerificationService builds its own DatabaseManager from the env
+        os.environ["DATABASE_URL"] = database_url
+        _seed(database_url)
+        candidates = _candidates(
+            args.urls, args.wire_fraction, args.non_article_fraction
+        )
+
+        print(f"{'mode':<22}{'urls/sec':>12}{'pattern loads':>16}{'processed':>11}")
+        for label, refresh in (("per-URL reload", 0.0), ("shared matcher", 300.0)):
+            metrics, elapsed, loads = _run(refresh, candidates, args.fake_sniffer)
+            rate = metrics["total_processed"] / elapsed if elapsed else 0.0
+            print(
+                f"{label:<22}{rate:>12.1f}{loads:>16}{metrics['total_processed']:>11}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark LocalVectorStore query latency at 100k and 1M vectors.
+
+Builds a store of random unit vectors (with planted near-duplicates) in a
+temporary directory, then reports p50/p95 query latency for brute-force
+search and for the IVF index, plus IVF recall@10 against brute force.
+
+Usage:
+    python scripts/benchmarks/vector_store_query_latency.py \\
+        --sizes 100000 1000000 --dim 384 --dtype float16 --queries 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.services.llm.local_vectorstore import LocalVectorStore  # noqa: E402
+
+
+def _percentiles(samples: list[float]) -> tuple[float, float]:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return statistics.median(ordered) * 1000, p95 * 1000
+
+
+def _time_queries(store, queries, **kwargs) -> tuple[list[float], list[list[str]]]:
+    latencies: list[float] = []
+    results: list[list[str]] = []
+    for query in queries:
+        started = time.perf_counter()
+        hits = store.search(query, k=10, **kwargs)
+        latencies.append(time.perf_counter() - started)
+        results.append([hit.id for hit in hits])
+    return latencies, results
+
+
+def run(size: int, args) -> None:
+    rng = np.random.default_rng(42)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = LocalVectorStore(
+            tmp,
+            dim=args.dim,
+            dtype=args.dtype,
+            flush_rows=args.segment_rows,
+        )
+        started = time.perf_counter()
+        for start in range(0, size, args.segment_rows):
+            rows = min(args.segment_rows, size - start)
+            vectors = rng.normal(size=(rows, args.dim)).astype(np.float32)
+            store.add([f"v{start + i}" for i in range(rows)], vectors)
+        store.flush()
+        ingest = time.perf_counter() - started
+
+        # Queries are perturbed copies of stored vectors (near-duplicates)
+        sample_ids = rng.choice(size, size=args.queries, replace=False)
+        queries = [
+            store.get_vector(f"v{i}") + rng.normal(scale=0.05, size=args.dim)
+            for i in sample_ids
+        ]
+
+        brute_lat, brute_hits = _time_queries(store, queries)
+
+        started = time.perf_counter()
+        store.build_ivf(nlist=args.nlist or None)
+        build = time.perf_counter() - started
+        ivf_lat, ivf_hits = _time_queries(store, queries, nprobe=args.nprobe)
+
+        recall = np.mean(
+            [
+                len(set(a) & set(b)) / len(a)
+                for a, b in zip(brute_hits, ivf_hits, strict=True)
+                if a
+            ]
+        )
+        b50, b95 = _percentiles(brute_lat)
+        i50, i95 = _percentiles(ivf_lat)
+        print(
+            f"\n{size:,} vectors (dim={args.dim}, {args.dtype}): "
+            f"ingest {size / ingest:,.0f} vec/s, IVF build {build:.1f}s"
+        )
+        print(f"  brute force  p50 {b50:8.2f} ms  p95 {b95:8.2f} ms")
+        print(
+            f"  IVF nprobe={args.nprobe:<3} p50 {i50:8.2f} ms  p95 {i95:8.2f} ms  "
+            f"recall@10 {recall:.3f}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--dtype", choices=["float32", "float16"], default="float16")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--segment-rows", type=int, default=65_536)
+    parser.add_argument("--nlist", type=int, default=0)
+    parser.add_argument("--nprobe", type=int, default=16)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run(size, args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
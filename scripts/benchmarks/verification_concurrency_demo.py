@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Demonstrate concurrent URL verification against a local stand-in HTTP server.
+
+Starts a threaded HTTP server that answers HEAD/GET after a fixed latency,
+spreads candidate URLs across several loopback hosts (127.0.0.1,
+127.0.0.2, ...), seeds them into a temporary SQLite database and runs
+``URLVerificationService.run_verification_loop`` with HTTP pre-checks
+enabled: once sequentially and once per ``--concurrency`` value. Statuses
+are reset between runs and the per-status counts are printed so the modes
+can be checked for identical outcomes.
+
+Usage:
+    python scripts/benchmarks/verification_concurrency_demo.py --urls 300 \\
+        --latency 0.05 --hosts 4 --concurrency 8 32 --per-host 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import text  # noqa: E402
+
+from src.models import CandidateLink  # noqa: E402
+from src.models.database import DatabaseManager  # noqa: E402
+from src.services import url_verification  # noqa: E402
+
+# Bound before _run() stubs out time.sleep for the inter-batch pause
+_server_sleep = time.sleep
+
+
+def _handler(latency: float):
+    class StandInHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _respond(self, body: bool) -> None:
+            _server_sleep(latency)
+            status = 404 if "missing" in self.path else 200
+            payload = b"<html><body>stand-in</body></html>"
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            if body:
+                self.wfile.write(payload)
+
+        def do_HEAD(self) -> None:  # noqa: N802
+            self._respond(body=False)
+
+        def do_GET(self) -> None:  # noqa: N802
+            self._respond(body=True)
+
+        def log_message(self, *_args) -> None:
+            return None
+
+    return StandInHandler
+
+
+def _seed(db: DatabaseManager, urls: list[str]) -> None:
+    with db.get_session() as session:
+        session.query(CandidateLink).delete()
+        for url in urls:
+            session.add(
+                CandidateLink(
+                    url=url,
+                    source="Stand-in News",
+                    source_name="Stand-in News",
+                    status="discovered",
+                    discovered_at=datetime.utcnow(),
+                )
+            )
+        session.commit()
+
+
+def _reset(db: DatabaseManager) -> None:
+    with db.engine.begin() as conn:
+        conn.execute(
+            text(
+                "UPDATE candidate_links SET status = 'discovered', "
+                "processed_at = NULL, error_message = NULL"
+            )
+        )
+
+
+def _status_counts(db: DatabaseManager) -> Counter:
+    with db.engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT status, COUNT(*) FROM candidate_links GROUP BY status")
+        )
+        return Counter({status: count for status, count in rows})
+
+
+def _run(args, concurrency: int | None) -> tuple[float, Counter]:
+    service = url_verification.URLVerificationService(
+        batch_size=args.batch_size,
+        sleep_interval=0,
+        run_http_precheck=True,
+        http_timeout=5.0,
+        http_retry_attempts=1,
+        telemetry_tracker=SimpleNamespace(
+            record_verification_batch=lambda **_kwargs: None
+        ),
+    )
+    service.http_session.trust_env = False
+    service.http_session.proxies.clear()
+    _reset(service.db)
+
+    original_sleep = url_verification.time.sleep
+    url_verification.time.sleep = lambda *_args: None  # skip inter-batch pause
+    try:
+        started = time.perf_counter()
+        service.run_verification_loop(
+            exit_on_idle=True,
+            concurrency=concurrency,
+            per_host_concurrency=args.per_host,
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        url_verification.time.sleep = original_sleep
+    return elapsed, _status_counts(service.db)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--urls", type=int, default=200)
+    parser.add_argument("--hosts", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8, 32])
+    parser.add_argument("--per-host", type=int, default=4)
+    parser.add_argument("--missing-fraction", type=float, default=0.1)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    server = ThreadingHTTPServer(("", 0), _handler(args.latency))
+    server.daemon_threads = True
+    port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    missing_every = (
+        max(1, round(1 / args.missing_fraction)) if args.missing_fraction else 0
+    )
+    urls = []
+    for index in range(args.urls):
+        host = f"127.0.0.{index % args.hosts + 1}:{port}"
+        slug = "missing" if missing_every and index % missing_every == 0 else "story"
+        urls.append(f"http://{host}/news/local/{slug}-county-update-{index}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite:///{tmp}/demo.db"
+        _seed(DatabaseManager(), urls)
+
+        print(
+            f"{args.urls} URLs over {args.hosts} hosts, "
+            f"{args.latency * 1000:.0f}ms server latency"
+        )
+        print(f"{'mode':<20}{'seconds':>10}{'urls/sec':>10}  statuses")
+        modes: list[tuple[str, int | None]] = [("sequential", None)]
+        modes += [(f"concurrent x{c}", c) for c in args.concurrency]
+        for label, concurrency in modes:
+            elapsed, counts = _run(args, concurrency)
+            rate = args.urls / elapsed if elapsed else 0.0
+            statuses = dict(sorted(counts.items()))
+            print(f"{label:<20}{elapsed:>10.2f}{rate:>10.1f}  {statuses}")
+
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
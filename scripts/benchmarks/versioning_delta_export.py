@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Compare full and delta dataset snapshot exports.
+
+Seeds ``--rows`` article-like rows (id, url, title, status, text excerpt,
+updated_at) into a temporary SQLite database, exports a watermarked full
+snapshot, touches ``--changed`` of the rows and then times a second full
+export against a delta export of the same version chain, plus compacting
+the base and delta into a new base.
+
+Usage:
+    python scripts/benchmarks/versioning_delta_export.py --rows 2000000 \\
+        --changed 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.models.versioning import (  # noqa: E402
+    compact_dataset_version,
+    create_dataset_version,
+    create_versioning_tables,
+    export_delta_snapshot_for_version,
+    export_snapshot_for_version,
+)
+
+TABLE = "bench_articles"
+EXCERPT = (
+    "County commissioners approved the road budget after a public hearing "
+    "on Tuesday, sending the plan to the state for review. "
+)
+
+
+def _seed(db_path: str, rows: int) -> None:
+    start = datetime(2025, 1, 1)
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        f"CREATE TABLE {TABLE} (id TEXT PRIMARY KEY, url TEXT, title TEXT, "
+        "status TEXT, text_excerpt TEXT, updated_at DATETIME)"
+    )
+    conn.executemany(
+        f"INSERT INTO {TABLE} VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            (
+                f"article-{index}",
+                f"https://news.example.com/{index % 400}/story-{index}",
+                f"Story number {index}",
+                "extracted" if index % 7 else "wire",
+                EXCERPT,
+                (start + timedelta(seconds=index)).strftime("%Y-%m-%d %H:%M:%S.%f"),
+            )
+            for index in range(rows)
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _touch(db_path: str, rows: int, fraction: float) -> int:
+    step = max(1, round(1 / fraction)) if fraction else rows + 1
+    changed_at = datetime(2026, 1, 1).strftime("%Y-%m-%d %H:%M:%S.%f")
+    conn = sqlite3.connect(db_path)
+    cursor = conn.executemany(
+        f"UPDATE {TABLE} SET status = 'labeled', updated_at = ? WHERE id = ?",
+        ((changed_at, f"article-{index}") for index in range(0, rows, step)),
+    )
+    conn.commit()
+    changed = cursor.rowcount
+    conn.close()
+    return changed
+
+
+def _timed(label: str, func, *args, **kwargs) -> None:
+    started = time.perf_counter()
+    path = func(*args, **kwargs)
+    elapsed = time.perf_counter() - started
+    size_mb = os.path.getsize(path) / 1_000_000
+    print(f"{label:<22}{elapsed:>10.2f}{size_mb:>12.1f}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--changed", type=float, default=0.01)
+    parser.add_argument("--chunksize", type=int, default=10_000)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, "bench.db")
+        db_url = f"sqlite:///{db_path}"
+        create_versioning_tables(db_url)
+        _seed(db_path, args.rows)
+
+        base = create_dataset_version(TABLE, "base", database_url=db_url)
+        print(f"{'export':<22}{'seconds':>10}{'size MB':>12}")
+        _timed(
+            "full (base)",
+            export_snapshot_for_version,
+            base.id,
+            TABLE,
+            os.path.join(workdir, "base.parquet"),
+            database_url=db_url,
+            chunksize=args.chunksize,
+            change_column="updated_at",
+        )
+
+        changed = _touch(db_path, args.rows, args.changed)
+
+        full = create_dataset_version(TABLE, "full", database_url=db_url)
+        _timed(
+            "full (after changes)",
+            export_snapshot_for_version,
+            full.id,
+            TABLE,
+            os.path.join(workdir, "full.parquet"),
+            database_url=db_url,
+            chunksize=args.chunksize,
+        )
+
+        delta = create_dataset_version(
+            TABLE, "delta", parent_version=base.id, database_url=db_url
+        )
+        _timed(
+            f"delta ({changed} rows)",
+            export_delta_snapshot_for_version,
+            delta.id,
+            TABLE,
+            os.path.join(workdir, "delta.parquet"),
+            database_url=db_url,
+            chunksize=args.chunksize,
+        )
+        _timed(
+            "compact base + delta",
+            compact_dataset_version,
+            delta.id,
+            os.path.join(workdir, "compacted.parquet"),
+            database_url=db_url,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
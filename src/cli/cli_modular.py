@@ -28,6 +28,7 @@ COMMAND_HANDLER_ATTRS: dict[str, str] = {
     "discovery-status": "handle_discovery_status_command",
     "extract": "handle_extraction_command",
     "extract-entities": "handle_entity_extraction_command",
+    "reextract": "handle_reextraction_command",
     "clean-articles": "handle_cleaning_command",
     "cleanup-candidates": "handle_cleanup_candidates_command",
     "housekeeping": "handle_housekeeping_command",
@@ -43,6 +44,8 @@ COMMAND_HANDLER_ATTRS: dict[str, str] = {
     "list-versions": "handle_list_versions_command",
     "export-version": "handle_export_version_command",
     "export-snapshot": "handle_export_snapshot_command",
+    "export-delta": "handle_export_delta_command",
+    "compact-version": "handle_compact_version_command",
     "status": "handle_status_command",
     "queue": "handle_queue_command",
     "dump-http-status": "handle_http_status_command",
@@ -86,6 +89,7 @@ def _load_command_parser(command: str) -> tuple[Callable, Callable] | None:
         "discovery-status": "discovery_status",
         "extract": "extraction",
         "extract-entities": "entity_extraction",
+        "reextract": "reextraction",
         "clean-articles": "cleaning",
         "analyze": "analysis",
         "load-sources": "load_sources",
@@ -99,6 +103,8 @@ def _load_command_parser(command: str) -> tuple[Callable, Callable] | None:
         "list-versions": "versioning",
         "export-version": "versioning",
         "export-snapshot": "versioning",
+        "export-delta": "versioning",
+        "compact-version": "versioning",
         "status": "background_processes",
         "queue": "background_processes",
         "dump-http-status": "http_status",
@@ -13,6 +13,7 @@ from src.ml.article_classifier import ArticleClassifier
 from src.models import Article, ArticleLabel
 from src.models.database import DatabaseManager, safe_session_execute
 from src.services.classification_service import ArticleClassificationService
+from src.utils.stage_resources import stage_resource
 
 logger = logging.getLogger(__name__)
 
@@ -265,6 +266,14 @@ def add_analysis_parser(subparsers) -> None:
             "selected label version"
         ),
     )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help=(
+            "Claim id-only batches with SKIP LOCKED and prefetch the next "
+            "batch while the classifier runs"
+        ),
+    )
     parser.add_argument(
         "--report-path",
         help=(
@@ -294,7 +303,10 @@ def handle_analysis_command(args) -> int:
     collect_diff = bool(args.report_path)
 
     try:
-        classifier = ArticleClassifier(model_path=model_path)
+        classifier = stage_resource(
+            ("article_classifier", str(model_path)),
+            lambda: ArticleClassifier(model_path=model_path),
+        )
     except Exception as exc:  # pylint: disable=broad-except
         logger.exception("Failed to load classification model: %s", exc)
         return 1
@@ -311,7 +323,12 @@ def handle_analysis_command(args) -> int:
                 filtered_statuses,
             )
 
-        stats = service.apply_classification(
+        classify = (
+            service.apply_classification_streaming
+            if getattr(args, "streaming", False)
+            else service.apply_classification
+        )
+        stats = classify(
             classifier,
             label_version=label_version,
             model_version=args.model_version,
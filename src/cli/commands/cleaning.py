@@ -15,6 +15,7 @@ from src.models.database import (
     safe_session_execute,
 )
 from src.utils.content_cleaner_balanced import BalancedBoundaryContentCleaner
+from src.utils.stage_resources import stage_resource
 
 logger = logging.getLogger(__name__)
 
@@ -68,7 +69,10 @@ def handle_cleaning_command(args) -> int:
     print(f"   Statuses: {', '.join(statuses)}")
     print()
 
-    cleaner = BalancedBoundaryContentCleaner(enable_telemetry=True)
+    cleaner = stage_resource(
+        "balanced_cleaner",
+        lambda: BalancedBoundaryContentCleaner(enable_telemetry=True),
+    )
     db = DatabaseManager()
 
     processed = 0
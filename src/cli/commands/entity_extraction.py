@@ -14,7 +14,7 @@ from sqlalchemy import text as sql_text
 from src.models.database import (
     DatabaseManager,
     safe_session_execute,
-    save_article_entities,
+    save_article_entities_bulk,
 )
 from src.pipeline.entity_extraction import (
     ArticleEntityExtractor,
@@ -90,7 +90,7 @@ def handle_entity_extraction_command(args, extractor=None) -> int:
             # -----------------------------
             # - FOR UPDATE SKIP LOCKED locks all selected articles
             # - Articles processed source-by-source (for gazetteer efficiency)
-            # - save_article_entities(autocommit=False) used per article
+            # - Entities for a source are saved with one bulk delete/insert
             # - Batch commit after each source releases locks together
             # - Other workers skip locked articles, grab different ones
             # - EXISTS check prevents re-processing on subsequent runs
@@ -182,6 +182,7 @@ def handle_entity_extraction_command(args, extractor=None) -> int:
                 )
                 log_and_print(f"   Loaded {len(gazetteer_rows)} gazetteer entries")
 
+                pending = []
                 for article_id, text, text_hash, _ in articles:
                     try:
                         # Extract entities from article text
@@ -199,17 +200,7 @@ def handle_entity_extraction_command(args, extractor=None) -> int:
                             gazetteer_rows=gazetteer_rows,
                         )
 
-                        # Save entities without committing (batch commit below)
-                        save_article_entities(
-                            session,
-                            str(article_id),
-                            entities,
-                            extractor.extractor_version,
-                            text_hash,
-                            autocommit=False,
-                        )
-
-                        processed += 1
+                        pending.append((str(article_id), entities, text_hash))
 
                     except Exception as exc:
                         error_msg = (
@@ -225,6 +216,27 @@ def handle_entity_extraction_command(args, extractor=None) -> int:
                         errors += 1
                         session.rollback()
 
+                # Save entities for this source with set-based statements
+                if pending:
+                    try:
+                        save_article_entities_bulk(
+                            session,
+                            pending,
+                            extractor.extractor_version,
+                            autocommit=False,
+                        )
+                        processed += len(pending)
+                    except Exception as exc:
+                        log_and_print(
+                            f"Failed to save entities for {source_name}: {exc}",
+                            level="error",
+                        )
+                        logger.exception(
+                            "Failed to save entities for %s: %s", source_name, exc
+                        )
+                        errors += len(pending)
+                        session.rollback()
+
                 # Commit all entities for this source batch
                 session.commit()
 
@@ -13,8 +13,9 @@ import time
 import uuid
 from collections import defaultdict
 from collections.abc import Iterable
+from concurrent.futures import Future, as_completed
 from datetime import datetime
-from typing import Any
+from typing import Any, NamedTuple
 
 from sqlalchemy import text
 
@@ -26,7 +27,7 @@ from src.models.database import (
     _commit_with_retry,
     calculate_content_hash,
     safe_session_execute,
-    save_article_entities,
+    save_article_entities_bulk,
 )
 
 # Lazy import: entity_extraction only needed for entity-extraction command
@@ -44,6 +45,8 @@ from src.utils.comprehensive_telemetry import (
 )
 from src.utils.content_cleaner_balanced import BalancedBoundaryContentCleaner
 from src.utils.content_type_detector import ContentTypeDetector
+from src.utils.reference_data import get_reference_data_registry
+from src.utils.stage_resources import stage_resource
 
 # Domains known to return 403 for paywalled content (not bot blocking)
 # These should be marked as 403/failed but NOT trigger a domain-wide pause
@@ -60,6 +63,25 @@ WORK_QUEUE_URL = os.getenv(
 )
 USE_WORK_QUEUE = os.getenv("USE_WORK_QUEUE", "false").lower() == "true"
 
+# Selenium fallback pool (0 keeps rendering inline on the persistent driver)
+SELENIUM_POOL_SIZE = int(os.getenv("SELENIUM_POOL_SIZE", "0"))
+SELENIUM_MAX_PAGES_PER_DRIVER = int(os.getenv("SELENIUM_MAX_PAGES_PER_DRIVER", "50"))
+SELENIUM_MAX_DRIVER_MEMORY_MB = float(os.getenv("SELENIUM_MAX_DRIVER_MEMORY_MB", "0"))
+# Learn per host whether to run BeautifulSoup before newspaper4k
+EXTRACTION_STRATEGY_ROUTING = (
+    os.getenv("EXTRACTION_STRATEGY_ROUTING", "true").lower() == "true"
+)
+
+
+class _DeferredExtraction(NamedTuple):
+    """An article waiting on the Selenium fallback queue."""
+
+    row: tuple
+    domain: str
+    article_id: str
+    metrics: ExtractionMetrics
+    future: Future
+
 
 class _PlaceholderNotFoundError(Exception):
     """Fallback exception until crawler dependencies are loaded."""
@@ -232,6 +254,7 @@ def _to_int(value, default=0):
 
 _ENTITY_EXTRACTOR: Any = None  # ArticleEntityExtractor lazy loaded
 _CONTENT_TYPE_DETECTOR: ContentTypeDetector | None = None
+_NEAR_DUPLICATE_INDEX: Any = None  # NearDuplicateIndex lazy loaded
 
 
 def _get_entity_extractor() -> Any:  # Returns ArticleEntityExtractor
@@ -251,6 +274,46 @@ def _get_content_type_detector() -> ContentTypeDetector:
     return _CONTENT_TYPE_DETECTOR
 
 
+def _get_near_duplicate_index() -> Any:  # Returns NearDuplicateIndex
+    global _NEAR_DUPLICATE_INDEX
+    if _NEAR_DUPLICATE_INDEX is None:
+        from src.pipeline.near_duplicates import NearDuplicateIndex
+
+        _NEAR_DUPLICATE_INDEX = NearDuplicateIndex()
+    return _NEAR_DUPLICATE_INDEX
+
+
+def _index_near_duplicate(session, article_id: str, content: str) -> None:
+    """Assign a cleaned article to its near-duplicate cluster.
+
+    Runs after the cleaning commit so a failure here only skips indexing.
+    """
+    try:
+        match = _get_near_duplicate_index().assign(session, article_id, content)
+        if match is None:
+            return
+        _commit_with_retry(session)
+    except Exception:
+        session.rollback()
+        logger.warning(
+            "Near-duplicate indexing failed for article %s", article_id, exc_info=True
+        )
+        return
+
+    if match.is_duplicate:
+        logger.info(
+            "Article %s is a near-duplicate of %s (similarity %.2f)",
+            article_id,
+            match.canonical_article_id,
+            match.similarity,
+        )
+
+
+def _build_byline_cleaner():
+    """Byline cleaner reading names from the shared reference data."""
+    return BylineCleaner(reference_data=get_reference_data_registry())
+
+
 ARTICLE_INSERT_SQL = text(
     "INSERT INTO articles (id, candidate_link_id, url, title, author, "
     "publish_date, content, text, status, metadata, wire, extracted_at, "
@@ -554,7 +617,17 @@ def handle_extraction_command(args) -> int:
     print()
 
     extractor = extractor_cls()
-    byline_cleaner = BylineCleaner()
+    if SELENIUM_POOL_SIZE > 0 and hasattr(extractor, "enable_browser_pool"):
+        extractor.enable_browser_pool(
+            SELENIUM_POOL_SIZE,
+            max_pages=SELENIUM_MAX_PAGES_PER_DRIVER,
+            max_memory_mb=SELENIUM_MAX_DRIVER_MEMORY_MB or None,
+        )
+        print(f"   Selenium fallback queue: {SELENIUM_POOL_SIZE} browsers")
+    strategy_router = None
+    if EXTRACTION_STRATEGY_ROUTING and hasattr(extractor, "enable_strategy_routing"):
+        strategy_router = extractor.enable_strategy_routing()
+    byline_cleaner = stage_resource("byline_cleaner", _build_byline_cleaner)
     telemetry = ComprehensiveExtractionTelemetry()
 
     # Track hosts that return 403 responses within this run
@@ -802,6 +875,31 @@ def handle_extraction_command(args) -> int:
                 driver_stats["driver_creation_count"],
             )
 
+        byline_stats = getattr(byline_cleaner, "get_cache_stats", dict)()
+        if isinstance(byline_stats, dict) and byline_stats.get("hits") is not None:
+            logger.info(
+                "Byline cache: %s hits, %s persistent hits, %s misses (%.0f%%)",
+                byline_stats["hits"],
+                byline_stats["persistent_hits"],
+                byline_stats["misses"],
+                byline_stats["hit_rate"] * 100,
+            )
+
+        if total_processed:
+            reference_stats = get_reference_data_registry().stats(
+                articles=total_processed
+            )
+            logger.info(
+                "Reference data: %s lookups, %s queries, "
+                "%.1f queries saved per 1,000 articles",
+                reference_stats["lookups"],
+                reference_stats["queries"],
+                reference_stats["queries_saved_per_1000_articles"],
+            )
+
+        if strategy_router is not None:
+            logger.info("Extraction strategy routing: %s", strategy_router.stats())
+
         print()
         print("✅ Extraction completed successfully!")
         print(f"   Total batches processed: {batch_num}")
@@ -813,6 +911,11 @@ def handle_extraction_command(args) -> int:
     finally:
         # Clean up persistent driver when job is complete
         extractor.close_persistent_driver()
+        close_browser_pool = getattr(extractor, "close_browser_pool", None)
+        if close_browser_pool is not None:
+            close_browser_pool()
+        if strategy_router is not None:
+            strategy_router.flush()
 
 
 def _process_batch(
@@ -946,8 +1049,25 @@ def _process_batch(
 
         processed = 0
         skipped_domains = set()
+        # Articles handed to the Selenium fallback queue, merged back below
+        in_flight: list[_DeferredExtraction] = []
+        from src.crawler.browser_pool import SeleniumFallbackQueue
+
+        browser_queue = getattr(extractor, "selenium_queue", None)
+        if not isinstance(browser_queue, SeleniumFallbackQueue):
+            browser_queue = None
+
+        def batch_work():
+            for row in rows:
+                # Stop if we've processed (or queued) enough articles
+                if processed + len(in_flight) >= per_batch:
+                    break
+                yield row, None
+            pending = {item.future: item for item in in_flight}
+            for future in as_completed(pending):
+                yield pending[future].row, pending[future]
 
-        for row in rows:
+        for row, deferred in batch_work():
             # Send heartbeat to work queue if enough time has passed
             if (
                 USE_WORK_QUEUE
@@ -957,10 +1077,6 @@ def _process_batch(
                 _send_heartbeat(worker_id)
                 last_heartbeat = time.time()
 
-            # Stop if we've processed enough articles
-            if processed >= per_batch:
-                break
-
             url_id, url, source, status, canonical_name = row
 
             # Extract domain for failure tracking
@@ -968,48 +1084,67 @@ def _process_batch(
 
             domain = urlparse(url).netloc
 
-            # Skip domains that already hit the per-batch limit
-            current_domain_count = domain_article_count.get(domain, 0)
-            if current_domain_count >= max_articles_per_domain:
-                logger.debug(
-                    "Skipping %s - domain %s hit max %d articles per batch",
-                    url,
-                    domain,
-                    max_articles_per_domain,
+            if deferred is not None:
+                article_id, metrics = deferred.article_id, deferred.metrics
+            else:
+                # Skip domains that already hit the per-batch limit
+                current_domain_count = domain_article_count.get(domain, 0) + sum(
+                    1 for item in in_flight if item.domain == domain
                 )
-                continue
+                if current_domain_count >= max_articles_per_domain:
+                    logger.debug(
+                        "Skipping %s - domain %s hit max %d articles per batch",
+                        url,
+                        domain,
+                        max_articles_per_domain,
+                    )
+                    continue
 
-            # Skip domains that have failed too many times
-            if domain in skipped_domains:
-                logger.debug(
-                    "Skipping %s - domain %s temporarily blocked",
-                    url,
-                    domain,
-                )
-                continue
+                # Skip domains that have failed too many times
+                if domain in skipped_domains:
+                    logger.debug(
+                        "Skipping %s - domain %s temporarily blocked",
+                        url,
+                        domain,
+                    )
+                    continue
 
-            # Check if domain is currently rate limited by extractor (CAPTCHA backoff)
-            if extractor._check_rate_limit(domain):
-                logger.info(
-                    "Skipping %s - domain %s is rate limited (backoff active)",
+                # Check if domain is currently rate limited by extractor (CAPTCHA backoff)
+                if extractor._check_rate_limit(domain):
+                    logger.info(
+                        "Skipping %s - domain %s is rate limited (backoff active)",
+                        url,
+                        domain,
+                    )
+                    skipped_domains.add(domain)
+                    continue
+
+                operation_id = f"ex_{batch_num}_{url_id}"
+                article_id = str(uuid.uuid4())
+                publisher = canonical_name or source
+                metrics = ExtractionMetrics(
+                    operation_id,
+                    article_id,
                     url,
-                    domain,
+                    publisher,
                 )
-                skipped_domains.add(domain)
-                continue
-
-            operation_id = f"ex_{batch_num}_{url_id}"
-            article_id = str(uuid.uuid4())
-            publisher = canonical_name or source
-            metrics = ExtractionMetrics(
-                operation_id,
-                article_id,
-                url,
-                publisher,
-            )
 
             try:
-                content = extractor.extract_content(url, metrics=metrics)
+                if deferred is not None:
+                    content = deferred.future.result()
+                elif browser_queue is not None:
+                    future = extractor.submit_extraction(url, metrics=metrics)
+                    if not future.done():
+                        # Keep extracting over HTTP while the browser renders
+                        in_flight.append(
+                            _DeferredExtraction(
+                                row, domain, article_id, metrics, future
+                            )
+                        )
+                        continue
+                    content = future.result()
+                else:
+                    content = extractor.extract_content(url, metrics=metrics)
                 detection_payload = None
 
                 if content and content.get("title"):
@@ -1083,8 +1218,12 @@ def _process_batch(
                         metadata_value["byline"] = byline_result
 
                     if article_status == "extracted":
-                        # Create detector with session to reuse DB connection
-                        detector = ContentTypeDetector(session=session)
+                        # Reference tables come from the process-wide
+                        # snapshot rather than per-article queries
+                        detector = ContentTypeDetector(
+                            session=session,
+                            reference_data=get_reference_data_registry().snapshot(),
+                        )
                         detection_result = detector.detect(
                             url=url,
                             title=content.get("title"),
@@ -1641,6 +1780,8 @@ def _run_post_extraction_cleaning(domains_to_articles, db=None):
                     if article_updated:
                         _commit_with_retry(session)
 
+                    _index_near_duplicate(session, article_id, cleaned_content)
+
                     status_for_entities = (new_status or "").lower()
                     disallowed_statuses = {"wire", "opinion", "obituary"}
                     if status_for_entities not in disallowed_statuses:
@@ -1669,6 +1810,31 @@ def _run_post_extraction_cleaning(domains_to_articles, db=None):
             _run_article_entity_extraction(articles_for_entities)
 
 
+def _save_entities_isolated(session, pending, extractor_version: str) -> None:
+    """Save ``pending`` entities in bulk, falling back to one savepoint per
+    article so a bad article does not discard the rest of the batch."""
+    try:
+        with session.begin_nested():
+            save_article_entities_bulk(
+                session, pending, extractor_version, autocommit=False
+            )
+    except Exception:
+        logger.warning(
+            "Bulk entity save failed for %d articles; saving individually",
+            len(pending),
+            exc_info=True,
+        )
+        for item in pending:
+            try:
+                with session.begin_nested():
+                    save_article_entities_bulk(
+                        session, [item], extractor_version, autocommit=False
+                    )
+            except Exception:
+                logger.exception("Failed to save entities for article %s", item[0])
+    _commit_with_retry(session)
+
+
 def _run_article_entity_extraction(article_ids: Iterable[str], db=None) -> None:
     """Extract entities from articles (requires rapidfuzz in processor image)."""
     # Lazy import entity extraction functions
@@ -1698,6 +1864,7 @@ def _run_article_entity_extraction(article_ids: Iterable[str], db=None) -> None:
 
         skip_statuses = {"wire", "opinion", "obituary"}
 
+        pending = []
         for article in articles:
             status_value = (article.status or "").lower()
             if status_value in skip_statuses:
@@ -1711,31 +1878,35 @@ def _run_article_entity_extraction(article_ids: Iterable[str], db=None) -> None:
                 source_id = None
                 dataset_id = None
 
+            article_id = str(getattr(article, "id", ""))
             raw_text = article.text or article.content
             text_value = raw_text if isinstance(raw_text, str) else None
-            gazetteer_rows = get_gazetteer_rows(
-                session,
-                source_id,
-                dataset_id,
-            )
-            entities = extractor.extract(
-                text_value,
-                gazetteer_rows=gazetteer_rows,
-            )
-            entities = attach_gazetteer_matches(
-                session,
-                source_id,
-                dataset_id,
-                entities,
-                gazetteer_rows=gazetteer_rows,
-            )
-            save_article_entities(
-                session,
-                str(getattr(article, "id", "")),
-                entities,
-                extractor.extractor_version,
-                getattr(article, "text_hash", None),
-            )
+            try:
+                # A failed lookup only rolls back this article's savepoint
+                with session.begin_nested():
+                    gazetteer_rows = get_gazetteer_rows(
+                        session,
+                        source_id,
+                        dataset_id,
+                    )
+                    entities = extractor.extract(
+                        text_value,
+                        gazetteer_rows=gazetteer_rows,
+                    )
+                    entities = attach_gazetteer_matches(
+                        session,
+                        source_id,
+                        dataset_id,
+                        entities,
+                        gazetteer_rows=gazetteer_rows,
+                    )
+            except Exception:
+                logger.exception("Entity extraction failed for article %s", article_id)
+                continue
+            pending.append((article_id, entities, getattr(article, "text_hash", None)))
+
+        if pending:
+            _save_entities_isolated(session, pending, extractor.extractor_version)
     except Exception:
         session.rollback()
         logger.exception("Entity extraction pipeline failed")
@@ -11,6 +11,8 @@ from ...services.llm import (
     ArticleLLMPipeline,
     ArticleLLMResult,
     LLMOrchestrator,
+    PromptResponseCache,
+    ProviderLimiterRegistry,
     ProviderRegistry,
     VectorStoreFactory,
     load_llm_settings,
@@ -56,6 +58,27 @@ def add_llm_parser(subparsers) -> None:
         action="store_true",
         help="Preview orchestration without persisting summaries",
     )
+    run_parser.add_argument(
+        "--concurrency",
+        type=int,
+        help=(
+            "Number of concurrent LLM requests (default: LLM_CONCURRENCY or 1). "
+            "Per-provider ceilings come from LLM_PROVIDER_LIMITS"
+        ),
+    )
+    run_parser.add_argument(
+        "--commit-every",
+        type=int,
+        default=25,
+        help="Commit persisted summaries every N articles (default: 25)",
+    )
+    run_parser.add_argument(
+        "--cache-path",
+        help=(
+            "SQLite file for the prompt-hash response cache "
+            "(default: LLM_CACHE_PATH; disabled when unset)"
+        ),
+    )
     run_parser.add_argument(
         "--show-failures",
         action="store_true",
@@ -107,10 +130,15 @@ def _handle_llm_status(args) -> int:
 def _handle_llm_run(args) -> int:
     settings = load_llm_settings()
     vector_store = VectorStoreFactory.create(settings)
+    cache_path = getattr(args, "cache_path", None) or settings.cache_path
+    cache = PromptResponseCache(cache_path) if cache_path else None
     orchestrator = LLMOrchestrator.from_settings(
         settings,
         vector_store=vector_store,
+        limiters=ProviderLimiterRegistry.from_settings(settings),
+        cache=cache,
     )
+    concurrency = max(1, getattr(args, "concurrency", None) or settings.concurrency)
 
     statuses = _normalize_statuses(args.statuses)
     prompt_template = ArticleLLMPipeline.load_prompt_template(
@@ -128,6 +156,8 @@ def _handle_llm_run(args) -> int:
             statuses=statuses,
             limit=args.limit,
             dry_run=args.dry_run,
+            concurrency=concurrency,
+            commit_every=getattr(args, "commit_every", None),
         )
         _render_run_summary(results, args.dry_run, args.show_failures)
         return 0
@@ -136,6 +166,10 @@ def _handle_llm_run(args) -> int:
         return 1
     finally:
         db.close()
+        if cache is not None:
+            cache.close()
+        if vector_store is not None:
+            vector_store.close()
 
 
 def _normalize_statuses(raw: Sequence[str] | None) -> list[str] | None:
@@ -168,6 +202,9 @@ def _render_run_summary(
     print(f"Total articles evaluated: {len(results)}")
     print(f"Successful summaries: {len(successes)}")
     print(f"Failures: {len(failures)}")
+    cached = sum(1 for result in results if result.cached)
+    if cached:
+        print(f"Served from cache: {cached}")
     if dry_run:
         print("Dry-run enabled: no summaries were persisted.")
 
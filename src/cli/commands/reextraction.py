@@ -0,0 +1,362 @@
+"""
+Re-extraction command module for the modular CLI.
+
+Re-extracts already stored articles with conditional fetches, running
+byline cleaning, content-type detection, content cleaning and entity
+extraction only for pages whose extracted text changed. See
+``src/pipeline/reextraction.py``.
+
+With ``--offline`` the archived HTML is re-extracted instead, across a
+process pool and without network access, and a field-level diff report is
+produced. See ``src/pipeline/offline_reextraction.py``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections import defaultdict
+from datetime import datetime
+from typing import Any
+from urllib.parse import urlparse
+
+from src.models import Article
+from src.models.api_backend import ReextractionJob
+from src.models.database import DatabaseManager, calculate_content_hash
+from src.pipeline.html_archive import ARCHIVE_DIR_ENV
+from src.pipeline.offline_reextraction import DIFF_FIELDS, OfflineReextractor
+from src.pipeline.reextraction import (
+    ReextractionStats,
+    ReextractionTarget,
+    Reextractor,
+    select_reextraction_targets,
+)
+from src.utils.content_type_detector import ContentTypeDetector
+from src.utils.reference_data import get_reference_data_registry
+
+logger = logging.getLogger(__name__)
+
+
+def add_reextraction_parser(subparsers):
+    """Add re-extraction command parser to CLI."""
+    parser = subparsers.add_parser(
+        "reextract",
+        help="Re-extract stored articles, skipping pages that have not changed",
+    )
+    parser.add_argument("--host", type=str, help="Only articles from this host")
+    parser.add_argument(
+        "--article-id",
+        dest="article_ids",
+        action="append",
+        help="Re-extract this article (repeatable)",
+    )
+    parser.add_argument(
+        "--limit", type=int, default=None, help="Maximum articles to check"
+    )
+    parser.add_argument(
+        "--jobs",
+        action="store_true",
+        default=False,
+        help="Process pending jobs from /api/reextract_jobs, one host each",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        default=False,
+        help="Ignore stored validators and digests; re-run every stage",
+    )
+    parser.add_argument(
+        "--skip-entities",
+        dest="skip_entities",
+        action="store_true",
+        default=False,
+        help="Do not re-run entity extraction for changed articles",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        default=False,
+        help="Re-extract archived HTML without fetching; report field changes",
+    )
+    parser.add_argument(
+        "--archive-dir",
+        dest="archive_dir",
+        type=str,
+        default=None,
+        help=f"HTML archive to replay (default: ${ARCHIVE_DIR_ENV})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for --offline (default: CPU count)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        dest="dry_run",
+        action="store_true",
+        default=False,
+        help="With --offline, only report changes; do not update articles",
+    )
+    parser.add_argument(
+        "--skip-cleaning",
+        dest="skip_cleaning",
+        action="store_true",
+        default=False,
+        help="With --offline, compare extraction output without content cleaning",
+    )
+    parser.add_argument(
+        "--report",
+        type=str,
+        default=None,
+        help="With --offline, write the JSON diff report to this path",
+    )
+    parser.set_defaults(func=handle_reextraction_command)
+
+
+def _parse_publish_date(value: Any) -> datetime | None:
+    if isinstance(value, datetime) or value is None:
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def _apply_reextracted_content(
+    session, byline_cleaner, target: ReextractionTarget, content: dict[str, Any]
+) -> None:
+    """Store a changed extraction the way the extract command would."""
+    from src.cli.commands.extraction import _format_cleaned_authors
+
+    article = session.get(Article, target.article_id)
+    if article is None:
+        return
+
+    metadata = content.get("metadata")
+    if not isinstance(metadata, dict):
+        metadata = {}
+    status = "extracted"
+    author = None
+    wire = None
+
+    raw_author = content.get("author")
+    if raw_author:
+        source = article.candidate_link.source if article.candidate_link else None
+        byline = byline_cleaner.clean_byline(
+            raw_author,
+            return_json=True,
+            source_name=source,
+            article_id=target.article_id,
+        )
+        author = _format_cleaned_authors(byline.get("authors", []))
+        metadata["byline"] = byline
+        if byline.get("is_wire_content") and byline.get("wire_services"):
+            status = "wire"
+            wire = byline["wire_services"]
+
+    text = content.get("content") or ""
+    if status == "extracted":
+        detector = ContentTypeDetector(
+            session=session, reference_data=get_reference_data_registry().snapshot()
+        )
+        detection = detector.detect(
+            url=target.url,
+            title=content.get("title"),
+            metadata=metadata,
+            content=text,
+        )
+        if detection:
+            status = detection.status
+            metadata["content_type_detection"] = {
+                "status": detection.status,
+                "confidence": detection.confidence,
+                "confidence_score": detection.confidence_score,
+                "reason": detection.reason,
+                "evidence": detection.evidence,
+                "version": detection.detector_version,
+                "detected_at": datetime.utcnow().isoformat(),
+            }
+
+    article.title = content.get("title")
+    article.author = author
+    article.publish_date = _parse_publish_date(content.get("publish_date"))
+    article.content = text
+    article.text = text
+    article.text_hash = calculate_content_hash(text)
+    article.meta = metadata
+    article.wire = wire
+    article.status = status
+    article.extracted_at = datetime.utcnow()
+
+
+def _run_downstream(domains_to_articles, db, skip_entities: bool) -> None:
+    from src.cli.commands import extraction
+
+    if not domains_to_articles:
+        return
+    extraction._run_post_extraction_cleaning(domains_to_articles, db=db)
+    if not skip_entities:
+        article_ids = [
+            article_id for ids in domains_to_articles.values() for article_id in ids
+        ]
+        extraction._run_article_entity_extraction(article_ids, db=db)
+
+
+def _reextract(args, db, extractor, byline_cleaner, host) -> ReextractionStats:
+    session = db.session
+    changed: dict[str, list[str]] = defaultdict(list)
+
+    def on_changed(target: ReextractionTarget, content: dict[str, Any]) -> None:
+        _apply_reextracted_content(session, byline_cleaner, target, content)
+        changed[urlparse(target.url).netloc].append(target.article_id)
+
+    targets = select_reextraction_targets(
+        session,
+        host=host,
+        article_ids=getattr(args, "article_ids", None),
+        limit=getattr(args, "limit", None),
+    )
+    print(
+        f"🔁 Re-extracting {len(targets)} articles" + (f" for {host}" if host else "")
+    )
+
+    reextractor = Reextractor(
+        extractor, session, on_changed, force=getattr(args, "force", False)
+    )
+    stats = reextractor.run(targets)
+    _run_downstream(changed, db, getattr(args, "skip_entities", False))
+
+    summary = stats.as_dict()
+    print(
+        f"   checked={summary['checked']} changed={summary['changed']} "
+        f"not_modified={summary['not_modified']} "
+        f"html_unchanged={summary['html_unchanged']} "
+        f"text_unchanged={summary['text_unchanged']} "
+        f"baseline={summary['baseline']} "
+        f"missing={summary['missing']} failed={summary['failed']}"
+    )
+    print(f"   skipped {stats.skipped_fraction:.1%} of downstream work")
+    return stats
+
+
+def _process_pending_jobs(args, db, extractor, byline_cleaner) -> int:
+    session = db.session
+    jobs = (
+        session.query(ReextractionJob)
+        .filter(ReextractionJob.status == "pending")
+        .order_by(ReextractionJob.created_at)
+        .all()
+    )
+    failures = 0
+    for job in jobs:
+        job.status = "running"
+        job.updated_at = datetime.utcnow()
+        session.commit()
+        try:
+            stats = _reextract(args, db, extractor, byline_cleaner, job.host)
+            failed = stats.outcomes["failed"]
+            if stats.checked and failed == stats.checked:
+                failures += 1
+                job.status = "failed"
+            elif failed:
+                job.status = "partial"
+            else:
+                job.status = "completed"
+            job.result_json = json.dumps(stats.as_dict())
+        except Exception as exc:
+            logger.exception("Re-extraction job %s failed", job.id)
+            session.rollback()
+            failures += 1
+            job.status = "failed"
+            job.result_json = json.dumps({"error": str(exc)})
+        job.updated_at = datetime.utcnow()
+        session.commit()
+    if not jobs:
+        print("No pending re-extraction jobs")
+    return 1 if failures else 0
+
+
+def _reextract_offline(args, db) -> int:
+    archive_dir = getattr(args, "archive_dir", None) or os.getenv(ARCHIVE_DIR_ENV)
+    if not archive_dir:
+        print(f"❌ --offline needs --archive-dir or ${ARCHIVE_DIR_ENV}")
+        return 1
+
+    targets = select_reextraction_targets(
+        db.session,
+        host=getattr(args, "host", None),
+        article_ids=getattr(args, "article_ids", None),
+        limit=getattr(args, "limit", None),
+    )
+    workers = getattr(args, "workers", 1)
+    dry_run = getattr(args, "dry_run", False)
+    print(
+        f"🗄️  Re-extracting {len(targets)} archived articles offline "
+        f"with {workers} workers" + (" (dry run)" if dry_run else "")
+    )
+
+    reextractor = OfflineReextractor(
+        archive_dir,
+        db.session,
+        workers=workers,
+        clean=not getattr(args, "skip_cleaning", False),
+        dry_run=dry_run,
+    )
+    report = reextractor.run(targets)
+
+    summary = report.as_dict()
+    print(
+        f"   processed={summary['processed']} in {summary['seconds']:.1f}s "
+        f"({summary['articles_per_second'] or 0:.1f}/s) "
+        + " ".join(f"{name}={count}" for name, count in summary["outcomes"].items())
+    )
+    for name in DIFF_FIELDS:
+        counts = summary["fields"][name]
+        print(
+            f"   {name:<13}"
+            + " ".join(
+                f"{kind}={counts.get(kind, 0)}"
+                for kind in ("unchanged", "changed", "added", "removed")
+            )
+        )
+    print(
+        f"   {report.articles_changed} articles changed"
+        + ("" if dry_run else " and updated")
+    )
+    if getattr(args, "report", None):
+        report.write(args.report)
+        print(f"   report written to {args.report}")
+    return 0
+
+
+def handle_reextraction_command(args) -> int:
+    """Execute re-extraction command logic."""
+    from src.cli.commands.extraction import _build_byline_cleaner
+    from src.crawler import ContentExtractor
+
+    try:
+        db = DatabaseManager()
+    except Exception:
+        logger.exception("Failed to initialize database connection")
+        return 1
+
+    if getattr(args, "offline", False):
+        try:
+            return _reextract_offline(args, db)
+        finally:
+            db.close()
+
+    extractor = ContentExtractor()
+    byline_cleaner = _build_byline_cleaner()
+    try:
+        if getattr(args, "jobs", False):
+            return _process_pending_jobs(args, db, extractor, byline_cleaner)
+        stats = _reextract(
+            args, db, extractor, byline_cleaner, getattr(args, "host", None)
+        )
+        return 1 if stats.checked and stats.outcomes["failed"] == stats.checked else 0
+    finally:
+        extractor.close_persistent_driver()
+        db.close()
@@ -8,8 +8,10 @@ from datetime import datetime
 from pathlib import Path
 
 from src.reporting.county_report import (
+    DEFAULT_CHUNK_SIZE,
+    REPORT_FORMATS,
     CountyReportConfig,
-    generate_county_report,
+    write_county_report,
 )
 
 logger = logging.getLogger(__name__)
@@ -29,7 +31,7 @@ def add_reports_parser(subparsers) -> argparse.ArgumentParser:
 
     parser = subparsers.add_parser(
         "county-report",
-        help="Generate a county-filtered article CSV report",
+        help="Generate a county-filtered article CSV or Parquet report",
     )
     parser.add_argument(
         "--counties",
@@ -53,7 +55,26 @@ def add_reports_parser(subparsers) -> argparse.ArgumentParser:
         "--output",
         type=Path,
         help=(
-            "Destination CSV path. Defaults to reports/county_report_<timestamp>.csv"
+            "Destination file path. Defaults to "
+            "reports/county_report_<timestamp>.<format>"
+        ),
+    )
+    parser.add_argument(
+        "--format",
+        dest="output_format",
+        choices=REPORT_FORMATS,
+        help=(
+            "Output format (default: inferred from the --output suffix, "
+            "otherwise csv)"
+        ),
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=(
+            "Rows fetched and written per step; bounds memory use "
+            f"(default: {DEFAULT_CHUNK_SIZE})"
         ),
     )
     parser.add_argument(
@@ -84,10 +105,12 @@ def handle_county_report_command(args) -> int:
 
     include_entities = not getattr(args, "no_entities", False)
 
+    output_format: str | None = getattr(args, "output_format", None)
     output_path: Path | None = getattr(args, "output", None)
     if output_path is None:
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        output_path = Path("reports") / f"county_report_{timestamp}.csv"
+        suffix = output_format or "csv"
+        output_path = Path("reports") / f"county_report_{timestamp}.{suffix}"
 
     config = CountyReportConfig(
         counties=list(args.counties),
@@ -100,11 +123,16 @@ def handle_county_report_command(args) -> int:
     )
 
     try:
-        df = generate_county_report(config, output_path=output_path)
+        rows_written = write_county_report(
+            config,
+            output_path,
+            output_format=output_format,
+            chunk_size=getattr(args, "chunk_size", DEFAULT_CHUNK_SIZE),
+        )
     except Exception as exc:  # pragma: no cover - passthrough logging
         logger.exception("Failed to generate county report")
         print(f"County report failed: {exc}")
         return 1
 
-    print(f"Wrote {len(df)} rows to {output_path}")
+    print(f"Wrote {rows_written} rows to {output_path}")
     return 0
@@ -66,6 +66,21 @@ def add_verification_parser(subparsers) -> argparse.ArgumentParser:
         ),
     )
 
+    verify_parser.add_argument(
+        "--concurrency",
+        type=int,
+        help=(
+            "Verify each batch concurrently with this many HTTP checks in "
+            "flight and flush statuses in bulk (default: sequential)"
+        ),
+    )
+    verify_parser.add_argument(
+        "--per-host-concurrency",
+        type=int,
+        default=2,
+        help="Maximum concurrent HTTP checks per host (default: 2)",
+    )
+
     verify_parser.set_defaults(func=handle_verification_command)
     return verify_parser
 
@@ -91,6 +106,8 @@ def handle_verification_command(args) -> int:
                 max_batches=args.max_batches,
                 continuous=args.continuous,
                 idle_grace_seconds=args.idle_grace_seconds,
+                concurrency=getattr(args, "concurrency", None),
+                per_host_concurrency=getattr(args, "per_host_concurrency", 2),
             )
 
     except Exception as e:
@@ -128,6 +145,8 @@ def run_verification_service(
     max_batches: int | None = None,
     continuous: bool = False,
     idle_grace_seconds: int = 0,
+    concurrency: int | None = None,
+    per_host_concurrency: int = 2,
 ) -> int:
     """Run the verification service."""
     try:
@@ -181,6 +200,13 @@ def run_verification_service(
         if idle_grace_supported and idle_grace_seconds:
             loop_kwargs["idle_grace_seconds"] = idle_grace_seconds
 
+        concurrency_supported = (
+            signature is None or "concurrency" in params or has_var_kw
+        )
+        if concurrency_supported and concurrency:
+            loop_kwargs["concurrency"] = concurrency
+            loop_kwargs["per_host_concurrency"] = per_host_concurrency
+
         if loop_kwargs:
             loop_callable(**loop_kwargs)
         else:
@@ -7,8 +7,10 @@ import logging
 from pathlib import Path
 
 from src.models.versioning import (
+    compact_dataset_version,
     create_dataset_version,
     export_dataset_version,
+    export_delta_snapshot_for_version,
     export_snapshot_for_version,
     list_dataset_versions,
 )
@@ -36,6 +38,10 @@ def add_versioning_parsers(subparsers: argparse._SubParsersAction) -> None:
         "--description",
         help="Optional description for the version",
     )
+    create_parser.add_argument(
+        "--parent-version",
+        help="Parent version id (required for delta snapshots)",
+    )
     create_parser.set_defaults(func=handle_create_version_command)
 
     list_parser = subparsers.add_parser(
@@ -87,27 +93,103 @@ def add_versioning_parsers(subparsers: argparse._SubParsersAction) -> None:
         help="Output path for snapshot",
     )
     snapshot_parser.add_argument(
+        "--change-column",
+        help=(
+            "Column that grows whenever a row changes (e.g. updated_at); "
+            "records a high-water mark so child versions can be exported "
+            "with export-delta"
+        ),
+    )
+    snapshot_parser.add_argument(
+        "--key-column",
+        default="id",
+        help="Row key used to merge deltas (default: id)",
+    )
+    _add_snapshot_options(snapshot_parser)
+    snapshot_parser.set_defaults(func=handle_export_snapshot_command)
+
+    delta_parser = subparsers.add_parser(
+        "export-delta",
+        help=(
+            "Create a delta Parquet snapshot holding only rows changed since "
+            "the version's parent"
+        ),
+    )
+    delta_parser.add_argument(
+        "--version-id",
+        required=True,
+        help="Dataset version id (must have a parent version)",
+    )
+    delta_parser.add_argument(
+        "--table",
+        required=True,
+        help="Database table to export",
+    )
+    delta_parser.add_argument(
+        "--output",
+        required=True,
+        help="Output path for the delta snapshot",
+    )
+    _add_snapshot_options(delta_parser)
+    delta_parser.set_defaults(func=handle_export_delta_command)
+
+    compact_parser = subparsers.add_parser(
+        "compact-version",
+        help="Merge a version's base snapshot and deltas into a new base",
+    )
+    compact_parser.add_argument(
+        "--version-id",
+        required=True,
+        help="Dataset version id",
+    )
+    compact_parser.add_argument(
+        "--output",
+        required=True,
+        help="Output path for the compacted snapshot",
+    )
+    compact_parser.add_argument(
+        "--snapshot-compression",
+        choices=["snappy", "gzip", "brotli", "zstd", "none"],
+        default=None,
+        help="Parquet compression codec to use",
+    )
+    compact_parser.set_defaults(func=handle_compact_version_command)
+
+
+def _add_snapshot_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--snapshot-chunksize",
         type=int,
         default=10_000,
         help="Rows per chunk when streaming export (default: 10000)",
     )
-    snapshot_parser.add_argument(
+    parser.add_argument(
         "--snapshot-compression",
         choices=["snappy", "gzip", "brotli", "zstd", "none"],
         default=None,
         help="Parquet compression codec to use",
     )
-    snapshot_parser.set_defaults(func=handle_export_snapshot_command)
+
+
+def _resolve_compression(args: argparse.Namespace) -> str | None:
+    compression = getattr(args, "snapshot_compression", None)
+    if compression is not None and compression.lower() != "none":
+        return compression
+    return None
 
 
 def handle_create_version_command(args: argparse.Namespace) -> int:
     """Create a new dataset version and print its identifier."""
+    kwargs = {}
+    if getattr(args, "parent_version", None):
+        kwargs["parent_version"] = args.parent_version
+
     try:
         version = create_dataset_version(
             dataset_name=args.dataset,
             version_tag=args.tag,
             description=getattr(args, "description", None),
+            **kwargs,
         )
     except Exception as exc:  # pragma: no cover - passthrough logging
         logger.exception("Failed to create dataset version")
@@ -160,10 +242,10 @@ def handle_export_version_command(args: argparse.Namespace) -> int:
 
 def handle_export_snapshot_command(args: argparse.Namespace) -> int:
     """Stream a Parquet snapshot for a dataset version."""
-    compression = getattr(args, "snapshot_compression", None)
-    resolved_compression: str | None = None
-    if compression is not None and compression.lower() != "none":
-        resolved_compression = compression
+    kwargs = {}
+    if getattr(args, "change_column", None):
+        kwargs["change_column"] = args.change_column
+        kwargs["key_column"] = getattr(args, "key_column", None) or "id"
 
     try:
         output_path = str(Path(args.output))
@@ -172,7 +254,8 @@ def handle_export_snapshot_command(args: argparse.Namespace) -> int:
             args.table,
             output_path,
             chunksize=getattr(args, "snapshot_chunksize", 10_000),
-            compression=resolved_compression,
+            compression=_resolve_compression(args),
+            **kwargs,
         )
     except Exception as exc:  # pragma: no cover - passthrough logging
         logger.exception("Failed to export snapshot")
@@ -183,3 +266,39 @@ def handle_export_snapshot_command(args: argparse.Namespace) -> int:
     snapshot_path = getattr(version, "snapshot_path", str(version))
     print(f"Snapshot created and version finalized: {version_id} -> {snapshot_path}")
     return 0
+
+
+def handle_export_delta_command(args: argparse.Namespace) -> int:
+    """Export the rows changed since a version's parent snapshot."""
+    try:
+        output_path = export_delta_snapshot_for_version(
+            args.version_id,
+            args.table,
+            str(Path(args.output)),
+            chunksize=getattr(args, "snapshot_chunksize", 10_000),
+            compression=_resolve_compression(args),
+        )
+    except Exception as exc:  # pragma: no cover - passthrough logging
+        logger.exception("Failed to export delta snapshot")
+        print(f"Failed to export delta snapshot: {exc}")
+        return 1
+
+    print(f"Delta snapshot created: {args.version_id} -> {output_path}")
+    return 0
+
+
+def handle_compact_version_command(args: argparse.Namespace) -> int:
+    """Merge a version's snapshot chain into a single base snapshot."""
+    try:
+        output_path = compact_dataset_version(
+            args.version_id,
+            str(Path(args.output)),
+            compression=_resolve_compression(args),
+        )
+    except Exception as exc:  # pragma: no cover - passthrough logging
+        logger.exception("Failed to compact dataset version")
+        print(f"Failed to compact version: {exc}")
+        return 1
+
+    print(f"Compacted version: {args.version_id} -> {output_path}")
+    return 0
@@ -10,6 +10,7 @@ import random
 import re
 import threading
 import time
+from concurrent.futures import Future
 from copy import deepcopy
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Tuple
@@ -17,13 +18,23 @@ from urllib.parse import urljoin, urlparse
 
 import requests
 from bs4 import BeautifulSoup, Tag
-from dateutil import parser as dateparser
 
+from src.pipeline.html_archive import archive_replay_enabled, get_html_archive
+from src.pipeline.site_rules import get_rules_for_hostname, load_site_rules
 from src.utils.bot_sensitivity_manager import BotSensitivityManager
 from src.utils.comprehensive_telemetry import ExtractionMetrics
 
+from .browser_pool import BrowserPool, SeleniumFallbackQueue
+from .date_extraction import DateStrategyCache, date_from_url, parse_date
 from .origin_proxy import enable_origin_proxy
 from .proxy_config import get_proxy_manager
+from .strategy_router import (
+    BS_FIRST_ROUTE,
+    DEFAULT_ROUTE,
+    FIELDS,
+    StrategyRouter,
+    get_strategy_router,
+)
 
 
 class RateLimitError(Exception):
@@ -111,32 +122,17 @@ def _ensure_attrs_dict(attrs: object) -> dict:
     return {}
 
 
-URL_DATE_FALLBACK_HOSTS = {
-    "columbiatribune.com",
-    "kbia.org",
-    "unterrifieddemocrat.com",
-    "mexicoledger.com",
-}
+def _comparable_field_value(value: Any) -> Optional[str]:
+    """Form of an extracted field compared for strategy-router parity.
 
+    Only surrounding whitespace is ignored: newspaper4k keeps paragraph
+    breaks that BeautifulSoup's text joins with spaces, and stored content
+    should not change shape when a host is routed.
+    """
+    if value is None:
+        return None
+    return str(value).strip() or None
 
-URL_DATE_REGEX_PATTERNS = [
-    (
-        "slash_year_month_day",
-        r"/(?P<year>20\d{2})/(?P<month>\d{1,2})/(?P<day>\d{1,2})(?:/|$)",
-    ),
-    (
-        "dash_year_month_day",
-        r"(?<!\d)(?P<year>20\d{2})-(?P<month>\d{1,2})-(?P<day>\d{1,2})(?!\d)",
-    ),
-    (
-        "underscore_year_month_day",
-        r"(?<!\d)(?P<year>20\d{2})_(?P<month>\d{1,2})_(?P<day>\d{1,2})(?!\d)",
-    ),
-    (
-        "compact_year_month_day",
-        r"/(?P<year>20\d{2})(?P<month>\d{2})(?P<day>\d{2})(?:/|$)",
-    ),
-]
 
 PUBLISH_DATE_KEYWORD_REGEX = re.compile(
     r"\b(?P<keyword>published|posted|updated|last\s+updated|modified|"
@@ -144,6 +140,31 @@ PUBLISH_DATE_KEYWORD_REGEX = re.compile(
     re.IGNORECASE,
 )
 
+# Every keyword above contains one of these words, so a page with none of
+# them cannot yield a keyworded candidate
+PUBLISH_DATE_KEYWORD_WORDS = re.compile(
+    r"\b(?:published|posted|updated|modified)\b", re.IGNORECASE
+)
+
+PUBLISH_DATE_META_SELECTORS = [
+    ("property", "article:published_time"),
+    ("name", "pubdate"),
+    ("name", "publishdate"),
+    ("name", "date"),
+    ("itemprop", "datePublished"),
+    ("name", "publish_date"),
+    ("property", "article:published"),
+]
+
+# Default order of publish-date strategies; DateStrategyCache moves a
+# host's usual winner to the front
+PUBLISH_DATE_STRATEGIES = (
+    "json_ld",
+    *(f"meta:{attr}={value}" for attr, value in PUBLISH_DATE_META_SELECTORS),
+    "time_tag",
+    "text_block",
+)
+
 MAX_TEXT_BLOCK_LENGTH = 240
 
 DATE_ONLY_REGEX_PATTERNS = [
@@ -166,6 +187,9 @@ DATE_ONLY_REGEX_PATTERNS = [
     ),
 ]
 
+# All DATE_ONLY_REGEX_PATTERNS require a year
+DATE_ONLY_YEAR_REGEX = re.compile(r"20\d{2}")
+
 
 class NewsCrawler:
     """Main crawler class for discovering and fetching news articles."""
@@ -357,6 +381,22 @@ class ContentExtractor:
         self._driver_creation_count = 0
         self._driver_reuse_count = 0
 
+        # Optional browser pool for rendering off the caller's thread
+        self.selenium_queue: Optional[SeleniumFallbackQueue] = None
+
+        # Optional raw-HTML archive (HTML_ARCHIVE_DIR); in replay mode
+        # (HTML_ARCHIVE_MODE=replay) archived pages are used instead of
+        # fetching them again
+        self.html_archive = get_html_archive()
+        self.archive_replay = archive_replay_enabled()
+        # Per-host publish-date strategy learned from past extractions
+        self.date_strategies = DateStrategyCache()
+        # Per-host newspaper4k/BeautifulSoup ordering; see
+        # enable_strategy_routing
+        self.strategy_router: Optional[StrategyRouter] = None
+        # lookups/site_rules.csv, loaded on first use by _site_content_selectors
+        self._site_rules: Optional[Dict[str, Dict[str, Any]]] = None
+
         # User agent pool for rotation - updated with latest browser versions
         # for better anti-detection (October 2025)
         self.user_agent_pool = [
@@ -801,8 +841,8 @@ class ContentExtractor:
         """Return a lock object for the domain to cap concurrency to 1."""
         lock = self.domain_locks.get(domain)
         if lock is None:
-            lock = threading.Lock()
-            self.domain_locks[domain] = lock
+            # setdefault keeps one lock when browser workers race here
+            lock = self.domain_locks.setdefault(domain, threading.Lock())
         return lock
 
     def get_rotation_stats(self) -> Dict[str, Any]:
@@ -1008,32 +1048,32 @@ class ContentExtractor:
         self.last_request_times.clear()
         logger.info("Cleared all domain sessions and rotation state")
 
+    def _create_driver(self):
+        """Create a Selenium driver, preferring undetected-chromedriver."""
+        if UNDETECTED_CHROME_AVAILABLE:
+            try:
+                driver = self._create_undetected_driver()
+                self._driver_method = "undetected-chromedriver"
+                return driver
+            except Exception as uc_err:
+                logger.warning(
+                    f"undetected-chromedriver failed to initialize: {uc_err}; "
+                    "falling back to selenium-stealth"
+                )
+                if not SELENIUM_AVAILABLE:
+                    raise
+        if SELENIUM_AVAILABLE:
+            driver = self._create_stealth_driver()
+            self._driver_method = "selenium-stealth"
+            return driver
+        raise Exception("No Selenium implementation available")
+
     def get_persistent_driver(self):
         """Get or create a persistent Selenium driver for reuse."""
         if self._persistent_driver is None:
             logger.info("Creating new persistent ChromeDriver for reuse")
             try:
-                # Try undetected-chromedriver first (most advanced)
-                if UNDETECTED_CHROME_AVAILABLE:
-                    try:
-                        self._persistent_driver = self._create_undetected_driver()
-                        self._driver_method = "undetected-chromedriver"
-                    except Exception as uc_err:
-                        logger.warning(
-                            f"undetected-chromedriver failed to initialize: {uc_err}; "
-                            "falling back to selenium-stealth"
-                        )
-                        if SELENIUM_AVAILABLE:
-                            self._persistent_driver = self._create_stealth_driver()
-                            self._driver_method = "selenium-stealth"
-                        else:
-                            raise
-                elif SELENIUM_AVAILABLE:
-                    self._persistent_driver = self._create_stealth_driver()
-                    self._driver_method = "selenium-stealth"
-                else:
-                    raise Exception("No Selenium implementation available")
-
+                self._persistent_driver = self._create_driver()
                 self._driver_creation_count += 1
                 logger.info(f"Created persistent driver using {self._driver_method}")
 
@@ -1067,12 +1107,63 @@ class ContentExtractor:
 
     def get_driver_stats(self) -> Dict[str, Any]:
         """Get statistics about driver usage."""
-        return {
+        stats = {
             "has_persistent_driver": self._persistent_driver is not None,
             "driver_creation_count": self._driver_creation_count,
             "driver_reuse_count": self._driver_reuse_count,
             "driver_method": getattr(self, "_driver_method", None),
         }
+        if getattr(self, "selenium_queue", None) is not None:
+            stats["browser_pool"] = self.selenium_queue.get_stats()
+        return stats
+
+    def enable_browser_pool(
+        self,
+        size: int = 2,
+        *,
+        max_pages: int = 50,
+        max_memory_mb: Optional[float] = None,
+        max_pending: Optional[int] = None,
+        driver_factory=None,
+    ) -> SeleniumFallbackQueue:
+        """Render Selenium fallbacks on a bounded browser pool.
+
+        After this, ``submit_extraction`` hands pages that need a browser to
+        a dedicated queue instead of rendering them on the caller's thread.
+        """
+        self.close_browser_pool()
+        pool = BrowserPool(
+            driver_factory or self._create_driver,
+            size,
+            max_pages=max_pages,
+            max_memory_mb=max_memory_mb,
+        )
+        self.selenium_queue = SeleniumFallbackQueue(pool, max_pending=max_pending)
+        logger.info(
+            "Selenium fallback queue enabled: %d browsers, recycle after %d pages%s",
+            size,
+            max_pages,
+            f" or {max_memory_mb:.0f} MB" if max_memory_mb else "",
+        )
+        return self.selenium_queue
+
+    def enable_strategy_routing(
+        self, router: Optional[StrategyRouter] = None
+    ) -> StrategyRouter:
+        """Order newspaper4k and BeautifulSoup per host from past outcomes.
+
+        Uses the process-wide router persisted to the database unless
+        ``router`` is given.
+        """
+        self.strategy_router = router or get_strategy_router()
+        return self.strategy_router
+
+    def close_browser_pool(self, wait: bool = True) -> None:
+        """Drain the Selenium fallback queue and quit pooled browsers."""
+        queue = getattr(self, "selenium_queue", None)
+        if queue is not None:
+            self.selenium_queue = None
+            queue.close(wait=wait)
 
     def extract_article_data(self, html: str, url: str) -> Dict[str, Any]:
         """Extract article metadata and content from HTML.
@@ -1095,8 +1186,8 @@ class ContentExtractor:
             "author": self._extract_author(soup),
             # legacy name `published_date` kept for internal use; callers
             # expect `publish_date` so we expose both below when returning
-            "published_date": self._extract_published_date(soup, html),
-            "content": self._extract_content(soup),
+            "published_date": self._extract_published_date(soup, html, url),
+            "content": self._extract_content(soup, url),
             "meta_description": self._extract_meta_description(soup),
             "extracted_at": datetime.utcnow().isoformat(),
             "content_hash": None,  # Will be calculated later
@@ -1110,6 +1201,70 @@ class ContentExtractor:
 
         return data
 
+    def fetch_conditional(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> requests.Response:
+        """GET ``url`` with ``If-None-Match``/``If-Modified-Since`` validators.
+
+        Uses the same per-domain session, backoff and single in-flight lock
+        as extraction. A 304 response means the stored copy is current.
+        404/410 raise ``NotFoundError``; 429 and 5xx record a backoff and
+        raise ``RateLimitError``.
+        """
+        domain = urlparse(url).netloc
+        session = self._get_domain_session(url)
+
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        referer = self._generate_referer(url)
+        if referer:
+            headers["Referer"] = referer
+
+        with self._get_domain_lock(domain):
+            response = session.get(url, timeout=self.timeout, headers=headers)
+
+        status = response.status_code
+        if status in (404, 410):
+            raise NotFoundError(f"URL returned {status}: {url}")
+        if status == 429 or status >= 500:
+            self._handle_rate_limit_error(domain, response)
+            raise RateLimitError(f"Status {status} on {domain}")
+        if status in (200, 304):
+            self._reset_error_count(domain)
+        if status == 200:
+            self._archive_html(url, response.text, status)
+        return response
+
+    def _archive_html(self, url: str, html: str, status: int = 200) -> None:
+        """Store a fetched page in the HTML archive, if one is configured."""
+        if self.html_archive is None or not html:
+            return
+        try:
+            self.html_archive.put(url, html, status=status)
+        except Exception as e:
+            logger.warning(f"Failed to archive HTML for {url}: {e}")
+
+    def _replay_html(self, url: str, html: Optional[str]) -> Tuple[Optional[str], bool]:
+        """Resolve the page HTML in archive replay mode.
+
+        Replay is offline: without ``html`` the latest archived copy is
+        used, and the flag is True (skip the Selenium fallback) whenever
+        HTML is available. Pages missing from the archive are fetched.
+        """
+        if not self.archive_replay:
+            return html, False
+        if html is None and self.html_archive is not None:
+            html = self.html_archive.latest(url)
+            if html is None:
+                logger.info(f"No archived HTML for {url}; fetching")
+        return html, html is not None
+
     def extract_content(
         self, url: str, html: str = None, metrics: Optional[ExtractionMetrics] = None
     ) -> Dict[str, Any]:
@@ -1127,7 +1282,58 @@ class ContentExtractor:
 
         Returns a dictionary with keys: title, author, content, publish_date,
         metadata (original meta), and extracted_at.
+
+        In archive replay mode, ``html`` defaults to the latest archived
+        copy of ``url`` and no browser is used for archived pages.
         """
+        html, replayed = self._replay_html(url, html)
+        result = self._extract_without_browser(url, html, metrics)
+
+        # Check what fields are still missing after BeautifulSoup
+        missing_fields = self._get_missing_fields(result)
+
+        # Try Selenium final fallback for remaining missing fields
+        if missing_fields and SELENIUM_AVAILABLE and not replayed:
+            self._apply_selenium_fallback(url, result, missing_fields, metrics)
+
+        return self._finalize_extraction(url, result)
+
+    def submit_extraction(
+        self, url: str, html: str = None, metrics: Optional[ExtractionMetrics] = None
+    ) -> Future:
+        """Like ``extract_content`` but never renders on the caller's thread.
+
+        The HTTP methods run immediately. When fields are still missing and
+        a browser pool is enabled, the Selenium fallback is queued and the
+        returned future completes once the pooled browser result has been
+        merged; otherwise the future is already done. ``NotFoundError`` and
+        ``RateLimitError`` from the HTTP methods propagate directly.
+        """
+        html, replayed = self._replay_html(url, html)
+        result = self._extract_without_browser(url, html, metrics)
+        missing_fields = [] if replayed else self._get_missing_fields(result)
+        queue = getattr(self, "selenium_queue", None)
+
+        if missing_fields and SELENIUM_AVAILABLE and queue is not None:
+            return queue.submit(
+                self._render_and_finalize, url, result, missing_fields, metrics
+            )
+
+        if missing_fields and SELENIUM_AVAILABLE:
+            self._apply_selenium_fallback(url, result, missing_fields, metrics)
+        future: Future = Future()
+        future.set_result(self._finalize_extraction(url, result))
+        return future
+
+    def _render_and_finalize(self, driver, url, result, missing_fields, metrics):
+        """Browser-queue job: Selenium fallback on a pooled driver."""
+        self._apply_selenium_fallback(url, result, missing_fields, metrics, driver)
+        return self._finalize_extraction(url, result)
+
+    def _extract_without_browser(
+        self, url: str, html: str = None, metrics: Optional[ExtractionMetrics] = None
+    ) -> Dict[str, Any]:
+        """Run the newspaper4k and BeautifulSoup stages of ``extract_content``."""
         logger.debug(f"Starting content extraction for {url}")
 
         # Reset publish-date detail tracking for this article
@@ -1145,185 +1351,320 @@ class ContentExtractor:
             "extraction_methods": {},  # Track which method worked for field
         }
 
+        router = self.strategy_router
+        route = router.route(urlparse(url).netloc.lower()) if router else DEFAULT_ROUTE
+        if route == BS_FIRST_ROUTE:
+            return self._extract_beautifulsoup_first(url, html, result, metrics)
+
         # Try newspaper4k first (primary method)
+        newspaper_result = None
         if NEWSPAPER_AVAILABLE:
+            newspaper_result = self._run_newspaper_stage(
+                url, html, result, None, metrics
+            )
+
+        # Check what fields are still missing
+        missing_fields = self._get_missing_fields(result)
+
+        # Try BeautifulSoup fallback for missing fields
+        if missing_fields:
+            bs_result = self._run_beautifulsoup_stage(
+                url, html, result, missing_fields, metrics
+            )
+            self._record_route_parity(url, newspaper_result, bs_result)
+
+        return result
+
+    def _extract_beautifulsoup_first(
+        self,
+        url: str,
+        html: Optional[str],
+        result: Dict[str, Any],
+        metrics: Optional[ExtractionMetrics] = None,
+    ) -> Dict[str, Any]:
+        """Routed order for hosts where newspaper4k keeps missing fields.
+
+        The page is still fetched through newspaper4k's session path (status
+        handling, backoff, archiving), but its parse only runs for core
+        fields BeautifulSoup left empty. The router only sends hosts here
+        where BeautifulSoup's values match what the default order keeps.
+        """
+        fetch_metadata: Dict[str, Any] = {}
+        if html is None and NEWSPAPER_AVAILABLE:
             try:
-                logger.info(f"Attempting newspaper4k extraction for {url}")
-                if metrics:
-                    metrics.start_method("newspaper4k")
+                fetched = self._extract_with_newspaper(url, None, parse=False)
+            except (NotFoundError, RateLimitError):
+                raise
+            except Exception as e:
+                logger.info(f"newspaper4k fetch failed for {url}: {e}")
+            else:
+                html = fetched.get("html")
+                fetch_metadata = fetched.get("metadata") or {}
+                if metrics and fetch_metadata.get("http_status"):
+                    metrics.set_http_metrics(fetch_metadata["http_status"], 0, 0)
 
-                newspaper_result = self._extract_with_newspaper(url, html)
+        self._run_beautifulsoup_stage(url, html, result, None, metrics)
+        for key, value in fetch_metadata.items():
+            result["metadata"].setdefault(key, value)
 
-                if newspaper_result:
-                    # Copy all successfully extracted fields
-                    self._merge_extraction_results(
-                        result, newspaper_result, "newspaper4k", None, metrics
-                    )
-                    logger.info(f"newspaper4k extraction completed for {url}")
-                    if metrics:
-                        metrics.end_method("newspaper4k", True, None, newspaper_result)
-                else:
-                    if metrics:
-                        metrics.end_method(
-                            "newspaper4k",
-                            False,
-                            "No content extracted",
-                            newspaper_result or {},
-                        )
+        missing_fields = [
+            field for field in self._get_missing_fields(result) if field in FIELDS
+        ]
+        if missing_fields and NEWSPAPER_AVAILABLE:
+            self._run_newspaper_stage(url, html, result, missing_fields, metrics)
 
-            except NotFoundError as e:
-                # 404/410 - URL permanently missing, stop all fallback attempts
-                logger.warning(f"URL not found (404/410), stopping extraction: {url}")
+        return result
+
+    def _run_newspaper_stage(
+        self,
+        url: str,
+        html: Optional[str],
+        result: Dict[str, Any],
+        fields: Optional[List[str]] = None,
+        metrics: Optional[ExtractionMetrics] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Merge newspaper4k's ``fields`` (all when None) into ``result``.
+
+        Returns newspaper4k's own result, or None when it raised.
+        """
+        newspaper_result = None
+        try:
+            logger.info(f"Attempting newspaper4k extraction for {url}")
+            if metrics:
+                metrics.start_method("newspaper4k")
+
+            newspaper_result = self._extract_with_newspaper(url, html)
+            self._record_route_outcome(url, "newspaper4k", newspaper_result)
+
+            if newspaper_result:
+                self._merge_extraction_results(
+                    result, newspaper_result, "newspaper4k", fields, metrics
+                )
+                logger.info(f"newspaper4k extraction completed for {url}")
                 if metrics:
-                    metrics.end_method("newspaper4k", False, str(e), {})
-                raise  # Re-raise to prevent BeautifulSoup/Selenium fallback
-            except RateLimitError as e:
-                # Rate limiting/bot protection, stop all fallback attempts
-                logger.warning(f"Rate limit/bot protection, stopping extraction: {url}")
+                    metrics.end_method("newspaper4k", True, None, newspaper_result)
+            else:
                 if metrics:
-                    metrics.end_method("newspaper4k", False, str(e), {})
-                raise  # Re-raise to prevent BeautifulSoup/Selenium fallback
-            except Exception as e:
-                logger.info(f"newspaper4k extraction failed for {url}: {e}")
-                # Try to get any partial result with metadata (including HTTP
-                # status)
-                partial_result = {}
-                if hasattr(e, "__context__") and hasattr(e.__context__, "response"):
-                    # Some HTTP errors might have response info
-                    pass
+                    metrics.end_method(
+                        "newspaper4k",
+                        False,
+                        "No content extracted",
+                        newspaper_result or {},
+                    )
+
+        except NotFoundError as e:
+            # 404/410 - URL permanently missing, stop all fallback attempts
+            logger.warning(f"URL not found (404/410), stopping extraction: {url}")
+            if metrics:
+                metrics.end_method("newspaper4k", False, str(e), {})
+            raise  # Re-raise to prevent BeautifulSoup/Selenium fallback
+        except RateLimitError as e:
+            # Rate limiting/bot protection, stop all fallback attempts
+            logger.warning(f"Rate limit/bot protection, stopping extraction: {url}")
+            if metrics:
+                metrics.end_method("newspaper4k", False, str(e), {})
+            raise  # Re-raise to prevent BeautifulSoup/Selenium fallback
+        except Exception as e:
+            logger.info(f"newspaper4k extraction failed for {url}: {e}")
+            # A failed parse extracted no fields; 404s and rate limits above
+            # say nothing about the host's markup and are not recorded
+            self._record_route_outcome(url, "newspaper4k", None)
+            # Try to get any partial result with metadata (including HTTP
+            # status)
+            partial_result = {}
+            if hasattr(e, "__context__") and hasattr(e.__context__, "response"):
+                # Some HTTP errors might have response info
+                pass
 
-                # Check if this is an HTTP error with status code in the
-                # message
-                error_str = str(e)
-                if "Status code" in error_str:
-                    import re
-
-                    status_match = re.search(r"Status code (\d+)", error_str)
-                    if status_match:
-                        http_status = int(status_match.group(1))
-                        partial_result = {
-                            "metadata": {
-                                "extraction_method": "newspaper4k",
-                                "http_status": http_status,
-                            }
+            # Check if this is an HTTP error with status code in the
+            # message
+            error_str = str(e)
+            if "Status code" in error_str:
+                import re
+
+                status_match = re.search(r"Status code (\d+)", error_str)
+                if status_match:
+                    http_status = int(status_match.group(1))
+                    partial_result = {
+                        "metadata": {
+                            "extraction_method": "newspaper4k",
+                            "http_status": http_status,
                         }
+                    }
 
-                if metrics:
-                    metrics.end_method("newspaper4k", False, str(e), partial_result)
+            if metrics:
+                metrics.end_method("newspaper4k", False, str(e), partial_result)
+        return newspaper_result
 
-        # Check what fields are still missing
-        missing_fields = self._get_missing_fields(result)
+    def _run_beautifulsoup_stage(
+        self,
+        url: str,
+        html: Optional[str],
+        result: Dict[str, Any],
+        fields: Optional[List[str]] = None,
+        metrics: Optional[ExtractionMetrics] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Merge BeautifulSoup's ``fields`` (all when None) into ``result``.
 
-        # Try BeautifulSoup fallback for missing fields
-        if missing_fields:
-            try:
-                logger.info(
-                    f"Attempting BeautifulSoup fallback for missing "
-                    f"fields {missing_fields} on {url}"
+        Returns BeautifulSoup's own result, or None when it raised.
+        """
+        bs_result = None
+        try:
+            logger.info(
+                f"Attempting BeautifulSoup extraction for "
+                f"fields {fields or 'all'} on {url}"
+            )
+            if metrics:
+                metrics.start_method("beautifulsoup")
+
+            bs_result = self._extract_with_beautifulsoup(url, html)
+
+            if bs_result:
+                self._record_route_outcome(url, "beautifulsoup", bs_result)
+                self._merge_extraction_results(
+                    result, bs_result, "beautifulsoup", fields, metrics
                 )
+                logger.info(f"BeautifulSoup extraction completed for {url}")
+                if metrics:
+                    metrics.end_method("beautifulsoup", True, None, bs_result)
+            else:
                 if metrics:
-                    metrics.start_method("beautifulsoup")
+                    metrics.end_method(
+                        "beautifulsoup",
+                        False,
+                        "No content extracted",
+                        bs_result or {},
+                    )
 
-                bs_result = self._extract_with_beautifulsoup(url, html)
+        except Exception as e:
+            logger.info(f"BeautifulSoup extraction failed for {url}: {e}")
+            if metrics:
+                metrics.end_method("beautifulsoup", False, str(e), {})
+        return bs_result
 
-                if bs_result:
-                    # Only copy missing fields
-                    self._merge_extraction_results(
-                        result, bs_result, "beautifulsoup", missing_fields, metrics
-                    )
-                    logger.info(f"BeautifulSoup extraction completed for {url}")
-                    if metrics:
-                        metrics.end_method("beautifulsoup", True, None, bs_result)
-                else:
-                    if metrics:
-                        metrics.end_method(
-                            "beautifulsoup",
-                            False,
-                            "No content extracted",
-                            bs_result or {},
-                        )
+    def _record_route_outcome(
+        self, url: str, method: str, extracted: Optional[Dict[str, Any]]
+    ) -> None:
+        """Feed which core fields ``method`` extracted to the strategy router."""
+        router = self.strategy_router
+        if router is None:
+            return
+        extracted = extracted or {}
+        router.record(
+            urlparse(url).netloc.lower(),
+            method,
+            {
+                field: self._is_field_value_meaningful(field, extracted.get(field))
+                for field in FIELDS
+            },
+        )
 
-            except Exception as e:
-                logger.info(f"BeautifulSoup extraction failed for {url}: {e}")
-                if metrics:
-                    metrics.end_method("beautifulsoup", False, str(e), {})
+    def _record_route_parity(
+        self,
+        url: str,
+        newspaper_result: Optional[Dict[str, Any]],
+        bs_result: Optional[Dict[str, Any]],
+    ) -> None:
+        """Tell the strategy router, for each core field newspaper4k
+        extracted, whether BeautifulSoup's value was the same."""
+        router = self.strategy_router
+        if router is None or not newspaper_result or not bs_result:
+            return
+        agreed = {
+            field: _comparable_field_value(bs_result.get(field))
+            == _comparable_field_value(newspaper_result.get(field))
+            for field in FIELDS
+            if self._is_field_value_meaningful(field, newspaper_result.get(field))
+        }
+        router.record_parity(urlparse(url).netloc.lower(), agreed)
 
-        # Check what fields are still missing after BeautifulSoup
-        missing_fields = self._get_missing_fields(result)
+    def _apply_selenium_fallback(
+        self,
+        url: str,
+        result: Dict[str, Any],
+        missing_fields: List[str],
+        metrics: Optional[ExtractionMetrics] = None,
+        driver=None,
+    ) -> None:
+        """Fill ``missing_fields`` in ``result`` from a Selenium render.
 
-        # Try Selenium final fallback for remaining missing fields
-        if missing_fields and SELENIUM_AVAILABLE:
-            try:
+        Uses ``driver`` when given (a pooled browser), otherwise the
+        persistent driver.
+        """
+        dom = urlparse(url).netloc
+        try:
+            logger.info(
+                f"Attempting Selenium fallback for missing "
+                f"fields {missing_fields} on {url}"
+            )
+            if metrics:
+                metrics.start_method("selenium")
+
+            # Check if domain is in CAPTCHA backoff period
+            # Selenium should respect CAPTCHA backoffs since it will just hit the same CAPTCHA
+            if self._check_rate_limit(dom):
                 logger.info(
-                    f"Attempting Selenium fallback for missing "
-                    f"fields {missing_fields} on {url}"
+                    f"Skipping Selenium for {dom} - domain is in CAPTCHA backoff period"
                 )
-                if metrics:
-                    metrics.start_method("selenium")
+                raise RateLimitError(f"Domain {dom} is in backoff period")
 
-                # Check if domain is in CAPTCHA backoff period
-                # Selenium should respect CAPTCHA backoffs since it will just hit the same CAPTCHA
-                dom = urlparse(url).netloc
-                if self._check_rate_limit(dom):
-                    logger.info(
-                        f"Skipping Selenium for {dom} - domain is in CAPTCHA backoff period"
-                    )
-                    raise RateLimitError(f"Domain {dom} is in backoff period")
-
-                # Only check if Selenium itself has failed repeatedly on this domain
-                selenium_failures = getattr(self, "_selenium_failure_counts", {})
-                if selenium_failures.get(dom, 0) >= 3:
-                    logger.warning(
-                        f"Skipping Selenium for {dom} - already failed {selenium_failures[dom]} times"
-                    )
-                    raise RateLimitError(
-                        f"Selenium repeatedly failed for {dom}; skipping"
-                    )
+            # Only check if Selenium itself has failed repeatedly on this domain
+            selenium_failures = getattr(self, "_selenium_failure_counts", {})
+            if selenium_failures.get(dom, 0) >= 3:
+                logger.warning(
+                    f"Skipping Selenium for {dom} - already failed {selenium_failures[dom]} times"
+                )
+                raise RateLimitError(f"Selenium repeatedly failed for {dom}; skipping")
 
+            if driver is None:
                 selenium_result = self._extract_with_selenium(url)
+            else:
+                selenium_result = self._extract_with_selenium(url, driver=driver)
 
-                if selenium_result and selenium_result.get("content"):
-                    # Only copy still-missing fields
-                    self._merge_extraction_results(
-                        result, selenium_result, "selenium", missing_fields, metrics
-                    )
-                    logger.info(f"✅ Selenium extraction succeeded for {url}")
+            if selenium_result and selenium_result.get("content"):
+                # Only copy still-missing fields
+                self._merge_extraction_results(
+                    result, selenium_result, "selenium", missing_fields, metrics
+                )
+                logger.info(f"✅ Selenium extraction succeeded for {url}")
 
-                    # Reset failure count on success
-                    if dom in self._selenium_failure_counts:
-                        del self._selenium_failure_counts[dom]
+                # Reset failure count on success
+                if dom in self._selenium_failure_counts:
+                    del self._selenium_failure_counts[dom]
 
-                    if metrics:
-                        metrics.end_method("selenium", True, None, selenium_result)
-                else:
-                    # Selenium returned empty result - track as failure
-                    self._selenium_failure_counts[dom] = (
-                        self._selenium_failure_counts.get(dom, 0) + 1
-                    )
-                    logger.warning(
-                        f"❌ Selenium returned empty result for {url} "
-                        f"(failure #{self._selenium_failure_counts[dom]})"
-                    )
-                    if metrics:
-                        metrics.end_method(
-                            "selenium",
-                            False,
-                            "No content extracted",
-                            selenium_result or {},
-                        )
-
-            except Exception as e:
-                # Track Selenium exception as failure
+                if metrics:
+                    metrics.end_method("selenium", True, None, selenium_result)
+            else:
+                # Selenium returned empty result - track as failure
                 self._selenium_failure_counts[dom] = (
                     self._selenium_failure_counts.get(dom, 0) + 1
                 )
-                logger.info(
-                    f"❌ Selenium extraction failed for {url}: {e} "
+                logger.warning(
+                    f"❌ Selenium returned empty result for {url} "
                     f"(failure #{self._selenium_failure_counts[dom]})"
                 )
                 if metrics:
-                    metrics.end_method("selenium", False, str(e), {})
+                    metrics.end_method(
+                        "selenium",
+                        False,
+                        "No content extracted",
+                        selenium_result or {},
+                    )
 
+        except Exception as e:
+            # Track Selenium exception as failure
+            self._selenium_failure_counts[dom] = (
+                self._selenium_failure_counts.get(dom, 0) + 1
+            )
+            logger.info(
+                f"❌ Selenium extraction failed for {url}: {e} "
+                f"(failure #{self._selenium_failure_counts[dom]})"
+            )
+            if metrics:
+                metrics.end_method("selenium", False, str(e), {})
+
+    def _finalize_extraction(self, url: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply URL date fallback and method tracking to a merged result."""
         # Apply URL-based publish date fallback when all methods fail
         if not result.get("publish_date"):
             url_fallback = self._extract_publish_date_from_url(url)
@@ -1405,39 +1746,7 @@ class ContentExtractor:
 
     def _extract_publish_date_from_url(self, url: str) -> Optional[Tuple[str, str]]:
         """Attempt to derive publish date directly from URL path."""
-        parsed = urlparse(url)
-        host = parsed.netloc.lower().split(":")[0]
-
-        if not any(host.endswith(allowed) for allowed in URL_DATE_FALLBACK_HOSTS):
-            return None
-
-        slug = parsed.path.lower()
-        if parsed.query:
-            slug = f"{slug}?{parsed.query.lower()}"
-
-        for pattern_name, pattern in URL_DATE_REGEX_PATTERNS:
-            match = re.search(pattern, slug)
-            if not match:
-                continue
-
-            try:
-                year = int(match.group("year"))
-                month = int(match.group("month"))
-                day = int(match.group("day"))
-            except (ValueError, KeyError):
-                continue
-
-            try:
-                current_year = datetime.utcnow().year
-                if not (2000 <= year <= current_year + 1):
-                    continue
-
-                publish_date = datetime(year, month, day).isoformat()
-                return publish_date, pattern_name
-            except ValueError:
-                continue
-
-        return None
+        return date_from_url(url)
 
     def _merge_extraction_results(
         self,
@@ -1561,8 +1870,14 @@ class ContentExtractor:
 
         return bool(title) or (bool(content) and len(content) > 100)
 
-    def _extract_with_newspaper(self, url: str, html: str = None) -> Dict[str, Any]:
-        """Extract content using newspaper4k library with cloudscraper support."""
+    def _extract_with_newspaper(
+        self, url: str, html: str = None, parse: bool = True
+    ) -> Dict[str, Any]:
+        """Extract content using newspaper4k library with cloudscraper support.
+
+        With ``parse=False`` only the fetch runs and the result holds the
+        page ``html`` and fetch ``metadata``.
+        """
         # Skip if known-dead URL
         ttl = getattr(self, "dead_url_ttl", 0)
         if ttl and url in getattr(self, "dead_urls", {}):
@@ -1715,6 +2030,7 @@ class ContentExtractor:
 
                     # Use the downloaded HTML content to parse the article
                     article.html = response.text
+                    self._archive_html(url, response.text)
                     ua = self.domain_user_agents.get(domain, "Unknown")
                     logger.info(
                         f"✅ Successfully fetched {len(response.text)} bytes from {domain} "
@@ -1794,6 +2110,13 @@ class ContentExtractor:
                             )
                     raise download_e
 
+        if not parse:
+            return {
+                "url": url,
+                "html": article.html,
+                "metadata": {"http_status": http_status, **proxy_metadata},
+            }
+
         article.parse()
 
         # Extract publish date if available
@@ -1878,6 +2201,7 @@ class ContentExtractor:
 
                     resp.raise_for_status()
                     page_html = resp.text
+                    self._archive_html(url, page_html, resp.status_code)
 
                     ua = self.domain_user_agents.get(domain, "Unknown")
                     is_cloudscraper = (
@@ -1923,14 +2247,19 @@ class ContentExtractor:
 
         return result
 
-    def _extract_with_selenium(self, url: str) -> Dict[str, Any]:
-        """Extract content using persistent Selenium driver."""
+    def _extract_with_selenium(self, url: str, driver=None) -> Dict[str, Any]:
+        """Extract content using a pooled or the persistent Selenium driver."""
+        pooled = driver is not None
         try:
             # Get the persistent driver (creates one if needed)
-            driver = self.get_persistent_driver()
+            if not pooled:
+                driver = self.get_persistent_driver()
             stealth_method = getattr(self, "_driver_method", "unknown")
 
-            logger.debug(f"Using persistent {stealth_method} driver for {url}")
+            logger.debug(
+                f"Using {'pooled' if pooled else 'persistent'} "
+                f"{stealth_method} driver for {url}"
+            )
 
             # Navigate with human-like behavior
             success = self._navigate_with_human_behavior(driver, url)
@@ -1953,15 +2282,16 @@ class ContentExtractor:
                 "url": url,
                 "title": self._extract_title(soup),
                 "author": self._extract_author(soup),
-                "publish_date": self._extract_published_date(soup, html),
-                "content": self._extract_content(soup),
+                "publish_date": self._extract_published_date(soup, html, url),
+                "content": self._extract_content(soup, url),
                 "metadata": {
                     "meta_description": self._extract_meta_description(soup),
                     "extraction_method": "selenium",
                     "stealth_mode": True,
                     "stealth_method": stealth_method,
                     "page_source_length": len(html),
-                    "driver_reused": self._driver_reuse_count > 0,
+                    "driver_reused": pooled or self._driver_reuse_count > 0,
+                    "driver_pooled": pooled,
                 },
                 "extracted_at": datetime.utcnow().isoformat(),
             }
@@ -1975,8 +2305,12 @@ class ContentExtractor:
             # If the driver fails, close it so a new one will be created next
             # time
             if "driver" in str(e).lower() or "session" in str(e).lower():
-                logger.warning("Driver error detected, closing persistent driver")
-                self.close_persistent_driver()
+                if pooled:
+                    logger.warning("Driver error detected, recycling pooled driver")
+                    self._recycle_if_crashed(driver, e)
+                else:
+                    logger.warning("Driver error detected, closing persistent driver")
+                    self.close_persistent_driver()
             return {}
 
     def _create_undetected_driver(self):
@@ -2256,8 +2590,17 @@ class ContentExtractor:
 
         except Exception as e:
             logger.error(f"Navigation failed for {url}: {e}")
+            self._recycle_if_crashed(driver, e)
             return False
 
+    def _recycle_if_crashed(self, driver, error: Exception) -> None:
+        """Flag a pooled driver whose browser session died for recycling."""
+        message = str(error).lower()
+        queue = getattr(self, "selenium_queue", None)
+        if queue is not None and ("driver" in message or "session" in message):
+            # No-op for drivers the pool did not lease (the persistent one)
+            queue.pool.mark_broken(driver)
+
     def _simulate_human_reading(self, driver):
         """Simulate realistic human reading and browsing behavior."""
         import random
@@ -2566,6 +2909,22 @@ class ContentExtractor:
 
         return None
 
+    @property
+    def _publish_date_details(self) -> Optional[Dict[str, Any]]:
+        # Per-thread: pooled browser workers extract concurrently with the
+        # HTTP path on the same extractor
+        return getattr(self._thread_state(), "publish_date_details", None)
+
+    @_publish_date_details.setter
+    def _publish_date_details(self, value: Optional[Dict[str, Any]]) -> None:
+        self._thread_state().publish_date_details = value
+
+    def _thread_state(self) -> threading.local:
+        state = self.__dict__.get("_thread_local")
+        if state is None:
+            state = self.__dict__.setdefault("_thread_local", threading.local())
+        return state
+
     def _record_publish_date_details(
         self, source: str, details: Optional[Dict[str, Any]] = None
     ) -> None:
@@ -2661,11 +3020,35 @@ class ContentExtractor:
         else:
             target_metadata["fallbacks"] = {"publish_date": details_copy}
 
-    def _extract_published_date(self, soup: BeautifulSoup, html: str) -> Optional[str]:
-        """Extract publication date using multiple heuristics."""
+    def _extract_published_date(
+        self, soup: BeautifulSoup, html: str, url: Optional[str] = None
+    ) -> Optional[str]:
+        """Extract publication date using multiple heuristics.
+
+        Strategies run in ``PUBLISH_DATE_STRATEGIES`` order, except that the
+        one that most often found the date on ``url``'s host goes first.
+        """
         self._publish_date_details = None
+        host = urlparse(url).netloc.lower() if url else None
+
+        for strategy in self.date_strategies.order(host, PUBLISH_DATE_STRATEGIES):
+            if strategy == "json_ld":
+                parsed = self._extract_publish_date_from_json_ld(soup)
+            elif strategy == "time_tag":
+                parsed = self._extract_publish_date_from_time_tag(soup)
+            elif strategy == "text_block":
+                # Fallback: scan text near bylines or keyworded blocks
+                parsed = self._extract_publish_date_from_text_blocks(soup)
+            else:
+                attr, value = strategy[len("meta:") :].split("=", 1)
+                parsed = self._extract_publish_date_from_meta(soup, attr, value)
+            if parsed:
+                self.date_strategies.record(host, strategy)
+                return parsed
+
+        return None
 
-        # Try JSON-LD first
+    def _extract_publish_date_from_json_ld(self, soup: BeautifulSoup) -> Optional[str]:
         try:
             for script in soup.find_all("script", type="application/ld+json"):
                 try:
@@ -2698,102 +3081,93 @@ class ContentExtractor:
                                 )
 
                             if date_published:
-                                try:
-                                    parsed_date = dateparser.parse(str(date_published))
-                                    return (
-                                        parsed_date.isoformat() if parsed_date else None
-                                    )
-                                except Exception:
-                                    self._record_publish_date_details(
-                                        "json_ld",
-                                        {
-                                            "strategy": "script",
-                                            "error": "parse_failed",
-                                        },
-                                    )
-                                    continue
+                                parsed_date = parse_date(date_published)
+                                if parsed_date:
+                                    return parsed_date
+                                self._record_publish_date_details(
+                                    "json_ld",
+                                    {
+                                        "strategy": "script",
+                                        "error": "parse_failed",
+                                    },
+                                )
 
                 except json.JSONDecodeError:
                     continue
         except Exception:
             pass
+        return None
 
-        # Try meta tags
-        meta_selectors = [
-            ("property", "article:published_time"),
-            ("name", "pubdate"),
-            ("name", "publishdate"),
-            ("name", "date"),
-            ("itemprop", "datePublished"),
-            ("name", "publish_date"),
-            ("property", "article:published"),
-        ]
-
-        for attr, value in meta_selectors:
-            meta_tag = soup.find("meta", attrs={attr: value})
-            if meta_tag and isinstance(meta_tag, Tag):
-                content = meta_tag.get("content")
-                if content:
-                    try:
-                        parsed_date = dateparser.parse(str(content))
-                        if parsed_date:
-                            self._record_publish_date_details(
-                                "meta_tag",
-                                {"attribute": attr, "value": value},
-                            )
-                            return parsed_date.isoformat()
-                        self._record_publish_date_details(
-                            "meta_tag",
-                            {
-                                "attribute": attr,
-                                "value": value,
-                                "error": "parse_failed",
-                            },
-                        )
-                    except Exception:
-                        continue
+    def _extract_publish_date_from_meta(
+        self, soup: BeautifulSoup, attr: str, value: str
+    ) -> Optional[str]:
+        meta_tag = soup.find("meta", attrs={attr: value})
+        if not meta_tag or not isinstance(meta_tag, Tag):
+            return None
+        content = meta_tag.get("content")
+        if not content:
+            return None
+        parsed_date = parse_date(content)
+        if parsed_date:
+            self._record_publish_date_details(
+                "meta_tag",
+                {"attribute": attr, "value": value},
+            )
+            return parsed_date
+        self._record_publish_date_details(
+            "meta_tag",
+            {
+                "attribute": attr,
+                "value": value,
+                "error": "parse_failed",
+            },
+        )
+        return None
 
-        # Try time element
+    def _extract_publish_date_from_time_tag(self, soup: BeautifulSoup) -> Optional[str]:
         time_tag = soup.find("time")
-        if time_tag and isinstance(time_tag, Tag):
-            datetime_attr = time_tag.get("datetime")
-            if datetime_attr:
-                try:
-                    parsed_date = dateparser.parse(str(datetime_attr))
-                    if parsed_date:
-                        self._record_publish_date_details(
-                            "time_tag",
-                            {"attribute": "datetime"},
-                        )
-                        return parsed_date.isoformat()
-                except Exception:
-                    pass
+        if not time_tag or not isinstance(time_tag, Tag):
+            return None
 
-            # Try time text content
-            time_text = time_tag.get_text().strip()
-            if time_text:
-                try:
-                    parsed_date = dateparser.parse(time_text)
-                    if parsed_date:
-                        self._record_publish_date_details(
-                            "time_tag",
-                            {"attribute": "text"},
-                        )
-                        return parsed_date.isoformat()
-                except Exception:
-                    pass
+        datetime_attr = time_tag.get("datetime")
+        if datetime_attr:
+            parsed_date = parse_date(datetime_attr)
+            if parsed_date:
+                self._record_publish_date_details(
+                    "time_tag",
+                    {"attribute": "datetime"},
+                )
+                return parsed_date
 
-        # Fallback: scan text near bylines or keyworded blocks
-        return self._extract_publish_date_from_text_blocks(soup)
+        # Try time text content
+        time_text = time_tag.get_text().strip()
+        if time_text:
+            parsed_date = parse_date(time_text)
+            if parsed_date:
+                self._record_publish_date_details(
+                    "time_tag",
+                    {"attribute": "text"},
+                )
+                return parsed_date
+
+        return None
 
-    def _extract_content(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract main article content."""
+    def _extract_content(
+        self, soup: BeautifulSoup, url: Optional[str] = None
+    ) -> Optional[str]:
+        """Extract main article content.
+
+        ``content_selector`` entries from lookups/site_rules.csv for the
+        host of ``url`` are tried before the generic selectors. This applies
+        wherever BeautifulSoup parses content (fallback, routed order and
+        Selenium), so the router's parity counts reflect the routed value.
+        """
         # Remove unwanted elements
         for element in soup(["script", "style", "nav", "header", "footer", "aside"]):
             element.decompose()
 
         # Try common content selectors
-        content_selectors = [
+        content_selectors = self._site_content_selectors(url) + [
             "article",
             '[role="main"]',
             ".article-content",
@@ -2821,6 +3195,15 @@ class ContentExtractor:
 
         return None
 
+    def _site_content_selectors(self, url: Optional[str]) -> List[str]:
+        if not url:
+            return []
+        if self._site_rules is None:
+            self._site_rules = load_site_rules()
+        rules = self._site_rules
+        host_rules = get_rules_for_hostname(urlparse(url).netloc.lower(), rules)
+        return list((host_rules or {}).get("content_selector") or [])
+
     def _extract_publish_date_from_text_blocks(
         self, soup: BeautifulSoup
     ) -> Optional[str]:
@@ -2860,51 +3243,68 @@ class ContentExtractor:
                 return parsed_value
             return None
 
-        for idx, text in enumerate(stripped_strings):
-            parsed = try_candidate(text, strategy="direct", block_index=idx)
-            if parsed:
-                return parsed
-
-            if self._contains_publish_keyword(text):
-                upper_bound = min(len(stripped_strings), idx + 3)
-                for neighbor_idx in range(idx + 1, upper_bound):
-                    neighbor = stripped_strings[neighbor_idx]
-                    combined = " ".join([text, neighbor])
-                    parsed = try_candidate(
-                        combined,
-                        strategy="keyword_neighbor",
-                        block_index=idx,
-                        neighbor_index=neighbor_idx,
-                    )
-                    if parsed:
-                        return parsed
-
-            if self._looks_like_byline(text):
-                before_start = max(0, idx - 2)
-                for neighbor_idx in range(before_start, idx):
-                    neighbor = stripped_strings[neighbor_idx]
-                    combined = f"{text} {neighbor}"
-                    parsed = try_candidate(
-                        combined,
-                        strategy="byline_combined_before",
-                        block_index=idx,
-                        neighbor_index=neighbor_idx,
-                    )
-                    if parsed:
-                        return parsed
-
-                after_end = min(len(stripped_strings), idx + 3)
-                for neighbor_idx in range(idx + 1, after_end):
-                    neighbor = stripped_strings[neighbor_idx]
-                    combined = f"{text} {neighbor}"
-                    parsed = try_candidate(
-                        combined,
-                        strategy="byline_combined_after",
-                        block_index=idx,
-                        neighbor_index=neighbor_idx,
-                    )
-                    if parsed:
-                        return parsed
+        # Keyworded candidates need a keyword in the block or in a neighbor
+        # within two blocks; skip the walk when no block has one
+        keyword_indexes = [
+            idx
+            for idx, text in enumerate(stripped_strings)
+            if PUBLISH_DATE_KEYWORD_WORDS.search(text)
+        ]
+        if keyword_indexes:
+            candidate_indexes = sorted(
+                {
+                    near
+                    for idx in keyword_indexes
+                    for near in range(max(0, idx - 2), idx + 3)
+                    if near < len(stripped_strings)
+                }
+            )
+            for idx in candidate_indexes:
+                text = stripped_strings[idx]
+                parsed = try_candidate(text, strategy="direct", block_index=idx)
+                if parsed:
+                    return parsed
+
+                if self._contains_publish_keyword(text):
+                    upper_bound = min(len(stripped_strings), idx + 3)
+                    for neighbor_idx in range(idx + 1, upper_bound):
+                        neighbor = stripped_strings[neighbor_idx]
+                        combined = " ".join([text, neighbor])
+                        parsed = try_candidate(
+                            combined,
+                            strategy="keyword_neighbor",
+                            block_index=idx,
+                            neighbor_index=neighbor_idx,
+                        )
+                        if parsed:
+                            return parsed
+
+                if self._looks_like_byline(text):
+                    before_start = max(0, idx - 2)
+                    for neighbor_idx in range(before_start, idx):
+                        neighbor = stripped_strings[neighbor_idx]
+                        combined = f"{text} {neighbor}"
+                        parsed = try_candidate(
+                            combined,
+                            strategy="byline_combined_before",
+                            block_index=idx,
+                            neighbor_index=neighbor_idx,
+                        )
+                        if parsed:
+                            return parsed
+
+                    after_end = min(len(stripped_strings), idx + 3)
+                    for neighbor_idx in range(idx + 1, after_end):
+                        neighbor = stripped_strings[neighbor_idx]
+                        combined = f"{text} {neighbor}"
+                        parsed = try_candidate(
+                            combined,
+                            strategy="byline_combined_after",
+                            block_index=idx,
+                            neighbor_index=neighbor_idx,
+                        )
+                        if parsed:
+                            return parsed
 
         loose_parsed = self._extract_publish_date_without_keywords(stripped_strings)
         if loose_parsed:
@@ -2931,14 +3331,7 @@ class ContentExtractor:
         if not tail:
             return None
 
-        try:
-            parsed_date = dateparser.parse(tail)
-            if parsed_date:
-                return parsed_date.isoformat()
-        except Exception:
-            return None
-
-        return None
+        return parse_date(tail)
 
     def _contains_publish_keyword(self, text: str) -> bool:
         if not text:
@@ -3036,6 +3429,9 @@ class ContentExtractor:
             return None
 
         search_limit = min(len(blocks), 150)
+        if not DATE_ONLY_YEAR_REGEX.search("\n".join(blocks[:search_limit])):
+            return None
+
         for idx in range(search_limit):
             candidate = blocks[idx].strip()
             if not candidate or not self._looks_like_date_only_line(candidate):
@@ -3044,15 +3440,10 @@ class ContentExtractor:
             if idx > 30 and not self._has_byline_context(blocks, idx):
                 continue
 
-            try:
-                parsed_date = dateparser.parse(candidate)
-            except Exception:
-                continue
-
-            if not parsed_date:
+            iso_value = parse_date(candidate)
+            if not iso_value:
                 continue
 
-            iso_value = parsed_date.isoformat()
             self._record_publish_date_details(
                 "text_block_loose",
                 {
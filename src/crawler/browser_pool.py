@@ -0,0 +1,288 @@
+"""Bounded pool of Selenium browsers behind a dedicated fallback queue.
+
+``ContentExtractor`` used to render JavaScript-heavy pages inline on a
+single persistent driver, so one slow page (navigation, modal handling,
+human-like pauses) stalled the HTTP extraction loop behind it. The classes
+here let the loop hand such pages to a ``SeleniumFallbackQueue`` and keep
+going:
+
+- ``BrowserPool`` owns at most ``size`` drivers, creates them lazily and
+  recycles a driver after ``max_pages`` pages, when it crashed, or when its
+  browser process tree exceeds ``max_memory_mb``.
+- ``SeleniumFallbackQueue`` runs render jobs on ``size`` worker threads,
+  each leasing a driver from the pool, and returns ``Future`` objects. At
+  most ``max_pending`` jobs may wait; further submissions block, which
+  applies back-pressure instead of queueing unbounded work.
+
+Drivers are only ever used by one thread at a time.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def _proc_children(pid: int) -> list[int]:
+    children: list[int] = []
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children") as handle:
+                children.extend(int(child) for child in handle.read().split())
+    except (OSError, ValueError):
+        pass
+    return children
+
+
+def _proc_rss_kb(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status") as handle:
+            for line in handle:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+
+def driver_memory_mb(driver) -> float | None:
+    """Resident memory of a driver's chromedriver/Chrome process tree.
+
+    Reads ``/proc``; returns ``None`` when the process is unknown or the
+    platform does not expose it.
+    """
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    pid = getattr(process, "pid", None) or getattr(driver, "browser_pid", None)
+    if not isinstance(pid, int) or not os.path.exists(f"/proc/{pid}"):
+        return None
+
+    total_kb = 0
+    stack = [pid]
+    seen: set[int] = set()
+    while stack:
+        current = stack.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        total_kb += _proc_rss_kb(current)
+        stack.extend(_proc_children(current))
+    return total_kb / 1024
+
+
+@dataclass
+class _PooledDriver:
+    driver: Any
+    created_at: float = field(default_factory=time.monotonic)
+    pages: int = 0
+    broken: bool = False
+
+
+class BrowserPool:
+    """Lazily created, recycled Selenium drivers shared by worker threads."""
+
+    def __init__(
+        self,
+        driver_factory: Callable[[], Any],
+        size: int = 2,
+        *,
+        max_pages: int = 50,
+        max_memory_mb: float | None = None,
+        memory_probe: Callable[[Any], float | None] = driver_memory_mb,
+    ):
+        if size < 1:
+            raise ValueError("BrowserPool size must be at least 1")
+        self.size = size
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self._factory = driver_factory
+        self._memory_probe = memory_probe
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._idle: list[_PooledDriver] = []
+        self._leased: dict[int, _PooledDriver] = {}
+        self._closed = False
+        self.stats: dict[str, int] = {
+            "created": 0,
+            "leases": 0,
+            "recycled_pages": 0,
+            "recycled_crash": 0,
+            "recycled_memory": 0,
+            "create_failures": 0,
+        }
+
+    @contextlib.contextmanager
+    def lease(self, timeout: float | None = None) -> Iterator[Any]:
+        """Borrow a driver for one page; blocks while all drivers are busy."""
+        if self._closed:
+            raise RuntimeError("BrowserPool is closed")
+        if not self._slots.acquire(timeout=-1 if timeout is None else timeout):
+            raise TimeoutError("No browser became available")
+        entry = None
+        try:
+            entry = self._checkout()
+            yield entry.driver
+        except BaseException:
+            if entry is not None and not entry.broken:
+                # A render job that raised out of the lease may have left
+                # the browser in an unknown state
+                entry.broken = True
+            raise
+        finally:
+            if entry is not None:
+                self._checkin(entry)
+            self._slots.release()
+
+    def mark_broken(self, driver) -> None:
+        """Flag a leased driver so it is quit instead of reused."""
+        with self._lock:
+            entry = self._leased.get(id(driver))
+        if entry is not None:
+            entry.broken = True
+
+    def _checkout(self) -> _PooledDriver:
+        with self._lock:
+            entry = self._idle.pop() if self._idle else None
+        if entry is None:
+            try:
+                entry = _PooledDriver(self._factory())
+            except Exception:
+                with self._lock:
+                    self.stats["create_failures"] += 1
+                raise
+            with self._lock:
+                self.stats["created"] += 1
+                created = self.stats["created"]
+            logger.info("Started pooled browser #%d", created)
+        with self._lock:
+            self._leased[id(entry.driver)] = entry
+            self.stats["leases"] += 1
+        return entry
+
+    def _recycle_reason(self, entry: _PooledDriver) -> str | None:
+        if entry.broken:
+            return "crash"
+        if self.max_pages and entry.pages >= self.max_pages:
+            return "pages"
+        if self.max_memory_mb:
+            try:
+                memory = self._memory_probe(entry.driver)
+            except Exception:
+                memory = None
+            if memory is not None and memory > self.max_memory_mb:
+                logger.info(
+                    "Pooled browser using %.0f MB (cap %.0f MB)",
+                    memory,
+                    self.max_memory_mb,
+                )
+                return "memory"
+        return None
+
+    def _checkin(self, entry: _PooledDriver) -> None:
+        entry.pages += 1
+        with self._lock:
+            self._leased.pop(id(entry.driver), None)
+        reason = None if self._closed else self._recycle_reason(entry)
+        if self._closed or reason:
+            if reason:
+                with self._lock:
+                    self.stats[f"recycled_{reason}"] += 1
+                logger.info(
+                    "Recycling pooled browser after %d pages (%s)",
+                    entry.pages,
+                    reason,
+                )
+            self._quit(entry)
+            return
+        with self._lock:
+            self._idle.append(entry)
+
+    @staticmethod
+    def _quit(entry: _PooledDriver) -> None:
+        try:
+            entry.driver.quit()
+        except Exception as exc:
+            logger.warning("Error closing pooled browser: %s", exc)
+
+    def close(self) -> None:
+        """Quit idle drivers; leased drivers are quit when returned."""
+        self._closed = True
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for entry in idle:
+            self._quit(entry)
+
+    def get_stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                **self.stats,
+                "idle": len(self._idle),
+                "leased": len(self._leased),
+                "size": self.size,
+            }
+
+
+class SeleniumFallbackQueue:
+    """Run browser render jobs off the caller's thread on a ``BrowserPool``."""
+
+    def __init__(self, pool: BrowserPool, *, max_pending: int | None = None):
+        self.pool = pool
+        self.max_pending = max_pending or pool.size * 8
+        self._pending = threading.BoundedSemaphore(self.max_pending)
+        self._executor = ThreadPoolExecutor(
+            max_workers=pool.size, thread_name_prefix="selenium-fallback"
+        )
+        self._lock = threading.Lock()
+        self.stats: dict[str, int] = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+        }
+
+    def submit(self, job: Callable[..., Any], *args, **kwargs) -> Future:
+        """Queue ``job(driver, *args, **kwargs)``; blocks while the queue is
+        full."""
+        self._pending.acquire()
+        self._count("submitted")
+        try:
+            return self._executor.submit(self._run, job, args, kwargs)
+        except BaseException:
+            self._pending.release()
+            raise
+
+    def _run(self, job, args, kwargs):
+        try:
+            with self.pool.lease() as driver:
+                result = job(driver, *args, **kwargs)
+            self._count("completed")
+            return result
+        except Exception:
+            self._count("failed")
+            raise
+        finally:
+            self._pending.release()
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def close(self, wait: bool = True) -> None:
+        """Stop accepting work, optionally wait for queued jobs, then quit
+        the browsers."""
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+        self.pool.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats: dict[str, Any] = dict(self.stats)
+        stats["pool"] = self.pool.get_stats()
+        return stats
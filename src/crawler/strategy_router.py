@@ -0,0 +1,353 @@
+"""Per-host routing of ``ContentExtractor``'s HTTP extraction methods.
+
+``extract_content`` runs newspaper4k on every page and BeautifulSoup for
+the fields it missed. On hosts where newspaper4k reliably misses a field,
+BeautifulSoup runs on every article anyway, and the full newspaper parse
+is wasted whenever BeautifulSoup alone fills every field.
+
+``StrategyRouter`` keeps exponentially decayed per-host, per-method,
+per-field success counts from the extractions it observes, plus (as the
+``parity`` method) how often BeautifulSoup's value for a field equals
+the one newspaper4k extracted when both ran. The routed order takes
+every field BeautifulSoup fills from BeautifulSoup, so it must produce
+what the default order would have. A host is routed BeautifulSoup-first
+once, over at least ``min_samples`` decayed observations of each:
+
+- BeautifulSoup's success rate is at least ``bs_threshold`` for every
+  field;
+- newspaper4k's success rate is below ``newspaper_floor`` for some field;
+- every other field either has newspaper4k below ``newspaper_floor`` too
+  (the default order already takes BeautifulSoup's value) or
+  BeautifulSoup's value matches newspaper4k's at least ``bs_threshold``
+  of the time.
+
+newspaper4k then runs only for fields BeautifulSoup left empty. A share
+``explore_rate`` of those articles still takes the default route, which
+keeps the parity counts current, so a site change that fixes newspaper4k
+(or breaks BeautifulSoup) moves the host back.
+
+Counts live in memory. With a ``session_factory`` they are loaded from
+``extraction_strategy_stats`` on first use, seeding hosts that have no
+stored counts from recent ``extraction_telemetry_v2`` rows, and written
+back every ``persist_interval`` seconds. Processes sharing the table each
+write their own view; the last write wins, which is fine for routing
+hints.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+import threading
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import select, text
+
+logger = logging.getLogger(__name__)
+
+NEWSPAPER = "newspaper4k"
+BEAUTIFULSOUP = "beautifulsoup"
+METHODS = (NEWSPAPER, BEAUTIFULSOUP)
+# Pseudo-method: BeautifulSoup's value equals newspaper4k's for a field
+PARITY = "parity"
+FIELDS = ("title", "author", "publish_date", "content")
+
+DEFAULT_ROUTE = (NEWSPAPER, BEAUTIFULSOUP)
+BS_FIRST_ROUTE = (BEAUTIFULSOUP, NEWSPAPER)
+
+DEFAULT_PERSIST_INTERVAL = 300.0
+TELEMETRY_SEED_ROWS = 20000
+
+_TELEMETRY_SQL = text(
+    "SELECT host, field_extraction FROM extraction_telemetry_v2 "
+    "WHERE host IS NOT NULL AND field_extraction IS NOT NULL "
+    "ORDER BY id DESC LIMIT :limit"
+)
+
+
+class StrategyRouter:
+    """Learns per host whether newspaper4k is worth running first.
+
+    ``session_factory`` returns a context manager yielding a SQLAlchemy
+    session (``DatabaseManager.get_session``); without one nothing is
+    loaded or persisted. ``half_life`` is in observations of a method on a
+    host.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any] | None = None,
+        *,
+        half_life: float = 200.0,
+        min_samples: float = 20.0,
+        newspaper_floor: float = 0.2,
+        bs_threshold: float = 0.9,
+        explore_rate: float = 0.05,
+        persist_interval: float = DEFAULT_PERSIST_INTERVAL,
+        max_hosts: int = 20000,
+        background: bool = True,
+        rng: random.Random | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self.decay = 0.5 ** (1.0 / half_life)
+        self.min_samples = min_samples
+        self.newspaper_floor = newspaper_floor
+        self.bs_threshold = bs_threshold
+        self.explore_rate = explore_rate
+        self.persist_interval = persist_interval
+        self.max_hosts = max_hosts
+        self.background = background
+        self._rng = rng or random.Random()
+        # host -> (method, field) -> [attempts, successes]
+        self._hosts: OrderedDict[str, dict[tuple[str, str], list[float]]] = (
+            OrderedDict()
+        )
+        self._dirty: set[str] = set()
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+        self._loaded = session_factory is None
+        self._flushed_at = time.monotonic()
+        self._flush_thread: threading.Thread | None = None
+
+    # -- routing ---------------------------------------------------------
+
+    def route(self, host: str | None) -> tuple[str, ...]:
+        """Methods to run for an article on ``host``, in order."""
+        if not host:
+            return DEFAULT_ROUTE
+        self._ensure_loaded()
+        with self._lock:
+            preferred = self._preferred(host)
+            if preferred == BS_FIRST_ROUTE and self._rng.random() < self.explore_rate:
+                self._counts["explored"] += 1
+                return DEFAULT_ROUTE
+            self._counts["bs_first" if preferred == BS_FIRST_ROUTE else "default"] += 1
+        return preferred
+
+    def _preferred(self, host: str) -> tuple[str, ...]:
+        stats = self._hosts.get(host)
+        if not stats:
+            return DEFAULT_ROUTE
+        self._hosts.move_to_end(host)
+        newspaper_misses = False
+        for field in FIELDS:
+            bs = self._rate(stats, BEAUTIFULSOUP, field)
+            newspaper = self._rate(stats, NEWSPAPER, field)
+            if bs is None or newspaper is None or bs < self.bs_threshold:
+                return DEFAULT_ROUTE
+            if newspaper < self.newspaper_floor:
+                newspaper_misses = True
+                continue
+            parity = self._rate(stats, PARITY, field)
+            if parity is None or parity < self.bs_threshold:
+                return DEFAULT_ROUTE
+        return BS_FIRST_ROUTE if newspaper_misses else DEFAULT_ROUTE
+
+    def _rate(
+        self, stats: dict[tuple[str, str], list[float]], method: str, field: str
+    ) -> float | None:
+        """Success rate, or None below ``min_samples`` observations."""
+        counts = stats.get((method, field))
+        if counts is None or counts[0] < self.min_samples:
+            return None
+        return counts[1] / counts[0]
+
+    def record(self, host: str | None, method: str, fields: Mapping[str, bool]) -> None:
+        """Record which of ``FIELDS`` ``method`` extracted for one article."""
+        if not host:
+            return
+        with self._lock:
+            self._observe(host, method, fields)
+            self._dirty.add(host)
+        if self._session_factory is not None:
+            self._maybe_flush()
+
+    def record_parity(self, host: str | None, agreed: Mapping[str, bool]) -> None:
+        """Record, for the fields newspaper4k extracted on one article that
+        BeautifulSoup also parsed, whether the two values were equal."""
+        if not host or not agreed:
+            return
+        with self._lock:
+            self._observe(host, PARITY, agreed, agreed.keys())
+            self._dirty.add(host)
+        if self._session_factory is not None:
+            self._maybe_flush()
+
+    def _observe(
+        self,
+        host: str,
+        method: str,
+        fields: Mapping[str, bool],
+        observed: Iterable[str] = FIELDS,
+    ) -> None:
+        stats = self._hosts.get(host)
+        if stats is None:
+            stats = self._hosts[host] = {}
+            if len(self._hosts) > self.max_hosts:
+                evicted, _ = self._hosts.popitem(last=False)
+                self._dirty.discard(evicted)
+        else:
+            self._hosts.move_to_end(host)
+        for field in observed:
+            counts = stats.setdefault((method, field), [0.0, 0.0])
+            counts[0] = counts[0] * self.decay + 1.0
+            counts[1] = counts[1] * self.decay + (1.0 if fields.get(field) else 0.0)
+
+    def success_rate(self, host: str, method: str, field: str) -> float | None:
+        """Decayed success rate of ``method`` for ``field`` on ``host``."""
+        with self._lock:
+            counts = self._hosts.get(host, {}).get((method, field))
+        if not counts or not counts[0]:
+            return None
+        return counts[1] / counts[0]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            routed = sum(
+                self._preferred(host) == BS_FIRST_ROUTE for host in list(self._hosts)
+            )
+            return {**self._counts, "hosts": len(self._hosts), "bs_first_hosts": routed}
+
+    # -- persistence -----------------------------------------------------
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+        try:
+            self.load()
+        except Exception as exc:
+            logger.warning("Failed to load extraction strategy stats: %s", exc)
+
+    def load(self) -> int:
+        """Load stored counts, then seed missing hosts from telemetry.
+
+        Returns the number of hosts known afterwards.
+        """
+        from src.models import ExtractionStrategyStat
+
+        stored: dict[str, dict[tuple[str, str], list[float]]] = {}
+        seeded: dict[str, dict[tuple[str, str], list[float]]] = {}
+        with self._session_factory() as session:
+            for row in session.execute(select(ExtractionStrategyStat)).scalars():
+                stored.setdefault(row.host, {})[(row.method, row.field)] = [
+                    row.attempts,
+                    row.successes,
+                ]
+            try:
+                rows = session.execute(
+                    _TELEMETRY_SQL, {"limit": TELEMETRY_SEED_ROWS}
+                ).fetchall()
+            except Exception as exc:
+                session.rollback()
+                logger.info("No extraction telemetry to seed routing from: %s", exc)
+                rows = []
+
+        with self._lock:
+            for host, stats in stored.items():
+                self._hosts.setdefault(host, stats)
+            # Oldest first, so recent articles weigh most after decay
+            for host, field_extraction in reversed(rows):
+                if host in stored:
+                    continue
+                try:
+                    methods = json.loads(field_extraction)
+                except (TypeError, ValueError):
+                    continue
+                for method in METHODS:
+                    if isinstance(methods.get(method), dict):
+                        self._observe(host, method, methods[method])
+                        seeded[host] = self._hosts[host]
+            self._dirty.update(seeded)
+            hosts = len(self._hosts)
+        logger.info(
+            "Loaded extraction strategy stats: %d stored hosts, %d seeded "
+            "from telemetry",
+            len(stored),
+            len(seeded),
+        )
+        return hosts
+
+    def _maybe_flush(self) -> None:
+        if time.monotonic() - self._flushed_at < self.persist_interval:
+            return
+        with self._lock:
+            if time.monotonic() - self._flushed_at < self.persist_interval:
+                return  # another recorder already claimed this interval
+            if self._flush_thread is not None and self._flush_thread.is_alive():
+                return
+            self._flushed_at = time.monotonic()
+            if self.background:
+                self._flush_thread = threading.Thread(
+                    target=self.flush,
+                    name="extraction-strategy-flush",
+                    daemon=True,
+                )
+                self._flush_thread.start()
+                return
+        self.flush()
+
+    def flush(self) -> int:
+        """Write counts of hosts changed since the last flush; return hosts."""
+        if self._session_factory is None:
+            return 0
+        from src.models import ExtractionStrategyStat
+
+        with self._lock:
+            dirty = {
+                host: {key: list(counts) for key, counts in self._hosts[host].items()}
+                for host in self._dirty
+                if host in self._hosts
+            }
+            self._dirty.clear()
+            self._flushed_at = time.monotonic()
+        if not dirty:
+            return 0
+
+        now = datetime.utcnow()
+        try:
+            with self._session_factory() as session:
+                for host, stats in dirty.items():
+                    for (method, field), (attempts, successes) in stats.items():
+                        session.merge(
+                            ExtractionStrategyStat(
+                                host=host,
+                                method=method,
+                                field=field,
+                                attempts=attempts,
+                                successes=successes,
+                                updated_at=now,
+                            )
+                        )
+                session.commit()
+        except Exception as exc:
+            logger.warning("Failed to persist extraction strategy stats: %s", exc)
+            with self._lock:
+                self._dirty.update(dirty)
+            return 0
+        return len(dirty)
+
+
+_router: StrategyRouter | None = None
+_router_lock = threading.Lock()
+
+
+def get_strategy_router() -> StrategyRouter:
+    """Get or create the process-wide router, persisted to the database."""
+    global _router
+    if _router is None:
+        with _router_lock:
+            if _router is None:
+                from src.models.database import DatabaseManager
+
+                db = DatabaseManager()
+                _router = StrategyRouter(db.get_session)
+    return _router
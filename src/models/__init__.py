@@ -6,16 +6,21 @@ from typing import Any
 
 from sqlalchemy import (
     JSON,
+    BigInteger,
     Boolean,
     Column,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
     create_engine,
+    event,
+    false,
     text,
 )
 from sqlalchemy.orm import (
@@ -41,6 +46,7 @@ from .verification import (  # noqa: E402,F401
     VerificationPattern,
     VerificationTelemetry,
 )
+from .wire_flag import install_is_wire_triggers  # noqa: E402
 
 
 class SourceMetadata(Base):
@@ -156,6 +162,9 @@ class Article(Base):
     meta: Mapped[dict | None] = mapped_column("metadata", JSON)
     # Wire service attribution payload stored as JSON for downstream reports
     wire: Mapped[dict | None] = mapped_column(JSON)
+    # Maintained by database triggers from `metadata` and `wire` (see
+    # src/models/wire_flag.py) so reports can filter without parsing JSON
+    is_wire = Column(Boolean, nullable=False, default=False, server_default=false())
     created_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=datetime.utcnow
     )
@@ -192,6 +201,13 @@ class Article(Base):
         cascade="all, delete-orphan",
     )
 
+    __table_args__ = (
+        Index("ix_articles_is_wire_publish_date", "is_wire", "publish_date"),
+    )
+
+
+event.listen(Article.__table__, "after_create", install_is_wire_triggers)
+
 
 class ArticleLabel(Base):
     """Versioned article labels with primary and alternate predictions."""
@@ -449,6 +465,91 @@ class ArticleEntity(Base):
     )
 
 
+class ArticleNearDuplicate(Base):
+    """MinHash signature and near-duplicate cluster of a cleaned article.
+
+    See ``src/pipeline/near_duplicates.py``. ``canonical_article_id`` is the
+    first article indexed in the cluster.
+    """
+
+    __tablename__ = "article_near_duplicates"
+
+    article_id = Column(
+        String, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True
+    )
+    cluster_id = Column(String, nullable=False, index=True)
+    canonical_article_id = Column(String, nullable=False, index=True)
+    similarity = Column(Float, nullable=False)
+    signature = Column(LargeBinary, nullable=False)
+    created_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        server_default=text("CURRENT_TIMESTAMP"),
+    )
+
+
+class ArticleMinHashBand(Base):
+    """LSH bucket of one band of an article's MinHash signature.
+
+    ``bucket`` already folds in the band number, so lookups only need the
+    leading ``bucket`` column of the primary key.
+    """
+
+    __tablename__ = "article_minhash_bands"
+
+    bucket = Column(BigInteger, primary_key=True)
+    band = Column(Integer, primary_key=True)
+    article_id = Column(
+        String,
+        ForeignKey("articles.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
+
+
+class ArticleFetchState(Base):
+    """HTTP validators and content digests from an article's last fetch.
+
+    Re-extraction sends ``etag``/``last_modified`` as conditional GET
+    headers and compares ``html_digest`` and ``extracted_text_hash`` to
+    skip downstream stages for unchanged pages.
+    """
+
+    __tablename__ = "article_fetch_state"
+
+    article_id = Column(
+        String,
+        ForeignKey("articles.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    etag = Column(String)
+    last_modified = Column(String)
+    html_digest = Column(String(64))  # SHA256 of the raw HTML
+    extracted_text_hash = Column(String(64))  # SHA256 of the extracted text
+    checked_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    changed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    unchanged_checks = Column(Integer, nullable=False, default=0)
+
+
+class ExtractionStrategyStat(Base):
+    """Decayed success counts of one extraction method for one field on a host.
+
+    Persisted by ``StrategyRouter`` (src/crawler/strategy_router.py), which
+    routes hosts to BeautifulSoup first when newspaper4k keeps missing a
+    field there.
+    """
+
+    __tablename__ = "extraction_strategy_stats"
+
+    host = Column(String, primary_key=True)
+    method = Column(String, primary_key=True)  # newspaper4k, beautifulsoup, parity
+    field = Column(String, primary_key=True)  # title, author, ...
+    attempts = Column(Float, nullable=False, default=0.0)
+    successes = Column(Float, nullable=False, default=0.0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
 class Job(Base):
     """Job execution metadata and audit trail."""
 
@@ -731,6 +832,29 @@ class GeocodeCache(Base):
     )
 
 
+class BylineCleaningCache(Base):
+    """Persisted ``BylineCleaner`` results shared across processes.
+
+    Keyed by a hash of (normalized raw byline, source name, source canonical
+    name, cleaner version); see ``src/utils/byline_cache.py``.
+    """
+
+    __tablename__ = "byline_cleaning_cache"
+
+    cache_key = Column(String(64), primary_key=True)
+    raw_byline = Column(Text, nullable=False)
+    source_name = Column(String, nullable=True)
+    source_canonical_name = Column(String, nullable=True)
+    cleaner_version = Column(String, nullable=False, index=True)
+    result = Column(JSON, nullable=False)
+    created_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        server_default=text("CURRENT_TIMESTAMP"),
+    )
+
+
 class BackgroundProcess(Base):
     """Track background processes and their execution status.
 
@@ -826,6 +950,44 @@ class BackgroundProcess(Base):
             self.status = "running"
 
 
+class PipelineStageCount(Base):
+    """Pending-work count for one continuous-processor stage.
+
+    ``pending`` is the last folded/reconciled value; on PostgreSQL, triggers
+    on candidate_links, articles and article_entities append changes to
+    ``pipeline_stage_count_deltas`` between folds (see
+    ``src/services/stage_counts.py``).
+    """
+
+    __tablename__ = "pipeline_stage_counts"
+
+    stage = Column(String, primary_key=True)
+    pending = Column(BigInteger, nullable=False, default=0)
+    last_drift = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    reconciled_at = Column(DateTime, nullable=True)
+
+
+class PipelineStageCountDelta(Base):
+    """Append-only pending-count change written by the stage triggers."""
+
+    __tablename__ = "pipeline_stage_count_deltas"
+
+    id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    stage = Column(String, nullable=False, index=True)
+    delta = Column(BigInteger, nullable=False)
+    created_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        server_default=text("CURRENT_TIMESTAMP"),
+    )
+
+
 # Database utilities
 
 
@@ -54,6 +54,7 @@ def create_cloud_sql_engine(
         from google.cloud.sql.connector import Connector
         from sqlalchemy import create_engine
         from sqlalchemy.engine import Engine
+        from sqlalchemy.pool import QueuePool
     except ImportError as e:
         logger.error(
             "Cloud SQL connector dependencies not installed. "
@@ -106,8 +107,8 @@ def create_cloud_sql_engine(
     engine_kwargs = dict(engine_kwargs)
 
     poolclass = engine_kwargs.get("poolclass")
-    if poolclass:
-        # NullPool and other explicit pool classes cannot accept size kwargs
+    if poolclass and not issubclass(poolclass, QueuePool):
+        # NullPool and other non-queue pool classes cannot accept size kwargs
         pool_keys = (
             "pool_size",
             "max_overflow",
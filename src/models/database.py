@@ -7,8 +7,13 @@ import os
 import random
 import re
 import sys
+import threading
 import time
 import uuid
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import Any, Literal
 from urllib.parse import urlparse
@@ -16,16 +21,22 @@ from urllib.parse import urlparse
 import pandas as pd
 from sqlalchemy import (
     MetaData,
+    String,
     Table,
+    any_,
+    bindparam,
     create_engine,
+    delete,
     event,
     insert,
     select,
     text,
 )
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm.attributes import flag_modified
+from sqlalchemy.pool import QueuePool
 
 from src.utils.url_utils import normalize_url
 
@@ -105,6 +116,213 @@ def _is_sequence_of_sequences(obj):
     return False
 
 
+_DML_PREFIX_RE = re.compile(r"\s*(?:insert|update|delete)\b", re.IGNORECASE)
+_RETURNING_RE = re.compile(r"\breturning\b", re.IGNORECASE)
+# Values every DBAPI driver binds the same way SQLAlchemy's text() would;
+# anything else (datetimes, decimals, JSON) keeps the named-parameter path
+_DRIVER_SAFE_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+
+def _rewrite_placeholders(sql_str: str, marker: str, replacement=None) -> str:
+    """Replace every ``marker`` in ``sql_str`` in a single pass.
+
+    ``replacement`` defaults to numbered named parameters (``:p0``, ``:p1``,
+    ...), numbered strictly left to right.
+    """
+    parts = sql_str.split(marker)
+    if replacement is not None:
+        return replacement.join(parts)
+    pieces = [parts[0]]
+    for index, part in enumerate(parts[1:]):
+        pieces.append(f":p{index}")
+        pieces.append(part)
+    return "".join(pieces)
+
+
+class CompiledStatement:
+    """A raw SQL string normalised for execution through ``text()``.
+
+    Holds the verbatim ``TextClause``, a second one with ``?``/``%s``
+    placeholders rewritten to ``:p0``, ``:p1``, ..., the placeholder count
+    and, for homogeneous
+    executemany batches, the SQL rewritten for each DBAPI paramstyle.
+    """
+
+    __slots__ = (
+        "sql",
+        "marker",
+        "text_clause",
+        "clause",
+        "placeholder_count",
+        "param_names",
+        "is_bulk_dml",
+        "_driver_sql",
+    )
+
+    def __init__(self, sql: str):
+        from sqlalchemy.sql import text as _text
+
+        self.sql = sql
+        if "?" in sql:
+            self.marker: str | None = "?"
+        elif "%s" in sql:
+            self.marker = "%s"
+        else:
+            self.marker = None
+
+        # Named (or parameterless) execution keeps the SQL verbatim, so a
+        # literal '?' such as the JSONB operator is left alone.
+        self.text_clause = _text(sql)
+        if self.marker is None:
+            self.placeholder_count = 0
+            self.clause = self.text_clause
+        else:
+            self.placeholder_count = sql.count(self.marker)
+            self.clause = _text(_rewrite_placeholders(sql, self.marker))
+        self.param_names = tuple(f"p{i}" for i in range(self.placeholder_count))
+        self.is_bulk_dml = bool(
+            self.marker and _DML_PREFIX_RE.match(sql) and not _RETURNING_RE.search(sql)
+        )
+        self._driver_sql: dict[str, str | None] = {}
+
+    def bind(self, row) -> dict[str, Any]:
+        """Map one positional row onto the ``:pN`` parameter names."""
+        return dict(zip(self.param_names, row, strict=False))
+
+    def driver_sql(self, paramstyle: str) -> str | None:
+        """Return the SQL in ``paramstyle`` for ``exec_driver_sql``.
+
+        Returns ``None`` when the statement cannot be handed to the driver
+        verbatim (unsupported paramstyle, or a literal ``%`` that a
+        format-style driver would try to interpret).
+        """
+        try:
+            return self._driver_sql[paramstyle]
+        except KeyError:
+            pass
+
+        sql = self.sql
+        driver_sql: str | None = None
+        if paramstyle == "qmark":
+            if self.marker == "?":
+                driver_sql = sql
+            elif self.marker == "%s" and "%" not in sql.replace("%s", ""):
+                driver_sql = _rewrite_placeholders(sql, "%s", "?")
+        elif paramstyle in ("format", "pyformat"):
+            if self.marker == "%s" and "%" not in sql.replace("%s", ""):
+                driver_sql = sql
+            elif self.marker == "?" and "%" not in sql:
+                driver_sql = _rewrite_placeholders(sql, "?", "%s")
+        self._driver_sql[paramstyle] = driver_sql
+        return driver_sql
+
+
+class _StatementCache:
+    """Thread-safe LRU of raw SQL strings to :class:`CompiledStatement`."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, CompiledStatement] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.executemany_batches = 0
+
+    def get(self, sql: str) -> CompiledStatement:
+        with self._lock:
+            statement = self._entries.get(sql)
+            if statement is not None:
+                self._entries.move_to_end(sql)
+                self.hits += 1
+                return statement
+            self.misses += 1
+
+        # Compile outside the lock; a concurrent miss just compiles twice
+        statement = CompiledStatement(sql)
+        if self.maxsize <= 0:
+            return statement
+        with self._lock:
+            self._entries[sql] = statement
+            self._entries.move_to_end(sql)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return statement
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "executemany_batches": self.executemany_batches,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+            self.executemany_batches = 0
+
+
+_STATEMENT_CACHE = _StatementCache(
+    int(os.getenv("SAFE_EXECUTE_STATEMENT_CACHE_SIZE", "512"))
+)
+
+
+def compile_statement(sql: str) -> CompiledStatement:
+    """Return the cached :class:`CompiledStatement` for ``sql``."""
+    return _STATEMENT_CACHE.get(sql)
+
+
+def statement_cache_stats() -> dict[str, int]:
+    """Return hit/miss counters for the ``safe_execute`` statement cache."""
+    return _STATEMENT_CACHE.stats()
+
+
+def clear_statement_cache() -> None:
+    """Drop cached statements and reset the counters (mainly for tests)."""
+    _STATEMENT_CACHE.clear()
+
+
+def _execute_many_direct(conn, statement: CompiledStatement, rows):
+    """Run a homogeneous positional batch through ``exec_driver_sql``.
+
+    Skips ``text()`` parameter processing and the per-row dict mapping by
+    handing the tuples straight to the DBAPI cursor's ``executemany``.
+    Only plain scalar rows of the statement's width qualify. Returns
+    ``None`` when the batch is not eligible so the caller can fall back to
+    the named-parameter path.
+    """
+    from sqlalchemy.engine import Connection
+
+    if not statement.is_bulk_dml or not isinstance(conn, Connection):
+        return None
+    width = statement.placeholder_count
+    safe_types = _DRIVER_SAFE_TYPES
+    for row in rows:
+        if len(row) != width:
+            return None
+        for value in row:
+            if type(value) not in safe_types:
+                return None
+    paramstyle = getattr(conn.dialect, "paramstyle", None)
+    if not isinstance(paramstyle, str):
+        return None
+    driver_sql = statement.driver_sql(paramstyle)
+    if driver_sql is None:
+        return None
+
+    batch = [row if isinstance(row, tuple) else tuple(row) for row in rows]
+    result = conn.exec_driver_sql(driver_sql, batch)
+    with _STATEMENT_CACHE._lock:
+        _STATEMENT_CACHE.executemany_batches += 1
+    return result
+
+
 def safe_execute(conn, sql, params=None):
     """Compatibility wrapper for Connection.execute to accept positional
     parameter sequences (e.g., executemany-style list of tuples) and honor
@@ -114,11 +332,13 @@ def safe_execute(conn, sql, params=None):
     - If `params` is a list/tuple of sequences and SQL contains '?' or '%s',
       convert the SQL to named parameters (:p0, :p1, ...) and map each tuple
       to a dict before executing (works with executemany semantics).
+      Homogeneous INSERT/UPDATE/DELETE batches on a real Connection are
+      handed to the driver's executemany directly instead.
     - Otherwise delegate to conn.execute(text(sql), params).
-    """
-    from sqlalchemy.exc import ArgumentError
-    from sqlalchemy.sql import text as _text
 
+    Raw SQL strings are normalised once and cached (see
+    :func:`statement_cache_stats`).
+    """
     # Use the original execute method if available (to avoid recursion when
     # called from a patched connection)
     original_execute = getattr(conn, "_orig_execute", None) or conn.execute
@@ -133,59 +353,31 @@ def safe_execute(conn, sql, params=None):
             # fallthrough to text wrapper
             pass
 
-    sql_str = str(sql)
+    statement = compile_statement(str(sql))
 
     # Handle list/tuple of tuple params for executemany-style calls where SQL
-    # uses '?' (qmark) or '%s' placeholders.
-    if _is_sequence_of_sequences(params) and ("?" in sql_str or "%s" in sql_str):
-        # normalize placeholders: replace each ? or %s with :p{index}
-        # Count the number of placeholders by counting occurrences of ? or %s
-        # We assume each row has the same number of columns as placeholders.
-        # Build a single-row named-parameter SQL then map each tuple to a dict.
-        # Find placeholders in order
-        if "?" in sql_str:
-            parts = sql_str.split("?")
-            ph_count = len(parts) - 1
-            for i in range(ph_count):
-                sql_str = sql_str.replace("?", f":p{i}", 1)
-        else:
-            # handle %s style
-            parts = sql_str.split("%s")
-            ph_count = len(parts) - 1
-            for i in range(ph_count):
-                sql_str = sql_str.replace("%s", f":p{i}", 1)
-
-        named_rows = []
-        for row in params:
-            named_rows.append({f"p{i}": v for i, v in enumerate(row)})
-
-        return original_execute(_text(sql_str), named_rows)
-
-    # Otherwise try normal execution; if ArgumentError arises, try to coerce
-    # positional single tuple into a named mapping.
-    try:
-        if params is not None:
-            return original_execute(_text(sql_str), params)
-        return original_execute(_text(sql_str))
-    except ArgumentError:
-        # If params is a single tuple/list, map to p0..pn and replace ?/%s
-        if (
-            isinstance(params, (list, tuple))
-            and params
-            and not isinstance(params[0], dict)
-        ):
-            row = params
-            if "?" in sql_str or "%s" in sql_str:
-                if "?" in sql_str:
-                    for i in range(len(row)):
-                        sql_str = sql_str.replace("?", f":p{i}", 1)
-                else:
-                    for i in range(len(row)):
-                        sql_str = sql_str.replace("%s", f":p{i}", 1)
-                named = {f"p{i}": v for i, v in enumerate(row)}
-                return original_execute(_text(sql_str), named)
-        # re-raise if we cannot coerce
-        raise
+    # uses '?' (qmark) or '%s' placeholders. We assume each row has the same
+    # number of columns as placeholders.
+    if statement.marker and _is_sequence_of_sequences(params):
+        result = _execute_many_direct(conn, statement, params)
+        if result is not None:
+            return result
+        named_rows = [statement.bind(row) for row in params]
+        return original_execute(statement.clause, named_rows)
+
+    # A single positional row can go straight to the named form; text()
+    # would only reject it with ArgumentError.
+    if (
+        statement.marker
+        and isinstance(params, (list, tuple))
+        and params
+        and not isinstance(params[0], dict)
+    ):
+        return original_execute(statement.clause, statement.bind(params))
+
+    if params is not None:
+        return original_execute(statement.text_clause, params)
+    return original_execute(statement.text_clause)
 
 
 def safe_session_execute(session, sql, params=None):
@@ -193,11 +385,8 @@ def safe_session_execute(session, sql, params=None):
     positional parameter styles (list/tuple of tuples) and qmark/%s
     placeholders by coercing them into named-parameter forms.
 
-    This function tries to call ``session.execute`` directly and only
-    transforms parameters when SQLAlchemy raises an ArgumentError.
+    Raw SQL strings share the :func:`safe_execute` statement cache.
     """
-    from sqlalchemy.exc import ArgumentError
-    from sqlalchemy.sql import text as _text
 
     # If caller passed a SQLAlchemy Core object, try to execute directly
     if not isinstance(sql, (str,)):
@@ -209,50 +398,24 @@ def safe_session_execute(session, sql, params=None):
             # fallthrough to string-based handling
             pass
 
-    sql_str = str(sql)
+    statement = compile_statement(str(sql))
 
     # Handle list/tuple-of-tuples executemany with qmark/%s placeholders
-    if _is_sequence_of_sequences(params) and ("?" in sql_str or "%s" in sql_str):
-        # Normalize placeholders to :p0, :p1, ...
-        if "?" in sql_str:
-            parts = sql_str.split("?")
-            ph_count = len(parts) - 1
-            for i in range(ph_count):
-                sql_str = sql_str.replace("?", f":p{i}", 1)
-        else:
-            parts = sql_str.split("%s")
-            ph_count = len(parts) - 1
-            for i in range(ph_count):
-                sql_str = sql_str.replace("%s", f":p{i}", 1)
-
-        named_rows = []
-        for row in params:
-            named_rows.append({f"p{i}": v for i, v in enumerate(row)})
+    if statement.marker and _is_sequence_of_sequences(params):
+        named_rows = [statement.bind(row) for row in params]
+        return session.execute(statement.clause, named_rows)
 
-        return session.execute(_text(sql_str), named_rows)
+    if (
+        statement.marker
+        and isinstance(params, (list, tuple))
+        and params
+        and not isinstance(params[0], dict)
+    ):
+        return session.execute(statement.clause, statement.bind(params))
 
-    # Otherwise try normal execution and coerce single tuple/list to mapping
-    try:
-        if params is not None:
-            return session.execute(_text(sql_str), params)
-        return session.execute(_text(sql_str))
-    except ArgumentError:
-        if (
-            isinstance(params, (list, tuple))
-            and params
-            and not isinstance(params[0], dict)
-        ):
-            row = params
-            if "?" in sql_str or "%s" in sql_str:
-                if "?" in sql_str:
-                    for i in range(len(row)):
-                        sql_str = sql_str.replace("?", f":p{i}", 1)
-                else:
-                    for i in range(len(row)):
-                        sql_str = sql_str.replace("%s", f":p{i}", 1)
-                named = {f"p{i}": v for i, v in enumerate(row)}
-                return session.execute(_text(sql_str), named)
-        raise
+    if params is not None:
+        return session.execute(statement.text_clause, params)
+    return session.execute(statement.text_clause)
 
 
 def _configure_sqlite_engine(engine, timeout: float | None) -> None:
@@ -459,10 +622,191 @@ def _wrap_engine_connections(engine):
     engine.begin = begin
 
 
+@dataclass(frozen=True)
+class EnginePoolSettings:
+    """Connection pool tuning applied to shared (registry) engines."""
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+
+    @classmethod
+    def from_env(cls) -> "EnginePoolSettings":
+        """Read ``DB_POOL_SIZE``, ``DB_MAX_OVERFLOW``, ``DB_POOL_TIMEOUT``,
+        ``DB_POOL_RECYCLE`` and ``DB_POOL_PRE_PING`` (unset values keep the
+        defaults)."""
+        defaults = cls()
+        pre_ping = os.getenv("DB_POOL_PRE_PING")
+        return cls(
+            pool_size=int(os.getenv("DB_POOL_SIZE", defaults.pool_size)),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", defaults.max_overflow)),
+            pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", defaults.pool_timeout)),
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", defaults.pool_recycle)),
+            pool_pre_ping=(
+                defaults.pool_pre_ping
+                if pre_ping is None
+                else pre_ping.lower() in ("1", "true", "yes")
+            ),
+        )
+
+
+class _PoolWaitStats:
+    """Thread-safe accumulator for connection checkout wait times."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += seconds
+            if seconds > self.wait_seconds_max:
+                self.wait_seconds_max = seconds
+
+
+class _InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waits for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = _PoolWaitStats()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.wait_stats.record(time.perf_counter() - started)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats
+        return pool
+
+
+@dataclass
+class _RegisteredEngine:
+    engine: Any
+    pid: int
+    settings: EnginePoolSettings
+
+
+_ENGINE_REGISTRY: dict[tuple[str, EnginePoolSettings], _RegisteredEngine] = {}
+_ENGINE_REGISTRY_LOCK = threading.Lock()
+_SCHEMA_READY: "weakref.WeakSet[Any]" = weakref.WeakSet()
+_SCHEMA_LOCK = threading.Lock()
+
+
+def _is_shareable_url(database_url: str) -> bool:
+    """Whether managers for ``database_url`` should share one engine.
+
+    SQLite is excluded: in-memory databases are private to their engine, and
+    tests routinely delete and recreate database files at the same path,
+    which a long-lived pool would keep pointing at the old file.
+    """
+    return not database_url.lower().startswith("sqlite")
+
+
+def get_shared_engine(
+    database_url: str,
+    *,
+    pool_settings: EnginePoolSettings | None = None,
+    creator: Callable[[], Any] | None = None,
+):
+    """Return the process-wide engine for ``database_url``.
+
+    Engines are keyed by URL and pool settings and built once per process
+    with an instrumented ``QueuePool``. ``creator`` overrides construction
+    (e.g. for the Cloud SQL connector) and is called with the same
+    ``poolclass`` and pool keyword arguments. After a fork the child drops
+    the inherited connections before reusing the engine.
+    """
+    settings = pool_settings or EnginePoolSettings.from_env()
+    key = (database_url, settings)
+    with _ENGINE_REGISTRY_LOCK:
+        entry = _ENGINE_REGISTRY.get(key)
+        if entry is not None:
+            if entry.pid != os.getpid():
+                entry.engine.dispose(close=False)
+                entry.pid = os.getpid()
+            return entry.engine
+
+        pool_kwargs = {"poolclass": _InstrumentedQueuePool, **asdict(settings)}
+        if creator is not None:
+            engine = creator(**pool_kwargs)
+        else:
+            engine = create_engine(database_url, echo=False, **pool_kwargs)
+        _ENGINE_REGISTRY[key] = _RegisteredEngine(engine, os.getpid(), settings)
+        logger.debug(
+            "Registered shared engine for %s", _mask_database_url(database_url)
+        )
+        return engine
+
+
+def ensure_schema(engine, *, force: bool = False) -> bool:
+    """Create ORM tables on ``engine`` once per process.
+
+    Returns True when ``create_all`` ran, False when the engine was already
+    initialised in this process.
+    """
+    with _SCHEMA_LOCK:
+        if not force and engine in _SCHEMA_READY:
+            return False
+        Base.metadata.create_all(engine)
+        _SCHEMA_READY.add(engine)
+        return True
+
+
+def engine_pool_metrics() -> list[dict[str, Any]]:
+    """Snapshot pool usage for every shared engine in this process."""
+    snapshots: list[dict[str, Any]] = []
+    with _ENGINE_REGISTRY_LOCK:
+        entries = list(_ENGINE_REGISTRY.items())
+    for (database_url, _settings), entry in entries:
+        pool = entry.engine.pool
+        snapshot: dict[str, Any] = {
+            "database_url": _mask_database_url(database_url),
+            "pool_class": type(pool).__name__,
+        }
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            method = getattr(pool, name, None)
+            if callable(method):
+                snapshot[name if name != "checkedin" else "checked_in"] = method()
+        if "checkedout" in snapshot:
+            snapshot["checked_out"] = snapshot.pop("checkedout")
+        stats = getattr(pool, "wait_stats", None)
+        if stats is not None:
+            snapshot["checkouts"] = stats.checkouts
+            snapshot["wait_seconds_total"] = stats.wait_seconds_total
+            snapshot["wait_seconds_max"] = stats.wait_seconds_max
+        snapshots.append(snapshot)
+    return snapshots
+
+
+def dispose_shared_engines() -> None:
+    """Dispose and forget every shared engine (process shutdown and tests)."""
+    with _ENGINE_REGISTRY_LOCK:
+        entries = list(_ENGINE_REGISTRY.values())
+        _ENGINE_REGISTRY.clear()
+    for entry in entries:
+        entry.engine.dispose()
+
+
 class DatabaseManager:
     """Manages database connections and operations."""
 
-    def __init__(self, database_url: str | None = None):
+    def __init__(
+        self,
+        database_url: str | None = None,
+        *,
+        shared_engine: bool | None = None,
+        create_schema: bool = True,
+    ):
         """
         Initialize DatabaseManager.
 
@@ -470,6 +814,11 @@ class DatabaseManager:
         DATABASE_URL from `src.config`. This allows call sites to simply use
         `DatabaseManager()` in deployed environments while still falling back
         to the default local SQLite path for quick local runs and tests.
+
+        Managers for the same server database share one pooled engine per
+        process (see `get_shared_engine`); `shared_engine=False` forces a
+        private engine, which is the default for SQLite. Tables are created
+        once per engine via `ensure_schema` unless `create_schema` is False.
         """
         # Defer import to avoid import-time side effects in test/bootstrap code
         # Resolution order:
@@ -518,7 +867,16 @@ class DatabaseManager:
                     f"Production should use PostgreSQL for compatibility."
                 )
 
-        if use_cloud_sql:
+        if shared_engine is None:
+            shared_engine = _is_shareable_url(database_url)
+        self._owns_engine = not shared_engine
+
+        if shared_engine:
+            self.engine = get_shared_engine(
+                database_url,
+                creator=self._create_cloud_sql_engine if use_cloud_sql else None,
+            )
+        elif use_cloud_sql:
             self.engine = self._create_cloud_sql_engine()
         else:
             # Direct PostgreSQL connection
@@ -528,9 +886,10 @@ class DatabaseManager:
                 echo=False,
             )
 
-        Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
+        if create_schema:
+            ensure_schema(self.engine)
+        self._session_factory = sessionmaker(bind=self.engine)
+        self.session = self._session_factory()
 
     def _should_use_cloud_sql_connector(self) -> bool:
         """Determine if Cloud SQL Python Connector should be used."""
@@ -547,8 +906,12 @@ class DatabaseManager:
         except ImportError:
             return False
 
-    def _create_cloud_sql_engine(self):
-        """Create database engine using Cloud SQL Python Connector."""
+    def _create_cloud_sql_engine(self, **engine_kwargs):
+        """Create database engine using Cloud SQL Python Connector.
+
+        ``engine_kwargs`` (pool class and sizing from the shared-engine
+        registry) are passed through to ``create_engine``.
+        """
         from src.config import (
             CLOUD_SQL_INSTANCE,
             DATABASE_NAME,
@@ -568,6 +931,7 @@ class DatabaseManager:
                 database=DATABASE_NAME,
                 driver="pg8000",
                 echo=False,
+                **engine_kwargs,
             )
         except ImportError as e:
             logger.warning(
@@ -579,7 +943,7 @@ class DatabaseManager:
             connection_url = (
                 f"postgresql://{DATABASE_USER}:{DATABASE_PASSWORD}" f"@/{DATABASE_NAME}"
             )
-            return create_engine(connection_url, echo=False)
+            return create_engine(connection_url, echo=False, **engine_kwargs)
 
     def get_session(self):
         """Context manager for getting a database session.
@@ -593,8 +957,7 @@ class DatabaseManager:
 
         @contextmanager
         def session_context():
-            Session = sessionmaker(bind=self.engine)
-            session = Session()
+            session = self._session_factory()
             try:
                 yield session
             finally:
@@ -603,9 +966,14 @@ class DatabaseManager:
         return session_context()
 
     def close(self):
-        """Close database connection."""
+        """Close the session and dispose the engine if this manager owns it.
+
+        Shared engines stay pooled for other managers; use
+        `dispose_shared_engines` at process shutdown.
+        """
         self.session.close()
-        self.engine.dispose()
+        if getattr(self, "_owns_engine", True):
+            self.engine.dispose()
 
     def update_source_metadata(self, source_id: str, updates: dict) -> bool:
         """Merge `updates` into the `metadata` JSON column for a Source.
@@ -1041,26 +1409,19 @@ def _normalize_entity_text(value: str | None) -> str:
     return normalized.strip()
 
 
-def save_article_entities(
-    session,
+def _article_entity_rows(
     article_id: str,
     entities: list[dict[str, Any]],
     extractor_version: str,
     article_text_hash: str | None = None,
-    autocommit: bool = True,
-) -> list[ArticleEntity]:
-    """Replace article entities for the given extractor version.
+) -> list[dict[str, Any]]:
+    """Build deduplicated ``article_entities`` column values for one article.
 
-    Args:
-        autocommit: If False, caller must commit. Use for batch processing.
+    Rows that would violate ``uq_article_entity`` are dropped. When nothing
+    usable remains a sentinel row is returned so the article is not picked
+    up for extraction again.
     """
-
-    session.query(ArticleEntity).filter_by(
-        article_id=article_id,
-        extractor_version=extractor_version,
-    ).delete()
-
-    records: list[ArticleEntity] = []
+    rows: list[dict[str, Any]] = []
     # Track seen combinations to avoid violating uq_article_entity.
     seen_keys: set[tuple[str, str, str]] = set()
     for entity in entities:
@@ -1089,48 +1450,148 @@ def save_article_entities(
         if dedupe_key in seen_keys:
             continue
         seen_keys.add(dedupe_key)
-        record = ArticleEntity(
-            article_id=article_id,
-            article_text_hash=article_text_hash,
-            entity_text=entity_text,
-            entity_norm=entity_norm,
-            entity_label=entity_label_value,
-            osm_category=entity.get("osm_category"),
-            osm_subcategory=entity.get("osm_subcategory"),
-            extractor_version=extractor_used,
-            confidence=entity.get("confidence"),
-            matched_gazetteer_id=entity.get("matched_gazetteer_id"),
-            match_score=entity.get("match_score"),
-            match_name=entity.get("match_name"),
-            meta=entity.get("meta"),
+        rows.append(
+            {
+                "article_id": article_id,
+                "article_text_hash": article_text_hash,
+                "entity_text": entity_text,
+                "entity_norm": entity_norm,
+                "entity_label": entity_label_value,
+                "osm_category": entity.get("osm_category"),
+                "osm_subcategory": entity.get("osm_subcategory"),
+                "extractor_version": extractor_used,
+                "confidence": entity.get("confidence"),
+                "matched_gazetteer_id": entity.get("matched_gazetteer_id"),
+                "match_score": entity.get("match_score"),
+                "match_name": entity.get("match_name"),
+                "meta": entity.get("meta"),
+            }
         )
-        session.add(record)
-        records.append(record)
 
     # If no entities extracted, add sentinel to mark extraction complete
     # This prevents infinite reprocessing of articles with no entities
-    if not records:
-        sentinel = ArticleEntity(
-            article_id=article_id,
-            article_text_hash=article_text_hash,
-            entity_text="__NO_ENTITIES_FOUND__",
-            entity_norm="__no_entities_found__",
-            entity_label="SENTINEL",
-            extractor_version=extractor_version,
-            confidence=1.0,
-            meta={
-                "sentinel": True,
-                "reason": "No location entities found in article text",
-            },
+    if not rows:
+        rows.append(
+            {
+                "article_id": article_id,
+                "article_text_hash": article_text_hash,
+                "entity_text": "__NO_ENTITIES_FOUND__",
+                "entity_norm": "__no_entities_found__",
+                "entity_label": "SENTINEL",
+                "osm_category": None,
+                "osm_subcategory": None,
+                "extractor_version": extractor_version,
+                "confidence": 1.0,
+                "matched_gazetteer_id": None,
+                "match_score": None,
+                "match_name": None,
+                "meta": {
+                    "sentinel": True,
+                    "reason": "No location entities found in article text",
+                },
+            }
         )
-        session.add(sentinel)
-        records.append(sentinel)
+    return rows
+
+
+def save_article_entities(
+    session,
+    article_id: str,
+    entities: list[dict[str, Any]],
+    extractor_version: str,
+    article_text_hash: str | None = None,
+    autocommit: bool = True,
+) -> list[ArticleEntity]:
+    """Replace article entities for the given extractor version.
+
+    Args:
+        autocommit: If False, caller must commit. Use for batch processing.
+    """
+
+    session.query(ArticleEntity).filter_by(
+        article_id=article_id,
+        extractor_version=extractor_version,
+    ).delete()
+
+    records = [
+        ArticleEntity(**row)
+        for row in _article_entity_rows(
+            article_id, entities, extractor_version, article_text_hash
+        )
+    ]
+    session.add_all(records)
 
     if autocommit:
         _commit_with_retry(session)
     return records
 
 
+ENTITY_BULK_CHUNK_SIZE = 1000
+
+
+def save_article_entities_bulk(
+    session,
+    batch: Iterable[tuple[str, list[dict[str, Any]], str | None]],
+    extractor_version: str,
+    autocommit: bool = True,
+    chunk_size: int = ENTITY_BULK_CHUNK_SIZE,
+) -> int:
+    """Replace entities for many articles with set-based statements.
+
+    ``batch`` yields ``(article_id, entities, article_text_hash)`` tuples.
+    Existing rows for ``extractor_version`` are removed with one
+    ``article_id = ANY(:ids)`` delete on PostgreSQL (chunked ``IN`` lists
+    elsewhere) and the new rows, sentinels included, are written with Core
+    multi-row inserts instead of one ORM object per entity. A repeated
+    article id replaces the earlier entry.
+
+    Args:
+        autocommit: If False, caller must commit. Use for batch processing.
+
+    Returns:
+        Number of ``article_entities`` rows inserted.
+    """
+    by_article: dict[str, list[dict[str, Any]]] = {}
+    for article_id, entities, article_text_hash in batch:
+        article_id = str(article_id)
+        by_article[article_id] = _article_entity_rows(
+            article_id, entities or [], extractor_version, article_text_hash
+        )
+    if not by_article:
+        return 0
+
+    table = ArticleEntity.__table__
+    article_ids = list(by_article)
+    if session.get_bind().dialect.name == "postgresql":
+        session.execute(
+            delete(table).where(
+                table.c.extractor_version == extractor_version,
+                table.c.article_id
+                == any_(bindparam("article_ids", type_=ARRAY(String))),
+            ),
+            {"article_ids": article_ids},
+        )
+    else:
+        for start in range(0, len(article_ids), chunk_size):
+            session.execute(
+                delete(table).where(
+                    table.c.extractor_version == extractor_version,
+                    table.c.article_id.in_(article_ids[start : start + chunk_size]),
+                )
+            )
+
+    rows = [row for article_rows in by_article.values() for row in article_rows]
+    for start in range(0, len(rows), chunk_size):
+        session.execute(insert(table), rows[start : start + chunk_size])
+
+    if autocommit:
+        _commit_with_retry(session)
+    logger.debug(
+        "Saved %d entities for %d articles in bulk", len(rows), len(by_article)
+    )
+    return len(rows)
+
+
 def create_job_record(
     session,
     job_type: str,
@@ -4,17 +4,22 @@ This file defines two SQLAlchemy models:
 - DatasetVersion
 - DatasetDelta
 
-It also provides a helper to create the tables.
+It also provides a helper to create the tables and the Parquet snapshot
+exports: full snapshots, delta snapshots holding only the rows changed
+since the parent version (chained by a JSON manifest next to each file),
+and compaction of a base plus deltas into a new base.
 """
 
 import hashlib
+import json
 import logging
 import os
 import shutil
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from sqlalchemy import (
     JSON,
@@ -282,6 +287,8 @@ def export_dataset_version(
 ) -> str:
     """Export a version by copying its snapshot to `output_path`.
 
+    A delta snapshot is merged with its base and earlier deltas first (see
+    `read_snapshot_table`) so the output always holds the full dataset.
     If no snapshot_path is available, raise NotImplementedError for now.
     """
     engine = create_database_engine(database_url or "sqlite:///data/mizzou.db")
@@ -297,10 +304,205 @@ def export_dataset_version(
             "Export without snapshot is not implemented. Create a snapshot first."
         )
 
+    manifest = load_snapshot_manifest(dv.snapshot_path)
+    if manifest and len(manifest["snapshots"]) > 1:
+        _write_parquet_atomic(read_snapshot_table(dv.snapshot_path), output_path)
+        return output_path
+
     shutil.copyfile(dv.snapshot_path, output_path)
     return output_path
 
 
+def snapshot_manifest_path(snapshot_path: str) -> str:
+    """Path of the manifest stored next to a watermarked snapshot."""
+    return f"{os.path.splitext(snapshot_path)[0]}.manifest.json"
+
+
+def load_snapshot_manifest(snapshot_path: str | None) -> dict[str, Any] | None:
+    """Return the manifest for `snapshot_path`, or None for plain snapshots.
+
+    A manifest records the exported table, its change and key columns, the
+    high-water mark of the change column and the chain of snapshot files
+    (one base followed by zero or more deltas) that make up the version.
+    """
+    if not snapshot_path:
+        return None
+    path = snapshot_manifest_path(snapshot_path)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_manifest(snapshot_path: str, manifest: dict[str, Any]) -> None:
+    path = snapshot_manifest_path(snapshot_path)
+    temp_path = f"{path}.tmp.{uuid.uuid4()}"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    _fsync_path(temp_path)
+    os.replace(temp_path, path)
+    _fsync_path(path)
+
+
+# Delta exports re-read rows this far below the parent's high-water mark:
+# a transaction that commits after a snapshot can carry an earlier change
+# timestamp, and rows sharing the boundary timestamp are not skipped
+DEFAULT_DELTA_OVERLAP = timedelta(minutes=15)
+
+
+def _encode_watermark(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    return value
+
+
+def _decode_watermark(value: Any) -> Any:
+    if isinstance(value, dict) and "datetime" in value:
+        return datetime.fromisoformat(value["datetime"])
+    return value
+
+
+def _python_scalar(value: Any) -> Any:
+    """Convert a pandas/numpy scalar to the equivalent Python value."""
+    if value is None or pd.isna(value):
+        return None
+    if hasattr(value, "to_pydatetime"):
+        return value.to_pydatetime()
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+
+def _parquet_options(compression: str | None) -> dict[str, Any]:
+    # pyarrow treats compression=None as "uncompressed"; omit it to keep
+    # the library default (snappy) when no codec was requested.
+    return {"compression": compression} if compression else {}
+
+
+def _write_parquet_atomic(
+    table: Any, output_path: str, compression: str | None = None
+) -> None:
+    out_dir = os.path.dirname(output_path) or "."
+    os.makedirs(out_dir, exist_ok=True)
+    temp_path = os.path.join(
+        out_dir, f".{os.path.basename(output_path)}.tmp.{uuid.uuid4()}"
+    )
+    try:
+        pq.write_table(table, temp_path, **_parquet_options(compression))
+        _fsync_path(temp_path)
+        os.replace(temp_path, output_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    _fsync_path(output_path)
+
+
+def _overlap_start(since: Any, overlap: timedelta) -> Any:
+    """Lower bound for a delta read: `since` moved back by `overlap`.
+
+    Date strings (SQLite) keep their separator so the untyped comparison
+    still matches; non-date marks are only made inclusive.
+    """
+    if isinstance(since, datetime):
+        return since - overlap
+    if isinstance(since, str):
+        try:
+            parsed = datetime.fromisoformat(since)
+        except ValueError:
+            return since
+        return (parsed - overlap).isoformat(sep="T" if "T" in since else " ")
+    return since
+
+
+def _snapshot_select(
+    engine,
+    table_name: str,
+    change_column: str | None,
+    since: Any = None,
+    overlap: timedelta = DEFAULT_DELTA_OVERLAP,
+) -> tuple[Any, dict[str, Any]]:
+    select_sql = f"SELECT * FROM {table_name}"
+    if change_column is None:
+        return text(select_sql), {}
+
+    columns = {column["name"] for column in inspect(engine).get_columns(table_name)}
+    if change_column not in columns:
+        raise ValueError(f"Column not found in {table_name}: {change_column}")
+    if since is None:
+        return text(select_sql), {}
+
+    # `since` is a value read back from this column, so comparing it
+    # untyped matches the stored representation (e.g. SQLite text dates).
+    # Rows in the overlap may already be in an earlier snapshot;
+    # read_snapshot_table keeps the latest copy of each key.
+    column = engine.dialect.identifier_preparer.quote(change_column)
+    return text(f"{select_sql} WHERE {column} >= :since"), {
+        "since": _overlap_start(since, overlap)
+    }
+
+
+def _write_parquet_batches(
+    result,
+    temp_path: str,
+    chunksize: int,
+    compression: str | None,
+    change_column: str | None = None,
+) -> tuple[int, Any]:
+    """Stream `result` into a Parquet file.
+
+    Each fetched batch is transposed into columns and converted with one
+    `pa.array` call per column. The first batch fixes the schema, so later
+    batches (for example one where a column is entirely NULL) are converted
+    to the same types. Returns the row count and the largest non-NULL value
+    of `change_column`.
+    """
+    names = list(result.keys())
+    watermark_index = names.index(change_column) if change_column else None
+    watermark: Any = None
+    total_rows = 0
+    schema: Any = None
+    writer: Any = None
+    try:
+        while True:
+            rows = result.fetchmany(chunksize)
+            if not rows:
+                break
+
+            columns = list(zip(*rows, strict=True))
+            if schema is None:
+                arrays = [pa.array(column) for column in columns]
+            else:
+                arrays = [
+                    pa.array(column, type=field.type)
+                    for column, field in zip(columns, schema, strict=True)
+                ]
+            table = pa.Table.from_arrays(arrays, names=names)
+            total_rows += table.num_rows
+
+            if watermark_index is not None:
+                values = [v for v in columns[watermark_index] if v is not None]
+                if values:
+                    batch_max = max(values)
+                    if watermark is None or batch_max > watermark:
+                        watermark = batch_max
+
+            if writer is None:
+                schema = table.schema
+                writer = pq.ParquetWriter(
+                    temp_path, schema, **_parquet_options(compression)
+                )
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        empty = pa.table({name: pa.array([], type=pa.null()) for name in names})
+        pq.write_table(empty, temp_path, **_parquet_options(compression))
+
+    return total_rows, watermark
+
+
 def export_snapshot_for_version(
     version_id: str,
     table_name: str,
@@ -308,6 +510,8 @@ def export_snapshot_for_version(
     database_url: str | None = None,
     chunksize: int = 10000,
     compression: str | None = None,
+    change_column: str | None = None,
+    key_column: str = "id",
 ) -> str:
     """Create a Parquet snapshot for a given version by exporting the entire
     table `table_name` from the configured database to `output_path`, update
@@ -317,7 +521,173 @@ def export_snapshot_for_version(
     concurrent writers. When using Postgres and the advisory lock is acquired,
     the export will run inside a REPEATABLE READ transaction to get a
     consistent snapshot.
+
+    When `change_column` is given (`updated_at` or another column that grows
+    whenever a row changes), its largest exported value is recorded as the
+    high-water mark in a manifest next to the snapshot, together with
+    `key_column`, so child versions can be exported with
+    `export_delta_snapshot_for_version`.
     """
+    return _export_snapshot(
+        version_id,
+        table_name,
+        output_path,
+        database_url=database_url,
+        chunksize=chunksize,
+        compression=compression,
+        change_column=change_column,
+        key_column=key_column,
+    )
+
+
+def export_delta_snapshot_for_version(
+    version_id: str,
+    table_name: str,
+    output_path: str,
+    database_url: str | None = None,
+    chunksize: int = 10000,
+    compression: str | None = None,
+    overlap: timedelta = DEFAULT_DELTA_OVERLAP,
+) -> str:
+    """Export only the rows of `table_name` changed since the parent version.
+
+    The version's `parent_version` must be a ready version whose snapshot
+    has a manifest (a full export with `change_column` set, or an earlier
+    delta). Rows whose change column is at or above the parent's
+    high-water mark less `overlap` are written to `output_path`, and the
+    manifest written next to it chains the parent's base and deltas with
+    the new file. The overlap catches rows committed after the parent
+    snapshot with an earlier timestamp; a row whose transaction stays open
+    longer than `overlap` can still be missed.
+
+    Deleted rows are not captured; take a full snapshot to drop them.
+    """
+    engine = create_database_engine(database_url or "sqlite:///data/mizzou.db")
+    Session = sessionmaker(bind=engine)
+    session = Session()
+
+    dv = session.query(DatasetVersion).filter_by(id=version_id).first()
+    if not dv:
+        raise ValueError(f"DatasetVersion not found: {version_id}")
+    if not dv.parent_version:
+        raise ValueError(f"DatasetVersion {version_id} has no parent_version")
+
+    parent = session.query(DatasetVersion).filter_by(id=dv.parent_version).first()
+    if not parent or parent.status != "ready":
+        raise ValueError(f"Parent DatasetVersion is not ready: {dv.parent_version}")
+
+    manifest = load_snapshot_manifest(parent.snapshot_path)
+    if manifest is None:
+        raise ValueError(
+            f"Parent DatasetVersion {parent.id} has no snapshot manifest; "
+            "export it with a change column first"
+        )
+    if manifest["table_name"] != table_name:
+        raise ValueError(
+            f"Parent DatasetVersion {parent.id} is a snapshot of "
+            f"{manifest['table_name']}, not {table_name}"
+        )
+
+    return _export_snapshot(
+        version_id,
+        table_name,
+        output_path,
+        database_url=database_url,
+        chunksize=chunksize,
+        compression=compression,
+        change_column=manifest["change_column"],
+        key_column=manifest["key_column"],
+        parent_manifest=manifest,
+        overlap=overlap,
+    )
+
+
+def read_snapshot_table(snapshot_path: str) -> Any:
+    """Return the full dataset behind a snapshot as a pyarrow Table.
+
+    For a delta snapshot the base and every delta in its manifest are
+    combined, keeping the most recent row for each key.
+    """
+    if not _HAS_PYARROW:
+        raise RuntimeError("pyarrow is required to read snapshot chains")
+
+    manifest = load_snapshot_manifest(snapshot_path)
+    if manifest is None or len(manifest["snapshots"]) == 1:
+        return pq.read_table(snapshot_path)
+
+    tables = [pq.read_table(entry["path"]) for entry in manifest["snapshots"]]
+    combined = pa.concat_tables(
+        [table for table in tables if table.num_rows] or tables[:1],
+        promote_options="permissive",
+    )
+    positions = pa.array(np.arange(combined.num_rows))
+    latest = (
+        combined.append_column("__position", positions)
+        .group_by(manifest["key_column"], use_threads=False)
+        .aggregate([("__position", "max")])
+    )
+    return combined.take(np.sort(latest["__position_max"].to_numpy()))
+
+
+def compact_dataset_version(
+    version_id: str,
+    output_path: str,
+    database_url: str | None = None,
+    compression: str | None = None,
+) -> str:
+    """Merge a version's base snapshot and deltas into a new base file.
+
+    The merged table is written to `output_path`, the version's
+    snapshot_path, row_count and checksum are updated, and its manifest is
+    replaced by a single base entry with the same high-water mark, so later
+    deltas chain from the compacted file.
+    """
+    engine = create_database_engine(database_url or "sqlite:///data/mizzou.db")
+    Session = sessionmaker(bind=engine)
+    session = Session()
+
+    dv = session.query(DatasetVersion).filter_by(id=version_id).first()
+    if not dv:
+        raise ValueError(f"DatasetVersion not found: {version_id}")
+
+    manifest = load_snapshot_manifest(dv.snapshot_path)
+    if manifest is None:
+        raise ValueError(f"DatasetVersion {version_id} has no snapshot manifest")
+
+    table = read_snapshot_table(dv.snapshot_path)
+    _write_parquet_atomic(table, output_path, compression)
+    checksum = _compute_file_checksum(output_path)
+    manifest["snapshots"] = [
+        {
+            "version_id": dv.id,
+            "kind": "base",
+            "path": output_path,
+            "row_count": table.num_rows,
+            "checksum": checksum,
+            "high_water_mark": manifest["high_water_mark"],
+        }
+    ]
+    _write_manifest(output_path, manifest)
+
+    dv.snapshot_path = output_path
+    dv.row_count = table.num_rows
+    dv.checksum = checksum
+    session.commit()
+    return output_path
+
+
+def _export_snapshot(
+    version_id: str,
+    table_name: str,
+    output_path: str,
+    database_url: str | None,
+    chunksize: int,
+    compression: str | None,
+    change_column: str | None,
+    key_column: str,
+    parent_manifest: dict[str, Any] | None = None,
+    overlap: timedelta = DEFAULT_DELTA_OVERLAP,
+) -> str:
     engine = create_database_engine(database_url or "sqlite:///data/mizzou.db")
     Session = sessionmaker(bind=engine)
     session = Session()
@@ -331,6 +701,13 @@ def export_snapshot_for_version(
     if table_name not in inspector.get_table_names():
         raise ValueError(f"Table not found in database: {table_name}")
 
+    since = None
+    if parent_manifest is not None:
+        since = _decode_watermark(parent_manifest["high_water_mark"])
+    select_sql, select_params = _snapshot_select(
+        engine, table_name, change_column, since, overlap
+    )
+
     # Ensure output dir exists
     out_dir = os.path.dirname(output_path) or "."
     os.makedirs(out_dir, exist_ok=True)
@@ -380,13 +757,9 @@ def export_snapshot_for_version(
             )
 
     total_rows = 0
+    watermark: Any = None
     try:
         if _HAS_PYARROW:
-            first = True
-            writer: Any = None
-
-            select_sql = text(f"SELECT * FROM {table_name}")
-
             if pg_lock_acquired and _is_postgres_engine(engine):
                 # Export inside a REPEATABLE READ transaction for consistent
                 # snapshot
@@ -397,81 +770,29 @@ def export_snapshot_for_version(
                             text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ"),
                         )
                         exec_conn = conn.execution_options(stream_results=True)
-                        result = safe_execute(exec_conn, select_sql)
-                        cols = result.keys()
-
-                        while True:
-                            rows = result.fetchmany(chunksize)
-                            if not rows:
-                                break
-
-                            col_data = {c: [] for c in cols}
-                            for r in rows:
-                                for c, v in zip(cols, r, strict=False):
-                                    col_data[c].append(v)
-
-                            table = pa.Table.from_pydict(col_data)
-                            total_rows += table.num_rows
-
-                            if first:
-                                # Pass compression if provided
-                                if compression:
-                                    writer = pq.ParquetWriter(
-                                        temp_path,
-                                        table.schema,
-                                        compression=compression,
-                                    )
-                                else:
-                                    writer = pq.ParquetWriter(temp_path, table.schema)
-                                writer.write_table(table)
-                                first = False
-                            else:
-                                writer.write_table(table)
+                        result = safe_execute(exec_conn, select_sql, select_params)
+                        total_rows, watermark = _write_parquet_batches(
+                            result, temp_path, chunksize, compression, change_column
+                        )
             else:
                 with engine.connect() as conn:
                     exec_conn = conn.execution_options(stream_results=True)
-                    result = safe_execute(exec_conn, select_sql)
-                    cols = result.keys()
-
-                    while True:
-                        rows = result.fetchmany(chunksize)
-                        if not rows:
-                            break
-
-                        col_data = {c: [] for c in cols}
-                        for r in rows:
-                            for c, v in zip(cols, r, strict=False):
-                                col_data[c].append(v)
-
-                        table = pa.Table.from_pydict(col_data)
-                        total_rows += table.num_rows
-
-                        if first:
-                            if compression:
-                                writer = pq.ParquetWriter(
-                                    temp_path,
-                                    table.schema,
-                                    compression=compression,
-                                )
-                            else:
-                                writer = pq.ParquetWriter(temp_path, table.schema)
-                            writer.write_table(table)
-                            first = False
-                        else:
-                            writer.write_table(table)
-
-            if writer:
-                writer.close()
-            else:
-                empty = pa.Table.from_pydict({})
-                pq.write_table(empty, temp_path, compression=compression)
+                    result = safe_execute(exec_conn, select_sql, select_params)
+                    total_rows, watermark = _write_parquet_batches(
+                        result, temp_path, chunksize, compression, change_column
+                    )
 
             _fsync_path(temp_path)
             os.replace(temp_path, output_path)
             _fsync_path(output_path)
         else:
             # pandas fallback: use read_sql_table for simplicity
-            df = pd.read_sql_table(table_name, con=engine)
+            if change_column is None:
+                df = pd.read_sql_table(table_name, con=engine)
+            else:
+                df = pd.read_sql_query(select_sql, con=engine, params=select_params)
+                if len(df):
+                    watermark = _python_scalar(df[change_column].max())
             total_rows = len(df)
             # pandas will accept compression=None; cast to Any to satisfy mypy
             # pandas accepts compression=None or a compression string. Keep
@@ -485,6 +806,32 @@ def export_snapshot_for_version(
 
         # compute checksum and finalize
         checksum = _compute_file_checksum(output_path)
+
+        if change_column is not None:
+            # A delta holding only overlap rows keeps the parent's mark
+            if watermark is None or (since is not None and watermark < since):
+                watermark = since
+            entry = {
+                "version_id": dv.id,
+                "kind": "delta" if parent_manifest else "base",
+                "path": output_path,
+                "row_count": total_rows,
+                "checksum": checksum,
+                "high_water_mark": _encode_watermark(watermark),
+            }
+            earlier = parent_manifest["snapshots"] if parent_manifest else []
+            _write_manifest(
+                output_path,
+                {
+                    "dataset_name": dv.dataset_name,
+                    "table_name": table_name,
+                    "change_column": change_column,
+                    "key_column": key_column,
+                    "high_water_mark": _encode_watermark(watermark),
+                    "snapshots": [*earlier, entry],
+                },
+            )
+
         finalize_dataset_version(
             dv.id,
             succeeded=True,
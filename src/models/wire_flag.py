@@ -0,0 +1,93 @@
+"""Database-maintained ``articles.is_wire`` flag.
+
+Reports used to decide whether an article is wire content by parsing its
+``metadata`` and ``wire`` JSON for every row, which no index can serve.
+Triggers keep ``is_wire`` in step with both columns on every write path,
+ORM and raw SQL alike: a BEFORE row trigger on PostgreSQL, and AFTER
+triggers that update the written row on SQLite.
+
+An article is wire content when its byline result flags it
+(``metadata.byline.is_wire_content``) or its ``wire`` payload names a
+provider (an unparseable payload also counts, as it did in the reports).
+
+The same DDL is installed by the ``add_articles_is_wire`` migration; this
+module installs it when ``Base.metadata.create_all`` creates ``articles``.
+"""
+
+from __future__ import annotations
+
+# ``{row}`` is "NEW." inside triggers and "" for a backfill UPDATE
+SQLITE_IS_WIRE_EXPRESSION = """CASE
+    WHEN COALESCE(
+        CASE WHEN json_valid({row}metadata)
+            THEN json_extract({row}metadata, '$.byline.is_wire_content')
+        END,
+        0
+    ) != 0 THEN 1
+    WHEN {row}wire IS NULL THEN 0
+    WHEN json_valid({row}wire) = 0 THEN 1
+    WHEN COALESCE(json_extract({row}wire, '$.provider'), '') != '' THEN 1
+    ELSE 0
+END"""
+
+SQLITE_TRIGGERS = (
+    f"""
+CREATE TRIGGER IF NOT EXISTS articles_is_wire_insert
+AFTER INSERT ON articles
+BEGIN
+    UPDATE articles
+    SET is_wire = {SQLITE_IS_WIRE_EXPRESSION.format(row="NEW.")}
+    WHERE id = NEW.id;
+END
+""",
+    f"""
+CREATE TRIGGER IF NOT EXISTS articles_is_wire_update
+AFTER UPDATE OF metadata, wire ON articles
+BEGIN
+    UPDATE articles
+    SET is_wire = {SQLITE_IS_WIRE_EXPRESSION.format(row="NEW.")}
+    WHERE id = NEW.id;
+END
+""",
+)
+
+POSTGRES_IS_WIRE_FUNCTION = """
+CREATE OR REPLACE FUNCTION article_is_wire(p_metadata json, p_wire json)
+RETURNS boolean AS $$
+    SELECT COALESCE(p_metadata #>> '{byline,is_wire_content}', 'false')
+               NOT IN ('false', '0')
+        OR COALESCE(p_wire ->> 'provider', '') <> ''
+$$ LANGUAGE sql IMMUTABLE
+"""
+
+POSTGRES_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION articles_set_is_wire()
+RETURNS trigger AS $$
+BEGIN
+    NEW.is_wire := article_is_wire(NEW.metadata::json, NEW.wire::json);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+POSTGRES_TRIGGERS = (
+    POSTGRES_IS_WIRE_FUNCTION,
+    POSTGRES_TRIGGER_FUNCTION,
+    "DROP TRIGGER IF EXISTS articles_set_is_wire ON articles",
+    "CREATE TRIGGER articles_set_is_wire "
+    "BEFORE INSERT OR UPDATE OF metadata, wire ON articles "
+    "FOR EACH ROW EXECUTE FUNCTION articles_set_is_wire()",
+)
+
+
+def install_is_wire_triggers(target, connection, **kw) -> None:
+    """``after_create`` listener for the ``articles`` table."""
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        statements = SQLITE_TRIGGERS
+    elif dialect == "postgresql":
+        statements = POSTGRES_TRIGGERS
+    else:
+        return
+    for statement in statements:
+        connection.exec_driver_sql(statement)
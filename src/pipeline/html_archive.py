@@ -0,0 +1,431 @@
+"""
+Content-addressed archive of fetched HTML.
+
+Fetched pages used to be discarded after ``ContentExtractor.extract_content``,
+so any change to extraction rules meant re-crawling publishers. ``HtmlArchive``
+keeps every fetched page on local disk so extraction can be replayed offline.
+
+Layout under the archive root::
+
+    segments/<timestamp>-<pid>-<n>.mzha   append-only record files
+    index.sqlite                          blob and fetch index
+
+Segments are WARC-like: each record is a one-line JSON header followed by
+``length`` bytes of payload and a newline. A ``response`` record carries a
+page compressed with zstd (zlib when ``zstandard`` is not installed); the
+codec is stored per record so mixed archives read back fine. Pages are
+addressed by the SHA256 of their HTML (the same digest as
+``calculate_content_hash`` and ``article_fetch_state.html_digest``), so a
+page fetched again unchanged is written as a payload-less ``revisit`` record.
+Headers also carry the URL, fetch time and HTTP status, which lets
+``rebuild_index`` recreate the index from the segments alone.
+
+Every process appends to its own segment files, rolled over at
+``segment_bytes``, so several extraction workers can share one archive.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+from src.models.database import calculate_content_hash
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_zstd_warning_logged = False
+
+
+def _warn_zstd_missing() -> None:
+    global _zstd_warning_logged
+    if not _zstd_warning_logged:
+        _zstd_warning_logged = True
+        logger.warning(
+            "zstandard is not installed; the HTML archive falls back to zlib, "
+            "which compresses worse and slower"
+        )
+
+
+ARCHIVE_DIR_ENV = "HTML_ARCHIVE_DIR"
+ARCHIVE_MODE_ENV = "HTML_ARCHIVE_MODE"
+SEGMENT_SUFFIX = ".mzha"
+DEFAULT_SEGMENT_BYTES = 256 * 1024 * 1024
+DEFAULT_ZSTD_LEVEL = 3
+DEFAULT_ZLIB_LEVEL = 6
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS html_blobs (
+        digest TEXT PRIMARY KEY,
+        segment TEXT NOT NULL,
+        payload_offset INTEGER NOT NULL,
+        length INTEGER NOT NULL,
+        raw_length INTEGER NOT NULL,
+        codec TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS html_fetches (
+        url TEXT NOT NULL,
+        fetched_at TEXT NOT NULL,
+        digest TEXT NOT NULL,
+        status INTEGER
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_html_fetches_url"
+    " ON html_fetches (url, fetched_at)",
+)
+
+
+class ArchivedFetch(NamedTuple):
+    """One fetch of a URL recorded in the archive."""
+
+    url: str
+    fetched_at: str
+    digest: str
+    status: int | None
+
+
+class HtmlArchive:
+    """Compressed, content-addressed store of fetched HTML.
+
+    Args:
+        root: Archive directory; created if missing.
+        segment_bytes: Size at which this process starts a new segment.
+        codec: ``"zstd"`` or ``"zlib"``; defaults to zstd when available.
+        level: Compression level for the chosen codec.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        codec: str | None = None,
+        level: int | None = None,
+    ) -> None:
+        self.root = Path(root).expanduser()
+        self.segment_dir = self.root / "segments"
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        if codec is None and not ZSTD_AVAILABLE:
+            _warn_zstd_missing()
+        self.codec = codec or ("zstd" if ZSTD_AVAILABLE else "zlib")
+        if self.codec == "zstd" and not ZSTD_AVAILABLE:
+            raise RuntimeError("zstandard is not installed; use codec='zlib'")
+        if self.codec not in ("zstd", "zlib"):
+            raise ValueError(f"Unknown archive codec: {self.codec}")
+        if level is None:
+            level = DEFAULT_ZSTD_LEVEL if self.codec == "zstd" else DEFAULT_ZLIB_LEVEL
+        self.level = level
+        self._compressor = (
+            zstandard.ZstdCompressor(level=self.level) if self.codec == "zstd" else None
+        )
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.root / "index.sqlite",
+            check_same_thread=False,
+            isolation_level=None,
+            timeout=30,
+        )
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        self._segment: Path | None = None
+        self._segment_file = None
+        self._segment_count = 0
+        self._read_fds: dict[str, int] = {}
+
+    # -- writing ---------------------------------------------------------
+
+    def put(
+        self,
+        url: str,
+        html: str,
+        *,
+        status: int | None = 200,
+        fetched_at: datetime | None = None,
+    ) -> str:
+        """Archive one fetch of ``url`` and return the page digest."""
+        return self.put_many([(url, html, status, fetched_at)])[0]
+
+    def put_many(
+        self,
+        pages: Iterable[tuple[str, str, int | None, datetime | None]],
+    ) -> list[str]:
+        """Archive ``(url, html, status, fetched_at)`` fetches in one transaction."""
+        digests: list[str] = []
+        blobs: list[tuple] = []
+        fetches: list[tuple] = []
+        with self._lock:
+            pending: set[str] = set()
+            for url, html, status, fetched_at in pages:
+                data = html.encode("utf-8")
+                digest = calculate_content_hash(html)
+                fetched = (fetched_at or datetime.utcnow()).isoformat()
+                header = {
+                    "url": url,
+                    "fetched_at": fetched,
+                    "status": status,
+                    "digest": digest,
+                }
+                if digest in pending or self._has_blob(digest):
+                    self._append({"type": "revisit", **header}, b"")
+                else:
+                    payload = self._compress(data)
+                    segment, offset = self._append(
+                        {
+                            "type": "response",
+                            **header,
+                            "codec": self.codec,
+                            "raw_length": len(data),
+                        },
+                        payload,
+                    )
+                    blobs.append(
+                        (digest, segment, offset, len(payload), len(data), self.codec)
+                    )
+                    pending.add(digest)
+                fetches.append((url, fetched, digest, status))
+                digests.append(digest)
+            if self._segment_file is not None:
+                self._segment_file.flush()
+            self._index(blobs, fetches)
+        return digests
+
+    def _has_blob(self, digest: str) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM html_blobs WHERE digest = ?", (digest,)
+        ).fetchone()
+        return row is not None
+
+    def _compress(self, data: bytes) -> bytes:
+        if self._compressor is not None:
+            return self._compressor.compress(data)
+        return zlib.compress(data, self.level)
+
+    def _append(self, header: dict, payload: bytes) -> tuple[str, int]:
+        """Write one record; return its segment name and payload offset."""
+        header["length"] = len(payload)
+        line = json.dumps(header, separators=(",", ":")).encode("utf-8") + b"\n"
+        if (
+            self._segment_file is None
+            or self._segment_file.tell() + len(line) + len(payload) + 1
+            > self.segment_bytes
+        ):
+            self._roll_segment()
+        offset = self._segment_file.tell() + len(line)
+        self._segment_file.write(line)
+        self._segment_file.write(payload)
+        self._segment_file.write(b"\n")
+        return self._segment.name, offset
+
+    def _roll_segment(self) -> None:
+        if self._segment_file is not None:
+            self._segment_file.close()
+        self._segment_count += 1
+        stamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+        name = f"{stamp}-{os.getpid()}-{self._segment_count:04d}{SEGMENT_SUFFIX}"
+        self._segment = self.segment_dir / name
+        self._segment_file = open(self._segment, "ab")
+
+    def _index(
+        self, blobs: list[tuple], fetches: list[tuple], replace: bool = False
+    ) -> None:
+        with self._conn:
+            self._conn.execute("BEGIN")
+            if replace:
+                self._conn.execute("DELETE FROM html_blobs")
+                self._conn.execute("DELETE FROM html_fetches")
+            self._conn.executemany(
+                "INSERT INTO html_blobs "
+                "(digest, segment, payload_offset, length, raw_length, codec) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (digest) DO NOTHING",
+                blobs,
+            )
+            self._conn.executemany(
+                "INSERT INTO html_fetches (url, fetched_at, digest, status) "
+                "VALUES (?, ?, ?, ?)",
+                fetches,
+            )
+
+    # -- reading ---------------------------------------------------------
+
+    def get(self, digest: str) -> str | None:
+        """Return the page stored under ``digest``."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT segment, payload_offset, length, codec FROM html_blobs "
+                "WHERE digest = ?",
+                (digest,),
+            ).fetchone()
+            if row is None:
+                return None
+            segment, offset, length, codec = row
+            fd = self._read_fd(segment)
+        payload = os.pread(fd, length, offset)
+        return self._decompress(payload, codec).decode("utf-8")
+
+    def latest(self, url: str, *, before: datetime | None = None) -> str | None:
+        """Return the most recent successful fetch of ``url``."""
+        fetch = self.latest_fetch(url, before=before)
+        return self.get(fetch.digest) if fetch else None
+
+    def latest_fetch(
+        self, url: str, *, before: datetime | None = None
+    ) -> ArchivedFetch | None:
+        """Index entry of the most recent successful fetch of ``url``."""
+        query = (
+            "SELECT url, fetched_at, digest, status FROM html_fetches "
+            "WHERE url = ? AND (status IS NULL OR status < 400)"
+        )
+        params: list = [url]
+        if before is not None:
+            query += " AND fetched_at < ?"
+            params.append(before.isoformat())
+        with self._lock:
+            row = self._conn.execute(
+                query + " ORDER BY fetched_at DESC LIMIT 1", params
+            ).fetchone()
+        return ArchivedFetch(*row) if row else None
+
+    def history(self, url: str) -> list[ArchivedFetch]:
+        """All archived fetches of ``url``, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url, fetched_at, digest, status FROM html_fetches "
+                "WHERE url = ? ORDER BY fetched_at",
+                (url,),
+            ).fetchall()
+        return [ArchivedFetch(*row) for row in rows]
+
+    def _read_fd(self, segment: str) -> int:
+        fd = self._read_fds.get(segment)
+        if fd is None:
+            fd = os.open(self.segment_dir / segment, os.O_RDONLY)
+            self._read_fds[segment] = fd
+        return fd
+
+    def _decompress(self, payload: bytes, codec: str) -> bytes:
+        if codec == "zlib":
+            return zlib.decompress(payload)
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("zstandard is required to read zstd archive records")
+        decompressor = getattr(self._local, "decompressor", None)
+        if decompressor is None:
+            decompressor = self._local.decompressor = zstandard.ZstdDecompressor()
+        return decompressor.decompress(payload)
+
+    # -- maintenance -----------------------------------------------------
+
+    def iter_records(self) -> Iterator[tuple[str, dict, int]]:
+        """Yield ``(segment, header, payload_offset)`` for every record."""
+        for path in sorted(self.segment_dir.glob(f"*{SEGMENT_SUFFIX}")):
+            with open(path, "rb") as handle:
+                while True:
+                    line = handle.readline()
+                    if not line:
+                        break
+                    try:
+                        header = json.loads(line)
+                    except ValueError:
+                        logger.warning("Truncated archive record in %s", path.name)
+                        break
+                    offset = handle.tell()
+                    yield path.name, header, offset
+                    handle.seek(offset + header["length"] + 1)
+
+    def rebuild_index(self) -> int:
+        """Recreate the index from the segment files; return fetches indexed."""
+        blobs: list[tuple] = []
+        fetches: list[tuple] = []
+        for segment, header, offset in self.iter_records():
+            if header["type"] == "response":
+                blobs.append(
+                    (
+                        header["digest"],
+                        segment,
+                        offset,
+                        header["length"],
+                        header["raw_length"],
+                        header["codec"],
+                    )
+                )
+            fetches.append(
+                (
+                    header["url"],
+                    header["fetched_at"],
+                    header["digest"],
+                    header["status"],
+                )
+            )
+        with self._lock:
+            self._index(blobs, fetches, replace=True)
+        return len(fetches)
+
+    def stats(self) -> dict[str, int]:
+        """Page, fetch and byte counts for the archive."""
+        with self._lock:
+            pages, raw_bytes, stored_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(raw_length), 0), "
+                "COALESCE(SUM(length), 0) FROM html_blobs"
+            ).fetchone()
+            (fetches,) = self._conn.execute(
+                "SELECT COUNT(*) FROM html_fetches"
+            ).fetchone()
+        return {
+            "pages": pages,
+            "fetches": fetches,
+            "raw_bytes": raw_bytes,
+            "stored_bytes": stored_bytes,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._segment_file is not None:
+                self._segment_file.close()
+                self._segment_file = None
+            for fd in self._read_fds.values():
+                os.close(fd)
+            self._read_fds.clear()
+            self._conn.close()
+
+
+_archives: dict[Path, HtmlArchive] = {}
+_archives_lock = threading.Lock()
+
+
+def get_html_archive(root: str | Path | None = None) -> HtmlArchive | None:
+    """Process-wide archive for ``root`` (default ``$HTML_ARCHIVE_DIR``).
+
+    Returns ``None`` when no archive directory is configured.
+    """
+    root = root or os.getenv(ARCHIVE_DIR_ENV)
+    if not root:
+        return None
+    path = Path(root).expanduser().resolve()
+    with _archives_lock:
+        archive = _archives.get(path)
+        if archive is None:
+            archive = _archives[path] = HtmlArchive(path)
+        return archive
+
+
+def archive_replay_enabled() -> bool:
+    """Whether ``$HTML_ARCHIVE_MODE`` asks extraction to replay the archive."""
+    return os.getenv(ARCHIVE_MODE_ENV, "").strip().lower() == "replay"
@@ -0,0 +1,416 @@
+"""
+Offline re-extraction of archived HTML across a process pool.
+
+Validating a selector or cleaner change used to mean re-crawling
+publishers for days. ``OfflineReextractor`` replays the pages stored in
+the HTML archive (``src/pipeline/html_archive.py``) through
+``ContentExtractor.extract_content`` in replay mode (no network, no
+browser), byline cleaning and content cleaning, and compares the title,
+author, publish date and content with what is stored for each article.
+
+Articles are sent to worker processes in chunks of ids and URLs. Each
+worker opens its own archive reader and database connection, so large
+pages and stored content never cross the process boundary. Results come
+back per chunk; the parent folds them into a ``DiffReport`` and, unless
+``dry_run`` is set, writes the changed fields back with bulk updates
+every ``commit_every`` articles.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+from urllib.parse import urlparse
+
+from sqlalchemy import select, update
+
+from src.models import Article, CandidateLink, Source
+from src.models.database import _commit_with_retry, calculate_content_hash
+from src.pipeline.reextraction import ReextractionTarget
+
+logger = logging.getLogger(__name__)
+
+DIFF_FIELDS = ("title", "author", "publish_date", "content")
+
+EXTRACTED = "extracted"
+NO_HTML = "no_html"
+FAILED = "failed"
+
+UNCHANGED = "unchanged"
+CHANGED = "changed"
+ADDED = "added"
+REMOVED = "removed"
+
+DEFAULT_CHUNK_SIZE = 25
+SAMPLE_CHARS = 300
+
+
+def _normalize(name: str, value: Any) -> str | None:
+    """Comparable form of a field value; empty values become None."""
+    if value is None:
+        return None
+    if name == "publish_date":
+        if isinstance(value, str):
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError:
+                return value.strip() or None
+        if isinstance(value, datetime):
+            return value.replace(tzinfo=None).isoformat(timespec="seconds")
+    text = str(value).strip()
+    return text or None
+
+
+def diff_fields(old: dict[str, Any], new: dict[str, Any]) -> dict[str, str]:
+    """Classify each of ``DIFF_FIELDS`` as unchanged/changed/added/removed."""
+    result = {}
+    for name in DIFF_FIELDS:
+        before, after = _normalize(name, old.get(name)), _normalize(name, new.get(name))
+        if before == after:
+            result[name] = UNCHANGED
+        elif before is None:
+            result[name] = ADDED
+        elif after is None:
+            result[name] = REMOVED
+        else:
+            result[name] = CHANGED
+    return result
+
+
+@dataclass
+class OfflineResult:
+    """Outcome of re-extracting one article offline."""
+
+    article_id: str
+    outcome: str
+    diff: dict[str, str] = field(default_factory=dict)
+    # Changed fields only, as Article column values
+    updates: dict[str, Any] = field(default_factory=dict)
+    # (before, after) excerpts of changed fields for the report
+    samples: dict[str, tuple[str | None, str | None]] = field(default_factory=dict)
+    content_delta: int = 0
+    error: str | None = None
+
+
+@dataclass
+class DiffReport:
+    """Field-level summary of an offline re-extraction run."""
+
+    max_samples: int = 20
+    outcomes: Counter = field(default_factory=Counter)
+    fields: dict[str, Counter] = field(
+        default_factory=lambda: {name: Counter() for name in DIFF_FIELDS}
+    )
+    samples: dict[str, list[dict[str, Any]]] = field(
+        default_factory=lambda: {name: [] for name in DIFF_FIELDS}
+    )
+    articles_changed: int = 0
+    content_chars_delta: int = 0
+    seconds: float = 0.0
+
+    def add(self, result: OfflineResult) -> None:
+        self.outcomes[result.outcome] += 1
+        if result.outcome != EXTRACTED:
+            return
+        for name, kind in result.diff.items():
+            self.fields[name][kind] += 1
+            samples = self.samples[name]
+            if kind != UNCHANGED and len(samples) < self.max_samples:
+                before, after = result.samples.get(name, (None, None))
+                samples.append(
+                    {
+                        "article_id": result.article_id,
+                        "kind": kind,
+                        "before": before,
+                        "after": after,
+                    }
+                )
+        if result.updates:
+            self.articles_changed += 1
+        self.content_chars_delta += result.content_delta
+
+    @property
+    def processed(self) -> int:
+        return sum(self.outcomes.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "processed": self.processed,
+            "outcomes": dict(self.outcomes),
+            "articles_changed": self.articles_changed,
+            "fields": {name: dict(counts) for name, counts in self.fields.items()},
+            "content_chars_delta": self.content_chars_delta,
+            "seconds": round(self.seconds, 3),
+            "articles_per_second": (
+                round(self.processed / self.seconds, 2) if self.seconds else None
+            ),
+            "samples": self.samples,
+        }
+
+    def write(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.as_dict(), handle, indent=2, default=str)
+
+
+class _Worker:
+    """Per-process extraction state, built once by ``_init_worker``."""
+
+    def __init__(self, archive_root: str, database_url: str | None, clean: bool):
+        from src.crawler import ContentExtractor
+        from src.models.database import DatabaseManager
+        from src.pipeline.html_archive import get_html_archive
+        from src.telemetry.store import TelemetryStore
+        from src.utils.byline_cleaner import BylineCleaner
+        from src.utils.content_cleaning_telemetry import ContentCleaningTelemetry
+        from src.utils.reference_data import ReferenceDataRegistry
+
+        self.archive = get_html_archive(archive_root)
+        self.db = DatabaseManager(database_url)
+        self.extractor = ContentExtractor()
+        self.extractor.archive_replay = True
+        self.byline_cleaner = BylineCleaner(
+            reference_data=ReferenceDataRegistry(self.db.get_session, background=False)
+        )
+        self.content_cleaner = None
+        if clean:
+            from src.utils.content_cleaner_balanced import (
+                BalancedBoundaryContentCleaner,
+            )
+
+            # Apply the patterns stored in this database, as production
+            # cleaning does, but record no telemetry
+            telemetry = ContentCleaningTelemetry(
+                enable_telemetry=False,
+                read_persistent_patterns=True,
+                store=TelemetryStore(
+                    self.db.database_url, async_writes=False, engine=self.db.engine
+                ),
+            )
+            self.content_cleaner = BalancedBoundaryContentCleaner(
+                enable_telemetry=False, db=self.db, telemetry=telemetry
+            )
+
+    def stored(self, article_ids: list[str]) -> dict[str, dict[str, Any]]:
+        query = (
+            select(
+                Article.id,
+                Article.title,
+                Article.author,
+                Article.publish_date,
+                Article.content,
+                CandidateLink.source,
+                Source.canonical_name,
+            )
+            .outerjoin(CandidateLink, Article.candidate_link_id == CandidateLink.id)
+            .outerjoin(Source, CandidateLink.source_id == Source.id)
+            .where(Article.id.in_(article_ids))
+        )
+        with self.db.get_session() as session:
+            return {row.id: row._asdict() for row in session.execute(query)}
+
+    def process(self, targets: list[tuple[str, str]]) -> list[OfflineResult]:
+        stored = self.stored([article_id for article_id, _ in targets])
+        return [
+            self.reextract(article_id, url, stored.get(article_id, {}))
+            for article_id, url in targets
+        ]
+
+    def reextract(self, article_id: str, url: str, old: dict) -> OfflineResult:
+        html = self.archive.latest(url)
+        if html is None:
+            return OfflineResult(article_id, NO_HTML)
+        try:
+            extracted = self.extractor.extract_content(url, html=html) or {}
+            new = self.clean(article_id, url, extracted, old)
+        except Exception as exc:
+            logger.warning("Offline re-extraction failed for %s: %s", url, exc)
+            return OfflineResult(article_id, FAILED, error=str(exc))
+        if not new["title"] and not new["content"]:
+            return OfflineResult(article_id, FAILED, error="nothing extracted")
+
+        diff = diff_fields(old, new)
+        result = OfflineResult(article_id, EXTRACTED, diff)
+        for name, kind in diff.items():
+            if kind == UNCHANGED:
+                continue
+            result.updates[name] = new[name]
+            result.samples[name] = (
+                _excerpt(old.get(name)),
+                _excerpt(new[name]),
+            )
+        # Same as post-extraction cleaning: text mirrors the cleaned content
+        if "content" in result.updates:
+            result.updates["text"] = new["content"]
+            result.updates["text_hash"] = calculate_content_hash(new["content"])
+        result.content_delta = len(new["content"] or "") - len(old.get("content") or "")
+        return result
+
+    def clean(
+        self, article_id: str, url: str, extracted: dict, stored: dict
+    ) -> dict[str, Any]:
+        """Byline and content cleaning, read-only (persistent patterns only).
+
+        ``stored`` supplies the article's source names, so the byline
+        cleaner drops the publication name and filters wire services as it
+        does during extraction.
+        """
+        source_name = stored.get("canonical_name") or stored.get("source")
+        author = None
+        if extracted.get("author"):
+            byline = self.byline_cleaner.clean_byline(
+                extracted["author"],
+                return_json=True,
+                source_name=source_name,
+                article_id=article_id,
+                source_canonical_name=stored.get("canonical_name"),
+            )
+            names = [name.strip() for name in byline.get("authors", []) if name]
+            author = ", ".join(name for name in names if name) or None
+
+        content = extracted.get("content") or ""
+        if self.content_cleaner is not None and content.strip():
+            content, _ = self.content_cleaner.process_single_article(
+                text=content, domain=urlparse(url).netloc, dry_run=True
+            )
+        publish_date = extracted.get("publish_date")
+        if isinstance(publish_date, str):
+            try:
+                publish_date = datetime.fromisoformat(publish_date)
+            except ValueError:
+                publish_date = None
+        return {
+            "title": extracted.get("title"),
+            "author": author,
+            "publish_date": publish_date,
+            "content": content,
+        }
+
+
+def _excerpt(value: Any) -> str | None:
+    if value is None:
+        return None
+    return str(value)[:SAMPLE_CHARS]
+
+
+_worker: _Worker | None = None
+
+
+def _init_worker(archive_root: str, database_url: str | None, clean: bool) -> None:
+    global _worker
+    logging.getLogger().setLevel(logging.WARNING)
+    _worker = _Worker(archive_root, database_url, clean)
+
+
+def _process_chunk(targets: list[tuple[str, str]]) -> list[OfflineResult]:
+    assert _worker is not None, "worker not initialized"
+    return _worker.process(targets)
+
+
+def _chunks(
+    targets: Iterable[ReextractionTarget], size: int
+) -> Iterator[list[tuple[str, str]]]:
+    chunk: list[tuple[str, str]] = []
+    for target in targets:
+        chunk.append((target.article_id, target.url))
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class OfflineReextractor:
+    """Re-extract archived articles in parallel and report field changes.
+
+    Args:
+        archive_root: HTML archive directory.
+        session: SQLAlchemy session used to write updates.
+        database_url: Database the workers read stored fields from;
+            defaults to the configured database.
+        workers: Worker processes; 1 runs everything in this process.
+        clean: Run content cleaning on the extracted text.
+        dry_run: Only build the report; leave articles untouched.
+    """
+
+    def __init__(
+        self,
+        archive_root: str,
+        session,
+        *,
+        database_url: str | None = None,
+        workers: int = 1,
+        clean: bool = True,
+        dry_run: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        commit_every: int = 500,
+    ) -> None:
+        self.archive_root = str(archive_root)
+        self.session = session
+        self.database_url = database_url
+        self.workers = max(1, workers)
+        self.clean = clean
+        self.dry_run = dry_run
+        self.chunk_size = chunk_size
+        self.commit_every = commit_every
+
+    def run(self, targets: Iterable[ReextractionTarget]) -> DiffReport:
+        report = DiffReport()
+        pending: list[dict[str, Any]] = []
+        started = time.perf_counter()
+        for results in self._results(_chunks(targets, self.chunk_size)):
+            for result in results:
+                report.add(result)
+                if result.updates and not self.dry_run:
+                    pending.append({"id": result.article_id, **result.updates})
+            if len(pending) >= self.commit_every:
+                self._write(pending)
+                pending = []
+        if pending:
+            self._write(pending)
+        report.seconds = time.perf_counter() - started
+        logger.info("Offline re-extraction finished: %s", report.as_dict())
+        return report
+
+    def _results(
+        self, chunks: Iterator[list[tuple[str, str]]]
+    ) -> Iterator[list[OfflineResult]]:
+        init_args = (self.archive_root, self.database_url, self.clean)
+        if self.workers == 1:
+            worker = _Worker(*init_args)
+            for chunk in chunks:
+                yield worker.process(chunk)
+            return
+
+        # Spawned workers do not inherit the parent's threads or
+        # connections; keep a few chunks queued per worker.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            self.workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=init_args,
+        ) as executor:
+            in_flight: set[Future] = set()
+            for chunk in chunks:
+                in_flight.add(executor.submit(_process_chunk, chunk))
+                if len(in_flight) >= self.workers * 4:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            for future in in_flight:
+                yield future.result()
+
+    def _write(self, rows: list[dict[str, Any]]) -> None:
+        extracted_at = datetime.utcnow()
+        for row in rows:
+            row["extracted_at"] = extracted_at
+        self.session.execute(update(Article), rows)
+        _commit_with_retry(self.session)
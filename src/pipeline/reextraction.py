@@ -0,0 +1,267 @@
+"""
+Re-extraction that skips work for pages that have not changed.
+
+Re-extraction used to refetch every page and re-run newspaper4k,
+BeautifulSoup, byline cleaning, content-type detection, content cleaning
+and entity extraction even when the publisher had not touched it.
+``Reextractor`` checks each article in three steps and stops at the first
+one that shows the page is unchanged:
+
+1. Conditional GET with the ``ETag``/``Last-Modified`` validators stored
+   in ``article_fetch_state``; a 304 skips everything.
+2. SHA256 of the raw HTML against the stored ``html_digest``; equal HTML
+   skips extraction.
+3. SHA256 of the extracted text (``calculate_content_hash``) against the
+   stored ``extracted_text_hash``, falling back to ``articles.text_hash``
+   the first time an article is checked; equal text skips the downstream
+   stages.
+
+``articles.text_hash`` is rewritten to the cleaned text's hash once
+content cleaning changes an article, so a first check that does not match
+it cannot tell an edit from cleaning. Such articles are recorded as
+``baseline``: their digests are stored without touching the article, and
+later checks compare raw extraction against raw extraction.
+
+Skipped articles only get their ``checked_at`` timestamp (and unchanged
+count) updated. Changed articles are handed to ``on_changed`` with the
+new extraction result, and their digests are stored once that succeeds.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from sqlalchemy import or_, select
+
+from src.models import Article, ArticleFetchState
+from src.models.database import _commit_with_retry, calculate_content_hash
+
+logger = logging.getLogger(__name__)
+
+NOT_MODIFIED = "not_modified"
+HTML_UNCHANGED = "html_unchanged"
+TEXT_UNCHANGED = "text_unchanged"
+BASELINE = "baseline"
+CHANGED = "changed"
+MISSING = "missing"
+FAILED = "failed"
+
+SKIPPED_OUTCOMES = (NOT_MODIFIED, HTML_UNCHANGED, TEXT_UNCHANGED, BASELINE)
+
+
+class ReextractionTarget(NamedTuple):
+    """An article to re-extract."""
+
+    article_id: str
+    url: str
+    text_hash: str | None
+
+
+@dataclass
+class ReextractionStats:
+    """Outcome counts for a re-extraction run."""
+
+    outcomes: Counter = field(default_factory=Counter)
+
+    def record(self, outcome: str) -> None:
+        self.outcomes[outcome] += 1
+
+    @property
+    def checked(self) -> int:
+        return sum(self.outcomes.values())
+
+    @property
+    def skipped(self) -> int:
+        return sum(self.outcomes[outcome] for outcome in SKIPPED_OUTCOMES)
+
+    @property
+    def skipped_fraction(self) -> float:
+        return self.skipped / self.checked if self.checked else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            outcome: self.outcomes[outcome]
+            for outcome in (*SKIPPED_OUTCOMES, CHANGED, MISSING, FAILED)
+        }
+        result.update(
+            checked=self.checked,
+            skipped=self.skipped,
+            skipped_fraction=round(self.skipped_fraction, 4),
+        )
+        return result
+
+
+def select_reextraction_targets(
+    session,
+    *,
+    host: str | None = None,
+    article_ids: Iterable[str] | None = None,
+    limit: int | None = None,
+) -> list[ReextractionTarget]:
+    """Articles to re-extract, least recently checked first."""
+    query = (
+        select(Article.id, Article.url, Article.text_hash)
+        .outerjoin(ArticleFetchState, ArticleFetchState.article_id == Article.id)
+        .where(Article.url.is_not(None))
+        .order_by(
+            ArticleFetchState.checked_at.is_not(None), ArticleFetchState.checked_at
+        )
+    )
+    if host:
+        host = host.lower().removeprefix("www.")
+        query = query.where(
+            or_(
+                Article.url.like(f"%://{host}/%"),
+                Article.url.like(f"%://www.{host}/%"),
+            )
+        )
+    if article_ids is not None:
+        query = query.where(Article.id.in_(list(article_ids)))
+    if limit:
+        query = query.limit(limit)
+    return [ReextractionTarget(*row) for row in session.execute(query)]
+
+
+class Reextractor:
+    """Re-extract articles, skipping those whose page has not changed.
+
+    Args:
+        extractor: ``ContentExtractor`` used for ``fetch_conditional`` and
+            ``extract_content``.
+        session: SQLAlchemy session holding ``article_fetch_state``.
+        on_changed: Called with the target and extraction result for
+            changed articles; runs the downstream stages.
+        force: Ignore stored validators and digests and treat every
+            article as changed.
+    """
+
+    def __init__(
+        self,
+        extractor,
+        session,
+        on_changed: Callable[[ReextractionTarget, dict[str, Any]], None] | None = None,
+        *,
+        force: bool = False,
+        clock: Callable[[], datetime] = datetime.utcnow,
+    ) -> None:
+        self.extractor = extractor
+        self.session = session
+        self.on_changed = on_changed
+        self.force = force
+        self.clock = clock
+
+    def reextract(self, target: ReextractionTarget) -> str:
+        """Check one article and return its outcome."""
+        state = self.session.get(ArticleFetchState, target.article_id)
+        use_state = state is not None and not self.force
+
+        try:
+            response = self.extractor.fetch_conditional(
+                target.url,
+                etag=state.etag if use_state else None,
+                last_modified=state.last_modified if use_state else None,
+            )
+        except Exception as exc:
+            from src.crawler import NotFoundError
+
+            if isinstance(exc, NotFoundError):
+                return MISSING
+            logger.warning("Conditional fetch failed for %s: %s", target.url, exc)
+            return FAILED
+
+        if response.status_code == 304 and use_state:
+            return self._record(state, target, NOT_MODIFIED)
+        if response.status_code != 200:
+            logger.warning(
+                "Unexpected status %s re-extracting %s",
+                response.status_code,
+                target.url,
+            )
+            return FAILED
+
+        html = response.text or ""
+        html_digest = calculate_content_hash(html)
+        validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        if use_state and html_digest == state.html_digest:
+            return self._record(state, target, HTML_UNCHANGED, **validators)
+
+        try:
+            content = self.extractor.extract_content(target.url, html=html) or {}
+        except Exception as exc:
+            logger.warning("Re-extraction failed for %s: %s", target.url, exc)
+            return FAILED
+        text = content.get("content") or ""
+        if not content.get("title") or not text:
+            return FAILED
+
+        text_hash = calculate_content_hash(text)
+        previous = state.extracted_text_hash if state is not None else None
+        if not self.force and text_hash == (previous or target.text_hash):
+            outcome = TEXT_UNCHANGED
+        elif not self.force and previous is None:
+            outcome = BASELINE
+        else:
+            if self.on_changed is not None:
+                try:
+                    # Roll back only this article; earlier articles' updates
+                    # in the uncommitted batch stay
+                    with self.session.begin_nested():
+                        self.on_changed(target, content)
+                except Exception as exc:
+                    logger.warning(
+                        "Storing re-extraction of %s failed: %s", target.url, exc
+                    )
+                    return FAILED
+            outcome = CHANGED
+        return self._record(
+            state,
+            target,
+            outcome,
+            html_digest=html_digest,
+            extracted_text_hash=text_hash,
+            **validators,
+        )
+
+    def _record(
+        self,
+        state: ArticleFetchState | None,
+        target: ReextractionTarget,
+        outcome: str,
+        **fields: Any,
+    ) -> str:
+        now = self.clock()
+        if state is None:
+            state = ArticleFetchState(
+                article_id=target.article_id, changed_at=now, unchanged_checks=0
+            )
+            self.session.add(state)
+        for name, value in fields.items():
+            setattr(state, name, value)
+        state.checked_at = now
+        if outcome == CHANGED:
+            state.changed_at = now
+            state.unchanged_checks = 0
+        else:
+            state.unchanged_checks = (state.unchanged_checks or 0) + 1
+        return outcome
+
+    def run(
+        self, targets: Iterable[ReextractionTarget], commit_every: int = 50
+    ) -> ReextractionStats:
+        """Re-extract ``targets``, committing every ``commit_every`` articles."""
+        stats = ReextractionStats()
+        for position, target in enumerate(targets, start=1):
+            stats.record(self.reextract(target))
+            if position % commit_every == 0:
+                _commit_with_retry(self.session)
+        _commit_with_retry(self.session)
+        logger.info("Re-extraction finished: %s", stats.as_dict())
+        return stats
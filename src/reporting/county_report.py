@@ -1,19 +1,27 @@
-"""Utilities for generating recurring county-level article reports."""
+"""Utilities for generating recurring county-level article reports.
+
+Reports are streamed: rows are fetched through a server-side cursor in
+chunks of ``chunk_size`` and each chunk is formatted and written before
+the next is fetched, so memory stays flat however many articles match.
+Wire content is excluded through the indexed, trigger-maintained
+``articles.is_wire`` flag rather than by parsing JSON for every row.
+"""
 
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
-from sqlalchemy import text
+from sqlalchemy import inspect, text
+from sqlalchemy.sql.elements import TextClause
 
 from src.models.database import DatabaseManager
 
-from .csv_writer import write_report_csv
+from .csv_writer import write_report_csv, write_report_csv_chunks
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +33,40 @@ DEFAULT_EXCLUDED_STATUSES: tuple[str, ...] = (
     "wire",
 )
 
+REPORT_COLUMNS: tuple[str, ...] = (
+    "article_id",
+    "host",
+    "publish_date",
+    "author",
+    "url",
+    "title",
+    "primary_label",
+    "secondary_label",
+    "entities",
+)
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+REPORT_FORMATS: tuple[str, ...] = ("csv", "parquet")
+
+# Used only against databases that predate the ``articles.is_wire`` column
+_LEGACY_WIRE_FILTER = (
+    "  AND (\n"
+    "        COALESCE(\n"
+    "            json_extract(a.metadata, '$.byline.is_wire_content'),\n"
+    "            0\n"
+    "        ) = 0\n"
+    "        AND COALESCE(\n"
+    "            CASE\n"
+    "                WHEN a.wire IS NULL THEN ''\n"
+    "                WHEN json_valid(a.wire) = 0 THEN '__wire__'\n"
+    "                ELSE json_extract(a.wire, '$.provider')\n"
+    "            END,\n"
+    "            ''\n"
+    "        ) = ''\n"
+    "      )\n"
+)
+
 
 @dataclass(frozen=True)
 class CountyReportConfig:
@@ -56,34 +98,26 @@ def _format_datetime_for_sql(value: datetime) -> str:
     return value.strftime("%Y-%m-%d %H:%M:%S")
 
 
-def generate_county_report(
+def _build_report_query(
     config: CountyReportConfig,
-    output_path: Path | None = None,
-) -> pd.DataFrame:
-    """Generate a county-focused article report and optionally persist to CSV.
-
-    Parameters
-    ----------
-    config:
-        Configuration parameters controlling the report scope and output.
-    output_path:
-        Optional path for the output CSV. When omitted, the caller can
-        handle persistence using the returned DataFrame.
-
-    Returns
-    -------
-    pandas.DataFrame
-        DataFrame containing the requested report rows.
+    *,
+    dialect: str = "sqlite",
+    has_is_wire: bool = True,
+) -> tuple[TextClause, dict[str, object]]:
+    """Build the report SELECT and its bind parameters.
+
+    Labels and entities are looked up per article with correlated
+    subqueries, so only matching articles are touched and rows can be
+    returned as soon as they are found instead of after every article's
+    labels and entities have been aggregated.
     """
 
     counties = _clean_counties(config.counties)
     county_bindings = {f"county_{idx}": county for idx, county in enumerate(counties)}
     county_placeholders = ", ".join(f":{name}" for name in county_bindings)
 
-    start_date_sql = _format_datetime_for_sql(config.start_date)
-    params: dict[str, str] = {
-        "start_date": start_date_sql,
-        "entity_separator": config.entity_separator,
+    params: dict[str, object] = {
+        "start_date": _format_datetime_for_sql(config.start_date),
         **county_bindings,
     }
 
@@ -98,65 +132,43 @@ def generate_county_report(
         f"      {status_placeholders}\n"
         "  )\n"
     )
-    wire_filter = (
-        "  AND (\n"
-        "        COALESCE(\n"
-        "            json_extract(a.metadata, '$.byline.is_wire_content'),\n"
-        "            0\n"
-        "        ) = 0\n"
-        "        AND COALESCE(\n"
-        "            CASE\n"
-        "                WHEN a.wire IS NULL THEN ''\n"
-        "                WHEN json_valid(a.wire) = 0 THEN '__wire__'\n"
-        "                ELSE json_extract(a.wire, '$.provider')\n"
-        "            END,\n"
-        "            ''\n"
-        "        ) = ''\n"
-        "      )\n"
-    )
 
-    label_filter_subquery = ""
-    label_filter_clause = ""
+    if has_is_wire:
+        wire_filter = "  AND a.is_wire = :not_wire\n"
+        params["not_wire"] = False
+    else:
+        wire_filter = _LEGACY_WIRE_FILTER
+
+    label_version_subquery = ""
+    label_version_join = ""
     if config.label_version:
-        label_filter_subquery = "        WHERE label_version = :label_version\n"
-        label_filter_clause = "    WHERE al.label_version = :label_version\n"
+        label_version_subquery = "          AND label_version = :label_version\n"
+        label_version_join = "   AND latest_labels.label_version = :label_version\n"
         params["label_version"] = config.label_version
 
-    cte_parts: list[str] = [
-        (
-            "latest_labels AS (\n"
-            "    SELECT al.article_id,\n"
-            "           al.primary_label,\n"
-            "           al.alternate_label,\n"
-            "           al.label_version,\n"
-            "           al.applied_at\n"
-            "    FROM article_labels al\n"
-            "    JOIN (\n"
-            "        SELECT article_id,\n"
-            "               MAX(applied_at) AS max_applied_at\n"
-            "        FROM article_labels\n"
-            f"{label_filter_subquery}"
-            "        GROUP BY article_id\n"
-            "    ) latest\n"
-            "      ON latest.article_id = al.article_id\n"
-            "     AND latest.max_applied_at = al.applied_at\n"
-            f"{label_filter_clause}"
-            ")\n"
-        )
-    ]
+    label_join = (
+        "LEFT JOIN article_labels latest_labels\n"
+        "    ON latest_labels.article_id = a.id\n"
+        "   AND latest_labels.applied_at = (\n"
+        "        SELECT MAX(applied_at)\n"
+        "        FROM article_labels\n"
+        "        WHERE article_id = a.id\n"
+        f"{label_version_subquery}"
+        "   )\n"
+        f"{label_version_join}"
+    )
 
-    entity_join = ""
-    entities_column = "    '' AS entities\n"
     if config.include_entities:
-        cte_parts.append(
-            "entity_agg AS (\n"
-            "    SELECT grouped.article_id,\n"
-            "           GROUP_CONCAT(\n"
-            "               grouped.entity_value,\n"
-            "               :entity_separator\n"
-            "           ) AS entities\n"
-            "    FROM (\n"
-            "        SELECT DISTINCT ae.article_id,\n"
+        params["entity_separator"] = config.entity_separator
+        if dialect == "postgresql":
+            aggregate = "STRING_AGG(grouped.entity_value, :entity_separator)"
+        else:
+            aggregate = "GROUP_CONCAT(grouped.entity_value, :entity_separator)"
+        entities_column = (
+            "    COALESCE((\n"
+            f"        SELECT {aggregate}\n"
+            "        FROM (\n"
+            "            SELECT DISTINCT\n"
             "                CASE\n"
             "                    WHEN ae.entity_label IS NOT NULL\n"
             "                         AND ae.entity_label != '' THEN\n"
@@ -164,18 +176,13 @@ def generate_county_report(
             "                        ae.entity_label || ']'\n"
             "                    ELSE ae.entity_text\n"
             "                END AS entity_value\n"
-            "        FROM article_entities ae\n"
-            "    ) AS grouped\n"
-            "    GROUP BY grouped.article_id\n"
-            ")\n"
+            "            FROM article_entities ae\n"
+            "            WHERE ae.article_id = a.id\n"
+            "        ) AS grouped\n"
+            "    ), '') AS entities\n"
         )
-        entity_join = "LEFT JOIN entity_agg ON entity_agg.article_id = a.id\n"
-        entities_column = "    COALESCE(entity_agg.entities, '') AS entities\n"
     else:
-        params.pop("entity_separator", None)
-
-    cte_clause = "WITH " + ",\n".join(part.rstrip() for part in cte_parts)
-    cte_clause += "\n"
+        entities_column = "    '' AS entities\n"
 
     time_filters = "  AND a.publish_date > :start_date\n"
     if config.end_date:
@@ -187,7 +194,6 @@ def generate_county_report(
     )
 
     query_sql = (
-        f"{cte_clause}"
         "SELECT\n"
         "    a.id AS article_id,\n"
         "    COALESCE(s.host, cl.source) AS host,\n"
@@ -207,58 +213,181 @@ def generate_county_report(
         "FROM articles a\n"
         "JOIN candidate_links cl ON a.candidate_link_id = cl.id\n"
         "LEFT JOIN sources s ON cl.source_id = s.id\n"
-        "LEFT JOIN latest_labels ON latest_labels.article_id = a.id\n"
-        f"{entity_join}"
+        f"{label_join}"
         "WHERE a.publish_date IS NOT NULL\n"
-        f"{status_filter}"
         f"{wire_filter}"
         f"{time_filters}"
+        f"{status_filter}"
         f"{county_filter}"
         "ORDER BY a.publish_date DESC\n"
     )
 
-    query = text(query_sql)
+    return text(query_sql), params
+
+
+def _format_report_chunk(df: pd.DataFrame) -> pd.DataFrame:
+    """Normalize one chunk of raw report rows into their output strings."""
+
+    df["article_id"] = df["article_id"].astype(str)
+    df["host"] = df["host"].astype(str)
+    parsed_dates = pd.to_datetime(
+        df["publish_date"],
+        errors="coerce",
+        utc=True,
+    )
+    parsed_dates = parsed_dates.dt.tz_localize(None)
+    df["publish_date"] = parsed_dates.dt.strftime("%Y-%m-%d %H:%M:%S").fillna("")
+    df["author"] = df["author"].fillna("").astype(str)
+    df["url"] = df["url"].astype(str)
+    df["title"] = df["title"].fillna("")
+    df["primary_label"] = df["primary_label"].fillna("")
+    df["secondary_label"] = df["secondary_label"].fillna("")
+    df["entities"] = df["entities"].fillna("")
+    return df
+
+
+def iter_county_report(
+    config: CountyReportConfig,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """Yield the report as formatted DataFrames of at most ``chunk_size`` rows.
+
+    Rows are read through a server-side cursor, so only one chunk is held
+    in memory at a time. Chunks arrive in report order (newest first).
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
 
     db = DatabaseManager(database_url=config.database_url)
     try:
-        # Pass the real SQLAlchemy Engine to pandas so TextClause queries
-        # are supported. If we pass a proxied Connection object, pandas may
-        # treat the connection as a DB-API object and require a string SQL.
-        df = pd.read_sql_query(query, db.engine, params=params)
+        engine = db.engine
+        article_columns = {
+            column["name"] for column in inspect(engine).get_columns("articles")
+        }
+        query, params = _build_report_query(
+            config,
+            dialect=engine.dialect.name,
+            has_is_wire="is_wire" in article_columns,
+        )
+        with engine.connect() as connection:
+            result = connection.execution_options(stream_results=True).execute(
+                query, params
+            )
+            while rows := result.fetchmany(chunk_size):
+                chunk = pd.DataFrame.from_records(rows, columns=list(REPORT_COLUMNS))
+                yield _format_report_chunk(chunk)
     finally:
         db.close()
 
-    if df.empty:
-        df = pd.DataFrame(
-            columns=[
-                "article_id",
-                "host",
-                "publish_date",
-                "author",
-                "url",
-                "title",
-                "primary_label",
-                "secondary_label",
-                "entities",
-            ]
+
+def _resolve_report_format(output_path: Path, output_format: str | None) -> str:
+    if output_format is None:
+        output_format = "parquet" if output_path.suffix == ".parquet" else "csv"
+    output_format = output_format.lower()
+    if output_format not in REPORT_FORMATS:
+        raise ValueError(
+            f"Unsupported report format {output_format!r}; "
+            f"expected one of {', '.join(REPORT_FORMATS)}"
         )
+    return output_format
+
+
+def _write_report_parquet_chunks(
+    chunks: Iterable[pd.DataFrame],
+    output_path: Path,
+) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError("pyarrow is required to write Parquet reports") from exc
+
+    schema = pa.schema([(column, pa.string()) for column in REPORT_COLUMNS])
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    rows_written = 0
+    with pq.ParquetWriter(str(output_path), schema) as writer:
+        for chunk in chunks:
+            writer.write_table(
+                pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            )
+            rows_written += len(chunk)
+    return rows_written
+
+
+def write_county_report(
+    config: CountyReportConfig,
+    output_path: Path | str,
+    *,
+    output_format: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Stream a county report straight to a CSV or Parquet file.
+
+    Parameters
+    ----------
+    config:
+        Configuration parameters controlling the report scope.
+    output_path:
+        Destination file. Parent directories are created as needed.
+    output_format:
+        ``"csv"`` or ``"parquet"``. Inferred from the file suffix when
+        omitted (``.parquet`` selects Parquet, anything else CSV).
+    chunk_size:
+        Number of rows fetched, formatted and written per step.
+
+    Returns
+    -------
+    int
+        Number of report rows written.
+    """
+
+    path = Path(output_path)
+    report_format = _resolve_report_format(path, output_format)
+    chunks = iter_county_report(config, chunk_size=chunk_size)
+
+    if report_format == "parquet":
+        rows_written = _write_report_parquet_chunks(chunks, path)
+        logger.info("Wrote county report to %s", path)
+        return rows_written
+
+    return write_report_csv_chunks(
+        chunks,
+        path,
+        columns=REPORT_COLUMNS,
+        logger=logger,
+        log_message="Wrote county report to %s",
+    )
+
+
+def generate_county_report(
+    config: CountyReportConfig,
+    output_path: Path | None = None,
+) -> pd.DataFrame:
+    """Generate a county-focused article report and optionally persist to CSV.
+
+    The whole report is collected in memory; use :func:`write_county_report`
+    or :func:`iter_county_report` for large reports.
+
+    Parameters
+    ----------
+    config:
+        Configuration parameters controlling the report scope and output.
+    output_path:
+        Optional path for the output CSV. When omitted, the caller can
+        handle persistence using the returned DataFrame.
+
+    Returns
+    -------
+    pandas.DataFrame
+        DataFrame containing the requested report rows.
+    """
+
+    chunks = list(iter_county_report(config))
+    if chunks:
+        df = pd.concat(chunks, ignore_index=True)
     else:
-        df["article_id"] = df["article_id"].astype(str)
-        df["host"] = df["host"].astype(str)
-        parsed_dates = pd.to_datetime(
-            df["publish_date"],
-            errors="coerce",
-            utc=True,
-        )
-        parsed_dates = parsed_dates.dt.tz_localize(None)
-        df["publish_date"] = parsed_dates.dt.strftime("%Y-%m-%d %H:%M:%S").fillna("")
-        df["author"] = df["author"].fillna("").astype(str)
-        df["url"] = df["url"].astype(str)
-        df["title"] = df["title"].fillna("")
-        df["primary_label"] = df["primary_label"].fillna("")
-        df["secondary_label"] = df["secondary_label"].fillna("")
-        if "entities" in df.columns:
-            df["entities"] = df["entities"].fillna("")
+        df = pd.DataFrame(columns=list(REPORT_COLUMNS))
 
     if output_path:
         write_report_csv(
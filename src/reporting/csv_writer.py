@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 
 import pandas as pd
@@ -56,3 +57,55 @@ def write_report_csv(
         logger.info(log_message, path)
 
     return path
+
+
+def write_report_csv_chunks(
+    chunks: Iterable[pd.DataFrame],
+    output_path: Path | str,
+    *,
+    columns: Sequence[str],
+    encoding: str = DEFAULT_REPORT_CSV_ENCODING,
+    mkdirs: bool = True,
+    logger=None,
+    log_message: str | None = "Wrote report to %s",
+) -> int:
+    """Append report chunks to one CSV file as they are produced.
+
+    Produces the same file as :func:`write_report_csv` on the concatenated
+    chunks, while holding only one chunk in memory at a time. The header is
+    written once, so an empty iterable still yields a header-only file.
+
+    Parameters
+    ----------
+    chunks:
+        DataFrames holding consecutive slices of the report.
+    output_path:
+        Destination path for the CSV file.
+    columns:
+        Output columns, in order; used for the header and to select each
+        chunk's columns.
+    encoding, mkdirs, logger, log_message:
+        As for :func:`write_report_csv`.
+
+    Returns
+    -------
+    int
+        Number of data rows written.
+    """
+
+    path = Path(output_path)
+    if mkdirs:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+    columns = list(columns)
+    rows_written = 0
+    with path.open("w", encoding=encoding, newline="") as handle:
+        pd.DataFrame(columns=columns).to_csv(handle, index=False)
+        for chunk in chunks:
+            chunk.to_csv(handle, columns=columns, header=False, index=False)
+            rows_written += len(chunk)
+
+    if logger is not None and log_message:
+        logger.info(log_message, path)
+
+    return rows_written
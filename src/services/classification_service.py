@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable, Sequence
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Protocol
+from typing import Any, Protocol
 
-from sqlalchemy import select
+from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Session
 
 from src.ml.article_classifier import Prediction
@@ -17,6 +18,9 @@ from src.models.database import save_article_classification
 
 logger = logging.getLogger(__name__)
 
+# Content types that are never sent through the classifier
+EXCLUDED_STATUSES = ("opinion", "opinions", "obituary", "obits", "wire")
+
 
 class BatchClassifier(Protocol):
     """Protocol describing the classifier interface used by the service."""
@@ -43,6 +47,25 @@ class ClassificationStats:
     proposed_labels: list[dict[str, object]] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class ArticleText:
+    """Lightweight projection of the article columns needed for inference."""
+
+    id: str
+    url: str | None
+    content: str | None
+    text: str | None
+    title: str | None
+
+
+@dataclass
+class _ClaimedBatch:
+    """A batch of articles locked by ``session`` awaiting classification."""
+
+    session: Session
+    articles: list[ArticleText]
+
+
 class ArticleClassificationService:
     """Apply text classification models to articles in the database."""
 
@@ -98,7 +121,103 @@ class ArticleClassificationService:
 
         return list(self.session.scalars(stmt))
 
-    def _prepare_text(self, article: Article) -> str | None:
+    @staticmethod
+    def _dialect_name(session: Session) -> str | None:
+        try:
+            return session.bind.dialect.name if session.bind else None
+        except AttributeError:
+            # Mock session in tests
+            return None
+
+    def _claim_article_ids(
+        self,
+        session: Session,
+        statuses: Sequence[str] | None,
+        label_version: str,
+        limit: int,
+        include_existing: bool,
+        excluded_statuses: Sequence[str] | None = None,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[tuple[str, datetime]]:
+        """Lock and return the next ``limit`` eligible ``(id, created_at)`` keys.
+
+        Only the primary key and sort key are read, so claiming a batch never
+        transfers article bodies. Instead of a growing ``NOT IN`` list, the
+        caller passes the last key it has seen and selection resumes strictly
+        after it in ``created_at DESC, id DESC`` order.
+        """
+
+        stmt = select(Article.id, Article.created_at)
+
+        if statuses:
+            stmt = stmt.where(Article.status.in_(list(statuses)))
+
+        if excluded_statuses:
+            stmt = stmt.where(Article.status.notin_(list(excluded_statuses)))
+
+        if not include_existing:
+            label_exists = (
+                select(ArticleLabel.id)
+                .where(
+                    ArticleLabel.article_id == Article.id,
+                    ArticleLabel.label_version == label_version,
+                )
+                .exists()
+            )
+            stmt = stmt.where(~label_exists)
+
+        if after is not None:
+            last_created_at, last_id = after
+            stmt = stmt.where(
+                or_(
+                    Article.created_at < last_created_at,
+                    and_(
+                        Article.created_at == last_created_at,
+                        Article.id < last_id,
+                    ),
+                )
+            )
+
+        stmt = stmt.order_by(Article.created_at.desc(), Article.id.desc())
+        stmt = stmt.limit(limit)
+
+        if self._dialect_name(session) == "postgresql":
+            stmt = stmt.with_for_update(skip_locked=True, of=Article)
+
+        return [(str(row[0]), row[1]) for row in session.execute(stmt)]
+
+    def _load_article_texts(
+        self,
+        session: Session,
+        article_ids: Sequence[str],
+    ) -> list[ArticleText]:
+        """Load only the columns used by ``_prepare_text`` for claimed ids."""
+
+        if not article_ids:
+            return []
+
+        stmt = select(
+            Article.id,
+            Article.url,
+            Article.content,
+            Article.text,
+            Article.title,
+        ).where(Article.id.in_(list(article_ids)))
+
+        by_id = {
+            str(row.id): ArticleText(
+                id=str(row.id),
+                url=row.url,
+                content=row.content,
+                text=row.text,
+                title=row.title,
+            )
+            for row in session.execute(stmt)
+        }
+        # Preserve claim order so output is deterministic across runs
+        return [by_id[article_id] for article_id in article_ids if article_id in by_id]
+
+    def _prepare_text(self, article: Article | ArticleText) -> str | None:
         for field_name in ("content", "text", "title"):
             value = getattr(article, field_name, None)
             if isinstance(value, str) and value.strip():
@@ -134,13 +253,7 @@ class ArticleClassificationService:
         This ensures no duplicate work across parallel workers.
         """
 
-        excluded_statuses = {
-            "opinion",
-            "opinions",
-            "obituary",
-            "obits",
-            "wire",
-        }
+        excluded_statuses = set(EXCLUDED_STATUSES)
         if statuses is None:
             effective_statuses: list[str] | None = None
         else:
@@ -229,72 +342,256 @@ class ArticleClassificationService:
                 self.session.rollback()
                 continue
 
-            for article, predictions in zip(
-                article_refs, predictions_batch, strict=False
-            ):
-                if not predictions:
-                    stats.skipped += 1
-                    self.logger.debug(
-                        "Classifier returned no predictions for article %s",
-                        getattr(article, "id", "<unknown>"),
-                    )
-                    continue
+            self._record_predictions(
+                self.session,
+                article_refs,
+                predictions_batch,
+                stats,
+                label_version=label_version,
+                model_version=effective_model_version,
+                model_path=effective_model_path,
+                dry_run=dry_run,
+            )
 
-                primary = predictions[0]
-                alternate = predictions[1] if len(predictions) > 1 else None
-
-                metadata = {
-                    "top_k": [pred.as_dict() for pred in predictions],
-                    "applied_at": datetime.utcnow().isoformat(),
-                }
-
-                if dry_run:
-                    stats.labeled += 1
-                    article_id_value = getattr(article, "id", None)
-                    stats.proposed_labels.append(
-                        {
-                            "article_id": (
-                                str(article_id_value)
-                                if article_id_value is not None
-                                else ""
-                            ),
-                            "url": getattr(article, "url", ""),
-                            "primary": primary.label,
-                            "alternate": (alternate.label if alternate else ""),
-                            "top_k": [pred.as_dict() for pred in predictions],
-                        }
-                    )
-                    self.logger.info(
-                        "[dry-run] %s -> %s (alt=%s)",
-                        article_id_value or "<unknown>",
-                        primary.label,
-                        alternate.label if alternate else None,
-                    )
-                    continue
+            # Commit batch to release locks for parallel workers
+            self.session.commit()
 
-                article_id_value = getattr(article, "id", None)
-                if not article_id_value:
-                    stats.errors += 1
-                    self.logger.error(
-                        "Article missing ID; cannot record classification"
-                    )
-                    continue
+        return stats
 
-                save_article_classification(
-                    self.session,
-                    article_id=str(article_id_value),
-                    label_version=label_version,
-                    model_version=effective_model_version,
-                    primary_prediction=primary,
-                    alternate_prediction=alternate,
-                    model_path=effective_model_path,
-                    metadata=metadata,
-                    autocommit=False,
+    def _record_predictions(
+        self,
+        session: Session,
+        article_refs: Sequence[Article | ArticleText],
+        predictions_batch: Sequence[Sequence[Prediction]],
+        stats: ClassificationStats,
+        *,
+        label_version: str,
+        model_version: str,
+        model_path: str | None,
+        dry_run: bool,
+    ) -> None:
+        """Persist (or, in dry-run mode, collect) predictions for a batch."""
+
+        for article, predictions in zip(article_refs, predictions_batch, strict=False):
+            if not predictions:
+                stats.skipped += 1
+                self.logger.debug(
+                    "Classifier returned no predictions for article %s",
+                    getattr(article, "id", "<unknown>"),
                 )
+                continue
+
+            primary = predictions[0]
+            alternate = predictions[1] if len(predictions) > 1 else None
+
+            metadata = {
+                "top_k": [pred.as_dict() for pred in predictions],
+                "applied_at": datetime.utcnow().isoformat(),
+            }
+
+            if dry_run:
                 stats.labeled += 1
+                article_id_value = getattr(article, "id", None)
+                stats.proposed_labels.append(
+                    {
+                        "article_id": (
+                            str(article_id_value)
+                            if article_id_value is not None
+                            else ""
+                        ),
+                        "url": getattr(article, "url", ""),
+                        "primary": primary.label,
+                        "alternate": (alternate.label if alternate else ""),
+                        "top_k": [pred.as_dict() for pred in predictions],
+                    }
+                )
+                self.logger.info(
+                    "[dry-run] %s -> %s (alt=%s)",
+                    article_id_value or "<unknown>",
+                    primary.label,
+                    alternate.label if alternate else None,
+                )
+                continue
 
-            # Commit batch to release locks for parallel workers
-            self.session.commit()
+            article_id_value = getattr(article, "id", None)
+            if not article_id_value:
+                stats.errors += 1
+                self.logger.error("Article missing ID; cannot record classification")
+                continue
+
+            save_article_classification(
+                session,
+                article_id=str(article_id_value),
+                label_version=label_version,
+                model_version=model_version,
+                primary_prediction=primary,
+                alternate_prediction=alternate,
+                model_path=model_path,
+                metadata=metadata,
+                autocommit=False,
+            )
+            stats.labeled += 1
+
+    def apply_classification_streaming(
+        self,
+        classifier: BatchClassifier,
+        *,
+        label_version: str,
+        model_version: str | None = None,
+        model_path: str | None = None,
+        statuses: Sequence[str] | None = ("cleaned", "local"),
+        limit: int | None = None,
+        batch_size: int = 16,
+        top_k: int = 2,
+        dry_run: bool = False,
+        include_existing: bool = False,
+        prefetch: bool = True,
+        session_factory: Callable[[], Session] | None = None,
+    ) -> ClassificationStats:
+        """Classify eligible articles using id-only claims and prefetching.
+
+        Differences from :meth:`apply_classification`:
+
+        1. Batches are claimed with ``SELECT id, created_at ... FOR UPDATE
+           SKIP LOCKED`` and resume from the last seen key, so no exclusion
+           list is sent back to the database.
+        2. Only ``id``, ``url``, ``content``, ``text`` and ``title`` are
+           loaded for claimed articles instead of full ORM rows.
+        3. With ``prefetch`` enabled, model inference for batch N runs on a
+           background thread while batch N+1 is claimed and loaded on a
+           second session. Each batch is claimed, labeled and committed on
+           the same session, so its row locks are held until its labels are
+           written and other workers skip it throughout.
+
+        ``session_factory`` creates the second session; it defaults to a
+        session bound to ``self.session.bind``. Prefetching is disabled when
+        no bind is available (e.g. mocked sessions in tests).
+        """
+
+        excluded_statuses = list(EXCLUDED_STATUSES)
+        if statuses is None:
+            effective_statuses: list[str] | None = None
+        else:
+            effective_statuses = [
+                status for status in statuses if status not in excluded_statuses
+            ]
+            if not effective_statuses:
+                self.logger.info(
+                    "No eligible statuses after excluding %s content",
+                    ", ".join(sorted(excluded_statuses)),
+                )
+                return ClassificationStats()
+
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        stats = ClassificationStats()
+        effective_model_version = model_version or classifier.model_version or "unknown"
+        effective_model_path = model_path or getattr(
+            classifier, "model_identifier", None
+        )
+        if effective_model_path is not None:
+            effective_model_path = str(effective_model_path)
+
+        sessions: list[Session] = [self.session]
+        owned_sessions: list[Session] = []
+        if prefetch:
+            if session_factory is not None:
+                owned_sessions.append(session_factory())
+            elif getattr(self.session, "bind", None) is not None:
+                owned_sessions.append(Session(bind=self.session.bind))
+            sessions.extend(owned_sessions)
+
+        remaining = limit if limit else float("inf")
+        cursor: tuple[datetime, str] | None = None
+
+        def claim(session: Session) -> _ClaimedBatch | None:
+            nonlocal remaining, cursor
+            if remaining <= 0:
+                return None
+            batch_limit = min(batch_size, int(remaining)) if limit else batch_size
+            keys = self._claim_article_ids(
+                session,
+                effective_statuses,
+                label_version,
+                batch_limit,
+                include_existing,
+                excluded_statuses,
+                after=cursor,
+            )
+            if not keys:
+                session.rollback()
+                return None
+            cursor = (keys[-1][1], keys[-1][0])
+            if limit:
+                remaining -= len(keys)
+            articles = self._load_article_texts(session, [key[0] for key in keys])
+            stats.processed += len(keys)
+            return _ClaimedBatch(session=session, articles=articles)
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="classify")
+        try:
+            slot = 0
+            current = claim(sessions[slot])
+            while current is not None:
+                texts: list[str] = []
+                article_refs: list[ArticleText] = []
+                for article in current.articles:
+                    text = self._prepare_text(article)
+                    if not text:
+                        stats.skipped += 1
+                        self.logger.debug(
+                            "Skipping article %s due to empty content", article.id
+                        )
+                        continue
+                    texts.append(text)
+                    article_refs.append(article)
+
+                future: Future[Any] | None = None
+                if texts:
+                    future = executor.submit(
+                        classifier.predict_batch, texts, top_k=top_k
+                    )
+
+                # Overlap the next claim with inference when a second session
+                # is available; otherwise claim after this batch commits.
+                upcoming: _ClaimedBatch | None = None
+                if len(sessions) > 1:
+                    slot = (slot + 1) % len(sessions)
+                    upcoming = claim(sessions[slot])
+
+                if future is None:
+                    # Release any row locks before continuing
+                    current.session.rollback()
+                else:
+                    try:
+                        predictions_batch = future.result()
+                    except Exception as exc:  # pylint: disable=broad-except
+                        stats.errors += len(texts)
+                        self.logger.exception("Classifier failed on batch: %s", exc)
+                        current.session.rollback()
+                    else:
+                        self._record_predictions(
+                            current.session,
+                            article_refs,
+                            predictions_batch,
+                            stats,
+                            label_version=label_version,
+                            model_version=effective_model_version,
+                            model_path=effective_model_path,
+                            dry_run=dry_run,
+                        )
+                        # Commit batch to release locks for parallel workers
+                        current.session.commit()
+
+                if len(sessions) == 1:
+                    upcoming = claim(sessions[0])
+                current = upcoming
+        finally:
+            executor.shutdown(wait=True)
+            for owned in owned_sessions:
+                owned.rollback()
+                owned.close()
 
         return stats
 
@@ -1,6 +1,8 @@
 """Pluggable large language model providers and orchestration helpers."""
 
 from .article_pipeline import ArticleLLMPipeline, ArticleLLMResult
+from .cache import PromptResponseCache
+from .limits import ProviderLimiterRegistry, ProviderRateLimiter
 from .orchestrator import LLMOrchestrator, LLMTaskConfig, OrchestrationResult
 from .providers import (
     Claude35SonnetProvider,
@@ -10,7 +12,12 @@ from .providers import (
     LLMProvider,
     ProviderRegistry,
 )
-from .settings import LLMSettings, VectorStoreSettings, load_llm_settings
+from .settings import (
+    LLMSettings,
+    ProviderLimits,
+    VectorStoreSettings,
+    load_llm_settings,
+)
 from .vectorstores import VectorStore, VectorStoreFactory
 
 __all__ = [
@@ -19,6 +26,10 @@ __all__ = [
     "OrchestrationResult",
     "ArticleLLMPipeline",
     "ArticleLLMResult",
+    "PromptResponseCache",
+    "ProviderLimiterRegistry",
+    "ProviderRateLimiter",
+    "ProviderLimits",
     "LLMProvider",
     "ProviderRegistry",
     "GPT41Provider",
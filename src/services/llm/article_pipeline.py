@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
+from collections import deque
 from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
@@ -39,6 +41,7 @@ class ArticleLLMResult:
     provider: str | None
     content: str | None
     failures: list[dict]
+    cached: bool = False
 
 
 class ArticleLLMPipeline:
@@ -61,37 +64,87 @@ class ArticleLLMPipeline:
         statuses: Sequence[str] | None = None,
         limit: int | None = None,
         dry_run: bool = False,
+        concurrency: int = 1,
+        commit_every: int | None = None,
     ) -> list[ArticleLLMResult]:
-        articles = list(self._iter_articles(statuses, limit))
-        results: list[ArticleLLMResult] = []
+        """Summarise selected articles and persist results to ``Article.meta``.
 
-        for article in articles:
-            prompt = self._render_prompt(article)
-            config = LLMTaskConfig(
-                metadata={
-                    "article_id": article.id,
-                    "url": article.url,
-                }
-            )
-            orchestration = self._orchestrator.generate(prompt, config=config)
-            result = ArticleLLMResult(
-                article_id=str(article.id),
-                success=orchestration.succeeded,
-                provider=orchestration.provider,
-                content=orchestration.content,
-                failures=[asdict(failure) for failure in orchestration.failures],
+        With ``concurrency`` above one, prompts are rendered on the calling
+        thread and ``LLMOrchestrator.generate`` runs on a bounded worker pool;
+        at most ``2 * concurrency`` requests are in flight and results are
+        persisted in selection order on the calling thread, so the session is
+        never shared across threads. ``commit_every`` commits after that many
+        persisted articles instead of once at the end.
+        """
+
+        results: list[ArticleLLMResult] = []
+        pending_writes = 0
+
+        def handle(article: Article, orchestration: OrchestrationResult) -> None:
+            nonlocal pending_writes
+            results.append(
+                ArticleLLMResult(
+                    article_id=str(article.id),
+                    success=orchestration.succeeded,
+                    provider=orchestration.provider,
+                    content=orchestration.content,
+                    failures=[asdict(failure) for failure in orchestration.failures],
+                    cached=orchestration.cached,
+                )
             )
-            results.append(result)
 
-            if not dry_run and orchestration.succeeded:
+            if dry_run:
+                return
+            if orchestration.succeeded:
                 self._persist_result(article, orchestration)
-            elif not dry_run and not orchestration.succeeded:
+            else:
                 self._persist_failure(article, orchestration)
+            pending_writes += 1
+            if commit_every and pending_writes >= commit_every:
+                self._session.commit()
+                pending_writes = 0
+
+        articles = self._iter_articles(statuses, limit)
+        if concurrency <= 1:
+            for article in articles:
+                orchestration = self._orchestrator.generate(
+                    self._render_prompt(article),
+                    config=self._task_config(article),
+                )
+                handle(article, orchestration)
+        else:
+            window: deque[tuple[Article, Future[OrchestrationResult]]] = deque()
+            with ThreadPoolExecutor(
+                max_workers=concurrency,
+                thread_name_prefix="llm-pipeline",
+            ) as executor:
+                for article in articles:
+                    future = executor.submit(
+                        self._orchestrator.generate,
+                        self._render_prompt(article),
+                        config=self._task_config(article),
+                    )
+                    window.append((article, future))
+                    if len(window) >= concurrency * 2:
+                        done_article, done_future = window.popleft()
+                        handle(done_article, done_future.result())
+                while window:
+                    done_article, done_future = window.popleft()
+                    handle(done_article, done_future.result())
 
         if not dry_run:
             self._session.commit()
         return results
 
+    @staticmethod
+    def _task_config(article: Article) -> LLMTaskConfig:
+        return LLMTaskConfig(
+            metadata={
+                "article_id": article.id,
+                "url": article.url,
+            }
+        )
+
     def _iter_articles(
         self,
         statuses: Sequence[str] | None,
@@ -0,0 +1,127 @@
+"""Persistent prompt-hash → response cache for LLM orchestration."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from .providers import LLMProviderResponse
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_response_cache (
+    prompt_hash TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    content TEXT NOT NULL,
+    metadata TEXT,
+    created_at TEXT NOT NULL
+)
+"""
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class PromptResponseCache:
+    """SQLite-backed cache of successful responses keyed by prompt hash.
+
+    The key covers the prompt text and generation parameters but not the
+    provider, so a response from any provider in the fallback chain satisfies
+    later requests for the same prompt. Connections are shared across worker
+    threads and serialised with a lock.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = str(path)
+        if self._path != ":memory:":
+            Path(self._path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self._path,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute(_SCHEMA)
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    @staticmethod
+    def key_for(
+        prompt: str,
+        *,
+        max_output_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> str:
+        payload = json.dumps(
+            {
+                "prompt": prompt,
+                "max_output_tokens": max_output_tokens,
+                "temperature": temperature,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> LLMProviderResponse | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT provider, model, content, metadata "
+                "FROM llm_response_cache WHERE prompt_hash = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+
+        provider, model, content, metadata = row
+        meta = json.loads(metadata) if metadata else {}
+        meta["cache_hit"] = True
+        return LLMProviderResponse(
+            provider=provider,
+            model=model,
+            content=content,
+            metadata=meta,
+        )
+
+    def put(self, key: str, response: LLMProviderResponse) -> None:
+        metadata = json.dumps(response.metadata or {}, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO llm_response_cache "
+                "(prompt_hash, provider, model, content, metadata, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (prompt_hash) DO UPDATE SET "
+                "provider = excluded.provider, model = excluded.model, "
+                "content = excluded.content, metadata = excluded.metadata, "
+                "created_at = excluded.created_at",
+                (
+                    key,
+                    response.provider,
+                    response.model,
+                    response.content,
+                    metadata,
+                    datetime.utcnow().isoformat(),
+                ),
+            )
+            self.stats.writes += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["CacheStats", "PromptResponseCache"]
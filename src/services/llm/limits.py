@@ -0,0 +1,110 @@
+"""Per-provider concurrency and request-rate limiting for LLM calls."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from .settings import LLMSettings, ProviderLimits
+
+
+class ProviderRateLimiter:
+    """Thread-safe gate enforcing concurrency, pacing and Retry-After."""
+
+    def __init__(
+        self,
+        limits: ProviderLimits,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._limits = limits
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._semaphore = (
+            threading.BoundedSemaphore(limits.max_concurrency)
+            if limits.max_concurrency and limits.max_concurrency > 0
+            else None
+        )
+        rpm = limits.requests_per_minute
+        self._interval = 60.0 / rpm if rpm and rpm > 0 else 0.0
+        self._next_allowed = 0.0
+        self._cooldown_until = 0.0
+
+    @property
+    def limits(self) -> ProviderLimits:
+        return self._limits
+
+    def acquire(self) -> float:
+        """Block until a request may be sent; return seconds spent waiting."""
+
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._next_allowed, self._cooldown_until)
+            if self._interval:
+                self._next_allowed = start + self._interval
+        wait = start - now
+        if wait > 0:
+            self._sleep(wait)
+        return max(wait, 0.0)
+
+    def release(self) -> None:
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def defer(self, seconds: float) -> None:
+        """Hold back every caller for ``seconds`` (provider Retry-After)."""
+
+        with self._lock:
+            self._cooldown_until = max(self._cooldown_until, self._clock() + seconds)
+
+
+class ProviderLimiterRegistry:
+    """Lazily created :class:`ProviderRateLimiter` instances keyed by slug."""
+
+    def __init__(
+        self,
+        limits: dict[str, ProviderLimits] | None = None,
+        *,
+        default: ProviderLimits | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._limits = dict(limits or {})
+        self._default = default or ProviderLimits()
+        self._clock = clock
+        self._sleep = sleep
+        self._limiters: dict[str, ProviderRateLimiter] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: LLMSettings) -> ProviderLimiterRegistry:
+        return cls(settings.provider_limits)
+
+    def get(self, provider_name: str) -> ProviderRateLimiter:
+        with self._lock:
+            limiter = self._limiters.get(provider_name)
+            if limiter is None:
+                limiter = ProviderRateLimiter(
+                    self._limits.get(provider_name, self._default),
+                    clock=self._clock,
+                    sleep=self._sleep,
+                )
+                self._limiters[provider_name] = limiter
+            return limiter
+
+
+__all__ = ["ProviderLimiterRegistry", "ProviderRateLimiter"]
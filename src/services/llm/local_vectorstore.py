@@ -0,0 +1,547 @@
+"""File-backed local vector store with brute-force and IVF search."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import zlib
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+import numpy as np
+
+from .vectorstores import VectorStore
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+IVF_NAME = "ivf.npz"
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class Embedder(Protocol):
+    """Callable turning text into a fixed-size vector."""
+
+    dim: int
+
+    def embed(self, text: str) -> np.ndarray: ...
+
+
+class HashingEmbedder:
+    """Dependency-free embedder using signed feature hashing.
+
+    Unigrams and word bigrams are hashed (``crc32``, stable across processes)
+    into ``dim`` signed buckets; the store L2-normalises on insert. Cosine
+    similarity of these vectors tracks shingle overlap, which is what near-duplicate
+    detection of syndicated copy needs; semantic search should supply model
+    embeddings via ``metadata["embedding"]`` instead.
+    """
+
+    def __init__(self, dim: int = 384) -> None:
+        self.dim = dim
+
+    def embed(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        tokens = _TOKEN_RE.findall((text or "").lower())
+        features = tokens + [
+            f"{a} {b}" for a, b in zip(tokens, tokens[1:], strict=False)
+        ]
+        for feature in features:
+            hashed = zlib.crc32(feature.encode("utf-8"))
+            sign = 1.0 if hashed & 0x80000000 else -1.0
+            vector[hashed % self.dim] += sign
+        return vector
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """A single similarity search result."""
+
+    id: str
+    score: float
+    metadata: dict[str, Any]
+
+
+@dataclass(slots=True)
+class _Segment:
+    name: str
+    rows: int
+    matrix: np.ndarray
+    ids: list[str]
+    metadata: list[dict[str, Any]]
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    if scores.size <= k:
+        return np.argsort(-scores)
+    candidates = np.argpartition(-scores, k)[:k]
+    return candidates[np.argsort(-scores[candidates])]
+
+
+class LocalVectorStore(VectorStore):
+    """Append-only, memory-mapped vector store rooted at ``path``.
+
+    Layout::
+
+        manifest.json          dim, dtype, ordered segment list
+        seg-000001.vec         row-major float16/float32 matrix (np.memmap)
+        seg-000001.ids.jsonl   one {"id", "metadata"} object per row
+        ivf.npz                optional IVF index over the first N rows
+
+    Vectors are L2-normalised on insert so inner product equals cosine
+    similarity. Writes accumulate in memory and are sealed into a new
+    immutable segment every ``flush_rows`` rows (or on :meth:`flush` /
+    :meth:`close`, which callers must invoke before exiting); sealed
+    segments are only ever read through read-only memory maps. Re-adding an
+    id appends a new row; searches report each id once and :meth:`compact`
+    keeps only its latest row.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        dim: int = 384,
+        dtype: str = "float32",
+        embedder: Embedder | None = None,
+        flush_rows: int = 4096,
+        search_chunk_rows: int = 65_536,
+    ) -> None:
+        self.path = Path(path).expanduser()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._flush_rows = flush_rows
+        self._chunk_rows = search_chunk_rows
+        self._segments: list[_Segment] = []
+        self._pending_vectors: list[np.ndarray] = []
+        self._pending_ids: list[str] = []
+        self._pending_meta: list[dict[str, Any]] = []
+        self._ivf: dict[str, np.ndarray] | None = None
+
+        manifest = self._read_manifest()
+        if manifest:
+            self.dim = int(manifest["dim"])
+            self.dtype = np.dtype(manifest["dtype"])
+        else:
+            self.dim = dim
+            self.dtype = np.dtype(dtype)
+            self._write_manifest()
+        if self.dtype not in (np.dtype("float32"), np.dtype("float16")):
+            raise ValueError(f"Unsupported vector dtype: {self.dtype}")
+        self.embedder = embedder or HashingEmbedder(self.dim)
+        if self.embedder.dim != self.dim:
+            raise ValueError(
+                f"Embedder dim {self.embedder.dim} does not match store dim {self.dim}"
+            )
+
+        for name in (manifest or {}).get("segments", []):
+            self._segments.append(self._open_segment(name))
+        self._load_ivf()
+
+    # ------------------------------------------------------------------
+    # VectorStore interface
+    # ------------------------------------------------------------------
+    def store(
+        self,
+        *,
+        prompt: str,
+        response: str,
+        metadata: dict[str, object],
+    ) -> None:
+        meta = dict(metadata or {})
+        embedding = meta.pop("embedding", None)
+        vector_id = str(
+            meta.get("article_id") or hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        )
+        if embedding is None:
+            embedding = self.embedder.embed(response or prompt)
+        meta.setdefault("response_excerpt", (response or "")[:280])
+        self.add([vector_id], np.asarray([embedding], dtype=np.float32), [meta])
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def add(
+        self,
+        ids: Sequence[str],
+        vectors: np.ndarray,
+        metadata: Sequence[dict[str, Any]] | None = None,
+    ) -> None:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected vectors of shape (n, {self.dim})")
+        if len(ids) != vectors.shape[0]:
+            raise ValueError("ids and vectors must have the same length")
+        meta = list(metadata) if metadata is not None else [{} for _ in ids]
+
+        with self._lock:
+            self._pending_vectors.append(_normalize(vectors))
+            self._pending_ids.extend(str(item) for item in ids)
+            self._pending_meta.extend(meta)
+            if len(self._pending_ids) >= self._flush_rows:
+                self.flush()
+
+    def add_texts(
+        self,
+        ids: Sequence[str],
+        texts: Iterable[str],
+        metadata: Sequence[dict[str, Any]] | None = None,
+    ) -> None:
+        vectors = np.stack([self.embedder.embed(text) for text in texts])
+        self.add(ids, vectors, metadata)
+
+    def flush(self) -> None:
+        """Seal buffered vectors into a new immutable segment."""
+
+        with self._lock:
+            if not self._pending_ids:
+                return
+            matrix = np.concatenate(self._pending_vectors).astype(self.dtype)
+            name = f"seg-{self._next_segment_number():06d}"
+            self._write_segment(name, matrix, self._pending_ids, self._pending_meta)
+            self._segments.append(self._open_segment(name))
+            self._pending_vectors = []
+            self._pending_ids = []
+            self._pending_meta = []
+            self._write_manifest()
+
+    def close(self) -> None:
+        self.flush()
+
+    def compact(self) -> None:
+        """Merge all segments into one, dropping superseded ids."""
+
+        with self._lock:
+            self.flush()
+            if len(self._segments) <= 1:
+                return
+            latest: dict[str, tuple[int, int]] = {}
+            for seg_index, segment in enumerate(self._segments):
+                for row, vector_id in enumerate(segment.ids):
+                    latest[vector_id] = (seg_index, row)
+
+            ids = list(latest)
+            matrix = np.empty((len(ids), self.dim), dtype=self.dtype)
+            meta: list[dict[str, Any]] = []
+            for out_row, vector_id in enumerate(ids):
+                seg_index, row = latest[vector_id]
+                matrix[out_row] = self._segments[seg_index].matrix[row]
+                meta.append(self._segments[seg_index].metadata[row])
+
+            old = [segment.name for segment in self._segments]
+            name = f"seg-{self._next_segment_number():06d}"
+            self._write_segment(name, matrix, ids, meta)
+            self._segments = [self._open_segment(name)]
+            self._ivf = None
+            self._write_manifest()
+            (self.path / IVF_NAME).unlink(missing_ok=True)
+            for old_name in old:
+                (self.path / f"{old_name}.vec").unlink(missing_ok=True)
+                (self.path / f"{old_name}.ids.jsonl").unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return sum(segment.rows for segment in self._segments) + len(self._pending_ids)
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int = 10,
+        *,
+        nprobe: int | None = None,
+        exclude_ids: Iterable[str] | None = None,
+    ) -> list[SearchHit]:
+        """Return the ``k`` most similar vectors to ``query`` (cosine).
+
+        Uses the IVF index when one has been built (probing ``nprobe`` lists)
+        and scans rows added after the build exhaustively.
+        """
+
+        q = _normalize(np.asarray(query, dtype=np.float32).reshape(1, -1))[0]
+        excluded = set(exclude_ids or ())
+        # Over-fetch so duplicates and exclusions do not starve the result
+        fetch = k + len(excluded) + 8
+
+        with self._lock:
+            candidates: list[tuple[float, int, int]] = []
+            ivf_rows = 0
+            if self._ivf is not None:
+                ivf_rows = int(self._ivf["rows"][0])
+                candidates.extend(self._search_ivf(q, fetch, nprobe))
+            candidates.extend(self._search_exhaustive(q, fetch, start_row=ivf_rows))
+            candidates.extend(self._search_pending(q, fetch))
+            candidates.sort(key=lambda item: -item[0])
+
+            hits: list[SearchHit] = []
+            seen: set[str] = set()
+            # Pending rows carry segment index -1
+            for score, seg_index, row in candidates:
+                if seg_index < 0:
+                    vector_id = self._pending_ids[row]
+                    meta = self._pending_meta[row]
+                else:
+                    segment = self._segments[seg_index]
+                    vector_id = segment.ids[row]
+                    meta = segment.metadata[row]
+                if vector_id in seen or vector_id in excluded:
+                    continue
+                seen.add(vector_id)
+                hits.append(SearchHit(id=vector_id, score=score, metadata=meta))
+                if len(hits) == k:
+                    break
+        return hits
+
+    def search_text(self, text: str, k: int = 10, **kwargs: Any) -> list[SearchHit]:
+        return self.search(self.embedder.embed(text), k, **kwargs)
+
+    def similar_to(
+        self,
+        vector_id: str,
+        k: int = 10,
+        *,
+        min_score: float = 0.0,
+        **kwargs: Any,
+    ) -> list[SearchHit]:
+        """Neighbours of a stored id, e.g. syndicated copies of an article."""
+
+        vector = self.get_vector(vector_id)
+        if vector is None:
+            raise KeyError(vector_id)
+        hits = self.search(vector, k, exclude_ids=[vector_id], **kwargs)
+        return [hit for hit in hits if hit.score >= min_score]
+
+    def get_vector(self, vector_id: str) -> np.ndarray | None:
+        with self._lock:
+            for row in range(len(self._pending_ids) - 1, -1, -1):
+                if self._pending_ids[row] == vector_id:
+                    return np.concatenate(self._pending_vectors)[row]
+            for segment in reversed(self._segments):
+                for row in range(segment.rows - 1, -1, -1):
+                    if segment.ids[row] == vector_id:
+                        return np.asarray(segment.matrix[row], dtype=np.float32)
+        return None
+
+    # ------------------------------------------------------------------
+    # IVF index
+    # ------------------------------------------------------------------
+    def build_ivf(
+        self,
+        nlist: int | None = None,
+        *,
+        sample_size: int = 100_000,
+        iterations: int = 10,
+        seed: int = 0,
+    ) -> None:
+        """Build an inverted-file index with ``nlist`` k-means centroids.
+
+        Rows added later are still found through the exhaustive tail scan;
+        rebuild periodically (or after :meth:`compact`) to keep it effective.
+        """
+
+        with self._lock:
+            self.flush()
+            total = sum(segment.rows for segment in self._segments)
+            if total == 0:
+                return
+            nlist = nlist or max(1, int(np.sqrt(total)))
+            nlist = min(nlist, total)
+            rng = np.random.default_rng(seed)
+
+            sample_rows = np.sort(
+                rng.choice(total, size=min(sample_size, total), replace=False)
+            )
+            sample = self._gather_rows(sample_rows)
+            centroids = sample[rng.choice(len(sample), size=nlist, replace=False)]
+            for _ in range(iterations):
+                assignment = np.argmax(sample @ centroids.T, axis=1)
+                for list_id in range(nlist):
+                    members = sample[assignment == list_id]
+                    if len(members):
+                        centroids[list_id] = members.mean(axis=0)
+                centroids = _normalize(centroids)
+
+            assignments = np.empty(total, dtype=np.int32)
+            offset = 0
+            for matrix in self._iter_chunks():
+                rows = len(matrix)
+                assignments[offset : offset + rows] = np.argmax(
+                    matrix @ centroids.T, axis=1
+                )
+                offset += rows
+
+            order = np.argsort(assignments, kind="stable").astype(np.int64)
+            counts = np.bincount(assignments, minlength=nlist)
+            offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+            self._ivf = {
+                "centroids": centroids.astype(np.float32),
+                "order": order,
+                "offsets": offsets,
+                "rows": np.asarray([total], dtype=np.int64),
+            }
+            np.savez(self.path / IVF_NAME, **self._ivf)
+
+    def _search_ivf(
+        self,
+        q: np.ndarray,
+        fetch: int,
+        nprobe: int | None,
+    ) -> list[tuple[float, int, int]]:
+        assert self._ivf is not None
+        centroids = self._ivf["centroids"]
+        nprobe = min(nprobe or max(1, len(centroids) // 16), len(centroids))
+        lists = _top_k(centroids @ q, nprobe)
+        offsets = self._ivf["offsets"]
+        rows = np.concatenate(
+            [self._ivf["order"][offsets[i] : offsets[i + 1]] for i in lists]
+        )
+        if rows.size == 0:
+            return []
+        rows.sort()
+        scores = self._gather_rows(rows) @ q
+        best = _top_k(scores, fetch)
+        return [(float(scores[i]), *self._locate(int(rows[i]))) for i in best]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _search_exhaustive(
+        self,
+        q: np.ndarray,
+        fetch: int,
+        *,
+        start_row: int = 0,
+    ) -> list[tuple[float, int, int]]:
+        results: list[tuple[float, int, int]] = []
+        global_row = 0
+        for seg_index, segment in enumerate(self._segments):
+            seg_start = max(0, start_row - global_row)
+            global_row += segment.rows
+            for chunk_start in range(seg_start, segment.rows, self._chunk_rows):
+                chunk = np.asarray(
+                    segment.matrix[chunk_start : chunk_start + self._chunk_rows],
+                    dtype=np.float32,
+                )
+                scores = chunk @ q
+                for i in _top_k(scores, fetch):
+                    results.append((float(scores[i]), seg_index, chunk_start + int(i)))
+        results.sort(key=lambda item: -item[0])
+        return results[:fetch]
+
+    def _search_pending(
+        self,
+        q: np.ndarray,
+        fetch: int,
+    ) -> list[tuple[float, int, int]]:
+        if not self._pending_ids:
+            return []
+        scores = np.concatenate(self._pending_vectors) @ q
+        return [(float(scores[i]), -1, int(i)) for i in _top_k(scores, fetch)]
+
+    def _iter_chunks(self) -> Iterable[np.ndarray]:
+        for segment in self._segments:
+            for start in range(0, segment.rows, self._chunk_rows):
+                yield np.asarray(
+                    segment.matrix[start : start + self._chunk_rows], dtype=np.float32
+                )
+
+    def _locate(self, global_row: int) -> tuple[int, int]:
+        for seg_index, segment in enumerate(self._segments):
+            if global_row < segment.rows:
+                return seg_index, global_row
+            global_row -= segment.rows
+        raise IndexError(global_row)
+
+    def _gather_rows(self, global_rows: np.ndarray) -> np.ndarray:
+        """Fetch sorted global row indices across segments as float32."""
+
+        out = np.empty((len(global_rows), self.dim), dtype=np.float32)
+        seg_start = 0
+        for segment in self._segments:
+            seg_end = seg_start + segment.rows
+            lo, hi = np.searchsorted(global_rows, [seg_start, seg_end])
+            if hi > lo:
+                out[lo:hi] = segment.matrix[global_rows[lo:hi] - seg_start]
+            seg_start = seg_end
+        return out
+
+    def _next_segment_number(self) -> int:
+        numbers = [int(segment.name.split("-")[1]) for segment in self._segments]
+        return max(numbers, default=0) + 1
+
+    def _write_segment(
+        self,
+        name: str,
+        matrix: np.ndarray,
+        ids: Sequence[str],
+        metadata: Sequence[dict[str, Any]],
+    ) -> None:
+        matrix.astype(self.dtype).tofile(self.path / f"{name}.vec")
+        with (self.path / f"{name}.ids.jsonl").open("w", encoding="utf-8") as handle:
+            for vector_id, meta in zip(ids, metadata, strict=True):
+                handle.write(
+                    json.dumps({"id": vector_id, "metadata": meta}, default=str) + "\n"
+                )
+
+    def _open_segment(self, name: str) -> _Segment:
+        ids: list[str] = []
+        metadata: list[dict[str, Any]] = []
+        with (self.path / f"{name}.ids.jsonl").open(encoding="utf-8") as handle:
+            for line in handle:
+                record = json.loads(line)
+                ids.append(record["id"])
+                metadata.append(record.get("metadata") or {})
+        rows = len(ids)
+        if rows:
+            matrix = np.memmap(
+                self.path / f"{name}.vec",
+                dtype=self.dtype,
+                mode="r",
+                shape=(rows, self.dim),
+            )
+        else:
+            matrix = np.empty((0, self.dim), dtype=self.dtype)
+        return _Segment(name=name, rows=rows, matrix=matrix, ids=ids, metadata=metadata)
+
+    def _read_manifest(self) -> dict[str, Any] | None:
+        manifest_path = self.path / MANIFEST_NAME
+        if not manifest_path.exists():
+            return None
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+    def _write_manifest(self) -> None:
+        manifest = {
+            "dim": self.dim,
+            "dtype": self.dtype.name,
+            "segments": [segment.name for segment in self._segments],
+        }
+        tmp_path = self.path / f"{MANIFEST_NAME}.tmp"
+        tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        tmp_path.replace(self.path / MANIFEST_NAME)
+
+    def _load_ivf(self) -> None:
+        ivf_path = self.path / IVF_NAME
+        if not ivf_path.exists():
+            return
+        with np.load(ivf_path) as data:
+            ivf = {key: data[key] for key in data.files}
+        total = sum(segment.rows for segment in self._segments)
+        if int(ivf["rows"][0]) > total:
+            logger.warning("Ignoring stale IVF index at %s", ivf_path)
+            return
+        self._ivf = ivf
+
+
+__all__ = ["Embedder", "HashingEmbedder", "LocalVectorStore", "SearchHit"]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
@@ -18,6 +19,8 @@ from .providers import (
 from .settings import LLMSettings, load_llm_settings
 
 if TYPE_CHECKING:  # pragma: no cover - typing helper only
+    from .cache import PromptResponseCache
+    from .limits import ProviderLimiterRegistry
     from .vectorstores import VectorStore
 
 
@@ -36,6 +39,7 @@ class OrchestrationResult:
 
     response: LLMProviderResponse | None = None
     failures: list[ProviderFailure] = field(default_factory=list)
+    cached: bool = False
 
     @property
     def succeeded(self) -> bool:
@@ -71,10 +75,15 @@ class LLMOrchestrator:
         settings: LLMSettings,
         providers: Sequence[LLMProvider],
         vector_store: VectorStore | None = None,
+        *,
+        limiters: ProviderLimiterRegistry | None = None,
+        cache: PromptResponseCache | None = None,
     ) -> None:
         self._settings = settings
         self._providers = list(providers)
         self._vector_store = vector_store
+        self._limiters = limiters
+        self._cache = cache
 
     @classmethod
     def from_settings(
@@ -82,13 +91,25 @@ class LLMOrchestrator:
         settings: LLMSettings | None = None,
         *,
         vector_store: VectorStore | None = None,
+        limiters: ProviderLimiterRegistry | None = None,
+        cache: PromptResponseCache | None = None,
     ) -> LLMOrchestrator:
         resolved = settings or load_llm_settings()
         providers = [
             ProviderRegistry.create(name, resolved)
             for name in resolved.provider_names()
         ]
-        return cls(resolved, providers, vector_store)
+        return cls(
+            resolved,
+            providers,
+            vector_store,
+            limiters=limiters,
+            cache=cache,
+        )
+
+    @property
+    def cache(self) -> PromptResponseCache | None:
+        return self._cache
 
     def list_providers(self) -> list[str]:
         return [provider.name for provider in self._providers]
@@ -101,6 +122,19 @@ class LLMOrchestrator:
         config = config or LLMTaskConfig()
         result = OrchestrationResult()
 
+        cache_key: str | None = None
+        if self._cache is not None:
+            cache_key = self._cache.key_for(
+                prompt,
+                max_output_tokens=config.max_output_tokens,
+                temperature=config.temperature,
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                result.response = cached
+                result.cached = True
+                return result
+
         for provider in self._providers:
             if not provider.is_available():
                 result.failures.append(
@@ -113,12 +147,7 @@ class LLMOrchestrator:
                 continue
 
             try:
-                response = provider.generate(
-                    prompt,
-                    max_output_tokens=config.max_output_tokens,
-                    temperature=config.temperature,
-                    metadata=config.metadata,
-                )
+                response = self._invoke_provider(provider, prompt, config)
             except LLMRateLimitError as exc:
                 result.failures.append(
                     ProviderFailure(
@@ -148,12 +177,58 @@ class LLMOrchestrator:
                 continue
 
             result.response = response
+            if self._cache is not None and cache_key is not None:
+                self._cache.put(cache_key, response)
             self._store_vector_if_enabled(prompt, response)
             return result
 
         # Exhausted providers without success
         return result
 
+    def _invoke_provider(
+        self,
+        provider: LLMProvider,
+        prompt: str,
+        config: LLMTaskConfig,
+    ) -> LLMProviderResponse:
+        """Call ``provider`` under its limiter, honouring Retry-After hints.
+
+        A rate-limit error that carries ``retry_after`` no longer than
+        ``settings.rate_limit_max_wait`` pauses every caller of that provider
+        and is retried up to ``settings.max_retries`` times; anything else is
+        re-raised so the orchestrator falls through to the next provider.
+        """
+
+        limiter = self._limiters.get(provider.name) if self._limiters else None
+        attempts = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                return provider.generate(
+                    prompt,
+                    max_output_tokens=config.max_output_tokens,
+                    temperature=config.temperature,
+                    metadata=config.metadata,
+                )
+            except LLMRateLimitError as exc:
+                retry_after = getattr(exc, "retry_after", None)
+                if retry_after is None:
+                    raise
+                if limiter is not None:
+                    limiter.defer(retry_after)
+                if (
+                    attempts >= self._settings.max_retries
+                    or retry_after > self._settings.rate_limit_max_wait
+                ):
+                    raise
+                attempts += 1
+                if limiter is None:
+                    time.sleep(retry_after)
+            finally:
+                if limiter is not None:
+                    limiter.release()
+
     def _store_vector_if_enabled(
         self,
         prompt: str,
@@ -33,7 +33,15 @@ class LLMProviderError(RuntimeError):
 
 
 class LLMRateLimitError(LLMProviderError):
-    """Raised when a provider reports a rate limit condition."""
+    """Raised when a provider reports a rate limit condition.
+
+    ``retry_after`` carries the provider's requested back-off in seconds when
+    the client exposes it (``Retry-After`` header or SDK attribute).
+    """
+
+    def __init__(self, message: str = "", *, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class LLMConfigurationError(LLMProviderError):
@@ -163,7 +171,9 @@ class GPT41Provider(LLMProvider):
             )
         except Exception as exc:  # pragma: no cover - client specific
             if rate_cls and isinstance(exc, rate_cls):
-                raise LLMRateLimitError(str(exc)) from exc
+                raise LLMRateLimitError(
+                    str(exc), retry_after=_retry_after_seconds(exc)
+                ) from exc
             if error_cls and isinstance(exc, error_cls):
                 raise LLMProviderError(str(exc)) from exc
             raise
@@ -236,7 +246,9 @@ class Claude35SonnetProvider(LLMProvider):
             )
         except Exception as exc:  # pragma: no cover - client specific
             if rate_cls and isinstance(exc, rate_cls):
-                raise LLMRateLimitError(str(exc)) from exc
+                raise LLMRateLimitError(
+                    str(exc), retry_after=_retry_after_seconds(exc)
+                ) from exc
             if error_cls and isinstance(exc, error_cls):
                 raise LLMProviderError(str(exc)) from exc
             raise
@@ -308,7 +320,9 @@ class Gemini15FlashProvider(LLMProvider):
             )
         except Exception as exc:  # pragma: no cover - client specific
             if rate_cls and isinstance(exc, rate_cls):
-                raise LLMRateLimitError(str(exc)) from exc
+                raise LLMRateLimitError(
+                    str(exc), retry_after=_retry_after_seconds(exc)
+                ) from exc
             if error_cls and isinstance(exc, error_cls):
                 raise LLMProviderError(str(exc)) from exc
             raise
@@ -348,6 +362,27 @@ class ProviderRegistry:
         return sorted(cls._registry)
 
 
+def _retry_after_seconds(exc: BaseException) -> float | None:
+    """Extract a ``Retry-After`` hint (seconds) from an SDK exception."""
+
+    value = getattr(exc, "retry_after", None)
+    if value is None:
+        response = getattr(exc, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers is not None:
+            try:
+                value = headers.get("retry-after") or headers.get("Retry-After")
+            except Exception:  # pragma: no cover - exotic header containers
+                value = None
+    if value is None:
+        return None
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None
+    return seconds if seconds >= 0 else None
+
+
 def _coalesce_response_text(response: Any) -> str:
     try:
         output_text = getattr(response, "output_text", None)
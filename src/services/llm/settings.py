@@ -24,6 +24,14 @@ class VectorStoreSettings:
         return bool(self.provider)
 
 
+@dataclass(slots=True)
+class ProviderLimits:
+    """Concurrency and request-rate ceilings for a single provider."""
+
+    max_concurrency: int | None = None
+    requests_per_minute: float | None = None
+
+
 @dataclass(slots=True)
 class LLMSettings:
     """Aggregated configuration for the LLM orchestration stack."""
@@ -38,6 +46,10 @@ class LLMSettings:
     default_max_output_tokens: int = 1024
     default_temperature: float = 0.2
     vector_store: VectorStoreSettings | None = None
+    concurrency: int = 1
+    provider_limits: dict[str, ProviderLimits] = field(default_factory=dict)
+    rate_limit_max_wait: float = 30.0
+    cache_path: str | None = None
 
     def provider_names(self) -> list[str]:
         return list(self.provider_order)
@@ -62,6 +74,34 @@ def _parse_provider_order(raw: str | None) -> list[str]:
     return parts
 
 
+def _parse_provider_limits(raw: str | None) -> dict[str, ProviderLimits]:
+    """Parse ``slug=concurrency[:rpm]`` pairs separated by commas.
+
+    Example: ``openai-gpt4.1=4:300,claude-3.5-sonnet=2:50``. Empty fields
+    leave that limit unset (``gemini-1.5-flash=:600``).
+    """
+
+    limits: dict[str, ProviderLimits] = {}
+    if not raw:
+        return limits
+    for segment in raw.split(","):
+        slug, _, spec = segment.partition("=")
+        slug = slug.strip()
+        if not slug or not spec.strip():
+            continue
+        concurrency_raw, _, rpm_raw = spec.strip().partition(":")
+        try:
+            concurrency = int(concurrency_raw) if concurrency_raw.strip() else None
+            rpm = float(rpm_raw) if rpm_raw.strip() else None
+        except ValueError:
+            continue
+        limits[slug] = ProviderLimits(
+            max_concurrency=concurrency,
+            requests_per_minute=rpm,
+        )
+    return limits
+
+
 def _vector_store_settings() -> VectorStoreSettings | None:
     provider = os.getenv("VECTOR_STORE_PROVIDER", "").strip().lower()
     if not provider:
@@ -89,6 +129,14 @@ def _vector_store_settings() -> VectorStoreSettings | None:
             value = os.getenv(key)
             if value:
                 options[key.lower()] = value
+    elif provider == "local":
+        options["local_path"] = os.getenv(
+            "LOCAL_VECTOR_STORE_PATH", "data/vector_store"
+        )
+        for key in ("LOCAL_VECTOR_STORE_DIM", "LOCAL_VECTOR_STORE_DTYPE"):
+            value = os.getenv(key)
+            if value:
+                options[key.lower()] = value
     else:
         # Preserve arbitrary providers for future extensions
         for key, value in os.environ.items():
@@ -125,6 +173,10 @@ def load_llm_settings() -> LLMSettings:
         ),
         default_temperature=float(os.getenv("LLM_DEFAULT_TEMPERATURE", "0.2")),
         vector_store=_vector_store_settings(),
+        concurrency=max(1, int(os.getenv("LLM_CONCURRENCY", "1"))),
+        provider_limits=_parse_provider_limits(os.getenv("LLM_PROVIDER_LIMITS")),
+        rate_limit_max_wait=float(os.getenv("LLM_RATE_LIMIT_MAX_WAIT", "30")),
+        cache_path=os.getenv("LLM_CACHE_PATH") or None,
     )
 
     return settings
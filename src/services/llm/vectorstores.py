@@ -22,6 +22,9 @@ class VectorStore:
     ) -> None:  # pragma: no cover - interface stub
         raise NotImplementedError
 
+    def close(self) -> None:
+        """Persist any buffered writes; called once the caller is done."""
+
 
 @dataclass(slots=True)
 class NoOpVectorStore(VectorStore):
@@ -53,10 +56,26 @@ class NoOpVectorStore(VectorStore):
         )
 
 
+def _create_local_vector_store(settings: VectorStoreSettings) -> VectorStore:
+    try:
+        from .local_vectorstore import LocalVectorStore
+    except ModuleNotFoundError as exc:  # pragma: no cover - numpy missing
+        return NoOpVectorStore(provider=settings.provider, reason=str(exc))
+
+    options = settings.options
+    return LocalVectorStore(
+        options.get("local_path", "data/vector_store"),
+        dim=int(options.get("local_vector_store_dim", 384)),
+        dtype=options.get("local_vector_store_dtype", "float32"),
+    )
+
+
 def _create_vector_store(settings: VectorStoreSettings) -> VectorStore:
     provider = settings.provider
     reason = "optional integration placeholder"
 
+    if provider == "local":
+        return _create_local_vector_store(settings)
     if provider == "pinecone":
         required = {"pinecone_api_key", "pinecone_index"}
         missing = required - set(settings.options)
@@ -87,9 +106,12 @@ class VectorStoreFactory:
             return None
 
         store = _create_vector_store(vec_settings)
-        logger.info(
-            "Vector store '%s' active in no-op mode (%s)",
-            vec_settings.provider,
-            getattr(store, "reason", ""),
-        )
+        if isinstance(store, NoOpVectorStore):
+            logger.info(
+                "Vector store '%s' active in no-op mode (%s)",
+                vec_settings.provider,
+                getattr(store, "reason", ""),
+            )
+        else:
+            logger.info("Vector store '%s' active", vec_settings.provider)
         return store
@@ -0,0 +1,374 @@
+"""Incrementally maintained pending-work counters for pipeline stages.
+
+The continuous processor used to decide what to run by issuing one
+``COUNT(*)`` (several with anti-joins) per stage on every cycle. On
+PostgreSQL the ``add_pipeline_stage_counts`` migration installs statement
+triggers on ``candidate_links``, ``articles`` and ``article_entities`` that
+append the net change of each stage's pending set to
+``pipeline_stage_count_deltas`` and ``NOTIFY pipeline_work`` when work is
+added. ``StageCounter`` reads ``pipeline_stage_counts`` plus the unfolded
+deltas, folds the deltas periodically and reconciles against exact counts
+to correct drift. It can also block on ``LISTEN pipeline_work`` so an idle
+processor wakes up as soon as new work is committed.
+
+Without the triggers (SQLite, or a database not yet migrated) the counter
+falls back to the exact ``COUNT(*)`` queries and plain sleeping.
+"""
+
+from __future__ import annotations
+
+import logging
+import select
+import time
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.exc import DBAPIError, OperationalError
+
+from src.models.database import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "pipeline_work"
+TRIGGER_PREFIX = "pipeline_stage_"
+
+# Stage name -> exact pending-work query (the definition the triggers track)
+EXACT_COUNT_SQL: dict[str, str] = {
+    "verification": (
+        "SELECT COUNT(*) FROM candidate_links WHERE status = 'discovered'"
+    ),
+    "extraction": (
+        "SELECT COUNT(*) FROM candidate_links cl "
+        "WHERE cl.status = 'article' "
+        "AND NOT EXISTS ("
+        "  SELECT 1 FROM articles a WHERE a.candidate_link_id = cl.id"
+        ")"
+    ),
+    "cleaning": (
+        "SELECT COUNT(*) FROM articles "
+        "WHERE status = 'extracted' AND content IS NOT NULL"
+    ),
+    "analysis": (
+        "SELECT COUNT(*) FROM articles "
+        "WHERE status = 'extracted' AND primary_label IS NULL"
+    ),
+    "entity_extraction": (
+        "SELECT COUNT(*) FROM articles a "
+        "WHERE a.status IN ('extracted', 'classified') "
+        "AND NOT EXISTS ("
+        "  SELECT 1 FROM article_entities ae WHERE ae.article_id = a.id"
+        ") AND a.content IS NOT NULL"
+    ),
+}
+STAGES = tuple(EXACT_COUNT_SQL)
+
+_READ_COUNTERS_SQL = text(
+    "SELECT c.stage, c.pending + COALESCE(SUM(d.delta), 0) AS pending "
+    "FROM pipeline_stage_counts c "
+    "LEFT JOIN pipeline_stage_count_deltas d ON d.stage = c.stage "
+    "WHERE c.stage IN :stages "
+    "GROUP BY c.stage, c.pending"
+).bindparams(bindparam("stages", expanding=True))
+
+_TAKE_DELTAS_SQL = text(
+    "DELETE FROM pipeline_stage_count_deltas "
+    "WHERE stage IN :stages RETURNING stage, delta"
+).bindparams(bindparam("stages", expanding=True))
+
+_UPSERT_COUNT_SQL = text(
+    "INSERT INTO pipeline_stage_counts "
+    "(stage, pending, last_drift, updated_at, reconciled_at) "
+    "VALUES (:stage, :pending, :drift, :now, :now) "
+    "ON CONFLICT (stage) DO UPDATE SET "
+    "pending = excluded.pending, last_drift = excluded.last_drift, "
+    "updated_at = excluded.updated_at, reconciled_at = excluded.reconciled_at"
+)
+
+_FOLD_COUNT_SQL = text(
+    "UPDATE pipeline_stage_counts SET pending = pending + :delta, "
+    "updated_at = :now WHERE stage = :stage"
+)
+
+
+class _NotificationListener:
+    """A dedicated autocommit connection blocked on ``LISTEN``."""
+
+    # Drivers without a waitable socket (pg8000) are pinged at this interval
+    PING_INTERVAL = 2.0
+
+    def __init__(self, engine, channel: str = NOTIFY_CHANNEL):
+        raw = engine.raw_connection()
+        # Keep the LISTEN session out of the pool
+        raw.detach()
+        self._raw = raw
+        self._driver = raw.driver_connection
+        # Pool pre-ping leaves a transaction open, and psycopg2 refuses to
+        # switch to autocommit inside one
+        self._driver.rollback()
+        self._driver.autocommit = True
+        cursor = raw.cursor()
+        try:
+            cursor.execute(f"LISTEN {channel}")
+        finally:
+            cursor.close()
+
+    def wait(self, timeout: float) -> list[str]:
+        """Block up to ``timeout`` seconds; return received payloads."""
+        driver = self._driver
+        if all(hasattr(driver, name) for name in ("poll", "notifies", "fileno")):
+            if not driver.notifies:
+                select.select([driver], [], [], max(0.0, timeout))
+                driver.poll()
+            payloads = [notify.payload for notify in driver.notifies]
+            driver.notifies.clear()
+            return payloads
+
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            cursor = self._raw.cursor()
+            try:
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            pending = getattr(driver, "notifications", None)
+            if pending:
+                payloads = [note[2] for note in pending]
+                pending.clear()
+                return payloads
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return []
+            time.sleep(min(self.PING_INTERVAL, remaining))
+
+    def close(self) -> None:
+        try:
+            self._raw.close()
+        except Exception:  # pragma: no cover - best effort
+            pass
+
+
+class StageCounter:
+    """Read, fold and reconcile the pipeline stage counters."""
+
+    def __init__(
+        self,
+        db: DatabaseManager | None = None,
+        *,
+        reconcile_interval: float = 900.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.db = db or DatabaseManager()
+        self.engine = self.db.engine
+        self.reconcile_interval = reconcile_interval
+        self._clock = clock
+        self._sleep = sleep
+        self._mode: str | None = None
+        self._listener: _NotificationListener | None = None
+        self._last_reconcile: float | None = None
+        self.stats: dict[str, Any] = {
+            "counter_reads": 0,
+            "exact_counts": 0,
+            "folds": 0,
+            "reconciles": 0,
+            "wakeups": 0,
+            "last_drift": {},
+        }
+
+    @property
+    def is_postgres(self) -> bool:
+        return self.engine.dialect.name == "postgresql"
+
+    @property
+    def mode(self) -> str:
+        """``"triggers"`` when the PostgreSQL triggers are installed, else
+        ``"poll"``."""
+        if self._mode is None:
+            self._mode = "triggers" if self._triggers_installed() else "poll"
+            logger.info("Stage counters running in %s mode", self._mode)
+        return self._mode
+
+    def _triggers_installed(self) -> bool:
+        if not self.is_postgres:
+            return False
+        try:
+            with self.engine.connect() as conn:
+                installed = conn.execute(
+                    text(
+                        "SELECT COUNT(*) FROM pg_trigger "
+                        "WHERE tgname LIKE :prefix AND NOT tgisinternal"
+                    ),
+                    {"prefix": f"{TRIGGER_PREFIX}%"},
+                ).scalar()
+        except (OperationalError, DBAPIError):
+            logger.warning("Could not inspect stage count triggers", exc_info=True)
+            return False
+        return bool(installed)
+
+    def exact_counts(self, stages: Iterable[str] = STAGES, conn=None) -> dict:
+        """Run the exact ``COUNT(*)`` query for each stage."""
+        stages = list(stages)
+        if conn is None:
+            with self.engine.connect() as own_conn:
+                return self.exact_counts(stages, own_conn)
+        counts = {
+            stage: int(conn.execute(text(EXACT_COUNT_SQL[stage])).scalar() or 0)
+            for stage in stages
+        }
+        self.stats["exact_counts"] += len(stages)
+        return counts
+
+    def get_counts(self, stages: Iterable[str] = STAGES) -> dict[str, int]:
+        """Return pending work per stage.
+
+        In trigger mode this is one small query against the counter tables;
+        stages that have never been reconciled are reconciled first.
+        """
+        stages = list(stages)
+        if not stages:
+            return {}
+        if self.mode != "triggers":
+            return self.exact_counts(stages)
+
+        self._ensure_listener()
+        with self.engine.connect() as conn:
+            rows = conn.execute(_READ_COUNTERS_SQL, {"stages": stages})
+            counts = {stage: max(0, int(pending)) for stage, pending in rows}
+        self.stats["counter_reads"] += 1
+
+        missing = [stage for stage in stages if stage not in counts]
+        if missing:
+            self.reconcile(missing)
+            counts.update(self.get_counts(missing))
+        return counts
+
+    def _take_deltas(self, conn, stages: list[str]) -> dict[str, int]:
+        taken = dict.fromkeys(stages, 0)
+        for stage, delta in conn.execute(_TAKE_DELTAS_SQL, {"stages": stages}):
+            taken[stage] += int(delta)
+        return taken
+
+    def _snapshot_connection(self, conn):
+        # One snapshot for the counts and the deltas they supersede; deltas
+        # committed after it stay in the table for the next fold
+        if self.is_postgres:
+            return conn.execution_options(isolation_level="REPEATABLE READ")
+        return conn
+
+    def fold(self, stages: Iterable[str] = STAGES) -> dict[str, int]:
+        """Move accumulated deltas into ``pipeline_stage_counts``."""
+        stages = list(stages)
+        now = datetime.utcnow()
+        with self.engine.connect() as base_conn:
+            conn = self._snapshot_connection(base_conn)
+            with conn.begin():
+                taken = self._take_deltas(conn, stages)
+                for stage, delta in taken.items():
+                    if delta:
+                        conn.execute(
+                            _FOLD_COUNT_SQL,
+                            {"stage": stage, "delta": delta, "now": now},
+                        )
+        self.stats["folds"] += 1
+        return taken
+
+    def reconcile(self, stages: Iterable[str] = STAGES) -> dict[str, int]:
+        """Reset counters to exact counts; return the drift per stage."""
+        stages = list(stages)
+        now = datetime.utcnow()
+        with self.engine.connect() as base_conn:
+            conn = self._snapshot_connection(base_conn)
+            with conn.begin():
+                exact = self.exact_counts(stages, conn)
+                taken = self._take_deltas(conn, stages)
+                previous = {
+                    stage: int(pending)
+                    for stage, pending in conn.execute(
+                        text(
+                            "SELECT stage, pending FROM pipeline_stage_counts "
+                            "WHERE stage IN :stages"
+                        ).bindparams(bindparam("stages", expanding=True)),
+                        {"stages": stages},
+                    )
+                }
+                drift = {}
+                for stage in stages:
+                    tracked = previous.get(stage, 0) + taken[stage]
+                    drift[stage] = exact[stage] - tracked if stage in previous else 0
+                    conn.execute(
+                        _UPSERT_COUNT_SQL,
+                        {
+                            "stage": stage,
+                            "pending": exact[stage],
+                            "drift": drift[stage],
+                            "now": now,
+                        },
+                    )
+
+        self._last_reconcile = self._clock()
+        self.stats["reconciles"] += 1
+        self.stats["last_drift"] = drift
+        if any(drift.values()):
+            logger.warning("Stage counter drift corrected: %s", drift)
+        return drift
+
+    def maintain(self) -> dict[str, int] | None:
+        """Fold deltas and reconcile when the interval has elapsed.
+
+        Returns the drift when a reconcile ran, otherwise ``None``. A no-op
+        in poll mode.
+        """
+        if self.mode != "triggers":
+            return None
+        due = (
+            self._last_reconcile is None
+            or self._clock() - self._last_reconcile >= self.reconcile_interval
+        )
+        try:
+            if due:
+                return self.reconcile()
+            self.fold()
+        except (OperationalError, DBAPIError):
+            # Typically a serialization conflict with another reconciler
+            logger.warning("Stage counter maintenance failed", exc_info=True)
+        return None
+
+    def _ensure_listener(self) -> None:
+        if self._listener is not None:
+            return
+        try:
+            self._listener = _NotificationListener(self.engine)
+        except Exception:
+            logger.warning("Could not LISTEN for pipeline work", exc_info=True)
+
+    def wait_for_work(self, timeout: float) -> bool:
+        """Sleep up to ``timeout`` seconds, returning early (True) when a
+        ``pipeline_work`` notification arrives."""
+        if self.mode == "triggers":
+            self._ensure_listener()
+        if self._listener is None:
+            self._sleep(timeout)
+            return False
+
+        started = self._clock()
+        try:
+            payloads = self._listener.wait(timeout)
+        except Exception:
+            logger.warning("LISTEN connection failed; reconnecting", exc_info=True)
+            self._listener.close()
+            self._listener = None
+            self._sleep(max(0.0, timeout - (self._clock() - started)))
+            return False
+        if payloads:
+            self.stats["wakeups"] += 1
+            logger.info("Woken by new work: %s", sorted(set(payloads)))
+            return True
+        return False
+
+    def close(self) -> None:
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
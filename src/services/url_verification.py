@@ -10,10 +10,9 @@ import argparse
 import inspect
 import logging
 import os
-import re
 import sys
 import time
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -39,10 +38,18 @@ except ImportError:
 from src.crawler.origin_proxy import enable_origin_proxy  # noqa: E402
 from src.crawler.proxy_config import get_proxy_manager  # noqa: E402
 from src.models.database import DatabaseManager, safe_execute  # noqa: E402
+from src.services.url_verification_worker import (  # noqa: E402
+    ConcurrentBatchVerifier,
+)
+from src.utils.stage_resources import stage_resource  # noqa: E402
 from src.utils.telemetry import (  # noqa: E402
     OperationTracker,
     create_telemetry_system,
 )
+from src.utils.url_classifier import (  # noqa: E402
+    WireURLMatcher,
+    is_likely_article_url,
+)
 
 _DEFAULT_HTTP_HEADERS: dict[str, str] = {
     "User-Agent": (
@@ -59,6 +66,9 @@ _RETRYABLE_STATUS_CODES = {429}
 _GET_FALLBACK_ATTEMPTS = 3
 _GET_FALLBACK_BACKOFF = 0.5  # seconds (exponential backoff)
 
+# Rows per UPDATE ... FROM (VALUES ...) statement in bulk status flushes
+_BULK_UPDATE_CHUNK = 500
+
 # Small pool of alternative User-Agent strings to use when sites block a single UA
 _ALT_USER_AGENTS = [
     (
@@ -94,6 +104,7 @@ class URLVerificationService:
         http_backoff_seconds: float = 0.5,
         http_headers: Mapping[str, str] | None = None,
         telemetry_tracker: OperationTracker | None = None,
+        wire_pattern_refresh_seconds: float = 300.0,
     ):
         """Initialize the verification service.
 
@@ -101,6 +112,8 @@ class URLVerificationService:
             batch_size: Number of URLs to process in each batch
             sleep_interval: Seconds to wait between batches when no work
             telemetry_tracker: Optional telemetry tracker for recording metrics
+            wire_pattern_refresh_seconds: How long compiled wire URL patterns
+                are reused before being reloaded from the database
         """
         self.batch_size = batch_size
         self.sleep_interval = sleep_interval
@@ -119,8 +132,12 @@ class URLVerificationService:
             self.run_http_precheck = bool(run_http_precheck)
         # (debug logging removed)
         self.db = DatabaseManager()
-        self.sniffer = storysniffer.StorySniffer()
+        self.sniffer = stage_resource("storysniffer", storysniffer.StorySniffer)
         self.logger = logging.getLogger(__name__)
+        self.wire_matcher = WireURLMatcher(
+            self._load_wire_url_patterns,
+            refresh_interval=wire_pattern_refresh_seconds,
+        )
         self.http_session = http_session or requests.Session()
         self.http_timeout = http_timeout
         self.http_retry_attempts = max(1, http_retry_attempts)
@@ -346,19 +363,17 @@ class URLVerificationService:
             last_error = "GET fallback failed"
         return False, status_code, last_error
 
-    def verify_url(self, url: str) -> dict:
-        """Verify a single URL with pattern matching and StorySniffer.
+    def _load_wire_url_patterns(self) -> list[tuple]:
+        """Fetch URL wire patterns through ContentTypeDetector."""
+        from src.utils.content_type_detector import ContentTypeDetector
 
-        Uses a three-stage verification process:
-        1. Check for wire service URLs (skip extraction entirely)
-        2. Fast URL pattern matching to filter obvious non-articles
-        3. StorySniffer ML model for remaining URLs
+        with self.db.get_session() as session:
+            detector = ContentTypeDetector(session=session)
+            return detector._get_wire_service_patterns(pattern_type="url")
 
-        Returns:
-            Dict with verification results and timing info
-        """
-        start_time = time.time()
-        result = {
+    @staticmethod
+    def _new_result(url: str) -> dict:
+        return {
             "url": url,
             "storysniffer_result": None,
             "verification_time_ms": 0.0,
@@ -369,31 +384,24 @@ class URLVerificationService:
             "wire_filtered": False,
         }
 
-        # Stage 0: Check for wire service URLs (highest priority)
-        from src.utils.content_type_detector import ContentTypeDetector
+    def _screen_url(self, url: str, result: dict, start_time: float) -> dict | None:
+        """Apply the cheap URL-only filters to ``result``.
 
-        # Reuse database session to avoid connection overhead
-        with self.db.get_session() as session:
-            detector = ContentTypeDetector(session=session)
-            # Quick URL-only wire detection (no content needed)
-            wire_patterns = detector._get_wire_service_patterns(pattern_type="url")
-
-            for pattern, service_name, case_sensitive in wire_patterns:
-                flags = 0 if case_sensitive else re.IGNORECASE
-                if re.search(pattern, url, flags):
-                    # This is a wire service URL - mark immediately
-                    result["storysniffer_result"] = False
-                    result["wire_filtered"] = True
-                    result["wire_service"] = service_name
-                    result["verification_time_ms"] = (time.time() - start_time) * 1000
-                    self.logger.debug(
-                        f"Filtered wire service URL: {url} ({service_name}) "
-                        f"({result['verification_time_ms']:.1f}ms)"
-                    )
-                    return result
-
-        # Stage 1: Fast URL pattern check
-        from src.utils.url_classifier import is_likely_article_url
+        Returns the finished result when the URL is a wire service or an
+        obvious non-article, or None when it still needs StorySniffer.
+        """
+        service_name = self.wire_matcher.match(url)
+        if service_name is not None:
+            # This is a wire service URL - mark immediately
+            result["storysniffer_result"] = False
+            result["wire_filtered"] = True
+            result["wire_service"] = service_name
+            result["verification_time_ms"] = (time.time() - start_time) * 1000
+            self.logger.debug(
+                f"Filtered wire service URL: {url} ({service_name}) "
+                f"({result['verification_time_ms']:.1f}ms)"
+            )
+            return result
 
         if not is_likely_article_url(url):
             # URL matches non-article pattern (gallery, category, etc.)
@@ -406,6 +414,41 @@ class URLVerificationService:
             )
             return result
 
+        return None
+
+    def screen_urls(self, urls: Sequence[str]) -> list[dict | None]:
+        """Screen URLs against wire and non-article patterns in one pass.
+
+        Returns a list aligned with ``urls``: a finished verification result
+        for every URL the patterns settle, and None for URLs that still need
+        StorySniffer (and the optional HTTP pre-check).
+        """
+        screened: list[dict | None] = []
+        for url in urls:
+            start_time = time.time()
+            result = self._new_result(url)
+            screened.append(self._screen_url(url, result, start_time))
+        return screened
+
+    def verify_url(self, url: str) -> dict:
+        """Verify a single URL with pattern matching and StorySniffer.
+
+        Uses a three-stage verification process:
+        1. Check for wire service URLs (skip extraction entirely)
+        2. Fast URL pattern matching to filter obvious non-articles
+        3. StorySniffer ML model for remaining URLs
+
+        Returns:
+            Dict with verification results and timing info
+        """
+        start_time = time.time()
+        result = self._new_result(url)
+
+        # Stages 0 and 1: wire service and non-article URL patterns
+        screened = self._screen_url(url, result, start_time)
+        if screened is not None:
+            return screened
+
         # Branching behavior: by default we run StorySniffer first and
         # short-circuit (this matches test expectations). When
         # `self.run_http_precheck` is True (production opt-in), perform a
@@ -510,9 +553,119 @@ class URLVerificationService:
 
         self.logger.debug(f"Updated candidate {candidate_id} to: {new_status}")
 
-    def process_batch(self, candidates: list[dict]) -> dict:
-        """Process a batch of candidates and return metrics."""
-        batch_metrics: dict = {
+    def update_candidate_statuses(
+        self, updates: Sequence[tuple[str, str, str | None]]
+    ) -> None:
+        """Apply many status changes with one statement per chunk.
+
+        ``updates`` holds ``(candidate_id, new_status, error_message)``
+        tuples. Semantics match :meth:`update_candidate_status`: every row
+        gets a fresh ``processed_at`` and ``error_message`` is only
+        overwritten when one is supplied. PostgreSQL uses a single
+        ``UPDATE ... FROM (VALUES ...)``; other dialects fall back to an
+        executemany of the per-row statement.
+        """
+        if not updates:
+            return
+
+        processed_at = datetime.now()
+        dialect = getattr(getattr(self.db.engine, "dialect", None), "name", "")
+
+        with self.db.engine.connect() as conn:
+            if dialect == "postgresql":
+                for offset in range(0, len(updates), _BULK_UPDATE_CHUNK):
+                    chunk = updates[offset : offset + _BULK_UPDATE_CHUNK]
+                    rows = []
+                    params: dict[str, Any] = {"processed_at": processed_at}
+                    for i, (candidate_id, status, error_message) in enumerate(chunk):
+                        rows.append(f"(:id_{i}, :status_{i}, CAST(:error_{i} AS TEXT))")
+                        params[f"id_{i}"] = candidate_id
+                        params[f"status_{i}"] = status
+                        params[f"error_{i}"] = error_message
+                    safe_execute(
+                        conn,
+                        f"""
+                        UPDATE candidate_links AS c
+                        SET status = v.status,
+                            processed_at = :processed_at,
+                            error_message = COALESCE(v.error_message, c.error_message)
+                        FROM (VALUES {", ".join(rows)})
+                            AS v(id, status, error_message)
+                        WHERE c.id = v.id
+                        """,
+                        params,
+                    )
+            else:
+                safe_execute(
+                    conn,
+                    """
+                    UPDATE candidate_links
+                    SET status = :status,
+                        processed_at = :processed_at,
+                        error_message = COALESCE(:error_message, error_message)
+                    WHERE id = :candidate_id
+                    """,
+                    [
+                        {
+                            "candidate_id": candidate_id,
+                            "status": status,
+                            "processed_at": processed_at,
+                            "error_message": error_message,
+                        }
+                        for candidate_id, status, error_message in updates
+                    ],
+                )
+            try:
+                conn.commit()
+            except Exception:
+                pass
+
+        self.logger.debug(f"Updated {len(updates)} candidate statuses in bulk")
+
+    def _record_result(
+        self, verification_result: dict, batch_metrics: dict
+    ) -> tuple[str, str | None]:
+        """Map a verification result to a candidate status and count it."""
+        batch_metrics["total_processed"] += 1
+
+        # Determine new status and update metrics
+        if verification_result.get("error"):
+            batch_metrics["verification_errors"] += 1
+            # If we ran HTTP pre-checks (production opt-in), treat
+            # exhausted HTTP failures as a terminal verification
+            # failure so orchestration can move candidates to the
+            # failed bucket. When running the default sniffer-first
+            # test-friendly path, preserve the non-terminal
+            # 'verification_uncertain' status so unit tests and
+            # manual review flows can retry or inspect candidates.
+            if self.run_http_precheck:
+                new_status = "verification_failed"
+            else:
+                new_status = "verification_uncertain"
+            error_message = verification_result["error"]
+        elif verification_result.get("wire_filtered"):
+            # Wire service URL detected - mark as wire
+            batch_metrics["verified_non_articles"] += 1
+            new_status = "wire"
+            error_message = None
+        elif verification_result.get("storysniffer_result"):
+            batch_metrics["verified_articles"] += 1
+            new_status = "article"
+            error_message = None
+        else:
+            batch_metrics["verified_non_articles"] += 1
+            new_status = "not_article"
+            error_message = None
+
+        batch_metrics["total_time_ms"] += verification_result.get(
+            "verification_time_ms", 0
+        )
+
+        return new_status, error_message
+
+    @staticmethod
+    def _new_batch_metrics() -> dict:
+        return {
             "total_processed": 0,
             "verified_articles": 0,
             "verified_non_articles": 0,
@@ -522,58 +675,75 @@ class URLVerificationService:
             "avg_verification_time_ms": 0.0,
         }
 
+    @staticmethod
+    def _finish_batch_metrics(batch_metrics: dict, batch_start_time: float) -> dict:
+        batch_metrics["batch_time_seconds"] = time.time() - batch_start_time
+        batch_metrics["avg_verification_time_ms"] = (
+            batch_metrics["total_time_ms"] / batch_metrics["total_processed"]
+            if batch_metrics["total_processed"] > 0
+            else 0.0
+        )
+        return batch_metrics
+
+    def process_batch(self, candidates: list[dict]) -> dict:
+        """Process a batch of candidates and return metrics."""
+        batch_metrics = self._new_batch_metrics()
         batch_start_time = time.time()
 
-        for candidate in candidates:
-            # Verify URL
-            verification_result = self.verify_url(candidate["url"])
-            batch_metrics["total_processed"] += 1
-
-            # Determine new status and update metrics
-            if verification_result.get("error"):
-                batch_metrics["verification_errors"] += 1
-                # If we ran HTTP pre-checks (production opt-in), treat
-                # exhausted HTTP failures as a terminal verification
-                # failure so orchestration can move candidates to the
-                # failed bucket. When running the default sniffer-first
-                # test-friendly path, preserve the non-terminal
-                # 'verification_uncertain' status so unit tests and
-                # manual review flows can retry or inspect candidates.
-                if self.run_http_precheck:
-                    new_status = "verification_failed"
-                else:
-                    new_status = "verification_uncertain"
-                error_message = verification_result["error"]
-            elif verification_result.get("wire_filtered"):
-                # Wire service URL detected - mark as wire
-                batch_metrics["verified_non_articles"] += 1
-                new_status = "wire"
-                error_message = None
-            elif verification_result.get("storysniffer_result"):
-                batch_metrics["verified_articles"] += 1
-                new_status = "article"
-                error_message = None
-            else:
-                batch_metrics["verified_non_articles"] += 1
-                new_status = "not_article"
-                error_message = None
+        # Settle wire and obvious non-article URLs before any StorySniffer call
+        screened = self.screen_urls([candidate["url"] for candidate in candidates])
 
-            batch_metrics["total_time_ms"] += verification_result.get(
-                "verification_time_ms", 0
+        for candidate, screened_result in zip(candidates, screened, strict=True):
+            # Verify URL
+            verification_result = screened_result or self.verify_url(candidate["url"])
+            new_status, error_message = self._record_result(
+                verification_result, batch_metrics
             )
 
             # Update candidate status
             self.update_candidate_status(candidate["id"], new_status, error_message)
 
-        # Calculate batch timing
-        batch_metrics["batch_time_seconds"] = time.time() - batch_start_time
-        batch_metrics["avg_verification_time_ms"] = (
-            batch_metrics["total_time_ms"] / batch_metrics["total_processed"]
-            if batch_metrics["total_processed"] > 0
-            else 0.0
+        return self._finish_batch_metrics(batch_metrics, batch_start_time)
+
+    def process_batch_concurrent(
+        self,
+        candidates: list[dict],
+        *,
+        concurrency: int = 8,
+        per_host_concurrency: int = 2,
+    ) -> dict:
+        """Process a batch with concurrent HTTP checks and one status flush.
+
+        Produces the same statuses as :meth:`process_batch`. HTTP pre-checks
+        (when enabled) run through :class:`AsyncVerificationWorker` with at
+        most ``per_host_concurrency`` requests per host, StorySniffer scores
+        all remaining URLs in one call, and status changes are written with
+        :meth:`update_candidate_statuses`. Candidates shed by the worker keep
+        their current status and are picked up by a later batch.
+        """
+        batch_metrics = self._new_batch_metrics()
+        batch_start_time = time.time()
+
+        verifier = ConcurrentBatchVerifier(
+            self,
+            concurrency=concurrency,
+            per_host_concurrency=per_host_concurrency,
+            logger=self.logger,
         )
+        results = verifier.verify([candidate["url"] for candidate in candidates])
 
-        return batch_metrics
+        updates: list[tuple[str, str, str | None]] = []
+        for candidate, verification_result in zip(candidates, results, strict=True):
+            if verification_result is None:
+                continue
+            new_status, error_message = self._record_result(
+                verification_result, batch_metrics
+            )
+            updates.append((candidate["id"], new_status, error_message))
+
+        self.update_candidate_statuses(updates)
+
+        return self._finish_batch_metrics(batch_metrics, batch_start_time)
 
     def save_telemetry_summary(
         self, batch_metrics: dict, candidates: list[dict], job_name: str
@@ -605,6 +775,8 @@ class URLVerificationService:
         max_batches: int | None = None,
         exit_on_idle: bool = False,
         idle_grace_seconds: int | float | None = None,
+        concurrency: int | None = None,
+        per_host_concurrency: int = 2,
     ) -> None:
         """Run the main verification loop.
 
@@ -614,6 +786,11 @@ class URLVerificationService:
                 instead of sleeping and polling again.
             idle_grace_seconds: Optional grace period to continue polling when
                 no work is available before exiting due to idleness.
+            concurrency: When set, process batches with
+                :meth:`process_batch_concurrent` using this many concurrent
+                HTTP checks instead of verifying URLs one at a time.
+            per_host_concurrency: Cap on concurrent HTTP checks per host in
+                concurrent mode.
         """
         self.running = True
         batch_count = 0
@@ -624,7 +801,13 @@ class URLVerificationService:
         self.logger.info(
             f"Starting verification loop: {job_name} "
             f"(batch_size={self.batch_size}, "
-            f"sleep_interval={self.sleep_interval}s)"
+            f"sleep_interval={self.sleep_interval}s"
+            + (
+                f", concurrency={concurrency}, "
+                f"per_host_concurrency={per_host_concurrency})"
+                if concurrency
+                else ")"
+            )
         )
 
         try:
@@ -694,7 +877,14 @@ class URLVerificationService:
                 )
 
                 # Process batch
-                batch_metrics = self.process_batch(candidates)
+                if concurrency:
+                    batch_metrics = self.process_batch_concurrent(
+                        candidates,
+                        concurrency=concurrency,
+                        per_host_concurrency=per_host_concurrency,
+                    )
+                else:
+                    batch_metrics = self.process_batch(candidates)
 
                 # Save telemetry
                 self.save_telemetry_summary(batch_metrics, candidates, job_name)
@@ -806,6 +996,17 @@ def main():
         action="store_true",
         help="Show current verification status and exit",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Concurrent HTTP checks per batch (default: sequential)",
+    )
+    parser.add_argument(
+        "--per-host-concurrency",
+        type=int,
+        default=2,
+        help="Maximum concurrent HTTP checks per host (default: 2)",
+    )
 
     args = parser.parse_args()
 
@@ -863,6 +1064,12 @@ def main():
         if signature is None or "exit_on_idle" in params or has_var_kw:
             run_kwargs["exit_on_idle"] = True
 
+        if args.concurrency and (
+            signature is None or "concurrency" in params or has_var_kw
+        ):
+            run_kwargs["concurrency"] = args.concurrency
+            run_kwargs["per_host_concurrency"] = args.per_host_concurrency
+
         if run_kwargs:
             loop_callable(**run_kwargs)
         else:
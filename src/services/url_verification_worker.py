@@ -4,6 +4,10 @@ This module provides the building blocks for the upcoming asynchronous
 verification refactor.  It exposes a lightweight worker that executes
 verifications in the background while monitoring backlog pressure so the
 system can shed excess work before overwhelming downstream services.
+
+:class:`ConcurrentBatchVerifier` wires the worker into batch verification:
+HTTP pre-checks run concurrently with per-host caps and StorySniffer scores
+every surviving URL with a single model call.
 """
 
 from __future__ import annotations
@@ -11,12 +15,21 @@ from __future__ import annotations
 import asyncio
 import inspect
 import logging
+import os
+import time
 from collections import deque
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
+from urllib.parse import urlparse
 
-__all__ = ["WorkerStats", "AsyncVerificationWorker"]
+__all__ = [
+    "WorkerStats",
+    "AsyncVerificationWorker",
+    "ConcurrentBatchVerifier",
+    "guess_many",
+]
 
 # Processor may be an async callable returning an Awaitable[None] or a sync function.
 Processor = Callable[[Any], Any]
@@ -212,3 +225,222 @@ class AsyncVerificationWorker:
         self.stats.shed += 1
         self.stats.last_shed_reason = reason
         self.stats.shed_samples.append(item)
+
+
+def _guess_one(sniffer: Any, url: str) -> tuple[bool | None, str | None]:
+    try:
+        is_article = sniffer.guess(url)
+    except Exception as exc:
+        return None, str(exc)
+    return (bool(is_article) if is_article is not None else None), None
+
+
+def guess_many(
+    sniffer: Any, urls: Sequence[str]
+) -> list[tuple[bool | None, str | None]]:
+    """Run StorySniffer over ``urls`` with one model prediction.
+
+    Mirrors ``StorySniffer.guess(url)`` (path-only model): the same blacklist
+    short-circuits and whitelist/blacklist overrides are applied per URL, but
+    the model scores all remaining paths in a single DataFrame. Sniffers that
+    do not expose ``path_only_model`` are called URL by URL.
+
+    Returns ``(is_article, error)`` tuples aligned with ``urls``.
+    """
+    model = getattr(sniffer, "path_only_model", None)
+    if model is None:
+        return [_guess_one(sniffer, url) for url in urls]
+
+    try:
+        import pandas as pd
+        import tldextract
+    except ImportError:  # pragma: no cover - storysniffer depends on both
+        return [_guess_one(sniffer, url) for url in urls]
+
+    outcomes: list[tuple[bool | None, str | None] | None] = [None] * len(urls)
+    pending: list[int] = []
+    paths: list[str] = []
+    for index, url in enumerate(urls):
+        try:
+            if not url or pd.isnull(url) or not url.strip():
+                outcomes[index] = (False, None)
+                continue
+            path = urlparse(url).path
+            tld = tldextract.extract(url)
+            if (
+                tld.domain in sniffer.DOMAIN_BLACKLIST
+                or tld.subdomain in sniffer.SUBDOMAIN_BLACKLIST
+                or path in sniffer.PATH_BLACKLIST
+                or os.path.splitext(path)[1] in sniffer.EXT_BLACKLIST
+            ):
+                outcomes[index] = (False, None)
+                continue
+        except Exception as exc:
+            outcomes[index] = (None, str(exc))
+            continue
+        pending.append(index)
+        paths.append(path)
+
+    if pending:
+        try:
+            predictions = model.predict(
+                pd.DataFrame({"path": paths, "text": [None] * len(paths)})
+            )
+        except Exception:
+            # Fall back to per-URL calls so errors are attributed correctly
+            for index in pending:
+                outcomes[index] = _guess_one(sniffer, urls[index])
+        else:
+            for index, path, raw in zip(pending, paths, predictions, strict=True):
+                prediction = bool(raw == 1)
+                if (
+                    not prediction
+                    and path.startswith(sniffer.PATHPART_WHITELIST)
+                    and len(path) > 10
+                    and ("-" in path or path.endswith(".html"))
+                ):
+                    prediction = True
+                elif prediction and path.startswith(sniffer.PATHPART_BLACKLIST):
+                    prediction = False
+                outcomes[index] = (prediction, None)
+
+    return [outcome or (None, "no verdict") for outcome in outcomes]
+
+
+def _interleave_by_host(items: Sequence[tuple[int, str]]) -> list[tuple[int, str]]:
+    """Round-robin items across hosts so one busy host cannot starve others."""
+    by_host: dict[str, deque[tuple[int, str]]] = {}
+    for item in items:
+        by_host.setdefault(urlparse(item[1]).netloc.lower(), deque()).append(item)
+    ordered: list[tuple[int, str]] = []
+    queues = list(by_host.values())
+    while queues:
+        for queue in queues:
+            ordered.append(queue.popleft())
+        queues = [queue for queue in queues if queue]
+    return ordered
+
+
+class ConcurrentBatchVerifier:
+    """Verify a batch of URLs with concurrent HTTP checks and batched sniffing.
+
+    ``service`` is a :class:`~src.services.url_verification.URLVerificationService`
+    (duck-typed): its URL screening, HTTP health check, StorySniffer instance
+    and ``run_http_precheck`` flag are reused so results carry exactly the
+    same fields and meaning as ``verify_url``.
+    """
+
+    def __init__(
+        self,
+        service: Any,
+        *,
+        concurrency: int = 8,
+        per_host_concurrency: int = 2,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if per_host_concurrency < 1:
+            raise ValueError("per_host_concurrency must be at least 1")
+        self.service = service
+        self.concurrency = concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self._logger = logger or logging.getLogger(
+            f"{__name__}.ConcurrentBatchVerifier"
+        )
+        self.last_worker_stats: WorkerStats | None = None
+
+    def verify(self, urls: Sequence[str]) -> list[dict | None]:
+        """Return verification results aligned with ``urls``.
+
+        An entry is None only when the HTTP worker shed the URL; callers
+        should leave such candidates untouched so a later batch retries them.
+        """
+        results: list[dict | None] = list(self.service.screen_urls(urls))
+        started = {index: time.time() for index, r in enumerate(results) if r is None}
+        for index in started:
+            results[index] = self.service._new_result(urls[index])
+
+        to_sniff = list(started)
+        if self.service.run_http_precheck and to_sniff:
+            checks = asyncio.run(
+                self._run_http_checks([(index, urls[index]) for index in to_sniff])
+            )
+            to_sniff = []
+            for index in started:
+                result = results[index]
+                outcome = checks.get(index)
+                if outcome is None:
+                    results[index] = None
+                    continue
+                ok, status_code, error_msg, attempts = outcome
+                result["http_status"] = status_code
+                result["http_attempts"] = attempts
+                if ok:
+                    to_sniff.append(index)
+                else:
+                    result["error"] = error_msg
+                    result["verification_time_ms"] = (
+                        time.time() - started[index]
+                    ) * 1000
+
+        if to_sniff:
+            verdicts = guess_many(
+                self.service.sniffer, [urls[index] for index in to_sniff]
+            )
+            finished = time.time()
+            for index, (is_article, error) in zip(to_sniff, verdicts, strict=True):
+                result = results[index]
+                result["storysniffer_result"] = is_article
+                result["error"] = error
+                result["verification_time_ms"] = (finished - started[index]) * 1000
+
+        return results
+
+    async def _run_http_checks(
+        self, items: Sequence[tuple[int, str]]
+    ) -> dict[int, tuple[bool, int | None, str | None, int]]:
+        loop = asyncio.get_running_loop()
+        outcomes: dict[int, tuple[bool, int | None, str | None, int]] = {}
+        host_limits: dict[str, asyncio.Semaphore] = {}
+
+        def check(url: str) -> tuple[bool, int | None, str | None, int]:
+            try:
+                return self.service._check_http_health(url)
+            except Exception as exc:
+                return False, None, str(exc), 0
+
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="verify-http"
+        ) as executor:
+
+            async def process(item: tuple[int, str]) -> None:
+                index, url = item
+                host = urlparse(url).netloc.lower()
+                limit = host_limits.get(host)
+                if limit is None:
+                    limit = host_limits[host] = asyncio.Semaphore(
+                        self.per_host_concurrency
+                    )
+                async with limit:
+                    outcomes[index] = await loop.run_in_executor(executor, check, url)
+
+            worker = AsyncVerificationWorker(
+                process,
+                max_queue_size=len(items) + 1,
+                concurrency=self.concurrency,
+                logger=self._logger,
+            )
+            await worker.start()
+            for item in _interleave_by_host(items):
+                await worker.submit(item)
+            await worker.stop()
+
+        self.last_worker_stats = worker.stats
+        if worker.stats.shed:
+            self._logger.warning(
+                "Shed %s URL checks (%s); they stay queued for the next batch",
+                worker.stats.shed,
+                worker.stats.last_shed_reason,
+            )
+        return outcomes
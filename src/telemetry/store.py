@@ -75,10 +75,7 @@ def _determine_default_database_url() -> str:
             DATABASE_PASSWORD,
         )
         from src.config import DATABASE_URL as CONFIG_DATABASE_URL
-        from src.config import (
-            DATABASE_USER,
-            USE_CLOUD_SQL_CONNECTOR,
-        )
+        from src.config import DATABASE_USER, USE_CLOUD_SQL_CONNECTOR
 
         # If using Cloud SQL Connector, build PostgreSQL URL
         if (
@@ -178,6 +175,13 @@ def _mask_database_url(url: str | None) -> str:
         return "<redacted>"
 
 
+def _compile_statement(sql: str):
+    """Return the shared cached ``?`` -> ``:pN`` rewrite for ``sql``."""
+    from src.models.database import compile_statement
+
+    return compile_statement(sql)
+
+
 class _ConnectionWrapper:
     """Wrapper that makes SQLAlchemy Connection behave like sqlite3.Connection.
 
@@ -197,15 +201,12 @@ class _ConnectionWrapper:
                 # Named parameters: already in SQLAlchemy format
                 result = self._conn.execute(text(sql), parameters)
             else:
-                # Positional parameters: Replace ? with :param0, :param1, etc.
-                param_count = sql.count("?")
-                if param_count > 0:
-                    adapted_sql = sql
-                    params_dict = {}
-                    for i, value in enumerate(parameters):
-                        adapted_sql = adapted_sql.replace("?", f":param{i}", 1)
-                        params_dict[f"param{i}"] = value
-                    result = self._conn.execute(text(adapted_sql), params_dict)
+                # Positional parameters: ? becomes :p0, :p1, ... (cached)
+                statement = _compile_statement(sql)
+                if statement.marker == "?":
+                    result = self._conn.execute(
+                        statement.clause, statement.bind(parameters)
+                    )
                 else:
                     result = self._conn.execute(text(sql), parameters)
         else:
@@ -252,15 +253,14 @@ class _CursorWrapper:
                 # Named parameters: already in SQLAlchemy format
                 self._last_result = self._conn.execute(text(sql), parameters)
             else:
-                # Positional parameters: Replace ? with :param0, :param1, etc.
-                adapted_sql = sql
-                params_dict = {}
-                param_count = sql.count("?")
-                for i in range(param_count):
-                    if i < len(parameters):
-                        adapted_sql = adapted_sql.replace("?", f":param{i}", 1)
-                        params_dict[f"param{i}"] = parameters[i]
-                self._last_result = self._conn.execute(text(adapted_sql), params_dict)
+                # Positional parameters: ? becomes :p0, :p1, ... (cached)
+                statement = _compile_statement(sql)
+                if statement.marker == "?":
+                    self._last_result = self._conn.execute(
+                        statement.clause, statement.bind(parameters)
+                    )
+                else:
+                    self._last_result = self._conn.execute(text(sql), {})
         else:
             self._last_result = self._conn.execute(text(sql))
 
@@ -269,6 +269,18 @@ class _CursorWrapper:
         self._rowcount = getattr(self._last_result, "rowcount", -1)
         return self._result_wrapper
 
+    def executemany(self, sql: str, seq_of_parameters) -> None:
+        """Execute ``sql`` once per parameter tuple in a single batch."""
+        rows = list(seq_of_parameters)
+        if not rows:
+            return
+        statement = _compile_statement(sql)
+        self._last_result = self._conn.execute(
+            statement.clause, [statement.bind(row) for row in rows]
+        )
+        self._result_wrapper = None
+        self._rowcount = getattr(self._last_result, "rowcount", -1)
+
     def fetchone(self):
         """Fetch one row from the last executed statement."""
         if self._result_wrapper is None:
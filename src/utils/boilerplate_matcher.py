@@ -0,0 +1,135 @@
+"""
+Compiled persistent boilerplate patterns for ``BalancedBoundaryContentCleaner``.
+
+The cleaner used to load a domain's stored patterns for every article, then
+re-classify each one (wire-service evidence, high-confidence boilerplate)
+and search the article once per pattern. ``PersistentPatternSet`` does the
+classification once per domain and folds the removable patterns into a
+single trie-shaped regex, so an article is scanned once for all of them.
+
+- ``compile_literal_trie`` builds that regex: patterns sharing a prefix
+  share a branch, so at each position the engine follows one path through
+  the trie instead of trying every pattern in turn.
+- ``PersistentPatternSet`` holds the classified patterns for one domain and
+  removes every occurrence in one pass.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+_END = ""
+
+
+def _trie_to_regex(node: dict[str, Any]) -> str:
+    branches = []
+    for char, child in sorted((k, v) for k, v in node.items() if k != _END):
+        # Collapse single-child chains into one literal run
+        run = [char]
+        while len(child) == 1 and _END not in child:
+            ((char, child),) = child.items()
+            run.append(char)
+        branch = re.escape("".join(run))
+        if any(key != _END for key in child):
+            rest = _trie_to_regex(child)
+            branch += f"(?:{rest})?" if _END in child else rest
+        branches.append(branch)
+    return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+
+def compile_literal_trie(literals: Iterable[str]) -> re.Pattern | None:
+    """One regex matching any of ``literals``, preferring the longest.
+
+    Returns ``None`` when there is nothing to match.
+    """
+    root: dict[str, Any] = {}
+    for literal in literals:
+        if not literal:
+            continue
+        node = root
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[_END] = True
+    if not root:
+        return None
+    return re.compile(_trie_to_regex(root))
+
+
+@dataclass
+class PersistentPatternSet:
+    """A domain's persistent patterns, classified and compiled once.
+
+    ``removable`` holds the patterns that pass the length/high-confidence
+    filter, in priority order (confidence, then occurrences).
+    ``wire_pattern`` and ``wire_detected`` record the first pattern (of all
+    the domain's patterns, in the same order) that carries wire-service
+    evidence. ``version`` is the telemetry pattern version the set was
+    built from and ``fingerprint`` the stored patterns' fingerprint
+    (``ContentCleaningTelemetry.persistent_patterns_fingerprint``).
+    """
+
+    removable: list[dict[str, Any]]
+    wire_pattern: dict[str, Any] | None = None
+    wire_detected: dict[str, Any] | None = None
+    version: int = 0
+    fingerprint: tuple | None = None
+    _regex: re.Pattern | None = field(init=False, repr=False)
+    _priority: dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._priority = {}
+        for index, pattern in enumerate(self.removable):
+            self._priority.setdefault(pattern["text_content"], index)
+        self._regex = compile_literal_trie(self._priority)
+
+    def remove(self, text: str) -> tuple[str, list[dict[str, Any]]]:
+        """Remove every occurrence of every removable pattern from ``text``.
+
+        Returns the cleaned text and one removal record per pattern found,
+        in priority order. Each record's ``position`` is where the pattern
+        first occurred once the higher-priority patterns had been removed,
+        matching the one-pattern-at-a-time removal this replaces. Where two
+        patterns overlap in the text the longer one is removed.
+        """
+        if self._regex is None:
+            return text, []
+
+        matches = [
+            (match.start(), match.end(), self._priority[match.group()])
+            for match in self._regex.finditer(text)
+        ]
+        if not matches:
+            return text, []
+
+        pieces = []
+        previous_end = 0
+        first_start: dict[int, int] = {}
+        for start, end, priority in matches:
+            pieces.append(text[previous_end:start])
+            previous_end = end
+            first_start.setdefault(priority, start)
+        pieces.append(text[previous_end:])
+
+        removals = []
+        for priority in sorted(first_start):
+            start = first_start[priority]
+            shift = sum(
+                end - begin
+                for begin, end, other in matches
+                if other < priority and end <= start
+            )
+            pattern = self.removable[priority]
+            removals.append(
+                {
+                    "text": pattern["text_content"],
+                    "position": start - shift,
+                    "confidence_score": pattern["confidence_score"],
+                    "occurrences_total": pattern["occurrences_total"],
+                    "pattern_type": pattern["pattern_type"],
+                    "removal_reason": pattern["removal_reason"],
+                }
+            )
+        return "".join(pieces), removals
@@ -0,0 +1,272 @@
+"""
+Memoization for ``BylineCleaner`` results.
+
+The same raw bylines ("By Staff Reports", a publisher's regular reporters)
+repeat thousands of times, and every repeat used to run the full cleaning
+pipeline. ``BylineCache`` keeps results keyed by
+(normalized raw byline, source name, source canonical name, cleaner
+version, fingerprint of the publication and organization names) in an
+in-process LRU, optionally backed by the ``byline_cleaning_cache`` table
+so warm results survive restarts and are shared between workers. A name
+list change gives new keys, so stored rows cleaned against the old names
+are no longer read.
+
+Cached values are plain JSON-serializable dicts produced by
+``BylineCleaner``; this module does not interpret them.
+
+Configuration (read by ``BylineCache.from_env``):
+    BYLINE_CACHE_SIZE: in-process entries, 0 disables caching (default 20000)
+    BYLINE_CACHE_PERSISTENT: "1"/"true" to read and write the database table
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import select
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[str, str, str, str, str]
+
+DEFAULT_CACHE_SIZE = 20000
+PERSISTENT_CHUNK_SIZE = 500
+
+
+def normalize_byline(byline: str) -> str:
+    """Collapse whitespace so formatting-only variants share an entry."""
+    return " ".join(byline.split())
+
+
+def byline_cache_key(
+    byline: str,
+    source_name: str | None,
+    source_canonical_name: str | None,
+    cleaner_version: str,
+    names_fingerprint: str = "",
+) -> CacheKey:
+    return (
+        normalize_byline(byline),
+        source_name or "",
+        source_canonical_name or "",
+        cleaner_version,
+        names_fingerprint,
+    )
+
+
+def names_fingerprint(names: Iterable[Any]) -> str:
+    """Short order-independent digest of a name set, for cache keys."""
+    digest = hashlib.sha256("\n".join(sorted(map(str, names))).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _digest(key: CacheKey) -> str:
+    return hashlib.sha256("\x1f".join(key).encode("utf-8")).hexdigest()
+
+
+class BylineCacheStore:
+    """Read/write cached results in the ``byline_cleaning_cache`` table."""
+
+    def __init__(self, engine=None):
+        self._engine = engine
+        self.disabled = False
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from src.models.database import DatabaseManager
+
+            self._engine = DatabaseManager().engine
+        return self._engine
+
+    @property
+    def table(self):
+        from src.models import BylineCleaningCache
+
+        return BylineCleaningCache.__table__
+
+    def load_many(self, keys: Iterable[CacheKey]) -> dict[CacheKey, dict]:
+        """Return stored results for whichever ``keys`` exist."""
+        by_digest = {_digest(key): key for key in keys}
+        if self.disabled or not by_digest:
+            return {}
+        table = self.table
+        digests = list(by_digest)
+        found: dict[CacheKey, dict] = {}
+        try:
+            with self.engine.connect() as conn:
+                for start in range(0, len(digests), PERSISTENT_CHUNK_SIZE):
+                    chunk = digests[start : start + PERSISTENT_CHUNK_SIZE]
+                    rows = conn.execute(
+                        select(table.c.cache_key, table.c.result).where(
+                            table.c.cache_key.in_(chunk)
+                        )
+                    )
+                    for digest, result in rows:
+                        if isinstance(result, dict):
+                            found[by_digest[digest]] = result
+        except Exception as exc:
+            self._disable(exc)
+        return found
+
+    def save_many(self, items: dict[CacheKey, dict]) -> None:
+        """Store results, keeping whichever row another worker wrote first."""
+        if self.disabled or not items:
+            return
+        rows = [
+            {
+                "cache_key": _digest(key),
+                "raw_byline": key[0],
+                "source_name": key[1] or None,
+                "source_canonical_name": key[2] or None,
+                "cleaner_version": key[3],
+                "result": value,
+            }
+            for key, value in items.items()
+        ]
+        try:
+            with self.engine.begin() as conn:
+                statement = self._insert_ignoring_duplicates(conn.dialect.name)
+                if statement is None:
+                    existing = self.load_many(items)
+                    rows = [
+                        row
+                        for key, row in zip(items, rows, strict=True)
+                        if key not in existing
+                    ]
+                    statement = self.table.insert()
+                for start in range(0, len(rows), PERSISTENT_CHUNK_SIZE):
+                    chunk = rows[start : start + PERSISTENT_CHUNK_SIZE]
+                    if chunk:
+                        conn.execute(statement, chunk)
+        except Exception as exc:
+            self._disable(exc)
+
+    def _insert_ignoring_duplicates(self, dialect_name: str):
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect_name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            return None
+        return insert(self.table).on_conflict_do_nothing(index_elements=["cache_key"])
+
+    def _disable(self, exc: Exception) -> None:
+        # A missing table (migration not applied) or an unreachable database
+        # must not break cleaning; fall back to the in-process cache.
+        self.disabled = True
+        logger.warning("Persistent byline cache disabled: %s", exc)
+
+
+class BylineCache:
+    """Thread-safe LRU of byline cleaning results with an optional store."""
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        store: BylineCacheStore | None = None,
+    ):
+        self.maxsize = maxsize
+        self.store = store
+        self._entries: OrderedDict[CacheKey, dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_env(cls) -> BylineCache:
+        maxsize = int(os.getenv("BYLINE_CACHE_SIZE", str(DEFAULT_CACHE_SIZE)))
+        persistent = os.getenv("BYLINE_CACHE_PERSISTENT", "").lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+        return cls(maxsize, BylineCacheStore() if persistent else None)
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def get(self, key: CacheKey) -> dict | None:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[CacheKey]) -> dict[CacheKey, dict]:
+        """Look ``keys`` up in memory, then in one store round trip.
+
+        Returned values are copies and may be mutated by the caller.
+        """
+        if not self.enabled:
+            return {}
+        found: dict[CacheKey, dict] = {}
+        missing: list[CacheKey] = []
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                value = self._entries.get(key)
+                if value is None:
+                    missing.append(key)
+                    continue
+                self._entries.move_to_end(key)
+                self.hits += 1
+                found[key] = value
+
+        if missing and self.store is not None:
+            stored = self.store.load_many(missing)
+            with self._lock:
+                self.persistent_hits += len(stored)
+                for key, value in stored.items():
+                    self._remember(key, value)
+            found.update(stored)
+
+        with self._lock:
+            self.misses += len(missing) - sum(key in found for key in missing)
+        return {key: copy.deepcopy(value) for key, value in found.items()}
+
+    def put(self, key: CacheKey, value: dict) -> None:
+        self.put_many({key: value})
+
+    def put_many(self, items: dict[CacheKey, dict]) -> None:
+        if not self.enabled or not items:
+            return
+        items = {key: copy.deepcopy(value) for key, value in items.items()}
+        with self._lock:
+            for key, value in items.items():
+                self._remember(key, value)
+        if self.store is not None:
+            self.store.save_many(items)
+
+    def _remember(self, key: CacheKey, value: dict) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop in-process entries; stored rows and counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.persistent_hits + self.misses
+            return {
+                "hits": self.hits,
+                "persistent_hits": self.persistent_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "persistent": self.store is not None and not self.store.disabled,
+                "hit_rate": (
+                    (self.hits + self.persistent_hits) / lookups if lookups else 0.0
+                ),
+            }
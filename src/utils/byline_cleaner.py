@@ -7,21 +7,40 @@ Byline cleaning utility for news articles.
 # incrementally improve typing in higher-priority modules.
 # mypy: ignore-errors
 
+import copy
 import json
 import logging
 import re
 from difflib import SequenceMatcher
 from typing import Any
 
+from .byline_cache import BylineCache, byline_cache_key, names_fingerprint
+from .byline_matcher import NameSpanIndex, WireServiceMatcher, compile_alternation
+
 # Import telemetry system
 from .byline_telemetry import BylineCleaningTelemetry
 
 logger = logging.getLogger(__name__)
 
+# Trailing noise removed by ``_remove_patterns`` after the byline patterns
+_DOMAIN_SUFFIX_PATTERNS = (
+    re.compile(r"\s*[•·]\s*@?\w*\.com\b.*$", re.IGNORECASE),
+    re.compile(r"\s*[•·]\s*@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}.*$", re.IGNORECASE),
+)
+_TRAILING_EMAIL_DOMAIN = re.compile(r"\s*@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}.*$")
+_TRAILING_TLD = re.compile(r"\s*\.\s*(com|org|net|edu|gov).*$", re.IGNORECASE)
+_PARENTHETICAL = re.compile(r"\([^)]*\)")
+_BRACKETED = re.compile(r"\[[^\]]*\]")
+_WHITESPACE = re.compile(r"\s+")
+
 
 class BylineCleaner:
     """Clean and normalize author bylines from news articles."""
 
+    # Part of every cache key; bump whenever cleaning rules change so that
+    # persisted results from older rules are no longer used.
+    CLEANER_VERSION = "2026.10.1"
+
     # Common titles and job descriptions to remove
     TITLES_TO_REMOVE = {
         # Basic titles
@@ -467,8 +486,21 @@ class BylineCleaner:
         " + ",
     ]
 
-    def __init__(self, enable_telemetry: bool = True):
-        """Initialize the byline cleaner."""
+    def __init__(
+        self,
+        enable_telemetry: bool = True,
+        cache: BylineCache | None = None,
+        reference_data=None,
+    ):
+        """Initialize the byline cleaner.
+
+        Args:
+            enable_telemetry: Record cleaning sessions and steps
+            cache: Result cache; defaults to ``BylineCache.from_env()``
+            reference_data: Optional ``ReferenceDataRegistry`` supplying
+                publication and organization names instead of per-cleaner
+                database queries
+        """
         # Compile regex patterns for efficiency
         self.compiled_patterns = [
             re.compile(pattern, re.IGNORECASE) for pattern in self.BYLINE_PATTERNS
@@ -482,6 +514,18 @@ class BylineCleaner:
         )
         self.title_pattern = re.compile(titles_pattern, re.IGNORECASE)
 
+        # One scan decides whether any removal pattern applies at all
+        self.removal_precheck = compile_alternation(
+            self.BYLINE_PATTERNS[4:], re.IGNORECASE
+        )
+        self.wire_matcher = WireServiceMatcher(self.WIRE_SERVICES)
+
+        # Name n-gram index, rebuilt when the name sets are reloaded;
+        # _names_generation is bumped by every reload
+        self._name_index: NameSpanIndex | None = None
+        self._name_index_generation: int | None = None
+        self._names_generation = 0
+
         # Initialize telemetry
         self.telemetry = BylineCleaningTelemetry(enable_telemetry=enable_telemetry)
 
@@ -493,12 +537,24 @@ class BylineCleaner:
         self._organization_cache: set[Any] | None = None
         self._organization_cache_timestamp: float | None = None
 
+        # Digests of the loaded name sets; part of every result cache key
+        self._publication_fingerprint = ""
+        self._organization_fingerprint = ""
+
+        # Shared reference data and the snapshots the name caches came from
+        self.reference_data = reference_data
+        self._publication_snapshot = None
+        self._organization_snapshot = None
+
         # Wire service detection tracking
         self._detected_wire_services: list[Any] = []
 
         # Current source name for wire service filtering
         self._current_source_name: str | None = None
 
+        # Memoized results keyed by normalized byline and source
+        self.cache = cache if cache is not None else BylineCache.from_env()
+
     def clean_byline(
         self,
         byline: str,
@@ -512,6 +568,10 @@ class BylineCleaner:
         """
         Clean a raw byline string with comprehensive telemetry.
 
+        Results are memoized per (normalized byline, source name, source
+        canonical name, cleaner version); a repeat skips the pipeline and
+        records a single ``cache_lookup`` telemetry step.
+
         Args:
             byline: Raw byline text from article
             return_json: If True, return detailed JSON with metadata
@@ -526,6 +586,141 @@ class BylineCleaner:
             When return_json=True, includes wire_service_detected flag for
             downstream article classification.
         """
+        telemetry_context = {
+            "article_id": article_id,
+            "candidate_link_id": candidate_link_id,
+            "source_id": source_id,
+        }
+        key = self._cache_key(byline, source_name, source_canonical_name)
+        cached = self.cache.get(key) if key else None
+        if cached is not None:
+            return self._replay_cached(
+                cached,
+                byline,
+                return_json,
+                source_name,
+                source_canonical_name,
+                telemetry_context,
+            )
+
+        entry = self._clean_and_describe(
+            byline, source_name, source_canonical_name, telemetry_context
+        )
+        if key and entry["cacheable"]:
+            self.cache.put(key, entry["value"])
+        return self._cached_result(entry["value"], return_json)
+
+    def _cache_key(
+        self,
+        byline: str | None,
+        source_name: str | None,
+        source_canonical_name: str | None,
+    ):
+        if not self.cache.enabled or not isinstance(byline, str):
+            return None
+        return byline_cache_key(
+            byline,
+            source_name,
+            source_canonical_name,
+            self.CLEANER_VERSION,
+            self._names_fingerprint(),
+        )
+
+    def _names_fingerprint(self) -> str:
+        """Digest of the current publication and organization names.
+
+        Loads (or refreshes) the names first, so persisted results cleaned
+        against older name lists are not reused.
+        """
+        self.get_publication_names()
+        self.get_organization_names()
+        return f"{self._publication_fingerprint}{self._organization_fingerprint}"
+
+    def _clean_and_describe(
+        self,
+        byline: str,
+        source_name: str | None,
+        source_canonical_name: str | None,
+        telemetry_context: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Run the full pipeline and package the outcome for the cache."""
+        self.telemetry.last_outcome = None
+        result = self._clean_byline_uncached(
+            byline,
+            return_json=True,
+            source_name=source_name,
+            source_canonical_name=source_canonical_name,
+            **telemetry_context,
+        )
+        outcome = getattr(self.telemetry, "last_outcome", None)
+        return {
+            "value": {
+                "result": result,
+                "detected_wire_services": list(self._detected_wire_services),
+                "outcome": outcome if isinstance(outcome, dict) else {},
+            },
+            # Errors may be transient (e.g. database lookups); retry them
+            "cacheable": isinstance(outcome, dict)
+            and outcome.get("cleaning_method") != "error_fallback",
+        }
+
+    def _replay_cached(
+        self,
+        value: dict[str, Any],
+        byline: str,
+        return_json: bool,
+        source_name: str | None,
+        source_canonical_name: str | None,
+        telemetry_context: dict[str, Any],
+    ) -> list[str] | dict:
+        """Restore per-call state from a cached result and record it."""
+        self._detected_wire_services = list(value.get("detected_wire_services", []))
+        self._current_source_name = source_canonical_name or source_name
+        result = value["result"]
+        outcome = value.get("outcome", {})
+
+        self.telemetry.start_cleaning_session(
+            raw_byline=byline,
+            source_name=source_name,
+            source_canonical_name=source_canonical_name,
+            **telemetry_context,
+        )
+        self.telemetry.log_transformation_step(
+            step_name="cache_lookup",
+            input_text=byline,
+            output_text=str(result.get("authors", [])),
+            transformation_type="cache_hit",
+            notes=f"Reused {outcome.get('cleaning_method', 'unknown')} result",
+        )
+        self.telemetry.finalize_cleaning_session(
+            final_authors=list(result.get("authors", [])),
+            cleaning_method=outcome.get("cleaning_method", "cached"),
+            likely_valid_authors=outcome.get("likely_valid_authors"),
+            likely_noise=outcome.get("likely_noise"),
+            requires_manual_review=outcome.get("requires_manual_review"),
+        )
+        return self._cached_result(value, return_json)
+
+    @staticmethod
+    def _cached_result(value: dict[str, Any], return_json: bool) -> list[str] | dict:
+        result = value["result"]
+        return result if return_json else list(result.get("authors", []))
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Hit/miss counters for the byline result cache."""
+        return self.cache.stats()
+
+    def _clean_byline_uncached(
+        self,
+        byline: str,
+        return_json: bool = False,
+        source_name: str | None = None,
+        article_id: str | None = None,
+        candidate_link_id: str | None = None,
+        source_id: str | None = None,
+        source_canonical_name: str | None = None,
+    ) -> list[str] | dict:
+        """Run the full cleaning pipeline; see ``clean_byline``."""
         # Start telemetry session
         self.telemetry.start_cleaning_session(
             raw_byline=byline,
@@ -1020,73 +1215,29 @@ class BylineCleaner:
                 byline_lower = byline_lower[len(prefix) :].strip()
 
         # Check if the byline matches known wire services
-        for wire_service in self.WIRE_SERVICES:
-            if byline_lower == wire_service or byline_lower.startswith(
-                wire_service + " "
-            ):
-                # Track detected wire service with normalization
-                normalized_service = self._normalize_wire_service(wire_service)
-                self._detected_wire_services.append(normalized_service)
-                return True
+        wire_service = self.wire_matcher.prefix(byline_lower)
+        if wire_service:
+            # Track detected wire service with normalization
+            normalized_service = self._normalize_wire_service(wire_service)
+            self._detected_wire_services.append(normalized_service)
+            return True
 
         # Check for common wire service patterns
-        wire_patterns = [
-            (
-                r"^(ap|reuters|bloomberg|cnn|npr|pbs)$",
-                "AP/Reuters/Bloomberg/CNN/NPR/PBS",
-            ),
-            (
-                r"^(the\s+)?(associated\s+press|new\s+york\s+times|"
-                r"washington\s+post)$",
-                "Major Publication",
-            ),
-            (
-                r"^(usa\s+today|wall\s+street\s+journal|" r"los\s+angeles\s+times)$",
-                "National Publication",
-            ),
-        ]
-
-        for pattern, service_category in wire_patterns:
-            if re.match(pattern, byline_lower):
-                # Extract the actual matched service
-                match = re.match(pattern, byline_lower)
-                if match:
-                    matched_service = match.group(0)
-                    normalized_service = self._normalize_wire_service(matched_service)
-                    self._detected_wire_services.append(normalized_service)
-                else:
-                    self._detected_wire_services.append(service_category)
-                return True
+        matched_service = self.wire_matcher.full(byline_lower)
+        if matched_service:
+            normalized_service = self._normalize_wire_service(matched_service)
+            self._detected_wire_services.append(normalized_service)
+            return True
 
         # Check for syndicated byline patterns: "Person Name USA TODAY" etc.
         # These indicate the story is syndicated when the publication is NOT
         # that service
-        syndicated_suffix_patterns = [
-            (r"\busa\s+today\s*$", "USA TODAY"),
-            (r"\bwall\s+street\s+journal\s*$", "Wall Street Journal"),
-            (r"\b(the\s+)?new\s+york\s+times\s*$", "The New York Times"),
-            (r"\b(the\s+)?washington\s+post\s*$", "The Washington Post"),
-            (r"\blos\s+angeles\s+times\s*$", "Los Angeles Times"),
-            (r"\bassociated\s+press\s*$", "The Associated Press"),
-            (r"\breuters\s*$", "Reuters"),
-            (r"\bbloomberg\s*$", "Bloomberg"),
-            (r"\bcnn\s*$", "CNN NewsSource"),
-            (r"\bnpr\s*$", "NPR"),
-            (r"\bstates\s+newsroom\s*$", "States Newsroom"),
-            (r"\bkansas\s+reflector\s*$", "States Newsroom"),
-            (r"\bkansasreflector\s*$", "States Newsroom"),
-            (r"\b(the\s+)?missouri\s+independent\s*$", "The Missouri Independent"),
-            (r"\bmissouriindependent\s*$", "The Missouri Independent"),
-            (r"\bwave\s*$", "WAVE"),
-            (r"\bwave3\s*$", "WAVE"),
-        ]
-
-        for pattern, service_name in syndicated_suffix_patterns:
-            if re.search(pattern, byline_lower):
-                # Track the detected wire service
-                normalized_service = self._normalize_wire_service(service_name)
-                self._detected_wire_services.append(normalized_service)
-                return True
+        service_name = self.wire_matcher.suffix(byline_lower)
+        if service_name:
+            # Track the detected wire service
+            normalized_service = self._normalize_wire_service(service_name)
+            self._detected_wire_services.append(normalized_service)
+            return True
 
         return False
 
@@ -1337,30 +1488,33 @@ class BylineCleaner:
 
     def _remove_patterns(self, text: str) -> str:
         """Remove unwanted patterns like emails, phones, etc."""
-        # Skip byline extraction patterns
-        for pattern in self.compiled_patterns[4:]:
-            text = pattern.sub("", text)
+        # Skip byline extraction patterns. Each pass can expose text for the
+        # next, so run them in order, but only when one of them matches.
+        if self.removal_precheck.search(text):
+            for pattern in self.compiled_patterns[4:]:
+                text = pattern.sub("", text)
 
         # Remove domain suffixes (e.g., "• @domain.com", "• .com")
-        text = re.sub(r"\s*[•·]\s*@?\w*\.com\b.*$", "", text, flags=re.IGNORECASE)
-        text = re.sub(
-            r"\s*[•·]\s*@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}.*$", "", text, flags=re.IGNORECASE
-        )
+        if "•" in text or "·" in text:
+            for pattern in _DOMAIN_SUFFIX_PATTERNS:
+                text = pattern.sub("", text)
 
         # Remove trailing email domains and handles
-        text = re.sub(r"\s*@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}.*$", "", text)
-        text = re.sub(
-            r"\s*\.\s*(com|org|net|edu|gov).*$", "", text, flags=re.IGNORECASE
-        )
+        if "@" in text:
+            text = _TRAILING_EMAIL_DOMAIN.sub("", text)
+        if "." in text:
+            text = _TRAILING_TLD.sub("", text)
 
         # Remove parenthetical information
-        text = re.sub(r"\([^)]*\)", "", text)
+        if "(" in text:
+            text = _PARENTHETICAL.sub("", text)
 
         # Remove bracketed information
-        text = re.sub(r"\[[^\]]*\]", "", text)
+        if "[" in text:
+            text = _BRACKETED.sub("", text)
 
         # Clean up extra spaces
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _WHITESPACE.sub(" ", text).strip()
 
         return text
 
@@ -1680,17 +1834,7 @@ class BylineCleaner:
             return ""
 
         words = text.split()
-        publication_names = self.get_publication_names()
-        organization_names = self.get_organization_names()
-
-        # Combine all organization names for matching
-        all_org_names = set()
-        all_org_names.update(publication_names)
-        all_org_names.update(organization_names)
-        all_org_names.update(self.WIRE_SERVICES)  # Add wire services!
-
-        # Convert to lowercase for case-insensitive matching
-        org_names_lower = {name.lower() for name in all_org_names}
+        name_index = self._get_name_index()
 
         # STEP 1: ORGANIZATION/PUBLICATION DETECTION (Priority)
         # Check for complete publication/organization matches first
@@ -1698,69 +1842,27 @@ class BylineCleaner:
         text_words = text_lower.split()
         spans_to_remove = []
 
-        # Check for multi-word organization matches ONLY (minimum 2 words)
-        # Single-word matches will be handled in STEP 3 after person name
-        # protection
-        for org_name in org_names_lower:
-            org_words = org_name.split()
-            if len(org_words) >= 2:  # Require at least 2 words
-                # Strategy 1: Try exact match first
-                for start_idx in range(len(text_words) - len(org_words) + 1):
-                    end_idx = start_idx + len(org_words)
-                    text_ngram = text_words[start_idx:end_idx]
-                    if text_ngram == org_words:
-                        # Calculate character positions for span removal
-                        words_before = text_words[:start_idx]
-                        char_start = len(" ".join(words_before))
-                        if words_before:  # Add space if there are words before
-                            char_start += 1
-
-                        # Calculate end position
-                        matched_text = " ".join(text_ngram)
-                        char_end = char_start + len(matched_text)
-
-                        spans_to_remove.append((char_start, char_end))
-
-                        # Track if this was a wire service
-                        if org_name in {ws.lower() for ws in self.WIRE_SERVICES}:
-                            # Find the original wire service name and normalize
-                            # it
-                            for service in self.WIRE_SERVICES:
-                                if service.lower() == org_name:
-                                    normalized_service = self._normalize_wire_service(
-                                        service
-                                    )
-                                    self._detected_wire_services.append(
-                                        normalized_service
-                                    )
-                                    break
-
-                # Strategy 2: Check if text contains a subsequence of org words
-                # (e.g., "missouri independent" matches "the missouri independent")
-                if len(org_words) >= 3:  # Only for longer organization names
-                    # Try all contiguous subsequences of length 2+
-                    for subseq_len in range(2, len(org_words)):
-                        max_start = len(org_words) - subseq_len + 1
-                        for subseq_start in range(max_start):
-                            subseq_end = subseq_start + subseq_len
-                            org_subseq = org_words[subseq_start:subseq_end]
-
-                            # Check if this subsequence appears in text
-                            subseq_max_start = len(text_words) - len(org_subseq) + 1
-                            for start_idx in range(subseq_max_start):
-                                end_idx = start_idx + len(org_subseq)
-                                text_ngram = text_words[start_idx:end_idx]
-                                if text_ngram == org_subseq:
-                                    # Calculate character positions
-                                    words_before = text_words[:start_idx]
-                                    char_start = len(" ".join(words_before))
-                                    if words_before:
-                                        char_start += 1
-
-                                    matched_text = " ".join(text_ngram)
-                                    char_end = char_start + len(matched_text)
-
-                                    spans_to_remove.append((char_start, char_end))
+        # Multi-word organization matches ONLY (minimum 2 words), including
+        # sub-phrases of longer names (e.g., "missouri independent" matches
+        # "the missouri independent"). Single-word matches are handled in
+        # STEP 3 after person name protection.
+        for span in name_index.find(text_words):
+            # Calculate character positions for span removal
+            words_before = text_words[: span.start]
+            char_start = len(" ".join(words_before))
+            if words_before:  # Add space if there are words before
+                char_start += 1
+            matched_text = " ".join(text_words[span.start : span.start + span.length])
+            char_end = char_start + len(matched_text)
+
+            # One span per name entry that produced this phrase
+            spans_to_remove.extend([(char_start, char_end)] * span.count)
+
+            # Track if this was a wire service
+            if span.wire_service:
+                self._detected_wire_services.append(
+                    self._normalize_wire_service(span.wire_service)
+                )
 
         # Apply organization removal spans (prioritized)
         if spans_to_remove:
@@ -1866,6 +1968,22 @@ class BylineCleaner:
 
         return " ".join(filtered_words).strip()
 
+    def _get_name_index(self) -> NameSpanIndex:
+        """N-gram index over publication, organization and wire names."""
+        publication_names = self.get_publication_names()
+        organization_names = self.get_organization_names()
+        generation = self._names_generation
+        if self._name_index is None or generation != self._name_index_generation:
+            all_org_names = set()
+            all_org_names.update(publication_names)
+            all_org_names.update(organization_names)
+            all_org_names.update(self.WIRE_SERVICES)  # Add wire services!
+            self._name_index = NameSpanIndex(
+                {name.lower() for name in all_org_names}, self.WIRE_SERVICES
+            )
+            self._name_index_generation = generation
+        return self._name_index
+
     def _get_known_name_patterns(self) -> dict[str, int]:
         """
         Get patterns of known person names from the database.
@@ -2310,19 +2428,172 @@ class BylineCleaner:
         return self._detected_wire_services[0] if self._detected_wire_services else None
 
     def clean_bulk_bylines(
-        self, bylines: list[str], return_json: bool = False
+        self,
+        bylines: list[str],
+        return_json: bool = False,
+        source_name: str | None = None,
+        source_canonical_name: str | None = None,
     ) -> list[str | dict]:
         """
         Clean multiple bylines in bulk.
 
+        Inputs are deduplicated first: each distinct byline is looked up in
+        the cache once (one database round trip when the persistent cache is
+        enabled), only the misses run the pipeline, and new results are
+        stored together. Telemetry is recorded once per distinct byline.
+
         Args:
             bylines: List of raw byline strings
             return_json: If True, return structured JSON for each
+            source_name: Optional source/publication name shared by the batch
+            source_canonical_name: Canonical source name shared by the batch
 
         Returns:
-            List of cleaned bylines (strings or JSON objects)
+            List of cleaned bylines (strings or JSON objects), in input order
         """
-        return [self.clean_byline(byline, return_json) for byline in bylines]
+        keys = [
+            self._cache_key(byline, source_name, source_canonical_name)
+            for byline in bylines
+        ]
+        if not self.cache.enabled:
+            return [
+                self.clean_byline(
+                    byline,
+                    return_json,
+                    source_name=source_name,
+                    source_canonical_name=source_canonical_name,
+                )
+                for byline in bylines
+            ]
+
+        values = self.cache.get_many(key for key in keys if key)
+        fresh = {}
+        for byline, key in zip(bylines, keys, strict=True):
+            if key is None or key in values or key in fresh:
+                continue
+            entry = self._clean_and_describe(
+                byline, source_name, source_canonical_name, {}
+            )
+            values[key] = entry["value"]
+            if entry["cacheable"]:
+                fresh[key] = entry["value"]
+        self.cache.put_many(fresh)
+
+        results = []
+        for byline, key in zip(bylines, keys, strict=True):
+            if key is None:
+                results.append(self.clean_byline(byline, return_json))
+                continue
+            value = values[key]
+            self._detected_wire_services = list(value["detected_wire_services"])
+            result = self._cached_result(value, return_json)
+            # Repeats must not share one mutable result object
+            results.append(copy.deepcopy(result) if return_json else result)
+        return results
+
+    # Words too common to identify a publication or organization on their own
+    _PUBLICATION_COMMON_WORDS = frozenset(
+        {
+            "the",
+            "and",
+            "news",
+            "daily",
+            "county",
+            "city",
+            "post",
+            "times",
+            "press",
+            "herald",
+            "tribune",
+            "gazette",
+            "journal",
+            "review",
+        }
+    )
+    _ORGANIZATION_COMMON_WORDS = frozenset(
+        {
+            "the",
+            "and",
+            "of",
+            "for",
+            "at",
+            "in",
+            "on",
+            "to",
+            "center",
+            "department",
+            "office",
+            "services",
+        }
+    )
+
+    @classmethod
+    def _expand_publication_names(cls, canonical_names) -> set:
+        """Full canonical names plus their significant (3+ char) words."""
+        publication_names = set()
+        for canonical_name in canonical_names:
+            if canonical_name:
+                # Add full name
+                publication_names.add(canonical_name.lower().strip())
+
+                # Add individual words for partial matching
+                for word in canonical_name.lower().split():
+                    if len(word) >= 3 and word not in cls._PUBLICATION_COMMON_WORDS:
+                        publication_names.add(word)
+        return publication_names
+
+    @classmethod
+    def _expand_organization_names(cls, names) -> set:
+        """Full gazetteer names plus their significant (4+ char) words."""
+        organization_names = set()
+        for name in names:
+            if name and len(name.strip()) >= 3:
+                # Add full name
+                organization_names.add(name.lower().strip())
+
+                # Add individual significant words
+                for word in name.lower().split():
+                    if len(word) >= 4 and word not in cls._ORGANIZATION_COMMON_WORDS:
+                        organization_names.add(word)
+        return organization_names
+
+    def _reference_snapshot(self, force_refresh: bool):
+        if force_refresh:
+            self.reference_data.refresh(force=True)
+        return self.reference_data.snapshot()
+
+    def _store_publication_names(self, publication_names: set, loaded_at: float):
+        # Results computed against the old names may now differ
+        if (
+            self._publication_cache is not None
+            and publication_names != self._publication_cache
+        ):
+            self.cache.clear()
+
+        # Cache the results
+        self._publication_cache = publication_names
+        self._publication_fingerprint = names_fingerprint(publication_names)
+        self._names_generation += 1
+        self._publication_cache_timestamp = loaded_at
+
+        logger.info(f"Loaded {len(publication_names)} publication names")
+
+    def _store_organization_names(self, organization_names: set, loaded_at: float):
+        if (
+            self._organization_cache is not None
+            and organization_names != self._organization_cache
+        ):
+            self.cache.clear()
+
+        self._organization_cache = organization_names
+        self._organization_fingerprint = names_fingerprint(organization_names)
+        self._names_generation += 1
+        self._organization_cache_timestamp = loaded_at
+
+        logger.info(
+            "Loaded %s organization names from gazetteer",
+            len(organization_names),
+        )
 
     def get_publication_names(
         self,
@@ -2331,6 +2602,9 @@ class BylineCleaner:
         """
         Get comprehensive list of publication names from database.
 
+        With a reference data registry the names come from its current
+        snapshot and are re-expanded only when the snapshot changes.
+
         Args:
             force_refresh: Force refresh of cache even if still valid
 
@@ -2343,6 +2617,19 @@ class BylineCleaner:
 
         from src.models.database import DatabaseManager, safe_session_execute
 
+        if self.reference_data is not None:
+            snapshot = self._reference_snapshot(force_refresh)
+            if snapshot is not self._publication_snapshot:
+                if "sources" in snapshot.unavailable:
+                    publication_names = set(self.WIRE_SERVICES)
+                else:
+                    publication_names = self._expand_publication_names(
+                        snapshot.publication_canonical_names()
+                    )
+                self._store_publication_names(publication_names, time.time())
+                self._publication_snapshot = snapshot
+            return self._publication_cache
+
         # Check if cache is still valid (refresh every 1 hour)
         current_time = time.time()
         cache_age = 3600  # 1 hour in seconds
@@ -2356,8 +2643,6 @@ class BylineCleaner:
             return self._publication_cache
 
         # Fetch fresh data from database
-        publication_names = set()
-
         try:
             db = DatabaseManager()
             session = db.session
@@ -2375,34 +2660,7 @@ class BylineCleaner:
                 ),
             )
 
-            for row in result:
-                canonical_name = row[0]
-                if canonical_name:
-                    # Add full name
-                    publication_names.add(canonical_name.lower().strip())
-
-                    # Add individual words for partial matching
-                    words = canonical_name.lower().split()
-                    for word in words:
-                        # Only add significant words (3+ chars, not common)
-                        common_words = {
-                            "the",
-                            "and",
-                            "news",
-                            "daily",
-                            "county",
-                            "city",
-                            "post",
-                            "times",
-                            "press",
-                            "herald",
-                            "tribune",
-                            "gazette",
-                            "journal",
-                            "review",
-                        }
-                        if len(word) >= 3 and word not in common_words:
-                            publication_names.add(word)
+            publication_names = self._expand_publication_names(row[0] for row in result)
 
             session.close()
 
@@ -2411,11 +2669,7 @@ class BylineCleaner:
             # Fallback to wire services if database fails
             publication_names = set(self.WIRE_SERVICES)
 
-        # Cache the results
-        self._publication_cache = publication_names
-        self._publication_cache_timestamp = current_time
-
-        logger.info(f"Loaded {len(publication_names)} publication names")
+        self._store_publication_names(publication_names, current_time)
         return publication_names
 
     def refresh_publication_cache(self):
@@ -2429,6 +2683,9 @@ class BylineCleaner:
         """
         Get organization names from gazetteer table for filtering.
 
+        With a reference data registry the names come from its current
+        snapshot and are re-expanded only when the snapshot changes.
+
         Args:
             force_refresh: Force refresh of cache even if still valid
 
@@ -2439,6 +2696,16 @@ class BylineCleaner:
 
         from src.models.database import DatabaseManager, safe_session_execute
 
+        if self.reference_data is not None:
+            snapshot = self._reference_snapshot(force_refresh)
+            if snapshot is not self._organization_snapshot:
+                organization_names = self._expand_organization_names(
+                    snapshot.gazetteer_organization_names()
+                )
+                self._store_organization_names(organization_names, time.time())
+                self._organization_snapshot = snapshot
+            return self._organization_cache
+
         current_time = time.time()
         cache_duration = 3600  # 1 hour
 
@@ -2452,8 +2719,6 @@ class BylineCleaner:
         ):
             return self._organization_cache
 
-        organization_names = set()
-
         try:
             db_manager = DatabaseManager()
             from sqlalchemy import text
@@ -2473,32 +2738,9 @@ class BylineCleaner:
             )
 
             result = safe_session_execute(db_manager.session, query)
-            for row in result:
-                name = row[0]
-                if name and len(name.strip()) >= 3:
-                    # Add full name
-                    organization_names.add(name.lower().strip())
-
-                    # Add individual significant words
-                    words = name.lower().split()
-                    for word in words:
-                        # Only add significant organizational words
-                        common_words = {
-                            "the",
-                            "and",
-                            "of",
-                            "for",
-                            "at",
-                            "in",
-                            "on",
-                            "to",
-                            "center",
-                            "department",
-                            "office",
-                            "services",
-                        }
-                        if len(word) >= 4 and word not in common_words:
-                            organization_names.add(word)
+            organization_names = self._expand_organization_names(
+                row[0] for row in result
+            )
 
             db_manager.close()
 
@@ -2507,14 +2749,7 @@ class BylineCleaner:
             # Fallback to empty set if database fails
             organization_names = set()
 
-        # Cache the results
-        self._organization_cache = organization_names
-        self._organization_cache_timestamp = current_time
-
-        logger.info(
-            "Loaded %s organization names from gazetteer",
-            len(organization_names),
-        )
+        self._store_organization_names(organization_names, current_time)
         return organization_names
 
     def _is_publication_name(self, text: str) -> bool:
@@ -0,0 +1,190 @@
+"""
+Precompiled matchers for ``BylineCleaner``'s pattern stages.
+
+The cleaner used to try its static patterns one at a time and to scan
+every publication, organization and wire-service name against each byline
+(for names of three or more words, every sub-phrase as well). With the
+gazetteer loaded that is thousands of names and seconds per byline. The
+matchers here are compiled once:
+
+- ``compile_alternation`` folds a list of regexes into one pattern, used as
+  a single-scan pre-check before the (order-dependent) per-pattern passes.
+- ``WireServiceMatcher`` holds one alternation per wire-service test.
+- ``NameSpanIndex`` indexes the name sets by word n-gram so a byline's
+  words are scanned once and the matched spans are returned to the caller.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+
+def compile_alternation(patterns: Iterable[str], flags: int = 0) -> re.Pattern:
+    """One regex matching wherever any of ``patterns`` would match."""
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), flags)
+
+
+class WireServiceMatcher:
+    """Single-pass versions of the wire-service checks in ``_is_wire_service``."""
+
+    # Whole-byline patterns; group(0) is the matched service
+    FULL_PATTERNS = [
+        r"^(ap|reuters|bloomberg|cnn|npr|pbs)$",
+        r"^(the\s+)?(associated\s+press|new\s+york\s+times|washington\s+post)$",
+        r"^(usa\s+today|wall\s+street\s+journal|los\s+angeles\s+times)$",
+    ]
+
+    # Syndicated "Person Name SERVICE" suffixes and the service they signal.
+    # The suffixes are mutually exclusive, so which alternative matched is
+    # the same as the first pattern that matches in list order.
+    SUFFIX_PATTERNS = [
+        (r"\busa\s+today\s*$", "USA TODAY"),
+        (r"\bwall\s+street\s+journal\s*$", "Wall Street Journal"),
+        (r"\b(the\s+)?new\s+york\s+times\s*$", "The New York Times"),
+        (r"\b(the\s+)?washington\s+post\s*$", "The Washington Post"),
+        (r"\blos\s+angeles\s+times\s*$", "Los Angeles Times"),
+        (r"\bassociated\s+press\s*$", "The Associated Press"),
+        (r"\breuters\s*$", "Reuters"),
+        (r"\bbloomberg\s*$", "Bloomberg"),
+        (r"\bcnn\s*$", "CNN NewsSource"),
+        (r"\bnpr\s*$", "NPR"),
+        (r"\bstates\s+newsroom\s*$", "States Newsroom"),
+        (r"\bkansas\s+reflector\s*$", "States Newsroom"),
+        (r"\bkansasreflector\s*$", "States Newsroom"),
+        (r"\b(the\s+)?missouri\s+independent\s*$", "The Missouri Independent"),
+        (r"\bmissouriindependent\s*$", "The Missouri Independent"),
+        (r"\bwave\s*$", "WAVE"),
+        (r"\bwave3\s*$", "WAVE"),
+    ]
+
+    def __init__(self, wire_services: Iterable[str]):
+        # Longest name first so "fox news" wins over "fox"
+        names = sorted(set(wire_services), key=lambda name: (-len(name), name))
+        self._prefix = re.compile(
+            "(" + "|".join(re.escape(name) for name in names) + r")(?= |\Z)"
+        )
+        self._full = compile_alternation(self.FULL_PATTERNS)
+        self._suffix = re.compile(
+            "|".join(
+                f"(?P<s{index}>{pattern})"
+                for index, (pattern, _service) in enumerate(self.SUFFIX_PATTERNS)
+            )
+        )
+
+    def prefix(self, byline_lower: str) -> str | None:
+        """Wire service the byline equals or starts with (then a space)."""
+        match = self._prefix.match(byline_lower)
+        return match.group(1) if match else None
+
+    def full(self, byline_lower: str) -> str | None:
+        """Service text when the whole byline is a known wire pattern."""
+        match = self._full.match(byline_lower)
+        return match.group(0) if match else None
+
+    def suffix(self, byline_lower: str) -> str | None:
+        """Service signalled by a syndicated byline suffix."""
+        match = self._suffix.search(byline_lower)
+        if not match:
+            return None
+        index = int(match.lastgroup[1:])
+        return self.SUFFIX_PATTERNS[index][1]
+
+
+@dataclass(frozen=True)
+class NameSpan:
+    """Words ``start``..``start + length`` of a byline match a known name.
+
+    ``count`` is how many name entries produce this phrase (a name itself
+    and/or sub-phrases of longer names); ``wire_service`` is set when the
+    phrase is itself a multi-word wire service.
+    """
+
+    start: int
+    length: int
+    count: int
+    wire_service: str | None = None
+
+
+class NameSpanIndex:
+    """Multi-word names (and sub-phrases of 3+ word names) by word tuple.
+
+    Phrases of up to ``max_indexed_words`` words are indexed. Longer phrases
+    only come from the occasional run-on gazetteer entry and can only match
+    equally long bylines, so those names are kept aside and their long
+    sub-phrases are looked up against the byline instead.
+    """
+
+    def __init__(
+        self,
+        names: Iterable[str],
+        wire_services: Iterable[str],
+        max_indexed_words: int = 12,
+    ):
+        self.max_indexed_words = max_indexed_words
+        counts: dict[tuple[str, ...], int] = {}
+        long_names: list[tuple[str, ...]] = []
+        for name in names:
+            words = tuple(name.split())
+            if len(words) < 2:
+                continue
+            if len(words) > max_indexed_words:
+                long_names.append(words)
+            # "missouri independent" should also match
+            # "the missouri independent"
+            for size in [len(words), *range(2, len(words))]:
+                if size > max_indexed_words:
+                    continue
+                for start in range(len(words) - size + 1):
+                    phrase = words[start : start + size]
+                    counts[phrase] = counts.get(phrase, 0) + 1
+        self._counts = counts
+        self._long_names = long_names
+        self._lengths = sorted({len(phrase) for phrase in counts}, reverse=True)
+        self._wire = {
+            tuple(service.split()): service
+            for service in wire_services
+            if len(service.split()) >= 2
+        }
+
+    def find(self, words: list[str]) -> list[NameSpan]:
+        """All matched spans, by start position and then longest first."""
+        spans: list[NameSpan] = []
+        total = len(words)
+        for start in range(total):
+            for length in self._lengths:
+                if start + length > total:
+                    continue
+                phrase = tuple(words[start : start + length])
+                count = self._counts.get(phrase)
+                if count:
+                    spans.append(NameSpan(start, length, count, self._wire.get(phrase)))
+        if total > self.max_indexed_words and self._long_names:
+            spans.extend(self._find_long(words))
+            spans.sort(key=lambda span: (span.start, -span.length))
+        return spans
+
+    def _find_long(self, words: list[str]) -> list[NameSpan]:
+        total = len(words)
+        at: dict[int, dict[tuple[str, ...], list[int]]] = {}
+        counts: dict[tuple[int, int], int] = {}
+        for name in self._long_names:
+            sizes = [len(name), *range(2, len(name))]
+            for size in sizes:
+                if size <= self.max_indexed_words or size > total:
+                    continue
+                if size not in at:
+                    at[size] = {}
+                    for start in range(total - size + 1):
+                        phrase = tuple(words[start : start + size])
+                        at[size].setdefault(phrase, []).append(start)
+                for offset in range(len(name) - size + 1):
+                    for start in at[size].get(name[offset : offset + size], ()):
+                        counts[(start, size)] = counts.get((start, size), 0) + 1
+        return [
+            NameSpan(
+                start, size, count, self._wire.get(tuple(words[start : start + size]))
+            )
+            for (start, size), count in counts.items()
+        ]
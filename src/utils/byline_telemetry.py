@@ -41,6 +41,10 @@ class BylineCleaningTelemetry:
         self.current_session: dict[str, Any] | None = None
         self.transformation_steps: list[dict[str, Any]] = []
 
+        # Classification of the last finalized session, kept even when
+        # telemetry is disabled so callers can reuse it (e.g. for caching)
+        self.last_outcome: dict[str, Any] | None = None
+
     @property
     def store(self) -> TelemetryStore:
         """Lazy-load the store only when needed."""
@@ -296,6 +300,12 @@ class BylineCleaningTelemetry:
             likely_noise: Whether result appears to be noise
             requires_manual_review: Whether result needs manual review
         """
+        self.last_outcome = {
+            "cleaning_method": cleaning_method,
+            "likely_valid_authors": likely_valid_authors,
+            "likely_noise": likely_noise,
+            "requires_manual_review": requires_manual_review,
+        }
         if not self.enable_telemetry or not self.current_session:
             return
 
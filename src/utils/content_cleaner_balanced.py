@@ -3,6 +3,7 @@
 import json
 import logging
 import re
+import time
 from collections import defaultdict
 from datetime import datetime
 from typing import Any
@@ -11,6 +12,7 @@ from sqlalchemy import text as sql_text
 
 from src.models.database import DatabaseManager, safe_session_execute
 
+from .boilerplate_matcher import PersistentPatternSet
 from .byline_cleaner import BylineCleaner
 from .content_cleaning_telemetry import ContentCleaningTelemetry
 
@@ -122,6 +124,14 @@ SOCIAL_SHARE_PHRASES = (
 
 SOCIAL_SHARE_PREFIX_SEPARATORS = " \t\u2022•|-–—:\u00b7·"
 
+# Domain analysis rejects most rough candidates; keep full telemetry rows
+# for this fraction of them (all are still counted by pattern type)
+DEFAULT_REJECTED_SEGMENT_SAMPLE_RATE = 0.01
+
+# Compiled persistent patterns are re-checked against the database at most
+# this often, to pick up patterns other workers and processes have stored
+DEFAULT_PERSISTENT_PATTERN_REFRESH_SECONDS = 60.0
+
 
 class BalancedBoundaryContentCleaner:
     """
@@ -135,13 +145,27 @@ class BalancedBoundaryContentCleaner:
         enable_telemetry: bool = True,
         use_cloud_sql: bool = True,
         db: "DatabaseManager" = None,
+        rejected_segment_sample_rate: float = DEFAULT_REJECTED_SEGMENT_SAMPLE_RATE,
+        persistent_pattern_refresh_seconds: float = (
+            DEFAULT_PERSISTENT_PATTERN_REFRESH_SECONDS
+        ),
+        telemetry: ContentCleaningTelemetry | None = None,
     ):
         self.db_path = db_path
         self.enable_telemetry = enable_telemetry
         self.use_cloud_sql = use_cloud_sql
         self.logger = logging.getLogger(__name__)
-        self.telemetry = ContentCleaningTelemetry(enable_telemetry=enable_telemetry)
+        # A caller-supplied collector may read persistent patterns without
+        # recording telemetry (see ContentCleaningTelemetry)
+        self.telemetry = telemetry or ContentCleaningTelemetry(
+            enable_telemetry=enable_telemetry,
+            rejected_segment_sample_rate=rejected_segment_sample_rate,
+        )
         self._shared_db = db  # Reuse shared DatabaseManager if provided
+        # Compiled persistent patterns by domain; see _get_persistent_pattern_set
+        self._persistent_pattern_sets: dict[str, PersistentPatternSet] = {}
+        self._persistent_pattern_checked_at: dict[str, float] = {}
+        self.persistent_pattern_refresh_seconds = persistent_pattern_refresh_seconds
 
         # Initialize wire service detector
         self.wire_detector = BylineCleaner()
@@ -500,7 +524,7 @@ class BalancedBoundaryContentCleaner:
                     pattern_type="rejected",
                     position_consistency=0.0,
                     segment_length=len(candidate_text),
-                    article_ids=list(candidate_article_ids),
+                    article_ids=candidate_article_ids,
                     was_removed=False,
                     removal_reason=f"Low boundary score: {boundary_score:.2f}",
                 )
@@ -922,72 +946,89 @@ class BalancedBoundaryContentCleaner:
             ),
         }
 
-    def _remove_persistent_patterns(
-        self, text: str, domain: str, article_id: str | None = None
-    ) -> dict:
-        """Check text against persistent patterns for quick removal."""
-        if not self.enable_telemetry:
-            return {"cleaned_text": text, "removals": [], "wire_detected": None}
+    def _get_persistent_pattern_set(self, domain: str) -> PersistentPatternSet:
+        """Return ``domain``'s compiled persistent patterns.
 
-        patterns = self.telemetry.get_persistent_patterns(domain)
-        if not patterns:
-            return {"cleaned_text": text, "removals": [], "wire_detected": None}
+        Patterns are loaded, classified and compiled once per domain and
+        reused until this process's telemetry collector changes the
+        domain's stored patterns, or a check of the stored patterns'
+        fingerprint (at most every ``persistent_pattern_refresh_seconds``)
+        shows that another worker has.
+        """
+        now = time.monotonic()
+        version = self.telemetry.persistent_patterns_version(domain)
+        cached = self._persistent_pattern_sets.get(domain)
+        if cached is not None and cached.version == version:
+            checked_at = self._persistent_pattern_checked_at.get(domain, now)
+            if now - checked_at < self.persistent_pattern_refresh_seconds:
+                return cached
+            self._persistent_pattern_checked_at[domain] = now
+            fingerprint = self.telemetry.persistent_patterns_fingerprint(domain)
+            if fingerprint == cached.fingerprint:
+                return cached
+        else:
+            fingerprint = self.telemetry.persistent_patterns_fingerprint(domain)
 
-        cleaned_text = text
-        removals = []
+        removable = []
+        wire_pattern = None
         wire_detected = None
-
-        for pattern in patterns:
+        for pattern in self.telemetry.get_persistent_patterns(domain):
             pattern_text = pattern["text_content"]
 
-            # WIRE SERVICE DETECTION: Check pattern before removal
-            if not wire_detected:
-                wire_service_info = self._detect_wire_service_in_pattern(
+            # WIRE SERVICE DETECTION: the first pattern with wire evidence
+            if wire_detected is None:
+                wire_detected = self._detect_wire_service_in_pattern(
                     pattern_text, domain
                 )
-                if wire_service_info:
-                    wire_detected = wire_service_info
-                    if self.enable_telemetry:
-                        self.telemetry.log_wire_detection(
-                            provider=wire_service_info["provider"],
-                            detection_method=wire_service_info["detection_method"],
-                            pattern_text=pattern_text,
-                            confidence=wire_service_info["confidence"],
-                            detection_stage="persistent_pattern",
-                            article_ids=[article_id] if article_id else None,
-                            domain=domain,
-                            extra_metadata={
-                                "pattern_type": pattern["pattern_type"],
-                                "pattern_confidence": pattern["confidence_score"],
-                                "pattern_occurrences": pattern["occurrences_total"],
-                            },
-                        )
-
-            # Check if this is a high-confidence boilerplate pattern
-            # that overrides length
-            is_high_confidence = self._is_high_confidence_boilerplate(pattern_text)
+                if wire_detected:
+                    wire_pattern = pattern
 
             # Apply minimum length filter (150 characters) unless
             # it's high-confidence boilerplate
-            if len(pattern_text) < 150 and not is_high_confidence:
-                continue
+            if len(pattern_text) >= 150 or self._is_high_confidence_boilerplate(
+                pattern_text
+            ):
+                removable.append(pattern)
+
+        pattern_set = PersistentPatternSet(
+            removable=removable,
+            wire_pattern=wire_pattern,
+            wire_detected=wire_detected,
+            version=version,
+            fingerprint=fingerprint,
+        )
+        self._persistent_pattern_sets[domain] = pattern_set
+        self._persistent_pattern_checked_at[domain] = now
+        return pattern_set
 
-            if pattern_text in cleaned_text:
-                # Calculate position before removal
-                position = cleaned_text.find(pattern_text)
-                cleaned_text = cleaned_text.replace(pattern_text, "")
+    def _remove_persistent_patterns(
+        self, text: str, domain: str, article_id: str | None = None
+    ) -> dict:
+        """Check text against persistent patterns for quick removal."""
+        if not (self.enable_telemetry or self.telemetry.read_persistent_patterns):
+            return {"cleaned_text": text, "removals": [], "wire_detected": None}
 
-                removals.append(
-                    {
-                        "text": pattern_text,
-                        "position": position,
-                        "confidence_score": pattern["confidence_score"],
-                        "occurrences_total": pattern["occurrences_total"],
-                        "pattern_type": pattern["pattern_type"],
-                        "removal_reason": pattern["removal_reason"],
-                    }
-                )
+        pattern_set = self._get_persistent_pattern_set(domain)
+
+        wire_detected = pattern_set.wire_detected
+        if wire_detected:
+            pattern = pattern_set.wire_pattern
+            self.telemetry.log_wire_detection(
+                provider=wire_detected["provider"],
+                detection_method=wire_detected["detection_method"],
+                pattern_text=pattern["text_content"],
+                confidence=wire_detected["confidence"],
+                detection_stage="persistent_pattern",
+                article_ids=[article_id] if article_id else None,
+                domain=domain,
+                extra_metadata={
+                    "pattern_type": pattern["pattern_type"],
+                    "pattern_confidence": pattern["confidence_score"],
+                    "pattern_occurrences": pattern["occurrences_total"],
+                },
+            )
 
+        cleaned_text, removals = pattern_set.remove(text)
         return {
             "cleaned_text": cleaned_text,
             "removals": removals,
@@ -7,7 +7,10 @@ for ML training data and performance analysis.
 
 import json
 import sqlite3
+import threading
 import uuid
+import zlib
+from collections.abc import Collection
 from datetime import datetime
 from typing import Any
 
@@ -23,23 +26,41 @@ class ContentCleaningTelemetry:
         enable_telemetry: bool = True,
         store: TelemetryStore | None = None,
         database_url: str = DATABASE_URL,
+        rejected_segment_sample_rate: float = 1.0,
+        read_persistent_patterns: bool = False,
     ):
         """
         Initialize telemetry collector.
 
         Args:
             enable_telemetry: Whether to actually collect and store telemetry
+            read_persistent_patterns: Read stored persistent patterns even
+                when ``enable_telemetry`` is False (nothing is recorded)
+            rejected_segment_sample_rate: Fraction (0.0-1.0) of rejected
+                segments stored in full. Every detection is still counted
+                by pattern type and outcome; accepted segments are always
+                stored in full.
         """
+        if not 0.0 <= rejected_segment_sample_rate <= 1.0:
+            raise ValueError("rejected_segment_sample_rate must be between 0 and 1")
         self.enable_telemetry = enable_telemetry
+        self.rejected_segment_sample_rate = rejected_segment_sample_rate
+        self.read_persistent_patterns = read_persistent_patterns
         self.session_id = str(uuid.uuid4())
         self.detection_counter = 0
         self._store: TelemetryStore | None = store
         self._database_url = database_url
         self._tables_initialized = False
+        # Bumped per domain whenever the stored pattern library changes so
+        # callers caching compiled patterns know to reload them
+        self._persistent_pattern_versions: dict[str, int] = {}
+        self._persistent_pattern_versions_lock = threading.Lock()
 
         # Current cleaning session data
         self.current_session: dict[str, Any] | None = None
         self.detected_segments: list[dict[str, Any]] = []
+        # Exact per-session counts keyed by (pattern_type, was_removed)
+        self.segment_counts: dict[tuple[str, bool], dict[str, Any]] = {}
         self.wire_detection_events: list[dict[str, Any]] = []
         self.locality_detection_events: list[dict[str, Any]] = []
         self._last_boundary_assessment: dict[str, Any] | None = None
@@ -49,7 +70,17 @@ class ContentCleaningTelemetry:
         """Lazy-load the store only when needed."""
         if not self.enable_telemetry:
             raise RuntimeError("Telemetry is disabled")
+        return self._load_store()
 
+    @property
+    def pattern_store(self) -> TelemetryStore:
+        """Store to read persistent patterns from, which a collector may do
+        without recording telemetry."""
+        if not (self.enable_telemetry or self.read_persistent_patterns):
+            raise RuntimeError("Telemetry is disabled")
+        return self._load_store()
+
+    def _load_store(self) -> TelemetryStore:
         if self._store is None:
             # Use DatabaseManager's engine if available (for Cloud SQL)
             try:
@@ -98,6 +129,7 @@ class ContentCleaningTelemetry:
         # Reset counters and state
         self.detection_counter = 0
         self.detected_segments = []
+        self.segment_counts = {}
         self.wire_detection_events = []
         self.locality_detection_events = []
 
@@ -180,16 +212,38 @@ class ContentCleaningTelemetry:
         pattern_type: str,
         position_consistency: float,
         segment_length: int,
-        article_ids: list[str],
+        article_ids: Collection[str],
         was_removed: bool = False,
         removal_reason: str | None = None,
     ):
-        """Log detection of a potential content segment."""
+        """Log detection of a potential content segment.
+
+        Every call is counted; rejected segments (``was_removed=False``) are
+        only recorded in full for the configured sample of them.
+        """
         if not self.enable_telemetry or not self.current_session:
             return
 
         self.detection_counter += 1
 
+        counts = self.segment_counts.get((pattern_type, bool(was_removed)))
+        if counts is None:
+            counts = self.segment_counts[(pattern_type, bool(was_removed))] = {
+                "pattern_type": pattern_type,
+                "was_removed": bool(was_removed),
+                "detection_count": 0,
+                "detailed_count": 0,
+                "total_occurrences": 0,
+                "boundary_score_sum": 0.0,
+            }
+        counts["detection_count"] += 1
+        counts["total_occurrences"] += occurrences or 0
+        counts["boundary_score_sum"] += boundary_score or 0.0
+
+        if not was_removed and not self._sample_rejected_segment(segment_text):
+            return
+        counts["detailed_count"] += 1
+
         segment_data = {
             "id": str(uuid.uuid4()),
             "telemetry_id": self.current_session["telemetry_id"],
@@ -205,11 +259,21 @@ class ContentCleaningTelemetry:
             "was_removed": was_removed,
             "removal_reason": removal_reason,
             "timestamp": datetime.now(),
-            "article_ids_json": json.dumps(article_ids),
+            "article_ids_json": json.dumps(list(article_ids)),
         }
 
         self.detected_segments.append(segment_data)
 
+    def _sample_rejected_segment(self, segment_text: str) -> bool:
+        """Deterministically keep ``rejected_segment_sample_rate`` of texts."""
+        rate = self.rejected_segment_sample_rate
+        if rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+        # Hash-based so the same rejected text is sampled in every session
+        return zlib.crc32(segment_text.encode("utf-8")) < rate * 0x100000000
+
     def log_boundary_assessment(
         self,
         text: str,
@@ -274,6 +338,7 @@ class ContentCleaningTelemetry:
         return {
             "session": dict(self.current_session or {}),
             "segments": [dict(segment) for segment in self.detected_segments],
+            "segment_counts": [dict(counts) for counts in self.segment_counts.values()],
             "wire_events": [dict(event) for event in self.wire_detection_events],
             "locality_events": [
                 dict(event) for event in self.locality_detection_events
@@ -311,6 +376,7 @@ class ContentCleaningTelemetry:
         """Clear session-specific telemetry buffers."""
         self.current_session = None
         self.detected_segments = []
+        self.segment_counts = {}
         self.wire_detection_events = []
         self.locality_detection_events = []
         self.detection_counter = 0
@@ -340,6 +406,7 @@ class ContentCleaningTelemetry:
 
         self._ensure_persistent_patterns_table(conn)
 
+        patterns_changed = False
         cursor = conn.cursor()
         try:
             for segment in segments:
@@ -357,7 +424,7 @@ class ContentCleaningTelemetry:
 
                 cursor.execute(
                     """
-                    SELECT id, occurrences_total, last_seen
+                    SELECT id, occurrences_total, last_seen, confidence_score
                     FROM persistent_boilerplate_patterns
                     WHERE domain = ? AND text_hash = ?
                     """,
@@ -385,6 +452,10 @@ class ContentCleaningTelemetry:
                             existing[0],
                         ),
                     )
+                    # Re-logged removals only bump counters; the pattern set
+                    # changes when a pattern is added or its confidence rises
+                    if (segment.get("boundary_score") or 0) > (existing[3] or 0):
+                        patterns_changed = True
                 else:
                     cursor.execute(
                         """
@@ -411,9 +482,60 @@ class ContentCleaningTelemetry:
                             is_ml_eligible,
                         ),
                     )
+                    patterns_changed = True
         finally:
             cursor.close()
 
+        if patterns_changed:
+            # Commit before publishing the new version so a reader that sees
+            # it also sees the rows; the caller's commit is then a no-op.
+            conn.commit()
+            self._bump_persistent_patterns_version(domain)
+
+    def _bump_persistent_patterns_version(self, domain: str) -> None:
+        with self._persistent_pattern_versions_lock:
+            self._persistent_pattern_versions[domain] = (
+                self._persistent_pattern_versions.get(domain, 0) + 1
+            )
+
+    def persistent_patterns_version(self, domain: str) -> int:
+        """Return a counter that changes whenever this collector adds a
+        persistent pattern for ``domain`` or raises one's confidence."""
+        with self._persistent_pattern_versions_lock:
+            return self._persistent_pattern_versions.get(domain, 0)
+
+    def persistent_patterns_fingerprint(self, domain: str) -> tuple | None:
+        """Return a cheap summary of ``domain``'s active stored patterns.
+
+        The count, confidence sum and newest ``first_seen`` change when any
+        process adds, deactivates or raises the confidence of a pattern, but
+        not when a known pattern is merely seen again. None when the store
+        is unavailable.
+        """
+        try:
+            store = self.pattern_store
+        except RuntimeError:
+            return None
+
+        try:
+            with store.connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    cursor.execute(
+                        """
+                        SELECT COUNT(*), SUM(confidence_score), MAX(first_seen)
+                        FROM persistent_boilerplate_patterns
+                        WHERE domain = ? AND is_active IS TRUE
+                        """,
+                        (domain,),
+                    )
+                    row = cursor.fetchone()
+                finally:
+                    cursor.close()
+        except Exception:
+            return None
+        return tuple(row) if row is not None else None
+
     def _ensure_persistent_patterns_table(
         self,
         conn: sqlite3.Connection,
@@ -476,7 +598,7 @@ class ContentCleaningTelemetry:
     def get_persistent_patterns(self, domain: str) -> list[dict]:
         """Get persistent boilerplate patterns for a domain."""
         try:
-            store = self.store
+            store = self.pattern_store
         except RuntimeError:
             # Telemetry disabled or not supported
             return []
@@ -644,6 +766,7 @@ class ContentCleaningTelemetry:
             return
 
         segments = payload.get("segments") or []
+        segment_counts = payload.get("segment_counts") or []
         wire_events = payload.get("wire_events") or []
         locality_events = payload.get("locality_events") or []
 
@@ -678,17 +801,17 @@ class ContentCleaningTelemetry:
                 ),
             )
 
-            for segment in segments:
-                cursor.execute(
-                    """
-                    INSERT INTO content_cleaning_segments (
-                        id, telemetry_id, detection_number, segment_text,
-                        segment_text_hash, boundary_score, occurrences,
-                        pattern_type, position_consistency, segment_length,
-                        affected_article_count, was_removed, removal_reason,
-                        timestamp, article_ids_json
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+            cursor.executemany(
+                """
+                INSERT INTO content_cleaning_segments (
+                    id, telemetry_id, detection_number, segment_text,
+                    segment_text_hash, boundary_score, occurrences,
+                    pattern_type, position_consistency, segment_length,
+                    affected_article_count, was_removed, removal_reason,
+                    timestamp, article_ids_json
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
                     (
                         segment.get("id"),
                         segment.get("telemetry_id"),
@@ -705,8 +828,32 @@ class ContentCleaningTelemetry:
                         segment.get("removal_reason"),
                         segment.get("timestamp"),
                         segment.get("article_ids_json"),
-                    ),
-                )
+                    )
+                    for segment in segments
+                ],
+            )
+
+            cursor.executemany(
+                """
+                INSERT INTO content_cleaning_segment_counts (
+                    telemetry_id, pattern_type, was_removed,
+                    detection_count, detailed_count, total_occurrences,
+                    boundary_score_sum
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        session.get("telemetry_id"),
+                        counts.get("pattern_type"),
+                        counts.get("was_removed"),
+                        counts.get("detection_count"),
+                        counts.get("detailed_count"),
+                        counts.get("total_occurrences"),
+                        counts.get("boundary_score_sum"),
+                    )
+                    for counts in segment_counts
+                ],
+            )
 
             for event in wire_events:
                 cursor.execute(
@@ -824,6 +971,26 @@ class ContentCleaningTelemetry:
         """
             )
 
+            # Exact per-session segment counts; segment rows above may be
+            # a sample of the rejected segments
+            cursor.execute(
+                """
+            CREATE TABLE IF NOT EXISTS content_cleaning_segment_counts (
+                telemetry_id TEXT NOT NULL,
+                pattern_type TEXT NOT NULL,
+                was_removed BOOLEAN NOT NULL,
+                detection_count INTEGER NOT NULL,
+                detailed_count INTEGER NOT NULL,
+                total_occurrences INTEGER,
+                boundary_score_sum REAL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (telemetry_id, pattern_type, was_removed),
+                FOREIGN KEY (telemetry_id)
+                    REFERENCES content_cleaning_sessions(telemetry_id)
+            )
+        """
+            )
+
             # Wire detection events table
             cursor.execute(
                 """
@@ -932,22 +1099,42 @@ class ContentCleaningTelemetry:
                     column_names = [desc[0] for desc in cursor.description]
                     session_summary = dict(zip(column_names, session_row, strict=False))
 
-                    # Get pattern breakdown
+                    # Get pattern breakdown: exact counts where the session
+                    # recorded them, otherwise its (unsampled) segment rows
                     cursor.execute(
                         """
-                        SELECT s.pattern_type,
-                               COUNT(*) as detection_count,
-                               AVG(s.boundary_score) as avg_boundary_score,
-                               SUM(CASE WHEN s.was_removed THEN 1 ELSE 0 END)
-                                   as removed_count
-                        FROM content_cleaning_segments s
-                        JOIN content_cleaning_sessions sess
-                            ON s.telemetry_id = sess.telemetry_id
-                        WHERE sess.domain = ?
-                        GROUP BY s.pattern_type
+                        SELECT pattern_type,
+                               SUM(detections) as detection_count,
+                               SUM(score_sum) / SUM(detections)
+                                   as avg_boundary_score,
+                               SUM(CASE WHEN was_removed THEN detections
+                                        ELSE 0 END) as removed_count
+                        FROM (
+                            SELECT c.pattern_type, c.was_removed,
+                                   c.detection_count AS detections,
+                                   c.boundary_score_sum AS score_sum
+                            FROM content_cleaning_segment_counts c
+                            JOIN content_cleaning_sessions sess
+                                ON c.telemetry_id = sess.telemetry_id
+                            WHERE sess.domain = ?
+                            UNION ALL
+                            SELECT s.pattern_type, s.was_removed,
+                                   1 AS detections,
+                                   s.boundary_score AS score_sum
+                            FROM content_cleaning_segments s
+                            JOIN content_cleaning_sessions sess
+                                ON s.telemetry_id = sess.telemetry_id
+                            WHERE sess.domain = ?
+                              AND NOT EXISTS (
+                                  SELECT 1
+                                  FROM content_cleaning_segment_counts c
+                                  WHERE c.telemetry_id = s.telemetry_id
+                              )
+                        ) detections
+                        GROUP BY pattern_type
                         ORDER BY detection_count DESC
                         """,
-                        (domain,),
+                        (domain, domain),
                     )
 
                     pattern_breakdown = [
@@ -5,10 +5,14 @@ from __future__ import annotations
 import re
 from collections.abc import Iterable
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from .confidence import normalize_score, score_to_label
 from .wire_reporters import is_wire_reporter
 
+if TYPE_CHECKING:
+    from .reference_data import ReferenceDataSnapshot
+
 
 @dataclass(frozen=True)
 class ContentTypeResult:
@@ -36,15 +40,24 @@ class ContentTypeDetector:
     _wire_patterns_cache: list[tuple] | None = None
     _wire_patterns_timestamp: float | None = None
 
-    def __init__(self, session=None):
+    def __init__(
+        self,
+        session=None,
+        reference_data: ReferenceDataSnapshot | None = None,
+    ):
         """Initialize ContentTypeDetector.
 
         Args:
             session: Optional SQLAlchemy session to reuse for database queries.
                     If not provided, creates a new DatabaseManager instance.
+            reference_data: Optional snapshot from the process-wide
+                    ``ReferenceDataRegistry``. When given, wire patterns,
+                    callsigns, wire reporters and wire-service hosts are read
+                    from it instead of the database.
         """
         self._session = session
         self._db = None
+        self._reference_data = reference_data
 
     # Known callsign to domain mappings (Missouri market)
     # Used when callsign doesn't appear directly in URL
@@ -203,6 +216,13 @@ class ContentTypeDetector:
         ):
             return self._local_callsigns_cache
 
+        if self._reference_data is not None:
+            self._local_callsigns_cache = (
+                self._reference_data.local_broadcaster_callsigns(dataset)
+            )
+            self._cache_timestamp = now
+            return self._local_callsigns_cache
+
         # Load from database
         try:
             from src.models import LocalBroadcasterCallsign
@@ -278,6 +298,16 @@ class ContentTypeDetector:
             ):
                 return self._wire_patterns_cache
 
+        if self._reference_data is not None:
+            result = self._reference_data.wire_service_patterns(pattern_type)
+            if pattern_type:
+                self._pattern_cache_by_type[cache_key] = result
+                self._pattern_timestamp_by_type[cache_key] = now
+            else:
+                self._wire_patterns_cache = result
+                self._wire_patterns_timestamp = now
+            return result
+
         # Load from database
         try:
             from src.models import WireService
@@ -392,6 +422,9 @@ class ContentTypeDetector:
                 if domain in host:
                     return True
 
+            if self._reference_data is not None:
+                return self._reference_data.is_wire_service_host(host)
+
             # Fallback: Query sources table for is_wire_service flag
             # This allows dynamic management without code changes
             try:
@@ -577,7 +610,14 @@ class ContentTypeDetector:
             # Only check additional patterns if not already detected
             if not byline_signal:
                 # Check against known wire reporters (from telemetry DB)
-                wire_reporter_check = is_wire_reporter(author_str)
+                wire_reporter_check = is_wire_reporter(
+                    author_str,
+                    reporters=(
+                        self._reference_data.wire_reporters
+                        if self._reference_data is not None
+                        else None
+                    ),
+                )
                 if wire_reporter_check:
                     service_name, confidence = wire_reporter_check
                     matches.setdefault("author", []).append(
@@ -2,6 +2,11 @@
 
 This module provides a simple interface for emitting custom metrics to
 Google Cloud Monitoring (formerly Stackdriver).
+
+The client from ``get_metrics_client`` records into the process-wide
+``MetricsAggregator`` (see ``src/utils/metrics_aggregator.py``), which
+flushes to Cloud Monitoring in batches through ``CloudMonitoringExporter``
+instead of making one API call per data point.
 """
 
 from __future__ import annotations
@@ -11,6 +16,14 @@ import os
 import time
 from typing import Optional
 
+from src.utils.metrics_aggregator import (
+    Histogram,
+    MetricsAggregator,
+    MetricsSnapshot,
+    SeriesKey,
+    get_metrics_aggregator,
+)
+
 try:
     from google.api import distribution_pb2
     from google.api import label_pb2 as ga_label
@@ -36,6 +49,7 @@ class MetricsClient:
         project_id: str | None = None,
         service_name: str = "mizzou-news-crawler",
         enabled: bool = True,
+        aggregator: MetricsAggregator | None = None,
     ):
         """Initialize metrics client.
 
@@ -43,7 +57,10 @@ class MetricsClient:
             project_id: GCP project ID. Auto-detected if None.
             service_name: Service name for metric labeling
             enabled: Whether to emit metrics (disable in tests/local dev)
+            aggregator: Buffer records here instead of writing each one to
+                Cloud Monitoring inline
         """
+        self.aggregator = aggregator
         self.project_id = (
             project_id or os.getenv("GCP_PROJECT_ID") or "mizzou-news-crawler"
         )
@@ -76,6 +93,31 @@ class MetricsClient:
             "pod_name": os.getenv("HOSTNAME") or "unknown",
         }
 
+    def _new_series(self, metric_name: str, labels: Optional[dict[str, str]] = None):
+        """Empty ``TimeSeries`` for a custom metric on this pod."""
+        series = monitoring_v3.TimeSeries()
+        series.metric.type = f"custom.googleapis.com/{metric_name}"
+
+        # Add metric labels
+        if labels:
+            for key, val in labels.items():
+                series.metric.labels[key] = str(val)
+
+        # Set resource type and labels
+        series.resource.type = "k8s_pod"
+        series.resource.labels.update(self.resource_labels)
+        return series
+
+    @staticmethod
+    def _interval(now: float | None = None):
+        """``TimeInterval`` ending at ``now`` (default: the current time)."""
+        now = time.time() if now is None else now
+        seconds = int(now)
+        nanos = int((now - seconds) * 10**9)
+        return monitoring_v3.TimeInterval(
+            {"end_time": {"seconds": seconds, "nanos": nanos}}
+        )
+
     def record_counter(
         self,
         metric_name: str,
@@ -89,32 +131,17 @@ class MetricsClient:
             value: Integer value to record
             labels: Additional metric labels
         """
+        if self.aggregator is not None:
+            self.aggregator.increment(metric_name, value, labels)
+            return
+
         if not self.enabled:
             return
 
         try:
-            series = monitoring_v3.TimeSeries()
-            series.metric.type = f"custom.googleapis.com/{metric_name}"
-
-            # Add metric labels
-            if labels:
-                for key, val in labels.items():
-                    series.metric.labels[key] = str(val)
-
-            # Set resource type and labels
-            series.resource.type = "k8s_pod"
-            series.resource.labels.update(self.resource_labels)
-
-            # Set the data point
-            now = time.time()
-            seconds = int(now)
-            nanos = int((now - seconds) * 10**9)
-
-            interval = monitoring_v3.TimeInterval(
-                {"end_time": {"seconds": seconds, "nanos": nanos}}
-            )
+            series = self._new_series(metric_name, labels)
             point = monitoring_v3.Point(
-                {"interval": interval, "value": {"int64_value": value}}
+                {"interval": self._interval(), "value": {"int64_value": value}}
             )
             series.points = [point]
 
@@ -139,32 +166,17 @@ class MetricsClient:
             value: Float value to record
             labels: Additional metric labels
         """
+        if self.aggregator is not None:
+            self.aggregator.set_gauge(metric_name, value, labels)
+            return
+
         if not self.enabled:
             return
 
         try:
-            series = monitoring_v3.TimeSeries()
-            series.metric.type = f"custom.googleapis.com/{metric_name}"
-
-            # Add metric labels
-            if labels:
-                for key, val in labels.items():
-                    series.metric.labels[key] = str(val)
-
-            # Set resource type and labels
-            series.resource.type = "k8s_pod"
-            series.resource.labels.update(self.resource_labels)
-
-            # Set the data point
-            now = time.time()
-            seconds = int(now)
-            nanos = int((now - seconds) * 10**9)
-
-            interval = monitoring_v3.TimeInterval(
-                {"end_time": {"seconds": seconds, "nanos": nanos}}
-            )
+            series = self._new_series(metric_name, labels)
             point = monitoring_v3.Point(
-                {"interval": interval, "value": {"double_value": value}}
+                {"interval": self._interval(), "value": {"double_value": value}}
             )
             series.points = [point]
 
@@ -189,30 +201,15 @@ class MetricsClient:
             value: Float value to record
             labels: Additional metric labels
         """
+        if self.aggregator is not None:
+            self.aggregator.observe(metric_name, value, labels)
+            return
+
         if not self.enabled:
             return
 
         try:
-            series = monitoring_v3.TimeSeries()
-            series.metric.type = f"custom.googleapis.com/{metric_name}"
-
-            # Add metric labels
-            if labels:
-                for key, val in labels.items():
-                    series.metric.labels[key] = str(val)
-
-            # Set resource type and labels
-            series.resource.type = "k8s_pod"
-            series.resource.labels.update(self.resource_labels)
-
-            # Set the data point
-            now = time.time()
-            seconds = int(now)
-            nanos = int((now - seconds) * 10**9)
-
-            interval = monitoring_v3.TimeInterval(
-                {"end_time": {"seconds": seconds, "nanos": nanos}}
-            )
+            series = self._new_series(metric_name, labels)
 
             # Create a simple distribution with a single value
             # Cloud Monitoring will aggregate these into percentiles
@@ -223,7 +220,10 @@ class MetricsClient:
             )
 
             point = monitoring_v3.Point(
-                {"interval": interval, "value": {"distribution_value": distribution}}
+                {
+                    "interval": self._interval(),
+                    "value": {"distribution_value": distribution},
+                }
             )
             series.points = [point]
 
@@ -295,6 +295,94 @@ class MetricsClient:
         self.record_gauge("queue_depth", float(depth), labels)
 
 
+class CloudMonitoringExporter:
+    """Writes aggregated snapshots to Cloud Monitoring in batched calls.
+
+    Snapshots are cumulative; this exporter sends what changed since its
+    previous export, so counters and distributions keep the per-interval
+    semantics of the old one-call-per-record path and unchanged series
+    are skipped.
+    """
+
+    # create_time_series accepts at most 200 series per request
+    BATCH_SIZE = 200
+
+    def __init__(self, client: MetricsClient) -> None:
+        self.client = client
+        self._counters: dict[SeriesKey, float] = {}
+        self._gauges: dict[SeriesKey, float] = {}
+        self._histograms: dict[SeriesKey, Histogram] = {}
+
+    def _series(self, key: SeriesKey, value: dict, now: float):
+        name, labels = key
+        series = self.client._new_series(name, dict(labels))
+        series.points = [
+            monitoring_v3.Point(
+                {"interval": self.client._interval(now), "value": value}
+            )
+        ]
+        return series
+
+    def _distribution(self, current: Histogram, previous: Histogram | None):
+        delta = current.copy()
+        if previous is not None:
+            delta.bucket_counts = [
+                now - before
+                for now, before in zip(
+                    current.bucket_counts, previous.bucket_counts, strict=True
+                )
+            ]
+            delta.count -= previous.count
+            delta.total -= previous.total
+            delta.sum_of_squares -= previous.sum_of_squares
+        mean = delta.total / delta.count
+        return distribution_pb2.Distribution(
+            count=delta.count,
+            mean=mean,
+            sum_of_squared_deviation=max(
+                delta.sum_of_squares - delta.count * mean * mean, 0.0
+            ),
+            bucket_options={"explicit_buckets": {"bounds": list(delta.bounds)}},
+            bucket_counts=delta.bucket_counts,
+        )
+
+    def export(self, snapshot: MetricsSnapshot) -> None:
+        if not self.client.enabled:
+            return
+
+        now = snapshot.timestamp
+        # (saved state, key, snapshot value, series) so each batch can
+        # advance the state of exactly the series it delivered
+        pending = []
+        for key, total in snapshot.counters.items():
+            delta = total - self._counters.get(key, 0)
+            if delta:
+                series = self._series(key, {"int64_value": int(delta)}, now)
+                pending.append((self._counters, key, total, series))
+        for key, value in snapshot.gauges.items():
+            if self._gauges.get(key) != value:
+                series = self._series(key, {"double_value": value}, now)
+                pending.append((self._gauges, key, value, series))
+        for key, histogram in snapshot.histograms.items():
+            previous = self._histograms.get(key)
+            if previous is None or histogram.count > previous.count:
+                distribution = self._distribution(histogram, previous)
+                series = self._series(key, {"distribution_value": distribution}, now)
+                pending.append((self._histograms, key, histogram, series))
+
+        # A failed batch raises before its state moves, so the next export
+        # retries only the series that were not delivered
+        for start in range(0, len(pending), self.BATCH_SIZE):
+            batch = pending[start : start + self.BATCH_SIZE]
+            self.client.client.create_time_series(
+                name=self.client.project_name,
+                time_series=[series for _, _, _, series in batch],
+            )
+            for state, key, value, _ in batch:
+                state[key] = value
+        logger.debug(f"Exported {len(pending)} metric series to Cloud Monitoring")
+
+
 # Global metrics client instance
 _metrics_client: Optional[MetricsClient] = None
 
@@ -313,18 +401,32 @@ def get_metrics_client(
 
     Returns:
         MetricsClient instance
+
+    Unless metrics are disabled or ``METRICS_BUFFERED`` is false, the
+    client records into the process-wide aggregator, with Cloud
+    Monitoring attached as an exporter when it is available.
     """
     global _metrics_client
 
     # Check if metrics should be disabled based on environment
     if os.getenv("DISABLE_METRICS", "").lower() in ("true", "1", "yes"):
         enabled = False
+    buffered = os.getenv("METRICS_BUFFERED", "true").lower() not in (
+        "false",
+        "0",
+        "no",
+    )
 
     if _metrics_client is None:
-        _metrics_client = MetricsClient(
+        client = MetricsClient(
             project_id=project_id,
             service_name=service_name,
             enabled=enabled,
         )
+        if enabled and buffered:
+            client.aggregator = get_metrics_aggregator()
+            if client.enabled:
+                client.aggregator.exporters.append(CloudMonitoringExporter(client))
+        _metrics_client = client
 
     return _metrics_client
@@ -0,0 +1,448 @@
+"""In-process buffering and aggregation for custom metrics.
+
+``MetricsClient`` used to build a ``TimeSeries`` and call
+``create_time_series`` for every data point, one network round trip per
+call from inside the crawl and extraction loops. ``MetricsAggregator``
+keeps that work off the hot path:
+
+- ``increment``, ``set_gauge`` and ``observe`` update a buffer owned by
+  the calling thread. Each buffer has its own lock, which only the flusher
+  ever contends for, so recording is a dict update.
+- Series are keyed by metric name plus sorted labels. Counters sum,
+  gauges keep the most recently set value and histograms count
+  observations into fixed buckets along with their sum and sum of
+  squares. Values are cumulative since the aggregator started, the way
+  Prometheus expects them.
+- A daemon thread calls ``flush()`` every ``flush_interval`` seconds,
+  handing one merged ``MetricsSnapshot`` to each exporter. Exporters turn
+  it into batched calls (Cloud Monitoring), or Prometheus text on stdout
+  or in a file for a node-exporter textfile collector.
+- ``start_http_server`` serves the current snapshot at ``/metrics`` in the
+  Prometheus text format for local scraping.
+"""
+
+from __future__ import annotations
+
+import atexit
+import bisect
+import itertools
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Iterable, Optional, Protocol, TextIO
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds, matching the Prometheus client defaults
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+)
+DEFAULT_FLUSH_INTERVAL = 60.0
+
+SeriesKey = tuple[str, tuple[tuple[str, str], ...]]
+
+# Orders gauge updates across thread buffers; next() on it is atomic
+_gauge_sequence = itertools.count()
+
+
+def series_key(name: str, labels: Optional[dict[str, Any]] = None) -> SeriesKey:
+    """Hashable key for ``name`` with ``labels`` sorted and stringified."""
+    if not labels:
+        return name, ()
+    return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+@dataclass
+class Histogram:
+    """Bucketed observations of one series.
+
+    ``bucket_counts`` has one entry per bound plus a final overflow bucket;
+    counts are per bucket, not cumulative.
+    """
+
+    bounds: tuple[float, ...]
+    bucket_counts: list[int]
+    count: int = 0
+    total: float = 0.0
+    sum_of_squares: float = 0.0
+
+    @classmethod
+    def empty(cls, bounds: tuple[float, ...]) -> Histogram:
+        return cls(bounds, [0] * (len(bounds) + 1))
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.sum_of_squares += value * value
+
+    def merge(self, other: Histogram) -> None:
+        for index, count in enumerate(other.bucket_counts):
+            self.bucket_counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.sum_of_squares += other.sum_of_squares
+
+    def copy(self) -> Histogram:
+        return Histogram(
+            self.bounds,
+            list(self.bucket_counts),
+            self.count,
+            self.total,
+            self.sum_of_squares,
+        )
+
+
+@dataclass
+class MetricsSnapshot:
+    """Cumulative values of every series at one point in time."""
+
+    counters: dict[SeriesKey, float] = field(default_factory=dict)
+    gauges: dict[SeriesKey, float] = field(default_factory=dict)
+    histograms: dict[SeriesKey, Histogram] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+
+class MetricsExporter(Protocol):
+    """Receives a snapshot on every flush."""
+
+    def export(self, snapshot: MetricsSnapshot) -> None: ...
+
+
+class _ThreadBuffer:
+    """Series recorded by one thread since the aggregator started."""
+
+    __slots__ = ("lock", "counters", "gauges", "histograms")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.counters: dict[SeriesKey, float] = {}
+        # Gauge values are (sequence, value) so the newest wins on merge
+        self.gauges: dict[SeriesKey, tuple[int, float]] = {}
+        self.histograms: dict[SeriesKey, Histogram] = {}
+
+
+class MetricsAggregator:
+    """Accumulates metrics in memory and flushes them to exporters.
+
+    Args:
+        exporters: Exporters called with each flushed snapshot.
+        flush_interval: Seconds between background flushes.
+        buckets: Histogram bucket upper bounds.
+        background: Start the flush thread on the first record; when False
+            callers flush explicitly.
+    """
+
+    def __init__(
+        self,
+        exporters: Iterable[MetricsExporter] = (),
+        *,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        background: bool = True,
+    ) -> None:
+        self.exporters = list(exporters)
+        self.flush_interval = flush_interval
+        self.buckets = tuple(sorted(buckets))
+        self.background = background
+        self._local = threading.local()
+        self._buffers: list[_ThreadBuffer] = []
+        self._buffers_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _buffer(self) -> _ThreadBuffer:
+        try:
+            return self._local.buffer
+        except AttributeError:
+            buffer = _ThreadBuffer()
+            with self._buffers_lock:
+                self._buffers.append(buffer)
+                if self.background and self._thread is None:
+                    self._start()
+            self._local.buffer = buffer
+            return buffer
+
+    def increment(
+        self, name: str, value: float = 1, labels: Optional[dict[str, Any]] = None
+    ) -> None:
+        """Add ``value`` to counter ``name``."""
+        key = series_key(name, labels)
+        buffer = self._buffer()
+        with buffer.lock:
+            buffer.counters[key] = buffer.counters.get(key, 0) + value
+
+    def set_gauge(
+        self, name: str, value: float, labels: Optional[dict[str, Any]] = None
+    ) -> None:
+        """Set gauge ``name`` to ``value``."""
+        key = series_key(name, labels)
+        buffer = self._buffer()
+        with buffer.lock:
+            buffer.gauges[key] = (next(_gauge_sequence), value)
+
+    def observe(
+        self, name: str, value: float, labels: Optional[dict[str, Any]] = None
+    ) -> None:
+        """Count ``value`` into histogram ``name``."""
+        key = series_key(name, labels)
+        buffer = self._buffer()
+        with buffer.lock:
+            histogram = buffer.histograms.get(key)
+            if histogram is None:
+                histogram = buffer.histograms[key] = Histogram.empty(self.buckets)
+            histogram.observe(value)
+
+    def collect(self) -> MetricsSnapshot:
+        """Merge every thread's buffer into one snapshot."""
+        snapshot = MetricsSnapshot()
+        latest: dict[SeriesKey, tuple[int, float]] = {}
+        with self._buffers_lock:
+            buffers = list(self._buffers)
+        for buffer in buffers:
+            with buffer.lock:
+                counters = dict(buffer.counters)
+                gauges = dict(buffer.gauges)
+                histograms = [
+                    (key, histogram.copy())
+                    for key, histogram in buffer.histograms.items()
+                ]
+            for key, value in counters.items():
+                snapshot.counters[key] = snapshot.counters.get(key, 0) + value
+            for key, entry in gauges.items():
+                if key not in latest or entry[0] > latest[key][0]:
+                    latest[key] = entry
+            for key, histogram in histograms:
+                merged = snapshot.histograms.get(key)
+                if merged is None:
+                    snapshot.histograms[key] = histogram
+                else:
+                    merged.merge(histogram)
+        snapshot.gauges = {key: value for key, (_, value) in latest.items()}
+        return snapshot
+
+    def flush(self) -> MetricsSnapshot:
+        """Export the current snapshot to every exporter and return it.
+
+        A failing exporter is logged and does not stop the others.
+        """
+        with self._flush_lock:
+            snapshot = self.collect()
+            for exporter in self.exporters:
+                try:
+                    exporter.export(snapshot)
+                except Exception as exc:
+                    logger.warning(
+                        "Metrics exporter %s failed: %s",
+                        type(exporter).__name__,
+                        exc,
+                    )
+            return snapshot
+
+    def render(self) -> str:
+        """Current snapshot in the Prometheus text exposition format."""
+        return render_prometheus(self.collect())
+
+    def _start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-flush", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        """Stop the flush thread and export what is buffered."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.flush_interval)
+        self.flush()
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...], **extra: str) -> str:
+    pairs = list(labels) + list(extra.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_prometheus(snapshot: MetricsSnapshot) -> str:
+    """Render ``snapshot`` in the Prometheus text exposition format."""
+    lines: list[str] = []
+
+    def by_name(series: dict) -> dict[str, list]:
+        grouped: dict[str, list] = {}
+        for (name, labels), value in sorted(series.items()):
+            grouped.setdefault(name, []).append((labels, value))
+        return grouped
+
+    for name, series in by_name(snapshot.counters).items():
+        lines.append(f"# TYPE {name} counter")
+        for labels, value in series:
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+    for name, series in by_name(snapshot.gauges).items():
+        lines.append(f"# TYPE {name} gauge")
+        for labels, value in series:
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+    for name, series in by_name(snapshot.histograms).items():
+        lines.append(f"# TYPE {name} histogram")
+        for labels, histogram in series:
+            cumulative = 0
+            bounds = list(histogram.bounds) + [float("inf")]
+            for bound, count in zip(bounds, histogram.bucket_counts, strict=True):
+                cumulative += count
+                le = _format_labels(labels, le=_format_value(bound))
+                lines.append(f"{name}_bucket{le} {cumulative}")
+            suffix = _format_labels(labels)
+            lines.append(f"{name}_sum{suffix} {_format_value(histogram.total)}")
+            lines.append(f"{name}_count{suffix} {histogram.count}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+class StdoutExporter:
+    """Writes each snapshot to a stream in the Prometheus text format."""
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        self.stream = stream
+
+    def export(self, snapshot: MetricsSnapshot) -> None:
+        stream = self.stream or sys.stdout
+        stream.write(render_prometheus(snapshot))
+        stream.flush()
+
+
+class FileExporter:
+    """Atomically rewrites ``path`` with the latest snapshot.
+
+    Suitable for the node-exporter textfile collector.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+
+    def export(self, snapshot: MetricsSnapshot) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        temporary.write_text(render_prometheus(snapshot), encoding="utf-8")
+        os.replace(temporary, self.path)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    aggregator: MetricsAggregator
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.aggregator.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("metrics endpoint: " + format, *args)
+
+
+def start_http_server(
+    aggregator: MetricsAggregator, port: int = 9464, host: str = "127.0.0.1"
+) -> ThreadingHTTPServer:
+    """Serve ``aggregator`` at ``http://host:port/metrics`` from a daemon thread.
+
+    Pass ``port=0`` to pick a free port; read it from ``server_address``.
+    Call ``shutdown()`` on the returned server to stop it.
+    """
+    handler = type("MetricsHandler", (_MetricsHandler,), {"aggregator": aggregator})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(
+        target=server.serve_forever, name="metrics-http", daemon=True
+    ).start()
+    return server
+
+
+_aggregator: MetricsAggregator | None = None
+_aggregator_lock = threading.Lock()
+
+
+def get_metrics_aggregator() -> MetricsAggregator:
+    """Get or create the process-wide aggregator.
+
+    Configured from the environment:
+
+    - ``METRICS_FLUSH_INTERVAL``: seconds between flushes (default 60).
+    - ``METRICS_EXPORTERS``: comma-separated extra exporters, ``stdout``
+      and/or ``file``; Cloud Monitoring is attached by
+      ``get_metrics_client`` when it is available.
+    - ``METRICS_FILE``: path for the file exporter
+      (default ``metrics/metrics.prom``).
+    - ``METRICS_PORT``: serve ``/metrics`` on this local port when set.
+    """
+    global _aggregator
+
+    if _aggregator is None:
+        with _aggregator_lock:
+            if _aggregator is None:
+                exporters: list[MetricsExporter] = []
+                names = os.getenv("METRICS_EXPORTERS", "")
+                for name in filter(None, (n.strip() for n in names.split(","))):
+                    if name == "stdout":
+                        exporters.append(StdoutExporter())
+                    elif name == "file":
+                        exporters.append(
+                            FileExporter(
+                                os.getenv("METRICS_FILE") or "metrics/metrics.prom"
+                            )
+                        )
+                    else:
+                        logger.warning("Unknown metrics exporter %r ignored", name)
+                aggregator = MetricsAggregator(
+                    exporters,
+                    flush_interval=float(
+                        os.getenv("METRICS_FLUSH_INTERVAL") or DEFAULT_FLUSH_INTERVAL
+                    ),
+                )
+                port = os.getenv("METRICS_PORT")
+                if port:
+                    try:
+                        start_http_server(aggregator, int(port))
+                    except (OSError, ValueError) as exc:
+                        logger.warning(
+                            "Could not serve /metrics on port %s: %s", port, exc
+                        )
+                _aggregator = aggregator
+    return _aggregator
@@ -0,0 +1,398 @@
+"""
+Process-wide reference data for wire, broadcaster and byline detection.
+
+Extraction builds a new ``ContentTypeDetector`` for every article, so its
+wire-pattern and callsign caches started cold each time, and the wire
+service own-domain check queried ``sources`` per article. ``BylineCleaner``
+and ``src.utils.wire_reporters`` kept further caches of their own.
+``ReferenceDataRegistry`` loads all of these tables once per process and
+hands out immutable ``ReferenceDataSnapshot`` objects:
+
+- wire service patterns (``wire_services``), by pattern type
+- local broadcaster callsigns, by dataset
+- wire reporters flagged in ``byline_cleaning_telemetry``
+- source canonical names and wire-service source hosts
+- gazetteer organization names
+
+Every ``refresh_interval`` seconds a background thread runs a cheap
+fingerprint query per table (row counts and ``updated_at`` maxima) and
+reloads only when a fingerprint changed, or unconditionally once a snapshot
+is ``max_age`` seconds old (catching edits the fingerprints miss). Readers
+never wait on a refresh; they keep using the previous snapshot until the
+new one is swapped in.
+
+Lookups through a snapshot's accessor methods are counted against the
+queries the registry actually ran, so ``stats(articles=n)`` reports the
+database queries saved per 1,000 articles.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_INTERVAL_SECONDS = 300.0
+DEFAULT_MAX_AGE_SECONDS = 3600.0
+
+WirePattern = tuple[str, str, bool]
+
+_WIRE_PATTERNS_SQL = text(
+    "SELECT pattern, service_name, case_sensitive, pattern_type "
+    "FROM wire_services WHERE active = :active ORDER BY priority, id"
+)
+_CALLSIGNS_SQL = text("SELECT dataset, callsign FROM local_broadcaster_callsigns")
+_WIRE_REPORTERS_SQL = text(
+    """
+    SELECT DISTINCT final_authors_display,
+           COALESCE(human_label, 'Wire Service') AS service_name
+    FROM byline_cleaning_telemetry
+    WHERE has_wire_service = :has_wire
+      AND final_authors_display IS NOT NULL
+      AND final_authors_display != ''
+    """
+)
+_CANONICAL_NAMES_SQL = text(
+    "SELECT DISTINCT canonical_name FROM sources "
+    "WHERE canonical_name IS NOT NULL AND canonical_name != ''"
+)
+_WIRE_HOSTS_SQL = text("SELECT host FROM sources WHERE is_wire_service = :is_wire")
+_ORGANIZATIONS_SQL = text(
+    """
+    SELECT DISTINCT name FROM gazetteer
+    WHERE category IN ('schools', 'government', 'healthcare', 'businesses')
+      AND name IS NOT NULL
+    """
+)
+
+# One cheap query per table; a changed result triggers a reload
+_FINGERPRINT_SQL = {
+    "wire_services": text("SELECT COUNT(*), MAX(updated_at) FROM wire_services"),
+    "local_broadcaster_callsigns": text(
+        "SELECT COUNT(*), MAX(updated_at) FROM local_broadcaster_callsigns"
+    ),
+    "byline_cleaning_telemetry": text(
+        "SELECT COUNT(*), MAX(extraction_timestamp) FROM byline_cleaning_telemetry "
+        "WHERE has_wire_service = :has_wire"
+    ),
+    "sources": text("SELECT COUNT(*), COUNT(DISTINCT canonical_name) FROM sources"),
+    "gazetteer": text("SELECT COUNT(*), MAX(created_at) FROM gazetteer"),
+}
+_FINGERPRINT_PARAMS = {"byline_cleaning_telemetry": {"has_wire": True}}
+
+
+class _LookupStats:
+    """Thread-safe counters shared by a registry and its snapshots."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.counts = {
+            "lookups": 0,
+            "queries": 0,
+            "version_checks": 0,
+            "reloads": 0,
+        }
+
+    def add(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counts[name] += amount
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self.counts)
+
+
+@dataclass(frozen=True)
+class ReferenceDataSnapshot:
+    """Immutable reference data as loaded at one point in time.
+
+    ``unavailable`` names the tables that could not be read (missing table,
+    database down); their data is empty so callers can apply their own
+    fallbacks.
+    """
+
+    wire_patterns: Mapping[str | None, tuple[WirePattern, ...]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    callsigns: Mapping[str, frozenset[str]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    wire_reporters: Mapping[str, tuple[str, str]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    source_canonical_names: tuple[str, ...] = ()
+    wire_service_hosts: frozenset[str] = frozenset()
+    organization_names: tuple[str, ...] = ()
+    fingerprint: tuple[Any, ...] | None = None
+    unavailable: frozenset[str] = frozenset()
+    loaded_at: float = field(default_factory=time.monotonic)
+    _stats: _LookupStats | None = field(default=None, compare=False, repr=False)
+
+    def _record_lookup(self) -> None:
+        if self._stats is not None:
+            self._stats.add("lookups")
+
+    def wire_service_patterns(self, pattern_type: str | None = None) -> list[tuple]:
+        """Active ``(pattern, service_name, case_sensitive)`` by priority."""
+        self._record_lookup()
+        return list(self.wire_patterns.get(pattern_type, ()))
+
+    def local_broadcaster_callsigns(self, dataset: str = "missouri") -> set[str]:
+        self._record_lookup()
+        return set(self.callsigns.get(dataset, ()))
+
+    def is_wire_service_host(self, host: str) -> bool:
+        self._record_lookup()
+        return host in self.wire_service_hosts
+
+    def publication_canonical_names(self) -> tuple[str, ...]:
+        self._record_lookup()
+        return self.source_canonical_names
+
+    def gazetteer_organization_names(self) -> tuple[str, ...]:
+        self._record_lookup()
+        return self.organization_names
+
+
+def _run(session, stats: _LookupStats, statement, params=None) -> list:
+    stats.add("queries")
+    return session.execute(statement, params or {}).fetchall()
+
+
+def load_reference_snapshot(
+    session, stats: _LookupStats | None = None
+) -> ReferenceDataSnapshot:
+    """Read every reference table through ``session`` into a snapshot."""
+    from src.models import Source
+
+    stats = stats or _LookupStats()
+    unavailable: set[str] = set()
+
+    def load(table: str, loader: Callable[[], Any], default: Any) -> Any:
+        try:
+            return loader()
+        except Exception as exc:
+            # A failed statement aborts the transaction on PostgreSQL
+            session.rollback()
+            unavailable.add(table)
+            logger.debug("Reference data table %s unavailable: %s", table, exc)
+            return default
+
+    def wire_patterns() -> dict[str | None, tuple[WirePattern, ...]]:
+        by_type: dict[str | None, list[WirePattern]] = {None: []}
+        rows = _run(session, stats, _WIRE_PATTERNS_SQL, {"active": True})
+        for pattern, service_name, case_sensitive, pattern_type in rows:
+            entry = (pattern, service_name, bool(case_sensitive))
+            by_type[None].append(entry)
+            by_type.setdefault(pattern_type, []).append(entry)
+        return {key: tuple(value) for key, value in by_type.items()}
+
+    def callsigns() -> dict[str, frozenset[str]]:
+        by_dataset: dict[str, set[str]] = {}
+        for dataset, callsign in _run(session, stats, _CALLSIGNS_SQL):
+            by_dataset.setdefault(dataset, set()).add(callsign)
+        return {key: frozenset(value) for key, value in by_dataset.items()}
+
+    def wire_reporters() -> dict[str, tuple[str, str]]:
+        rows = _run(session, stats, _WIRE_REPORTERS_SQL, {"has_wire": True})
+        return {
+            author.lower().strip(): (service_name, "high")
+            for author, service_name in rows
+            if author
+        }
+
+    def wire_hosts() -> frozenset[str]:
+        if "is_wire_service" not in Source.__table__.c:
+            return frozenset()
+        rows = _run(session, stats, _WIRE_HOSTS_SQL, {"is_wire": True})
+        return frozenset(host.lower() for (host,) in rows if host)
+
+    return ReferenceDataSnapshot(
+        fingerprint=reference_fingerprint(session, stats),
+        wire_patterns=MappingProxyType(load("wire_services", wire_patterns, {})),
+        callsigns=MappingProxyType(load("local_broadcaster_callsigns", callsigns, {})),
+        wire_reporters=MappingProxyType(
+            load("byline_cleaning_telemetry", wire_reporters, {})
+        ),
+        source_canonical_names=load(
+            "sources",
+            lambda: tuple(row[0] for row in _run(session, stats, _CANONICAL_NAMES_SQL)),
+            (),
+        ),
+        wire_service_hosts=load("wire_service_hosts", wire_hosts, frozenset()),
+        organization_names=load(
+            "gazetteer",
+            lambda: tuple(row[0] for row in _run(session, stats, _ORGANIZATIONS_SQL)),
+            (),
+        ),
+        unavailable=frozenset(unavailable),
+        _stats=stats,
+    )
+
+
+def reference_fingerprint(
+    session, stats: _LookupStats | None = None
+) -> tuple[Any, ...]:
+    """Per-table ``(count, marker)`` pairs; unreadable tables report None."""
+    stats = stats or _LookupStats()
+    parts = []
+    for table, statement in _FINGERPRINT_SQL.items():
+        try:
+            row = _run(session, stats, statement, _FINGERPRINT_PARAMS.get(table))[0]
+            parts.append((table, tuple(str(value) for value in row)))
+        except Exception:
+            session.rollback()
+            parts.append((table, None))
+    return tuple(parts)
+
+
+class ReferenceDataRegistry:
+    """Loads reference data once per process and refreshes it in background.
+
+    ``session_factory`` returns a context manager yielding a SQLAlchemy
+    session; by default one ``DatabaseManager`` is created on first use.
+    Pass ``background=False`` to refresh synchronously inside
+    ``snapshot()`` instead of on a daemon thread.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any] | None = None,
+        *,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL_SECONDS,
+        max_age: float = DEFAULT_MAX_AGE_SECONDS,
+        background: bool = True,
+    ) -> None:
+        self._session_factory = session_factory
+        self._db = None
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.background = background
+        self._stats = _LookupStats()
+        self._snapshot: ReferenceDataSnapshot | None = None
+        self._checked_at = 0.0
+        self._load_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread: threading.Thread | None = None
+
+    def _session(self):
+        if self._session_factory is not None:
+            return self._session_factory()
+        if self._db is None:
+            from src.models.database import DatabaseManager
+
+            self._db = DatabaseManager()
+        return self._db.get_session()
+
+    def snapshot(self) -> ReferenceDataSnapshot:
+        """The current snapshot, loading it on first use.
+
+        Schedules a refresh when the last check is older than
+        ``refresh_interval``; the returned snapshot is never mutated.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._load_lock:
+                if self._snapshot is None:
+                    self._load()
+            snapshot = self._snapshot
+        elif time.monotonic() - self._checked_at >= self.refresh_interval:
+            self._schedule_refresh()
+            snapshot = self._snapshot
+        return snapshot
+
+    def _load(self) -> None:
+        try:
+            with self._session() as session:
+                snapshot = load_reference_snapshot(session, self._stats)
+        except Exception as exc:
+            logger.warning("Failed to load reference data: %s", exc)
+            snapshot = ReferenceDataSnapshot(
+                unavailable=frozenset(_FINGERPRINT_SQL), _stats=self._stats
+            )
+        self._stats.add("reloads")
+        self._snapshot = snapshot
+        self._checked_at = time.monotonic()
+        logger.info(
+            "Loaded reference data: %d wire patterns, %d callsign datasets, "
+            "%d wire reporters, %d source names, %d organizations",
+            len(snapshot.wire_patterns.get(None, ())),
+            len(snapshot.callsigns),
+            len(snapshot.wire_reporters),
+            len(snapshot.source_canonical_names),
+            len(snapshot.organization_names),
+        )
+
+    def _schedule_refresh(self) -> None:
+        with self._refresh_lock:
+            if time.monotonic() - self._checked_at < self.refresh_interval:
+                return  # another reader already claimed this interval
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._checked_at = time.monotonic()
+            if self.background:
+                self._refresh_thread = threading.Thread(
+                    target=self.refresh,
+                    name="reference-data-refresh",
+                    daemon=True,
+                )
+                self._refresh_thread.start()
+                return
+        self.refresh()
+
+    def refresh(self, force: bool = False) -> bool:
+        """Reload when the tables changed (or ``force``); True if reloaded."""
+        current = self._snapshot
+        try:
+            if not force and current is not None:
+                if time.monotonic() - current.loaded_at < self.max_age:
+                    self._stats.add("version_checks")
+                    with self._session() as session:
+                        fingerprint = reference_fingerprint(session, self._stats)
+                    if fingerprint == current.fingerprint:
+                        self._checked_at = time.monotonic()
+                        return False
+            with self._load_lock:
+                self._load()
+            return True
+        except Exception as exc:
+            logger.warning("Reference data refresh failed: %s", exc)
+            return False
+
+    def stats(self, articles: int | None = None) -> dict[str, Any]:
+        """Counters, plus queries saved per 1,000 articles when given.
+
+        ``queries_saved`` is the number of snapshot lookups (each one a
+        query a cold per-article detector or cleaner cache would have run)
+        minus the queries the registry itself ran.
+        """
+        counts = self._stats.snapshot()
+        saved = max(counts["lookups"] - counts["queries"], 0)
+        result: dict[str, Any] = {**counts, "queries_saved": saved}
+        if articles:
+            result["queries_saved_per_1000_articles"] = round(
+                saved * 1000 / articles, 1
+            )
+        return result
+
+
+_registry: ReferenceDataRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_reference_data_registry() -> ReferenceDataRegistry:
+    """Get or create the process-wide reference data registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ReferenceDataRegistry()
+    return _registry
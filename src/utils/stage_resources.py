@@ -0,0 +1,87 @@
+"""Process-resident resources for long-lived pipeline stage workers.
+
+CLI handlers normally build their heavy objects (StorySniffer, the ML
+classifier, content cleaners) on every invocation, which is fine when each
+invocation is its own process. The warm stage runtime in
+``orchestration/stage_runtime.py`` instead calls the handlers repeatedly
+inside one worker process; it calls :func:`enable_stage_resources` so that
+:func:`stage_resource` keeps those objects resident between calls.
+
+Outside a stage worker :func:`stage_resource` simply calls the factory, so
+handlers behave exactly as before when run from the command line or tests.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_lock = threading.Lock()
+_enabled = False
+_resources: dict[Hashable, Any] = {}
+_stats = {"hits": 0, "loads": 0, "load_seconds": 0.0}
+
+
+def enable_stage_resources(enabled: bool = True) -> None:
+    """Turn resident resource caching on (stage workers) or off."""
+    global _enabled
+    with _lock:
+        _enabled = enabled
+        if not enabled:
+            _resources.clear()
+
+
+def stage_resources_enabled() -> bool:
+    """Return True when running inside a warm stage worker."""
+    return _enabled
+
+
+def stage_resource(key: Hashable, factory: Callable[[], T]) -> T:
+    """Return the resident object for ``key``, building it on first use.
+
+    When resident caching is disabled the factory is called every time.
+    """
+    if not _enabled:
+        return factory()
+
+    with _lock:
+        if key in _resources:
+            _stats["hits"] += 1
+            return _resources[key]
+
+    # Build outside the lock; handlers in one worker run sequentially
+    started = time.perf_counter()
+    resource = factory()
+    elapsed = time.perf_counter() - started
+    logger.info("Loaded resident stage resource %r in %.2fs", key, elapsed)
+
+    with _lock:
+        existing = _resources.setdefault(key, resource)
+        _stats["loads"] += 1
+        _stats["load_seconds"] += elapsed
+    return existing
+
+
+def discard_stage_resource(key: Hashable) -> None:
+    """Drop a resident object so the next call rebuilds it."""
+    with _lock:
+        _resources.pop(key, None)
+
+
+def stage_resource_stats() -> dict[str, Any]:
+    """Return hit/load counters and the keys currently resident."""
+    with _lock:
+        return {
+            "enabled": _enabled,
+            "hits": _stats["hits"],
+            "loads": _stats["loads"],
+            "load_seconds": round(_stats["load_seconds"], 3),
+            "resident": sorted(repr(key) for key in _resources),
+        }
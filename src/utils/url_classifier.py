@@ -1,8 +1,14 @@
 """URL classification utilities for filtering non-article pages during discovery."""
 
+import logging
 import re
+import threading
+import time
+from collections.abc import Callable, Sequence
 from urllib.parse import urlparse
 
+logger = logging.getLogger(__name__)
+
 # Patterns that strongly indicate a non-article page
 NON_ARTICLE_PATTERNS = [
     # Gallery and multimedia pages
@@ -57,6 +63,14 @@ COMPILED_NON_ARTICLE_PATTERNS = [
     re.compile(pattern, re.IGNORECASE) for pattern in NON_ARTICLE_PATTERNS
 ]
 
+# Single alternation of every non-article pattern so a path is scanned once
+_NON_ARTICLE_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in NON_ARTICLE_PATTERNS), re.IGNORECASE
+)
+
+# Backreferences would point at the wrong group once patterns are combined
+_BACKREFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=")
+
 
 def is_likely_article_url(url: str) -> bool:
     """Check if a URL is likely to be an article page.
@@ -84,11 +98,7 @@ def is_likely_article_url(url: str) -> bool:
         path = parsed.path.lower()
 
         # Check against non-article patterns
-        for pattern in COMPILED_NON_ARTICLE_PATTERNS:
-            if pattern.search(path):
-                return False
-
-        return True
+        return _NON_ARTICLE_RE.search(path) is None
 
     except Exception:
         # If parsing fails, be conservative and allow it
@@ -114,3 +124,96 @@ def classify_url_batch(urls: list[str]) -> tuple[list[str], list[str]]:
             filtered_out.append(url)
 
     return likely_articles, filtered_out
+
+
+class WireURLMatcher:
+    """Compiled, periodically refreshed matcher for wire-service URL patterns.
+
+    ``loader`` returns ``(pattern, service_name, case_sensitive)`` tuples in
+    priority order (the shape of
+    ``ContentTypeDetector._get_wire_service_patterns``). Patterns are compiled
+    once per refresh and a combined alternation pre-screens each URL, so the
+    common non-wire case costs a single regex scan. When the pre-screen hits,
+    patterns are tried in priority order so the first matching service wins.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Sequence[tuple]],
+        refresh_interval: float = 300.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._loader = loader
+        self.refresh_interval = refresh_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._compiled: list[tuple[re.Pattern[str], str]] = []
+        self._prefilter: re.Pattern[str] | None = None
+        self._loaded_at: float | None = None
+        self.loads = 0
+
+    @property
+    def pattern_count(self) -> int:
+        """Number of compiled patterns currently in use."""
+        return len(self._compiled)
+
+    def invalidate(self) -> None:
+        """Force a reload on the next match."""
+        with self._lock:
+            self._loaded_at = None
+
+    def refresh(self) -> None:
+        """Reload and recompile patterns from the loader."""
+        patterns = list(self._loader() or [])
+        compiled: list[tuple[re.Pattern[str], str]] = []
+        parts: list[str] = []
+        combinable = True
+        for pattern, service_name, case_sensitive in patterns:
+            flags = 0 if case_sensitive else re.IGNORECASE
+            try:
+                compiled.append((re.compile(pattern, flags), service_name))
+            except re.error as exc:
+                logger.warning(
+                    "Skipping invalid wire URL pattern %r (%s): %s",
+                    pattern,
+                    service_name,
+                    exc,
+                )
+                continue
+            if _BACKREFERENCE_RE.search(pattern):
+                combinable = False
+            parts.append(f"(?i:{pattern})" if flags else f"(?:{pattern})")
+
+        prefilter = None
+        if compiled and combinable:
+            try:
+                prefilter = re.compile("|".join(parts))
+            except re.error:
+                prefilter = None
+
+        with self._lock:
+            self._compiled = compiled
+            self._prefilter = prefilter
+            self._loaded_at = self._clock()
+            self.loads += 1
+
+    def _ensure_fresh(self) -> None:
+        loaded_at = self._loaded_at
+        if loaded_at is not None and (
+            self._clock() - loaded_at < self.refresh_interval
+        ):
+            return
+        self.refresh()
+
+    def match(self, url: str) -> str | None:
+        """Return the wire service name for ``url``, or None if no pattern hits."""
+        self._ensure_fresh()
+        prefilter = self._prefilter
+        compiled = self._compiled
+        if prefilter is not None and prefilter.search(url) is None:
+            return None
+        for regex, service_name in compiled:
+            if regex.search(url):
+                return service_name
+        return None
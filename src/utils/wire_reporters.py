@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Mapping
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -79,11 +80,15 @@ def set_wire_reporters_cache(reporters: dict[str, tuple[str, str]]):
     _wire_reporters_cache = reporters
 
 
-def is_wire_reporter(author: str) -> tuple[str, str] | None:
+def is_wire_reporter(
+    author: str, reporters: Mapping[str, tuple[str, str]] | None = None
+) -> tuple[str, str] | None:
     """Check if author is a known wire reporter.
 
     Args:
         author: Author name to check
+        reporters: Known reporters (e.g. from a reference data snapshot);
+            loaded from the database when not given
 
     Returns:
         Tuple of (service_name, confidence) if match found, None otherwise
@@ -94,7 +99,8 @@ def is_wire_reporter(author: str) -> tuple[str, str] | None:
     author_lower = author.lower().strip()
 
     # Load reporters from database
-    reporters = _load_wire_reporters()
+    if reporters is None:
+        reporters = _load_wire_reporters()
 
     # Direct match
     if author_lower in reporters:
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import threading
 from argparse import ArgumentParser, Namespace
 from collections import defaultdict
+from concurrent.futures import Future
+from unittest.mock import Mock
 
 import src.cli.commands.extraction as extraction
+from src.crawler.browser_pool import SeleniumFallbackQueue
 
 
 def _parse_args(argv: list[str]) -> Namespace:
@@ -80,7 +84,7 @@ def test_handle_extraction_command_success(monkeypatch):
         }
 
     monkeypatch.setattr(extraction, "ContentExtractor", FakeExtractor)
-    monkeypatch.setattr(extraction, "BylineCleaner", lambda: object())
+    monkeypatch.setattr(extraction, "BylineCleaner", lambda **_kw: object())
     monkeypatch.setattr(
         extraction,
         "ComprehensiveExtractionTelemetry",
@@ -134,7 +138,7 @@ def test_handle_extraction_command_handles_exception(monkeypatch):
         }
 
     monkeypatch.setattr(extraction, "ContentExtractor", FakeExtractor)
-    monkeypatch.setattr(extraction, "BylineCleaner", lambda: object())
+    monkeypatch.setattr(extraction, "BylineCleaner", lambda **_kw: object())
     monkeypatch.setattr(extraction, "_analyze_dataset_domains", fake_domain_analysis)
     monkeypatch.setattr(
         extraction,
@@ -329,6 +333,86 @@ def test_process_batch_success_path(monkeypatch):
     assert telemetry_calls
 
 
+def test_process_batch_merges_deferred_browser_results(monkeypatch):
+    rows = [
+        ("cand-1", "https://static.example.com/a", "Static", "article", None),
+        ("cand-2", "https://js.example.com/b", "Script", "article", None),
+        ("cand-3", "https://other.example.com/c", "Other", "article", None),
+    ]
+    session = _FakeSession(rows)
+    monkeypatch.setattr(extraction, "DatabaseManager", lambda: _FakeDBManager(session))
+
+    class FakeMetrics:
+        def __init__(self, *_a, **_kw):
+            self.error_message = None
+            self.error_type = None
+
+        def set_content_type_detection(self, *_a, **_kw):
+            return None
+
+        def finalize(self, *_a, **_kw):
+            return None
+
+    monkeypatch.setattr(extraction, "ExtractionMetrics", FakeMetrics)
+
+    def content(url):
+        return {"title": f"Title {url[-1]}", "content": "Body", "metadata": {}}
+
+    class QueueingExtractor:
+        selenium_queue = Mock(spec=SeleniumFallbackQueue)
+
+        def __init__(self):
+            self.submitted = []
+
+        def _check_rate_limit(self, _domain):
+            return False
+
+        def extract_content(self, *_a, **_kw):  # pragma: no cover - not used
+            raise AssertionError("browser pages must not render inline")
+
+        def submit_extraction(self, url, metrics=None):
+            self.submitted.append(url)
+            future = Future()
+            if "js." in url:
+                # Rendered by the browser pool after the HTTP pages
+                threading.Timer(0.05, future.set_result, [content(url)]).start()
+            else:
+                future.set_result(content(url))
+            return future
+
+    class FakeByline:
+        def clean_byline(self, *_a, **_kw):
+            return {"authors": [], "wire_services": []}
+
+    class FakeTelemetry:
+        def record_extraction(self, _metrics):
+            return None
+
+    domains_for_cleaning = defaultdict(list)
+    result = extraction._process_batch(
+        Namespace(limit=3, source=None),
+        QueueingExtractor(),
+        FakeByline(),
+        FakeTelemetry(),
+        3,
+        1,
+        {},
+        domains_for_cleaning,
+    )
+
+    assert result["processed"] == 3
+    assert [call["title"] for call in session.insert_calls] == [
+        "Title a",
+        "Title c",
+        "Title b",
+    ]
+    assert set(domains_for_cleaning) == {
+        "static.example.com",
+        "js.example.com",
+        "other.example.com",
+    }
+
+
 def test_process_batch_rate_limited(monkeypatch):
     rows = [("cand-1", "https://blocked.com/a", "Example", "article", None)]
     session = _FakeSession(rows)
@@ -524,6 +608,64 @@ def test_analyze_dataset_domains_no_urls():
     assert result["sample_domains"] == []
 
 
+def test_run_article_entity_extraction_isolates_failing_articles(monkeypatch, tmp_path):
+    from src.models import Article, ArticleEntity, CandidateLink
+    from src.models.database import DatabaseManager
+
+    db = DatabaseManager(database_url=f"sqlite:///{tmp_path / 'entities.db'}")
+    for article_id in ("good", "bad-extract", "bad-save"):
+        db.session.add(
+            CandidateLink(
+                id=f"cl-{article_id}",
+                url=f"https://example.com/{article_id}",
+                source="Example",
+            )
+        )
+        db.session.add(
+            Article(
+                id=article_id,
+                candidate_link_id=f"cl-{article_id}",
+                url=f"https://example.com/{article_id}",
+                content=f"Story about {article_id}",
+            )
+        )
+    db.session.commit()
+
+    class FakeExtractor:
+        extractor_version = "v1"
+
+        def extract(self, text, **_kw):
+            if "bad-extract" in text:
+                raise ValueError("extractor crashed")
+            return [{"entity_text": "Columbia", "entity_label": "GPE"}]
+
+    import src.pipeline.entity_extraction as entity_mod
+
+    monkeypatch.setattr(extraction, "_get_entity_extractor", FakeExtractor)
+    monkeypatch.setattr(entity_mod, "get_gazetteer_rows", lambda *a, **k: [])
+    monkeypatch.setattr(
+        entity_mod,
+        "attach_gazetteer_matches",
+        lambda _session, _source, _dataset, entities, **_k: entities,
+    )
+    real_save = extraction.save_article_entities_bulk
+
+    def failing_save(session, batch, *args, **kwargs):
+        batch = list(batch)
+        if any(article_id == "bad-save" for article_id, _, _ in batch):
+            raise RuntimeError("insert failed")
+        return real_save(session, batch, *args, **kwargs)
+
+    monkeypatch.setattr(extraction, "save_article_entities_bulk", failing_save)
+
+    extraction._run_article_entity_extraction(["good", "bad-extract", "bad-save"], db)
+
+    with db.get_session() as session:
+        saved = {row.article_id for row in session.query(ArticleEntity)}
+    assert saved == {"good"}
+    db.close()
+
+
 def test_run_article_entity_extraction_handles_skip(monkeypatch):
     class FakeExtractor:
         extractor_version = "v1"
@@ -593,7 +735,7 @@ def test_run_article_entity_extraction_handles_skip(monkeypatch):
     )
     monkeypatch.setattr(
         extraction,
-        "save_article_entities",
+        "save_article_entities_bulk",
         lambda *_a, **_kw: None,
     )
 
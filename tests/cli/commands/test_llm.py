@@ -67,6 +67,9 @@ def test_handle_llm_run_executes_pipeline(monkeypatch):
         anthropic_api_key=None,
         google_api_key=None,
         vector_store=None,
+        concurrency=1,
+        provider_limits={},
+        cache_path=None,
     )
     monkeypatch.setattr(llm, "load_llm_settings", lambda: fake_settings)
 
@@ -82,7 +85,7 @@ def test_handle_llm_run_executes_pipeline(monkeypatch):
         llm.LLMOrchestrator,
         "from_settings",
         classmethod(
-            lambda cls, settings, vector_store=None: orchestrators.append(
+            lambda cls, settings, vector_store=None, **_kwargs: orchestrators.append(
                 (settings, vector_store)
             )
             or SimpleNamespace()
@@ -131,12 +134,22 @@ def test_handle_llm_run_executes_pipeline(monkeypatch):
         def load_prompt_template(path):
             return "PROMPT" if path else None
 
-        def run(self, *, statuses=None, limit=None, dry_run=False):
+        def run(
+            self,
+            *,
+            statuses=None,
+            limit=None,
+            dry_run=False,
+            concurrency=1,
+            commit_every=None,
+        ):
             run_calls.append(
                 {
                     "statuses": statuses,
                     "limit": limit,
                     "dry_run": dry_run,
+                    "concurrency": concurrency,
+                    "commit_every": commit_every,
                 }
             )
             return list(self.results)
@@ -155,6 +168,9 @@ def test_handle_llm_run_executes_pipeline(monkeypatch):
         dry_run=False,
         show_failures=True,
         prompt_template=None,
+        concurrency=4,
+        commit_every=10,
+        cache_path=None,
     )
 
     exit_code = llm._handle_llm_run(args)
@@ -168,8 +184,73 @@ def test_handle_llm_run_executes_pipeline(monkeypatch):
             "statuses": ["cleaned"],
             "limit": 3,
             "dry_run": False,
+            "concurrency": 4,
+            "commit_every": 10,
         }
     ]
     assert any("Total articles evaluated: 2" in line for line in printed)
     assert any("Failures: 1" in line for line in printed)
     assert any("Summary sample" in line for line in printed)
+
+
+def test_handle_llm_run_flushes_local_vector_store(monkeypatch, tmp_path):
+    from src.services.llm.local_vectorstore import LocalVectorStore
+
+    fake_settings = SimpleNamespace(
+        vector_store=None,
+        concurrency=1,
+        provider_limits={},
+        cache_path=None,
+    )
+    monkeypatch.setattr(llm, "load_llm_settings", lambda: fake_settings)
+    store = LocalVectorStore(tmp_path, dim=16)
+    monkeypatch.setattr(
+        llm.VectorStoreFactory, "create", classmethod(lambda cls, settings: store)
+    )
+    monkeypatch.setattr(
+        llm.LLMOrchestrator,
+        "from_settings",
+        classmethod(
+            lambda cls, settings, vector_store=None, **_kwargs: SimpleNamespace(
+                vector_store=vector_store
+            )
+        ),
+    )
+    monkeypatch.setattr(
+        llm,
+        "DatabaseManager",
+        lambda: SimpleNamespace(session=None, close=lambda: None),
+    )
+
+    class FakePipeline:
+        def __init__(self, session, orchestrator, *, prompt_template=None):
+            self.orchestrator = orchestrator
+
+        @staticmethod
+        def load_prompt_template(path):
+            return None
+
+        def run(self, **_kwargs):
+            for index in range(3):
+                self.orchestrator.vector_store.store(
+                    prompt=f"prompt {index}",
+                    response=f"summary {index}",
+                    metadata={"article_id": f"a{index}"},
+                )
+            return []
+
+    monkeypatch.setattr(llm, "ArticleLLMPipeline", FakePipeline)
+    args = Namespace(
+        statuses=None,
+        limit=None,
+        dry_run=False,
+        show_failures=False,
+        prompt_template=None,
+        concurrency=None,
+        commit_every=None,
+        cache_path=None,
+    )
+
+    assert llm._handle_llm_run(args) == 0
+
+    assert len(LocalVectorStore(tmp_path)) == 3
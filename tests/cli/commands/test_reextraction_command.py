@@ -0,0 +1,129 @@
+"""Tests for the reextract CLI command."""
+
+import argparse
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.cli.commands import reextraction
+from src.models import Base
+from src.models.api_backend import ReextractionJob
+from src.pipeline.reextraction import CHANGED, FAILED, NOT_MODIFIED, ReextractionStats
+
+
+def test_parser_registers_reextract_options():
+    parser = argparse.ArgumentParser()
+    reextraction.add_reextraction_parser(parser.add_subparsers(dest="command"))
+
+    args = parser.parse_args(
+        ["reextract", "--host", "example.com", "--article-id", "a1", "--force"]
+    )
+
+    assert args.func is reextraction.handle_reextraction_command
+    assert args.host == "example.com"
+    assert args.article_ids == ["a1"]
+    assert args.force and not args.jobs and not args.skip_entities
+    assert not args.offline
+
+
+def test_parser_registers_offline_options():
+    parser = argparse.ArgumentParser()
+    reextraction.add_reextraction_parser(parser.add_subparsers(dest="command"))
+
+    args = parser.parse_args(
+        ["reextract", "--offline", "--archive-dir", "/data/html", "--workers", "8"]
+        + ["--dry-run", "--report", "diff.json"]
+    )
+
+    assert args.offline and args.dry_run and not args.skip_cleaning
+    assert args.archive_dir == "/data/html"
+    assert args.workers == 8
+    assert args.report == "diff.json"
+
+
+def test_offline_requires_archive(db, monkeypatch, capsys):
+    monkeypatch.delenv("HTML_ARCHIVE_DIR", raising=False)
+    args = argparse.Namespace(offline=True, archive_dir=None)
+
+    assert reextraction._reextract_offline(args, db) == 1
+    assert "--archive-dir" in capsys.readouterr().out
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        yield SimpleNamespace(session=session)
+    engine.dispose()
+
+
+def test_pending_jobs_record_stats_per_host(db, monkeypatch):
+    now = datetime.utcnow()
+    for job_id, host in [("j1", "good.example"), ("j2", "bad.example")]:
+        db.session.add(
+            ReextractionJob(
+                id=job_id, host=host, status="pending", created_at=now, updated_at=now
+            )
+        )
+    db.session.add(
+        ReextractionJob(
+            id="j0", host="done.example", status="completed", created_at=now
+        )
+    )
+    db.session.commit()
+    hosts = []
+
+    def fake_reextract(args, db, extractor, byline_cleaner, host):
+        hosts.append(host)
+        if host == "bad.example":
+            raise RuntimeError("publisher down")
+        stats = ReextractionStats()
+        stats.record(NOT_MODIFIED)
+        stats.record(CHANGED)
+        return stats
+
+    monkeypatch.setattr(reextraction, "_reextract", fake_reextract)
+
+    result = reextraction._process_pending_jobs(argparse.Namespace(), db, None, None)
+
+    assert result == 1
+    assert hosts == ["good.example", "bad.example"]
+    good = db.session.get(ReextractionJob, "j1")
+    bad = db.session.get(ReextractionJob, "j2")
+    assert good.status == "completed"
+    assert json.loads(good.result_json)["skipped_fraction"] == 0.5
+    assert bad.status == "failed"
+    assert json.loads(bad.result_json) == {"error": "publisher down"}
+
+
+def test_pending_jobs_report_failed_articles(db, monkeypatch):
+    now = datetime.utcnow()
+    outcomes = {"mixed.example": [CHANGED, FAILED], "down.example": [FAILED] * 2}
+    for host in outcomes:
+        db.session.add(
+            ReextractionJob(
+                id=host, host=host, status="pending", created_at=now, updated_at=now
+            )
+        )
+    db.session.commit()
+
+    def fake_reextract(args, db, extractor, byline_cleaner, host):
+        stats = ReextractionStats()
+        for outcome in outcomes[host]:
+            stats.record(outcome)
+        return stats
+
+    monkeypatch.setattr(reextraction, "_reextract", fake_reextract)
+
+    result = reextraction._process_pending_jobs(argparse.Namespace(), db, None, None)
+
+    assert result == 1
+    assert db.session.get(ReextractionJob, "mixed.example").status == "partial"
+    down = db.session.get(ReextractionJob, "down.example")
+    assert down.status == "failed"
+    assert json.loads(down.result_json)["failed"] == 2
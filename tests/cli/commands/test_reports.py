@@ -5,8 +5,6 @@ from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
 
-import pandas as pd
-
 import src.cli.commands.reports as reports
 
 
@@ -18,19 +16,17 @@ class FixedDateTime(datetime):
         return cls(2024, 9, 1, 12, 0, 0)
 
 
-def _dummy_dataframe(row_count: int = 2) -> pd.DataFrame:
-    return pd.DataFrame([{"idx": i} for i in range(row_count)])
-
-
 def test_handle_county_report_uses_default_output_path(monkeypatch, capsys):
     captured: dict[str, Any] = {}
 
-    def fake_generate(config, output_path: Path):
+    def fake_write(config, output_path: Path, *, output_format, chunk_size):
         captured["config"] = config
         captured["output"] = output_path
-        return _dummy_dataframe()
+        captured["format"] = output_format
+        captured["chunk_size"] = chunk_size
+        return 2
 
-    monkeypatch.setattr(reports, "generate_county_report", fake_generate)
+    monkeypatch.setattr(reports, "write_county_report", fake_write)
     monkeypatch.setattr(reports, "datetime", FixedDateTime)
 
     args = SimpleNamespace(
@@ -53,6 +49,8 @@ def test_handle_county_report_uses_default_output_path(monkeypatch, capsys):
     assert config.counties == ["Boone"]
     assert config.include_entities is True
     assert config.database_url == "sqlite:///data/test.db"
+    assert captured["format"] is None
+    assert captured["chunk_size"] == reports.DEFAULT_CHUNK_SIZE
 
     output = capsys.readouterr().out.strip()
     assert output == f"Wrote 2 rows to {expected_path}"
@@ -61,12 +59,14 @@ def test_handle_county_report_uses_default_output_path(monkeypatch, capsys):
 def test_handle_county_report_respects_cli_flags(monkeypatch, capsys, tmp_path):
     captured: dict[str, Any] = {}
 
-    def fake_generate(config, output_path: Path):
+    def fake_write(config, output_path: Path, *, output_format, chunk_size):
         captured["config"] = config
         captured["output"] = output_path
-        return _dummy_dataframe(row_count=3)
+        captured["format"] = output_format
+        captured["chunk_size"] = chunk_size
+        return 3
 
-    monkeypatch.setattr(reports, "generate_county_report", fake_generate)
+    monkeypatch.setattr(reports, "write_county_report", fake_write)
 
     custom_output = tmp_path / "custom.csv"
     args = SimpleNamespace(
@@ -78,6 +78,8 @@ def test_handle_county_report_respects_cli_flags(monkeypatch, capsys, tmp_path):
         label_version="v5",
         no_entities=True,
         output=custom_output,
+        output_format="csv",
+        chunk_size=500,
     )
 
     exit_code = reports.handle_county_report_command(args)
@@ -90,16 +92,18 @@ def test_handle_county_report_respects_cli_flags(monkeypatch, capsys, tmp_path):
     assert config.end_date == datetime(2024, 9, 30, 23, 59, 0)
     assert config.label_version == "v5"
     assert config.entity_separator == " | "
+    assert captured["format"] == "csv"
+    assert captured["chunk_size"] == 500
 
     output = capsys.readouterr().out.strip()
     assert output == f"Wrote 3 rows to {custom_output}"
 
 
 def test_handle_county_report_handles_generation_errors(monkeypatch, capsys):
-    def fake_generate(config, output_path: Path):
+    def fake_write(config, output_path: Path, *, output_format, chunk_size):
         raise ValueError("invalid counties")
 
-    monkeypatch.setattr(reports, "generate_county_report", fake_generate)
+    monkeypatch.setattr(reports, "write_county_report", fake_write)
 
     args = SimpleNamespace(
         counties=["Unknown"],
@@ -117,3 +121,24 @@ def test_handle_county_report_handles_generation_errors(monkeypatch, capsys):
     assert exit_code == 1
     stdout = capsys.readouterr().out.strip()
     assert stdout.startswith("County report failed:")
+
+
+def test_handle_county_report_default_path_uses_requested_format(monkeypatch):
+    captured: dict[str, Any] = {}
+
+    def fake_write(config, output_path: Path, *, output_format, chunk_size):
+        captured["output"] = output_path
+        return 0
+
+    monkeypatch.setattr(reports, "write_county_report", fake_write)
+    monkeypatch.setattr(reports, "datetime", FixedDateTime)
+
+    args = SimpleNamespace(
+        counties=["Boone"],
+        start_date=datetime(2024, 8, 1, 0, 0, 0),
+        output=None,
+        output_format="parquet",
+    )
+
+    assert reports.handle_county_report_command(args) == 0
+    assert captured["output"] == Path("reports/county_report_20240901_120000.parquet")
@@ -112,6 +112,35 @@ def test_handle_verification_passes_idle_grace(monkeypatch):
     assert recorded == [(None, 180)]
 
 
+def test_handle_verification_passes_concurrency(monkeypatch):
+    monkeypatch.setattr(verification.logging, "basicConfig", lambda **_: None)
+
+    recorded: list[tuple[int | None, int]] = []
+
+    class ConcurrentService:
+        def __init__(self, *, batch_size: int, sleep_interval: int) -> None:
+            self.batch_size = batch_size
+            self.sleep_interval = sleep_interval
+
+        def run_verification_loop(
+            self,
+            *,
+            max_batches: int | None,
+            concurrency: int | None = None,
+            per_host_concurrency: int = 2,
+        ) -> None:
+            recorded.append((concurrency, per_host_concurrency))
+
+    monkeypatch.setattr(verification, "URLVerificationService", ConcurrentService)
+
+    args = _default_args(concurrency=16, per_host_concurrency=3)
+
+    exit_code = verification.handle_verification_command(args)
+
+    assert exit_code == 0
+    assert recorded == [(16, 3)]
+
+
 def test_handle_verification_returns_error_on_failure(monkeypatch):
     monkeypatch.setattr(verification.logging, "basicConfig", lambda **_: None)
 
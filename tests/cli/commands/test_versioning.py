@@ -177,3 +177,67 @@ def test_handle_export_snapshot_error(monkeypatch, capsys):
 
     assert result == 1
     assert "Failed to export snapshot" in output
+
+
+def test_handle_export_snapshot_command_with_change_column(monkeypatch, capsys):
+    captured = {}
+
+    def fake_export(version_id, table, output_path, **kwargs):
+        captured.update(kwargs)
+        return types.SimpleNamespace(id=version_id, snapshot_path=output_path)
+
+    monkeypatch.setattr(versioning, "export_snapshot_for_version", fake_export)
+
+    args = argparse.Namespace(
+        version_id="v1",
+        table="articles",
+        output="base.parquet",
+        snapshot_chunksize=10_000,
+        snapshot_compression="zstd",
+        change_column="updated_at",
+        key_column="id",
+    )
+
+    assert versioning.handle_export_snapshot_command(args) == 0
+    assert captured["change_column"] == "updated_at"
+    assert captured["key_column"] == "id"
+    assert captured["compression"] == "zstd"
+
+
+def test_handle_export_delta_command(monkeypatch, capsys):
+    def fake_export(version_id, table, output_path, **kwargs):
+        assert version_id == "v2"
+        assert table == "articles"
+        assert kwargs["compression"] is None
+        return output_path
+
+    monkeypatch.setattr(versioning, "export_delta_snapshot_for_version", fake_export)
+
+    args = argparse.Namespace(
+        version_id="v2",
+        table="articles",
+        output="delta.parquet",
+        snapshot_chunksize=10_000,
+        snapshot_compression="none",
+    )
+
+    result = versioning.handle_export_delta_command(args)
+    output = capsys.readouterr().out
+
+    assert result == 0
+    assert "Delta snapshot created: v2 -> delta.parquet" in output
+
+
+def test_handle_compact_version_error(monkeypatch, capsys):
+    def fake_compact(*args, **kwargs):
+        raise ValueError("DatasetVersion v2 has no snapshot manifest")
+
+    monkeypatch.setattr(versioning, "compact_dataset_version", fake_compact)
+
+    result = versioning.handle_compact_version_command(
+        argparse.Namespace(version_id="v2", output="compact.parquet"),
+    )
+    output = capsys.readouterr().out
+
+    assert result == 1
+    assert "Failed to compact version" in output
@@ -0,0 +1,217 @@
+"""Tests for the Selenium browser pool and fallback queue."""
+
+from __future__ import annotations
+
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import src.crawler as crawler_module
+from src.crawler import ContentExtractor
+from src.crawler.browser_pool import BrowserPool, SeleniumFallbackQueue
+
+ARTICLE_BODY = " ".join(
+    ["County commissioners approved the road budget after a public hearing."] * 8
+)
+RENDERED_PAGE = f"""<html><head><title>Budget approved</title>
+<meta name="author" content="Jane Reporter">
+<meta property="article:published_time" content="2025-01-15T10:00:00">
+</head><body><article><h1>Budget approved</h1>
+<p>{ARTICLE_BODY}</p><p>{ARTICLE_BODY}</p></article></body></html>"""
+SHELL_PAGE = "<html><head></head><body><div id='app'></div></body></html>"
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802 - http.server API
+        # /js/* pages only have content once "rendered" by the browser
+        rendered = "rendered=1" in self.path or not self.path.startswith("/js/")
+        body = (RENDERED_PAGE if rendered else SHELL_PAGE).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def page_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class FakeDriver:
+    """Just enough WebDriver for the extractor's Selenium path."""
+
+    def __init__(self, render_delay: float = 0.0, fail_on: str | None = None):
+        self.render_delay = render_delay
+        self.fail_on = fail_on
+        self.page_source = ""
+        self.pages: list[str] = []
+        self.quit_called = False
+
+    def get(self, url):
+        if self.fail_on and self.fail_on in url:
+            raise RuntimeError("chrome not reachable: driver session crashed")
+        time.sleep(self.render_delay)
+        separator = "&" if "?" in url else "?"
+        with urllib.request.urlopen(f"{url}{separator}rendered=1") as response:
+            self.page_source = response.read().decode()
+        self.pages.append(url)
+
+    def find_element(self, *_args):
+        return object()
+
+    def find_elements(self, *_args):
+        return []
+
+    def execute_script(self, *_args):
+        return None
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_pool_recycles_after_max_pages():
+    drivers = []
+
+    def factory():
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    pool = BrowserPool(factory, size=1, max_pages=2)
+    for _ in range(5):
+        with pool.lease():
+            pass
+
+    assert len(drivers) == 3
+    assert [driver.quit_called for driver in drivers] == [True, True, False]
+    assert pool.get_stats()["recycled_pages"] == 2
+    pool.close()
+    assert drivers[-1].quit_called
+
+
+def test_pool_recycles_crashed_and_oversized_drivers():
+    memory = {"value": 100.0}
+    pool = BrowserPool(
+        FakeDriver,
+        size=1,
+        max_memory_mb=500,
+        memory_probe=lambda _driver: memory["value"],
+    )
+
+    with pytest.raises(RuntimeError):
+        with pool.lease() as driver:
+            raise RuntimeError("boom")
+    assert driver.quit_called
+
+    with pool.lease() as driver:
+        pool.mark_broken(driver)
+    assert driver.quit_called
+
+    with pool.lease() as driver:
+        memory["value"] = 900.0
+    assert driver.quit_called
+
+    with pool.lease() as driver:
+        memory["value"] = 100.0
+    assert not driver.quit_called
+
+    stats = pool.get_stats()
+    assert stats["recycled_crash"] == 2
+    assert stats["recycled_memory"] == 1
+    assert stats["idle"] == 1
+
+
+def test_queue_bounds_concurrency_to_pool_size():
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def render(_driver, value):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        return value * 2
+
+    queue = SeleniumFallbackQueue(BrowserPool(FakeDriver, size=2), max_pending=3)
+    futures = [queue.submit(render, value) for value in range(8)]
+
+    assert [future.result(timeout=5) for future in futures] == [
+        value * 2 for value in range(8)
+    ]
+    assert active["peak"] == 2
+    stats = queue.get_stats()
+    assert stats["completed"] == 8
+    assert stats["pool"]["created"] == 2
+    queue.close()
+
+
+def test_submit_extraction_defers_only_browser_pages(monkeypatch, page_server):
+    monkeypatch.setattr(crawler_module, "SELENIUM_AVAILABLE", True)
+    extractor = ContentExtractor()
+    extractor.enable_browser_pool(
+        2, driver_factory=lambda: FakeDriver(render_delay=0.2)
+    )
+
+    def fetch(path):
+        with urllib.request.urlopen(f"{page_server}{path}") as response:
+            return response.read().decode()
+
+    try:
+        static_url = f"{page_server}/news/budget"
+        static = extractor.submit_extraction(static_url, html=fetch("/news/budget"))
+        # Static pages never wait on a browser
+        assert static.done()
+        assert static.result()["metadata"]["extraction_method"] != "selenium"
+
+        started = time.perf_counter()
+        js_url = f"{page_server}/js/budget"
+        deferred = extractor.submit_extraction(js_url, html=fetch("/js/budget"))
+        assert time.perf_counter() - started < 0.2
+        assert not deferred.done()
+
+        result = deferred.result(timeout=10)
+        assert result["title"] == "Budget approved"
+        assert "County commissioners" in result["content"]
+        assert result["metadata"]["extraction_methods"]["content"] == "selenium"
+        assert extractor.get_driver_stats()["browser_pool"]["completed"] == 1
+    finally:
+        extractor.close_browser_pool()
+    assert extractor.selenium_queue is None
+
+
+def test_crashed_pooled_driver_is_replaced(monkeypatch, page_server):
+    monkeypatch.setattr(crawler_module, "SELENIUM_AVAILABLE", True)
+    drivers = []
+
+    def factory():
+        drivers.append(FakeDriver(fail_on="/js/crash"))
+        return drivers[-1]
+
+    extractor = ContentExtractor()
+    extractor.enable_browser_pool(1, driver_factory=factory)
+    try:
+        crashed = extractor.submit_extraction(
+            f"{page_server}/js/crash", html=SHELL_PAGE
+        )
+        assert not crashed.result(timeout=10)["content"]
+
+        ok = extractor.submit_extraction(f"{page_server}/js/ok", html=SHELL_PAGE)
+        assert ok.result(timeout=10)["content"]
+    finally:
+        extractor.close_browser_pool()
+
+    assert len(drivers) == 2
+    assert drivers[0].quit_called
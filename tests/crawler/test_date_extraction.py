@@ -0,0 +1,90 @@
+"""Tests for cached publish-date parsing and per-host strategy ordering."""
+
+from bs4 import BeautifulSoup
+
+from src.crawler import ContentExtractor
+from src.crawler.date_extraction import (
+    DateStrategyCache,
+    date_from_url,
+    parse_cache_info,
+    parse_date,
+)
+
+
+def test_parse_date_matches_dateutil_formats():
+    assert parse_date("2026-10-01T10:00:00Z") == "2026-10-01T10:00:00+00:00"
+    assert parse_date("2026-10-01") == "2026-10-01T00:00:00"
+    assert parse_date("October 12, 2026 4:05 PM") == "2026-10-12T16:05:00"
+    assert parse_date("2026-13-01") is None
+    # No digits: dateutil would resolve these relative to today
+    assert parse_date("Monday") is None
+    assert parse_date(None) is None
+
+
+def test_parse_date_caches_repeated_strings():
+    before = parse_cache_info().hits
+    for _ in range(3):
+        parse_date("Sept. 30, 2026")
+
+    assert parse_cache_info().hits - before == 2
+
+
+def test_date_from_url_only_for_known_hosts():
+    assert date_from_url("https://www.kbia.org/news/2026-10-05/story") == (
+        "2026-10-05T00:00:00",
+        "dash_year_month_day",
+    )
+    assert date_from_url("https://example.com/2026/10/05/story") is None
+
+
+def test_strategy_cache_promotes_winner_after_min_wins():
+    cache = DateStrategyCache(min_wins=2, max_hosts=2)
+    strategies = ["json_ld", "time_tag", "text_block"]
+
+    cache.record("a.example", "time_tag")
+    assert cache.order("a.example", strategies) == strategies
+    cache.record("a.example", "time_tag")
+    assert cache.order("a.example", strategies)[0] == "time_tag"
+
+    cache.record("b.example", "json_ld")
+    cache.record("c.example", "json_ld")
+    assert cache.winner("a.example") is None  # evicted
+
+
+def test_extractor_learns_host_strategy():
+    extractor = ContentExtractor()
+    extractor.date_strategies.min_wins = 1
+    html = (
+        "<html><head>"
+        '<meta property="article:published_time" content="2026-10-01T10:00:00">'
+        '</head><body><time datetime="2026-09-30T08:00:00">Sept. 30</time>'
+        "<p>Published Sept. 29, 2026</p></body></html>"
+    )
+    url = "https://news.example/local/story"
+
+    first = extractor._extract_published_date(
+        BeautifulSoup(html, "html.parser"), html, url
+    )
+    assert first == "2026-10-01T10:00:00"
+    assert extractor._publish_date_details["source"] == "meta_tag"
+    assert (
+        extractor.date_strategies.winner("news.example")
+        == "meta:property=article:published_time"
+    )
+
+    page = html.replace("article:published_time", "og:updated_time")
+    second = extractor._extract_published_date(
+        BeautifulSoup(page, "html.parser"), page, url
+    )
+    assert second == "2026-09-30T08:00:00"
+    assert extractor._publish_date_details["source"] == "time_tag"
+
+
+def test_text_block_date_without_keyword_match():
+    extractor = ContentExtractor()
+    html = "<html><body><p>Jane Doe</p><p>October 12, 2026</p></body></html>"
+
+    parsed = extractor._extract_published_date(BeautifulSoup(html, "html.parser"), html)
+
+    assert parsed == "2026-10-12T00:00:00"
+    assert extractor._publish_date_details["source"] == "text_block_loose"
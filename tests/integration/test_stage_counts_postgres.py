@@ -0,0 +1,127 @@
+"""Integration tests for the pipeline stage count triggers on PostgreSQL.
+
+The triggers are installed by the ``add_pipeline_stage_counts`` migration;
+tests skip when the target database has not been migrated that far. All
+changes happen inside the ``cloud_sql_session`` transaction and are rolled
+back afterwards.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+from src.models import Article, ArticleEntity, CandidateLink
+
+pytestmark = [pytest.mark.postgres, pytest.mark.integration]
+
+
+@pytest.fixture
+def session(cloud_sql_session):
+    installed = cloud_sql_session.execute(
+        text(
+            "SELECT COUNT(*) FROM pg_trigger "
+            "WHERE tgname LIKE 'pipeline_stage_%' AND NOT tgisinternal"
+        )
+    ).scalar()
+    if not installed:
+        pytest.skip("pipeline stage count triggers are not installed")
+    return cloud_sql_session
+
+
+def _deltas(session) -> dict[str, int]:
+    session.flush()
+    rows = session.execute(
+        text(
+            "SELECT stage, COALESCE(SUM(delta), 0) "
+            "FROM pipeline_stage_count_deltas GROUP BY stage"
+        )
+    )
+    return {stage: int(total) for stage, total in rows}
+
+
+def test_triggers_track_a_link_through_the_pipeline(session):
+    baseline = _deltas(session)
+
+    def changed():
+        current = _deltas(session)
+        stages = set(current) | set(baseline)
+        return {
+            stage: current.get(stage, 0) - baseline.get(stage, 0)
+            for stage in stages
+            if current.get(stage, 0) != baseline.get(stage, 0)
+        }
+
+    link = CandidateLink(
+        id=str(uuid.uuid4()),
+        url=f"https://stage-counts.example.com/{uuid.uuid4()}",
+        source="Stage Counts",
+        status="discovered",
+    )
+    session.add(link)
+    assert changed() == {"verification": 1}
+
+    link.status = "article"
+    assert changed() == {"extraction": 1}
+
+    article = Article(
+        id=str(uuid.uuid4()),
+        candidate_link_id=link.id,
+        url=link.url,
+        content="Body",
+        status="extracted",
+    )
+    session.add(article)
+    assert changed() == {"cleaning": 1, "analysis": 1, "entity_extraction": 1}
+
+    session.add(
+        ArticleEntity(
+            article_id=article.id,
+            entity_text="Columbia",
+            entity_norm="columbia",
+            entity_label="GPE",
+        )
+    )
+    assert changed() == {"cleaning": 1, "analysis": 1}
+
+    article.status = "cleaned"
+    assert changed() == {}
+
+
+def test_bulk_update_writes_one_delta_per_stage(session):
+    links = [
+        CandidateLink(
+            id=str(uuid.uuid4()),
+            url=f"https://stage-counts.example.com/bulk-{index}-{uuid.uuid4()}",
+            source="Stage Counts Bulk",
+            status="discovered",
+        )
+        for index in range(5)
+    ]
+    session.add_all(links)
+    session.flush()
+    before = session.execute(
+        text("SELECT COUNT(*) FROM pipeline_stage_count_deltas")
+    ).scalar()
+
+    session.execute(
+        text(
+            "UPDATE candidate_links SET status = 'article' "
+            "WHERE source = 'Stage Counts Bulk'"
+        )
+    )
+
+    rows = session.execute(
+        text(
+            "SELECT stage, delta FROM pipeline_stage_count_deltas "
+            "ORDER BY id DESC LIMIT 2"
+        )
+    ).all()
+    after = session.execute(
+        text("SELECT COUNT(*) FROM pipeline_stage_count_deltas")
+    ).scalar()
+    assert after - before == 2
+    assert sorted(tuple(row) for row in rows) == [
+        ("extraction", 5),
+        ("verification", -5),
+    ]
@@ -392,3 +392,59 @@ class TestVerificationTelemetryPostgres:
         # Should find the recently verified candidate
         assert len(recent_verifications) >= 1
         assert candidate.id in [row[0] for row in recent_verifications]
+
+
+class TestVerificationBulkUpdatePostgres:
+    """Test the bulk UPDATE ... FROM (VALUES ...) status flush."""
+
+    def test_update_candidate_statuses_postgres(
+        self, cloud_sql_session, discovered_candidates
+    ):
+        """Bulk status flush updates every row in one statement."""
+        import logging
+        from types import SimpleNamespace
+
+        from src.services.url_verification import URLVerificationService
+
+        connection = cloud_sql_session.connection()
+
+        class _SharedConnection:
+            """Reuse the fixture transaction so the test rolls back cleanly."""
+
+            def __enter__(self):
+                return connection
+
+            def __exit__(self, *_):
+                return None
+
+        service = URLVerificationService.__new__(URLVerificationService)
+        service.logger = logging.getLogger(__name__)
+        service.db = SimpleNamespace(
+            engine=SimpleNamespace(
+                dialect=connection.dialect, connect=lambda: _SharedConnection()
+            )
+        )
+
+        first, second, third = discovered_candidates[:3]
+        service.update_candidate_statuses(
+            [
+                (first.id, "article", None),
+                (second.id, "verification_failed", "HTTP 503"),
+                (third.id, "wire", None),
+            ]
+        )
+
+        rows = {
+            row[0]: (row[1], row[2], row[3])
+            for row in cloud_sql_session.execute(
+                text(
+                    "SELECT id, status, error_message, processed_at "
+                    "FROM candidate_links WHERE id IN (:a, :b, :c)"
+                ),
+                {"a": first.id, "b": second.id, "c": third.id},
+            )
+        }
+        assert rows[first.id][:2] == ("article", None)
+        assert rows[second.id][:2] == ("verification_failed", "HTTP 503")
+        assert rows[third.id][:2] == ("wire", None)
+        assert all(value[2] is not None for value in rows.values())
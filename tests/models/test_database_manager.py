@@ -5,17 +5,20 @@ import os
 import sqlite3
 import tempfile
 import types
+from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
 import pytest
-from sqlalchemy import select, text
+from sqlalchemy import create_engine, select, text
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
 
 from src.models import (
     Article,
     ArticleEntity,
     ArticleLabel,
+    Base,
     CandidateLink,
     Dataset,
     Job,
@@ -25,21 +28,32 @@ from src.models import (
 )
 from src.models.database import (
     DatabaseManager,
+    EnginePoolSettings,
     _commit_with_retry,
     _normalize_entity_text,
     _prediction_to_tuple,
     bulk_insert_articles,
     bulk_insert_candidate_links,
     calculate_content_hash,
+    clear_statement_cache,
+    compile_statement,
     create_job_record,
+    dispose_shared_engines,
+    engine_pool_metrics,
+    ensure_schema,
     export_to_parquet,
     finish_job_record,
+    get_shared_engine,
     read_articles,
     read_candidate_links,
+    safe_execute,
+    safe_session_execute,
     save_article_classification,
     save_article_entities,
+    save_article_entities_bulk,
     save_locations,
     save_ml_results,
+    statement_cache_stats,
     upsert_article,
     upsert_candidate_link,
 )
@@ -79,6 +93,123 @@ def test_database_manager_context_calls_close(monkeypatch):
         assert close_calls == [True]
 
 
+def test_shared_engine_reused_across_managers():
+    """Shared managers reuse one engine and create the schema only once."""
+
+    with temporary_database() as (db_url, _):
+        create_calls = []
+        original_create_all = Base.metadata.create_all
+
+        def counting_create_all(bind, *args, **kwargs):
+            create_calls.append(bind)
+            return original_create_all(bind, *args, **kwargs)
+
+        try:
+            with pytest.MonkeyPatch.context() as mp:
+                mp.setattr(Base.metadata, "create_all", counting_create_all)
+                first = DatabaseManager(database_url=db_url, shared_engine=True)
+                first.close()
+                second = DatabaseManager(database_url=db_url, shared_engine=True)
+
+            assert second.engine is first.engine
+            assert len(create_calls) == 1
+
+            # close() on a shared manager must leave the pool usable
+            with second.get_session() as session:
+                assert session.execute(text("SELECT 1")).scalar() == 1
+            second.close()
+        finally:
+            dispose_shared_engines()
+
+
+def test_sqlite_managers_keep_private_engines():
+    """SQLite defaults to a private engine so test databases stay isolated."""
+
+    with temporary_database() as (db_url, _):
+        first = DatabaseManager(database_url=db_url)
+        second = DatabaseManager(database_url=db_url)
+        try:
+            assert first.engine is not second.engine
+        finally:
+            first.close()
+            second.close()
+
+
+def test_get_shared_engine_keys_on_pool_settings_and_reports_metrics():
+    """Distinct pool settings get distinct engines; metrics cover checkouts."""
+
+    with temporary_database() as (db_url, _):
+        small = EnginePoolSettings(pool_size=1, max_overflow=0)
+        try:
+            engine = get_shared_engine(db_url, pool_settings=small)
+            assert get_shared_engine(db_url, pool_settings=small) is engine
+            assert (
+                get_shared_engine(db_url, pool_settings=EnginePoolSettings())
+                is not engine
+            )
+
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                (metrics,) = [m for m in engine_pool_metrics() if m["size"] == 1]
+                assert metrics["checked_out"] == 1
+
+            assert metrics["checkouts"] >= 1
+            assert metrics["wait_seconds_total"] >= 0.0
+            assert metrics["database_url"] == db_url
+        finally:
+            dispose_shared_engines()
+        assert engine_pool_metrics() == []
+
+
+def test_get_shared_engine_passes_pool_settings_to_creator():
+    """Custom creators (Cloud SQL) still get the tuned, instrumented pool."""
+
+    with temporary_database() as (db_url, _):
+        settings = EnginePoolSettings(pool_size=2, max_overflow=1)
+        received = {}
+
+        def creator(**kwargs):
+            received.update(kwargs)
+            return create_engine(db_url, **kwargs)
+
+        try:
+            engine = get_shared_engine(db_url, pool_settings=settings, creator=creator)
+            assert received["pool_size"] == 2
+            assert received["max_overflow"] == 1
+            assert engine.pool.size() == 2
+            (metrics,) = engine_pool_metrics()
+            assert metrics["pool_class"] == "_InstrumentedQueuePool"
+        finally:
+            dispose_shared_engines()
+
+
+def test_ensure_schema_runs_once_per_engine():
+    """ensure_schema is idempotent per engine unless forced."""
+
+    with temporary_database() as (db_url, _):
+        manager = DatabaseManager(database_url=db_url)
+        try:
+            assert ensure_schema(manager.engine) is False
+            assert ensure_schema(manager.engine, force=True) is True
+        finally:
+            manager.close()
+
+
+def test_pool_settings_from_env(monkeypatch):
+    """Pool tuning can be overridden through environment variables."""
+
+    monkeypatch.setenv("DB_POOL_SIZE", "12")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "3")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+
+    settings = EnginePoolSettings.from_env()
+
+    assert settings.pool_size == 12
+    assert settings.max_overflow == 3
+    assert settings.pool_pre_ping is False
+    assert settings.pool_recycle == EnginePoolSettings().pool_recycle
+
+
 def test_upsert_candidate_link_inserts_and_updates():
     """upsert_candidate_link should normalize URLs and update existing rows."""
 
@@ -1002,6 +1133,83 @@ def test_save_article_entities_replaces_existing():
         manager.close()
 
 
+def test_save_article_entities_bulk_replaces_many_articles():
+    with temporary_database() as (db_url, _):
+        manager = DatabaseManager(database_url=db_url)
+
+        for article_id in ("bulk-a", "bulk-b", "bulk-c"):
+            manager.session.add(
+                Article(
+                    id=article_id,
+                    candidate_link_id=f"cand-{article_id}",
+                    url=f"https://example.com/{article_id}",
+                )
+            )
+        manager.session.add_all(
+            [
+                ArticleEntity(
+                    article_id="bulk-a",
+                    entity_text="Old Name",
+                    entity_norm="old name",
+                    entity_label="PLACE",
+                    extractor_version="v1",
+                ),
+                ArticleEntity(
+                    article_id="bulk-a",
+                    entity_text="Other Version",
+                    entity_norm="other version",
+                    entity_label="PLACE",
+                    extractor_version="v0",
+                ),
+            ]
+        )
+        manager.session.commit()
+
+        inserted = save_article_entities_bulk(
+            manager.session,
+            [
+                (
+                    "bulk-a",
+                    [
+                        {"entity_text": "City Hall", "entity_label": "PLACE"},
+                        {"text": "city hall", "label": "PLACE"},
+                        {"entity_text": "Boone County", "entity_label": "GPE"},
+                    ],
+                    "hash-a",
+                ),
+                ("bulk-b", [{"text": None}], "hash-b"),
+                ("bulk-c", [{"text": "Columbia", "meta": {"k": 1}}], None),
+            ],
+            extractor_version="v1",
+        )
+
+        assert inserted == 4
+        rows = (
+            manager.session.query(ArticleEntity)
+            .order_by(ArticleEntity.article_id, ArticleEntity.entity_norm)
+            .all()
+        )
+        assert [
+            (row.article_id, row.entity_norm, row.extractor_version) for row in rows
+        ] == [
+            ("bulk-a", "boone county", "v1"),
+            ("bulk-a", "city hall", "v1"),
+            ("bulk-a", "other version", "v0"),
+            ("bulk-b", "__no_entities_found__", "v1"),
+            ("bulk-c", "columbia", "v1"),
+        ]
+        sentinel = rows[3]
+        assert sentinel.entity_label == "SENTINEL"
+        assert sentinel.article_text_hash == "hash-b"
+        assert sentinel.meta["sentinel"] is True
+        assert rows[4].meta == {"k": 1}
+        assert all(row.id and row.created_at for row in rows)
+
+        assert save_article_entities_bulk(manager.session, [], "v1") == 0
+
+        manager.close()
+
+
 def test_create_and_finish_job_record_updates_metrics():
     with temporary_database() as (db_url, _):
         manager = DatabaseManager(database_url=db_url)
@@ -1121,3 +1329,81 @@ def test_export_to_parquet_emits_snappy_file(tmp_path, monkeypatch):
         assert Path(result).read_text() == "parquet-placeholder"
 
         manager.close()
+
+
+def test_compile_statement_rewrites_placeholders_and_caches():
+    clear_statement_cache()
+
+    statement = compile_statement("INSERT INTO t (a, b, c) VALUES (?, ?, ?)")
+    again = compile_statement("INSERT INTO t (a, b, c) VALUES (?, ?, ?)")
+    percent = compile_statement("UPDATE t SET a = %s WHERE b = %s RETURNING a")
+
+    assert again is statement
+    assert str(statement.clause) == "INSERT INTO t (a, b, c) VALUES (:p0, :p1, :p2)"
+    assert statement.placeholder_count == 3
+    assert statement.bind((1, "x", None)) == {"p0": 1, "p1": "x", "p2": None}
+    assert statement.is_bulk_dml is True
+    assert str(percent.clause) == "UPDATE t SET a = :p0 WHERE b = :p1 RETURNING a"
+    assert percent.is_bulk_dml is False
+    assert percent.driver_sql("qmark") == "UPDATE t SET a = ? WHERE b = ? RETURNING a"
+    assert compile_statement("SELECT '%' || ?").driver_sql("pyformat") is None
+
+    stats = statement_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["size"] == 3
+
+
+def test_safe_execute_batches_and_single_rows_share_cached_statement():
+    clear_statement_cache()
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (a INTEGER, b TEXT, c TIMESTAMP)"))
+        insert_sql = "INSERT INTO t (a, b, c) VALUES (?, ?, ?)"
+
+        # Plain scalars go through the driver's executemany
+        safe_execute(conn, insert_sql, [(1, "one", None), (2, "two", None)])
+        assert statement_cache_stats()["executemany_batches"] == 1
+
+        # Non-scalar values keep the named-parameter path
+        stamp = datetime(2024, 1, 2, 3, 4, 5)
+        safe_execute(conn, insert_sql, [(3, "three", stamp)])
+        assert statement_cache_stats()["executemany_batches"] == 1
+
+        safe_execute(conn, insert_sql, (4, "four", None))
+        # Named parameters keep the SQL verbatim
+        rows = safe_execute(
+            conn, "SELECT a, b, c FROM t WHERE a >= :low ORDER BY a", {"low": 0}
+        ).fetchall()
+
+    assert [tuple(row)[:2] for row in rows] == [
+        (1, "one"),
+        (2, "two"),
+        (3, "three"),
+        (4, "four"),
+    ]
+    assert rows[2][2] is not None
+    stats = statement_cache_stats()
+    assert stats["misses"] == 2
+    assert stats["hits"] == 2
+    engine.dispose()
+
+
+def test_safe_session_execute_uses_statement_cache():
+    clear_statement_cache()
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (a INTEGER, b TEXT)"))
+
+    with Session(engine) as session:
+        safe_session_execute(
+            session, "INSERT INTO t (a, b) VALUES (%s, %s)", [(1, "x"), (2, "y")]
+        )
+        value = safe_session_execute(
+            session, "SELECT b FROM t WHERE a = %s", (2,)
+        ).scalar()
+        session.commit()
+
+    assert value == "y"
+    assert statement_cache_stats()["misses"] == 2
+    engine.dispose()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import hashlib
+import json
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -10,14 +12,20 @@ from src.models import create_database_engine
 from src.models.versioning import (
     _compute_advisory_lock_id,
     _compute_file_checksum,
+    _decode_watermark,
+    _encode_watermark,
     _fsync_path,
     claim_dataset_version,
+    compact_dataset_version,
     create_dataset_version,
     create_versioning_tables,
     export_dataset_version,
+    export_delta_snapshot_for_version,
     export_snapshot_for_version,
     finalize_dataset_version,
     list_dataset_versions,
+    load_snapshot_manifest,
+    read_snapshot_table,
 )
 
 
@@ -209,3 +217,210 @@ def test_export_snapshot_for_version_pandas_fallback(
     assert int(stored.row_count) == 2  # type: ignore[arg-type]
     assert str(stored.snapshot_path) == str(output_path)
     assert stored.checksum is not None
+
+
+def _create_articles(db_url: str, rows: list[tuple[str, str, str]]) -> None:
+    engine = create_database_engine(db_url)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE IF NOT EXISTS snapshot_articles "
+                "(id TEXT PRIMARY KEY, title TEXT, updated_at DATETIME)"
+            )
+        )
+        for row_id, title, updated_at in rows:
+            conn.execute(
+                text(
+                    "INSERT INTO snapshot_articles (id, title, updated_at) "
+                    "VALUES (:id, :title, :updated_at) "
+                    "ON CONFLICT (id) DO UPDATE SET title = excluded.title, "
+                    "updated_at = excluded.updated_at"
+                ),
+                {"id": row_id, "title": title, "updated_at": updated_at},
+            )
+
+
+def test_delta_snapshots_chain_from_parent_high_water_mark(
+    ensure_tables: str,
+    tmp_path: Path,
+):
+    import pyarrow.parquet as pq
+
+    db_url = ensure_tables
+    _create_articles(
+        db_url,
+        [
+            ("a", "first", "2025-10-01 08:00:00.000000"),
+            ("b", "second", "2025-10-01 09:00:00.000000"),
+        ],
+    )
+    base = create_dataset_version("articles", "v1", database_url=db_url)
+    base_path = tmp_path / "base.parquet"
+    export_snapshot_for_version(
+        str(base.id),
+        "snapshot_articles",
+        str(base_path),
+        database_url=db_url,
+        change_column="updated_at",
+    )
+
+    _create_articles(
+        db_url,
+        [
+            ("b", "second (corrected)", "2025-10-02 10:00:00.000000"),
+            ("c", "third", "2025-10-02 11:00:00.000000"),
+        ],
+    )
+    delta = create_dataset_version(
+        "articles", "v2", parent_version=str(base.id), database_url=db_url
+    )
+    delta_path = tmp_path / "delta.parquet"
+    export_delta_snapshot_for_version(
+        str(delta.id), "snapshot_articles", str(delta_path), database_url=db_url
+    )
+
+    assert sorted(pq.read_table(delta_path)["id"].to_pylist()) == ["b", "c"]
+    manifest = load_snapshot_manifest(str(delta_path))
+    assert manifest is not None
+    assert [entry["kind"] for entry in manifest["snapshots"]] == ["base", "delta"]
+    assert manifest["high_water_mark"] == "2025-10-02 11:00:00.000000"
+    delta_version = list_dataset_versions("articles", database_url=db_url)[0]
+    assert delta_version.row_count == 2
+
+    merged = read_snapshot_table(str(delta_path)).to_pylist()
+    assert {row["id"]: row["title"] for row in merged} == {
+        "a": "first",
+        "b": "second (corrected)",
+        "c": "third",
+    }
+
+    # Nothing changed since v2, so the next delta only re-reads the overlap
+    empty = create_dataset_version(
+        "articles", "v3", parent_version=str(delta.id), database_url=db_url
+    )
+    empty_path = tmp_path / "empty.parquet"
+    export_delta_snapshot_for_version(
+        str(empty.id), "snapshot_articles", str(empty_path), database_url=db_url
+    )
+    assert load_snapshot_manifest(str(empty_path))["high_water_mark"] == (
+        manifest["high_water_mark"]
+    )
+    assert len(read_snapshot_table(str(empty_path))) == 3
+
+    exported = tmp_path / "export.parquet"
+    export_dataset_version(str(empty.id), str(exported), database_url=db_url)
+    assert len(pq.read_table(exported)) == 3
+
+
+def test_delta_snapshot_rereads_overlap_for_late_commits(
+    ensure_tables: str,
+    tmp_path: Path,
+):
+    import pyarrow.parquet as pq
+
+    db_url = ensure_tables
+    _create_articles(db_url, [("a", "first", "2025-10-01 09:00:00.000000")])
+    base = create_dataset_version("articles", "v1", database_url=db_url)
+    export_snapshot_for_version(
+        str(base.id),
+        "snapshot_articles",
+        str(tmp_path / "base.parquet"),
+        database_url=db_url,
+        change_column="updated_at",
+    )
+
+    # Committed after the base export: one row on the boundary timestamp,
+    # one stamped just before it, one outside the overlap window
+    _create_articles(
+        db_url,
+        [
+            ("b", "boundary", "2025-10-01 09:00:00.000000"),
+            ("c", "late", "2025-10-01 08:55:00.000000"),
+            ("d", "too late", "2025-10-01 08:00:00.000000"),
+        ],
+    )
+    delta = create_dataset_version(
+        "articles", "v2", parent_version=str(base.id), database_url=db_url
+    )
+    delta_path = tmp_path / "delta.parquet"
+    export_delta_snapshot_for_version(
+        str(delta.id), "snapshot_articles", str(delta_path), database_url=db_url
+    )
+
+    assert sorted(pq.read_table(delta_path)["id"].to_pylist()) == ["a", "b", "c"]
+    manifest = load_snapshot_manifest(str(delta_path))
+    assert manifest["high_water_mark"] == "2025-10-01 09:00:00.000000"
+    merged = read_snapshot_table(str(delta_path))["id"].to_pylist()
+    assert sorted(merged) == ["a", "b", "c"]
+
+
+def test_compact_dataset_version_rewrites_chain_as_base(
+    ensure_tables: str,
+    tmp_path: Path,
+):
+    import pyarrow.parquet as pq
+
+    db_url = ensure_tables
+    _create_articles(db_url, [("a", "first", "2025-10-01 08:00:00.000000")])
+    base = create_dataset_version("articles", "v1", database_url=db_url)
+    export_snapshot_for_version(
+        str(base.id),
+        "snapshot_articles",
+        str(tmp_path / "base.parquet"),
+        database_url=db_url,
+        change_column="updated_at",
+    )
+    _create_articles(db_url, [("a", "edited", "2025-10-03 08:00:00.000000")])
+    delta = create_dataset_version(
+        "articles", "v2", parent_version=str(base.id), database_url=db_url
+    )
+    export_delta_snapshot_for_version(
+        str(delta.id),
+        "snapshot_articles",
+        str(tmp_path / "delta.parquet"),
+        database_url=db_url,
+    )
+
+    compacted = tmp_path / "compacted.parquet"
+    compact_dataset_version(str(delta.id), str(compacted), database_url=db_url)
+
+    assert pq.read_table(compacted).to_pylist()[0]["title"] == "edited"
+    manifest = load_snapshot_manifest(str(compacted))
+    assert manifest is not None
+    assert [entry["kind"] for entry in manifest["snapshots"]] == ["base"]
+    version = list_dataset_versions("articles", database_url=db_url)[0]
+    assert version.snapshot_path == str(compacted)
+    assert version.row_count == 1
+
+
+def test_delta_snapshot_requires_parent_manifest(
+    ensure_tables: str,
+    tmp_path: Path,
+):
+    db_url = ensure_tables
+    _create_articles(db_url, [("a", "first", "2025-10-01 08:00:00.000000")])
+    base = create_dataset_version("articles", "v1", database_url=db_url)
+    # A plain full snapshot records no high-water mark
+    export_snapshot_for_version(
+        str(base.id),
+        "snapshot_articles",
+        str(tmp_path / "base.parquet"),
+        database_url=db_url,
+    )
+    delta = create_dataset_version(
+        "articles", "v2", parent_version=str(base.id), database_url=db_url
+    )
+
+    with pytest.raises(ValueError, match="no snapshot manifest"):
+        export_delta_snapshot_for_version(
+            str(delta.id),
+            "snapshot_articles",
+            str(tmp_path / "delta.parquet"),
+            database_url=db_url,
+        )
+
+
+def test_watermark_round_trips_through_manifest_json():
+    for value in (datetime(2025, 10, 2, 11, 0, 0, 250), 42, "2025-10-02 11:00:00"):
+        encoded = json.loads(json.dumps(_encode_watermark(value)))
+        assert _decode_watermark(encoded) == value
@@ -0,0 +1,130 @@
+"""Tests for the content-addressed HTML archive."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.crawler import ContentExtractor
+from src.models.database import calculate_content_hash
+from src.pipeline.html_archive import HtmlArchive, get_html_archive
+
+URL = "https://example.com/news/budget"
+
+
+def _page(body):
+    return f"<html><body><article>{body}</article></body></html>"
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = HtmlArchive(tmp_path / "archive", codec="zlib")
+    yield archive
+    archive.close()
+
+
+def test_round_trip_and_latest(archive):
+    first = archive.put(URL, _page("draft"), fetched_at=datetime(2026, 1, 1))
+    archive.put(URL, _page("final"), fetched_at=datetime(2026, 1, 2))
+    archive.put(URL, "<html>error</html>", status=503, fetched_at=datetime(2026, 1, 3))
+
+    assert first == calculate_content_hash(_page("draft"))
+    assert archive.get(first) == _page("draft")
+    assert archive.latest(URL) == _page("final")
+    assert archive.latest(URL, before=datetime(2026, 1, 2)) == _page("draft")
+    assert archive.latest("https://example.com/other") is None
+    assert [fetch.status for fetch in archive.history(URL)] == [200, 200, 503]
+
+
+def test_identical_pages_are_stored_once(archive):
+    html = _page("same story " * 200)
+    archive.put(URL, html)
+    size = sum(path.stat().st_size for path in archive.segment_dir.iterdir())
+    archive.put_many(
+        [(URL, html, 200, None), ("https://example.com/amp", html, 200, None)]
+    )
+
+    stats = archive.stats()
+    assert stats["pages"] == 1
+    assert stats["fetches"] == 3
+    assert stats["stored_bytes"] < stats["raw_bytes"]
+    grown = sum(path.stat().st_size for path in archive.segment_dir.iterdir()) - size
+    assert grown < 500
+    assert archive.latest("https://example.com/amp") == html
+
+
+def test_segments_roll_over_and_rebuild_index(tmp_path):
+    archive = HtmlArchive(tmp_path / "archive", codec="zlib", segment_bytes=400)
+    pages = [(f"{URL}/{n}", _page(f"story {n}"), 200, None) for n in range(10)]
+    archive.put_many(pages)
+    archive.put(f"{URL}/0", _page("story 0"))
+
+    assert len(list(archive.segment_dir.iterdir())) > 1
+    assert archive.rebuild_index() == 11
+    assert archive.stats()["pages"] == 10
+    assert archive.latest(f"{URL}/7") == _page("story 7")
+    archive.close()
+
+    reopened = HtmlArchive(tmp_path / "archive", codec="zlib")
+    assert len(reopened.history(f"{URL}/0")) == 2
+    reopened.close()
+
+
+def test_get_html_archive_reads_environment(tmp_path, monkeypatch):
+    monkeypatch.delenv("HTML_ARCHIVE_DIR", raising=False)
+    assert get_html_archive() is None
+
+    monkeypatch.setenv("HTML_ARCHIVE_DIR", str(tmp_path / "env-archive"))
+    assert get_html_archive() is get_html_archive(tmp_path / "env-archive")
+
+
+def test_extractor_replays_archive_without_network(archive, monkeypatch):
+    html = (
+        "<html><head><title>County approves road bond plan</title></head><body>"
+        "<article><h1>County approves road bond plan</h1>"
+        + "<p>The county commission approved the road bond plan on Tuesday.</p>" * 8
+        + "</article></body></html>"
+    )
+    archive.put(URL, html)
+    extractor = ContentExtractor()
+    extractor.html_archive = archive
+    extractor.archive_replay = True
+
+    def no_network(url):
+        raise AssertionError(f"fetched {url} during replay")
+
+    monkeypatch.setattr(extractor, "_get_domain_session", no_network)
+    monkeypatch.setattr(extractor, "_apply_selenium_fallback", no_network)
+
+    result = extractor.extract_content(URL)
+
+    assert result["title"] == "County approves road bond plan"
+    assert "road bond plan" in result["content"]
+
+
+def test_conditional_fetch_records_page(archive, monkeypatch):
+    extractor = ContentExtractor()
+    extractor.html_archive = archive
+    response = SimpleNamespace(status_code=200, text=_page("fresh"), headers={})
+    session = SimpleNamespace(get=lambda *args, **kwargs: response)
+    monkeypatch.setattr(extractor, "_get_domain_session", lambda url: session)
+
+    extractor.fetch_conditional(URL)
+
+    assert archive.latest(URL) == _page("fresh")
+
+
+def test_missing_zstandard_warns_once(tmp_path, monkeypatch, caplog):
+    import src.pipeline.html_archive as html_archive
+
+    monkeypatch.setattr(html_archive, "ZSTD_AVAILABLE", False)
+    monkeypatch.setattr(html_archive, "_zstd_warning_logged", False)
+
+    with caplog.at_level("WARNING", logger=html_archive.__name__):
+        archives = [HtmlArchive(tmp_path / name) for name in ("a", "b")]
+
+    assert [archive.codec for archive in archives] == ["zlib", "zlib"]
+    (record,) = caplog.records
+    assert "zstandard is not installed" in record.message
+    for archive in archives:
+        archive.close()
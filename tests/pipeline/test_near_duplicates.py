@@ -0,0 +1,120 @@
+"""Tests for MinHash/LSH near-duplicate detection."""
+
+import random
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from src.models import ArticleMinHashBand, Base
+from src.pipeline.near_duplicates import (
+    MinHasher,
+    NearDuplicateIndex,
+    band_keys,
+    clusters_for,
+    estimate_similarity,
+    shingle_hashes,
+)
+
+WORDS = [f"word{index}" for index in range(3000)]
+
+
+def _story(rng, length=300):
+    return " ".join(rng.choices(WORDS, k=length))
+
+
+def _republish(rng, story):
+    """A syndicated copy: new header and footer, a trimmed paragraph."""
+    words = story.split()
+    cut = rng.randrange(len(words) - 20)
+    del words[cut : cut + 15]
+    return f"Published by the Boone Courier. {' '.join(words)} Subscribe today."
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        yield session
+    engine.dispose()
+
+
+def test_shingle_hashes_ignore_case_and_punctuation():
+    assert np.array_equal(
+        shingle_hashes("The Council, voted on Tuesday night!", 3),
+        shingle_hashes("the council voted on tuesday night", 3),
+    )
+    assert shingle_hashes("too short", 3).size == 0
+
+
+def test_signature_similarity_tracks_jaccard():
+    rng = random.Random(3)
+    base = set(rng.sample(range(10**6), 1000))
+    overlap = set(list(base)[:600]) | set(rng.sample(range(10**6, 2 * 10**6), 400))
+    jaccard = len(base & overlap) / len(base | overlap)
+
+    hasher = MinHasher(num_perm=256)
+    first = hasher.signature(np.array(sorted(base), dtype=np.uint64))
+    second = hasher.signature(np.array(sorted(overlap), dtype=np.uint64))
+
+    assert estimate_similarity(first, second[None, :])[0] == pytest.approx(
+        jaccard, abs=0.08
+    )
+    assert hasher.signature(np.empty(0, dtype=np.uint64)) is None
+
+
+def test_band_keys_change_only_with_their_band():
+    signature = np.arange(128, dtype=np.uint32)
+    changed = signature.copy()
+    changed[0] += 1
+
+    keys = band_keys(signature, 16)
+    changed_keys = band_keys(changed, 16)
+
+    assert len(keys) == 16
+    assert keys[0] != changed_keys[0]
+    assert keys[1:] == changed_keys[1:]
+
+
+def test_assign_clusters_syndicated_copies(session):
+    rng = random.Random(7)
+    index = NearDuplicateIndex()
+    story = _story(rng)
+
+    original = index.assign(session, "original", story)
+    copies = [
+        index.assign(session, f"copy-{n}", _republish(rng, story)) for n in range(3)
+    ]
+    unrelated = index.assign(session, "unrelated", _story(rng))
+
+    assert not original.is_duplicate
+    for copy in copies:
+        assert copy.is_duplicate
+        assert copy.cluster_id == original.cluster_id
+        assert copy.canonical_article_id == "original"
+        assert copy.similarity >= index.threshold
+    assert unrelated.cluster_id != original.cluster_id
+    assert not unrelated.is_duplicate
+
+    bands = session.execute(select(func.count()).select_from(ArticleMinHashBand))
+    assert bands.scalar() == 5 * index.bands
+
+
+def test_assign_is_idempotent_and_skips_short_text(session):
+    rng = random.Random(11)
+    index = NearDuplicateIndex()
+    story = _story(rng)
+
+    first = index.assign(session, "a", story)
+    again = index.assign(session, "a", _story(rng))
+
+    assert again == first
+    assert index.assign(session, "short", "Four words only here") is None
+    assert set(clusters_for(session, ["a", "short", "missing"])) == {"a"}
+
+
+def test_num_perm_must_split_into_bands():
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(num_perm=100, bands=16)
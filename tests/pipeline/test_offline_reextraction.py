@@ -0,0 +1,191 @@
+"""Tests for offline re-extraction of archived HTML."""
+
+from datetime import datetime
+
+import pytest
+
+from src.models import Article, CandidateLink, Source
+from src.models.database import DatabaseManager, calculate_content_hash
+from src.pipeline.html_archive import HtmlArchive
+from src.pipeline.offline_reextraction import (
+    ADDED,
+    CHANGED,
+    NO_HTML,
+    REMOVED,
+    UNCHANGED,
+    OfflineReextractor,
+    diff_fields,
+)
+from src.pipeline.reextraction import select_reextraction_targets
+from src.telemetry.store import TelemetryStore
+from src.utils.content_cleaning_telemetry import ContentCleaningTelemetry
+
+BODY = "<p>The county commission approved the road bond plan on Tuesday.</p>" * 6
+
+
+def _page(title):
+    return (
+        f"<html><head><title>{title}</title></head><body>"
+        f"<article><h1>{title}</h1>{BODY}</article></body></html>"
+    )
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    db_url = f"sqlite:///{tmp_path / 'offline.db'}"
+    archive = HtmlArchive(tmp_path / "archive", codec="zlib")
+    db = DatabaseManager(database_url=db_url)
+    titles = {
+        "a0": "County approves road bond plan",
+        "a1": "Council delays vote on park levy",
+        "a2": "School board hires new principal",
+    }
+    for article_id, title in titles.items():
+        url = f"https://example.com/news/{article_id}"
+        db.session.add(CandidateLink(id=f"c-{article_id}", url=url, source="test"))
+        db.session.add(
+            Article(id=article_id, candidate_link_id=f"c-{article_id}", url=url)
+        )
+        if article_id != "a2":
+            archive.put(url, _page(title))
+    db.session.commit()
+
+    # Extract once so stored fields match the current rules, then make
+    # a1's stored title stale as if selectors had changed since.
+    OfflineReextractor(archive.root, db.session, database_url=db_url, clean=False).run(
+        select_reextraction_targets(db.session)
+    )
+    db.session.get(Article, "a1").title = "Old headline"
+    db.session.commit()
+    yield db, archive, db_url
+    db.close()
+    archive.close()
+
+
+def test_diff_fields_classifies_changes():
+    old = {"title": "A", "author": None, "publish_date": datetime(2026, 1, 1)}
+    new = {
+        "title": "B",
+        "author": "Jane Doe",
+        "publish_date": "2026-01-01T00:00:00",
+        "content": None,
+    }
+
+    assert diff_fields(old, new) == {
+        "title": CHANGED,
+        "author": ADDED,
+        "publish_date": UNCHANGED,
+        "content": UNCHANGED,
+    }
+    assert diff_fields({"content": "text"}, {"content": "  "})["content"] == REMOVED
+
+
+def test_dry_run_reports_without_updating(corpus):
+    db, archive, db_url = corpus
+    reextractor = OfflineReextractor(
+        archive.root, db.session, database_url=db_url, clean=False, dry_run=True
+    )
+
+    report = reextractor.run(select_reextraction_targets(db.session))
+
+    assert report.outcomes[NO_HTML] == 1
+    assert report.fields["title"] == {UNCHANGED: 1, CHANGED: 1}
+    assert report.fields["content"] == {UNCHANGED: 2}
+    assert report.articles_changed == 1
+    (sample,) = report.samples["title"]
+    assert sample["article_id"] == "a1"
+    assert sample["before"] == "Old headline"
+    db.session.expire_all()
+    assert db.session.get(Article, "a1").title == "Old headline"
+
+
+def test_run_updates_changed_articles(corpus):
+    db, archive, db_url = corpus
+
+    OfflineReextractor(archive.root, db.session, database_url=db_url, clean=False).run(
+        select_reextraction_targets(db.session)
+    )
+
+    db.session.expire_all()
+    assert db.session.get(Article, "a1").title == "Council delays vote on park levy"
+    assert db.session.get(Article, "a2").title is None
+
+
+def test_process_pool_matches_single_process(corpus):
+    db, archive, db_url = corpus
+    targets = select_reextraction_targets(db.session)
+
+    def run(workers):
+        return OfflineReextractor(
+            archive.root,
+            db.session,
+            database_url=db_url,
+            workers=workers,
+            clean=False,
+            dry_run=True,
+            chunk_size=1,
+        ).run(targets)
+
+    single, pooled = run(1), run(2)
+
+    assert pooled.outcomes == single.outcomes
+    assert pooled.fields == single.fields
+
+
+def test_clean_applies_stored_patterns_and_source_name(tmp_path):
+    db_url = f"sqlite:///{tmp_path / 'offline.db'}"
+    db = DatabaseManager(database_url=db_url)
+    archive = HtmlArchive(tmp_path / "archive", codec="zlib")
+    pattern = "Subscribe today for unlimited access to local news. " * 3
+
+    # Production cleaning learned the pattern for this domain
+    telemetry = ContentCleaningTelemetry(
+        store=TelemetryStore(db_url, async_writes=False, engine=db.engine)
+    )
+    telemetry.start_cleaning_session("example.com", article_count=3)
+    telemetry.log_segment_detection(
+        segment_text=pattern.strip(),
+        boundary_score=0.9,
+        occurrences=3,
+        pattern_type="subscription",
+        position_consistency=1.0,
+        segment_length=len(pattern.strip()),
+        article_ids=["1", "2", "3"],
+        was_removed=True,
+        removal_reason="paywall",
+    )
+    telemetry.finalize_cleaning_session(
+        rough_candidates_found=1,
+        segments_detected=1,
+        total_removable_chars=len(pattern),
+        removal_percentage=20.0,
+    )
+
+    url = "https://example.com/news/a0"
+    db.session.add(
+        Source(id="s1", host="example.com", canonical_name="Lakeshore Ledger")
+    )
+    db.session.add(CandidateLink(id="c-a0", url=url, source="test", source_id="s1"))
+    db.session.add(Article(id="a0", candidate_link_id="c-a0", url=url))
+    db.session.commit()
+    archive.put(
+        url,
+        "<html><head><title>County approves road bond plan</title>"
+        '<meta name="author" content="Jane Doe, Lakeshore Ledger"></head><body>'
+        f"<article><h1>County approves road bond plan</h1>{BODY}"
+        f"<p>{pattern.strip()}</p></article></body></html>",
+    )
+
+    OfflineReextractor(archive.root, db.session, database_url=db_url).run(
+        select_reextraction_targets(db.session)
+    )
+
+    db.session.expire_all()
+    article = db.session.get(Article, "a0")
+    assert "road bond plan" in article.content
+    assert "Subscribe today" not in article.content
+    assert article.text == article.content
+    assert article.text_hash == calculate_content_hash(article.content)
+    assert article.author == "Jane Doe"
+    db.close()
+    archive.close()
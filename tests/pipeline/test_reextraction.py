@@ -0,0 +1,218 @@
+"""Tests for conditional re-extraction."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.crawler import NotFoundError
+from src.models import Article, ArticleFetchState, Base, CandidateLink
+from src.models.database import calculate_content_hash
+from src.pipeline.reextraction import (
+    BASELINE,
+    CHANGED,
+    FAILED,
+    HTML_UNCHANGED,
+    MISSING,
+    NOT_MODIFIED,
+    TEXT_UNCHANGED,
+    Reextractor,
+    select_reextraction_targets,
+)
+
+STORY = "The council approved the budget on Tuesday night."
+
+
+class FakeSite:
+    """Serves one page per URL with optional ETag support."""
+
+    def __init__(self):
+        self.pages = {}
+        self.etags = {}
+        self.fetches = []
+        self.extractions = 0
+
+    def fetch_conditional(self, url, etag=None, last_modified=None):
+        self.fetches.append((url, etag, last_modified))
+        if url not in self.pages:
+            raise NotFoundError(url)
+        current = self.etags.get(url)
+        if current and etag == current:
+            return SimpleNamespace(status_code=304, text="", headers={})
+        headers = {"ETag": current} if current else {}
+        return SimpleNamespace(status_code=200, text=self.pages[url], headers=headers)
+
+    def extract_content(self, url, html=None):
+        self.extractions += 1
+        body = html.split("<article>")[1].split("</article>")[0]
+        return {"title": "Budget", "content": body}
+
+
+def _page(body, chrome="ad-1"):
+    return f"<html><aside>{chrome}</aside><article>{body}</article></html>"
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        for index, host in enumerate(["example.com", "www.example.com", "other.org"]):
+            url = f"https://{host}/news/{index}"
+            session.add(CandidateLink(id=f"c{index}", url=url, source=host))
+            session.add(
+                Article(
+                    id=f"a{index}",
+                    candidate_link_id=f"c{index}",
+                    url=url,
+                    text_hash=calculate_content_hash(STORY),
+                )
+            )
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def site():
+    site = FakeSite()
+    site.pages["https://example.com/news/0"] = _page(STORY)
+    return site
+
+
+def _target(session, article_id="a0"):
+    (target,) = select_reextraction_targets(session, article_ids=[article_id])
+    return target
+
+
+def test_select_targets_filters_host_and_prefers_unchecked(session):
+    session.add(ArticleFetchState(article_id="a0", checked_at=datetime(2026, 1, 1)))
+    session.commit()
+
+    hosts = select_reextraction_targets(session, host="www.example.com")
+    everything = select_reextraction_targets(session)
+
+    assert sorted(target.article_id for target in hosts) == ["a0", "a1"]
+    assert everything[-1].article_id == "a0"
+
+
+def test_unchanged_text_skips_downstream_and_records_digests(session, site):
+    changed = []
+    reextractor = Reextractor(site, session, lambda *args: changed.append(args))
+
+    assert reextractor.reextract(_target(session)) == TEXT_UNCHANGED
+
+    state = session.get(ArticleFetchState, "a0")
+    assert changed == []
+    assert state.extracted_text_hash == calculate_content_hash(STORY)
+    assert state.html_digest == calculate_content_hash(_page(STORY))
+    assert state.unchanged_checks == 1
+
+
+def test_first_check_against_cleaned_hash_seeds_baseline(session, site):
+    article = session.get(Article, "a0")
+    article.text_hash = calculate_content_hash(STORY.removesuffix(" night."))
+    session.commit()
+    changed = []
+    reextractor = Reextractor(site, session, lambda *args: changed.append(args))
+
+    assert reextractor.reextract(_target(session)) == BASELINE
+    assert changed == []
+    state = session.get(ArticleFetchState, "a0")
+    assert state.extracted_text_hash == calculate_content_hash(STORY)
+
+    site.pages["https://example.com/news/0"] = _page(STORY, chrome="ad-2")
+    assert reextractor.reextract(_target(session)) == TEXT_UNCHANGED
+    site.pages["https://example.com/news/0"] = _page(STORY + " Updated.")
+    assert reextractor.reextract(_target(session)) == CHANGED
+    assert len(changed) == 1
+
+
+def test_identical_html_skips_extraction(session, site):
+    reextractor = Reextractor(site, session)
+    reextractor.reextract(_target(session))
+
+    assert reextractor.reextract(_target(session)) == HTML_UNCHANGED
+    assert site.extractions == 1
+
+
+def test_etag_match_returns_not_modified(session, site):
+    url = "https://example.com/news/0"
+    site.etags[url] = '"v1"'
+    reextractor = Reextractor(site, session)
+    reextractor.reextract(_target(session))
+
+    assert reextractor.reextract(_target(session)) == NOT_MODIFIED
+    assert site.fetches[-1] == (url, '"v1"', None)
+    assert site.extractions == 1
+
+
+def test_changed_text_runs_downstream_once(session, site):
+    changed = []
+    reextractor = Reextractor(site, session, lambda *args: changed.append(args))
+    reextractor.reextract(_target(session))
+
+    site.pages["https://example.com/news/0"] = _page(STORY, chrome="ad-2")
+    assert reextractor.reextract(_target(session)) == TEXT_UNCHANGED
+
+    corrected = STORY + " Correction: the vote was 5-2."
+    site.pages["https://example.com/news/0"] = _page(corrected)
+    assert reextractor.reextract(_target(session)) == CHANGED
+
+    ((target, content),) = changed
+    assert target.article_id == "a0"
+    assert content["content"] == corrected
+    state = session.get(ArticleFetchState, "a0")
+    assert state.extracted_text_hash == calculate_content_hash(corrected)
+    assert state.unchanged_checks == 0
+
+
+def test_failed_callback_keeps_earlier_updates_in_batch(session, site):
+    site.pages["https://www.example.com/news/1"] = _page(STORY)
+    stored = []
+
+    def on_changed(target, content):
+        article = session.get(Article, target.article_id)
+        article.content = content["content"]
+        session.flush()
+        if target.article_id == "a1":
+            raise RuntimeError("cleaning failed")
+        stored.append(target.article_id)
+
+    reextractor = Reextractor(site, session, on_changed, force=True)
+    stats = reextractor.run(
+        [_target(session, "a0"), _target(session, "a1")], commit_every=10
+    )
+
+    assert stats.outcomes[CHANGED] == 1
+    assert stats.outcomes[FAILED] == 1
+    assert stored == ["a0"]
+    session.expire_all()
+    assert session.get(Article, "a0").content == STORY
+    assert session.get(Article, "a1").content is None
+    assert session.get(ArticleFetchState, "a1") is None
+
+
+def test_missing_and_failed_pages_leave_no_state(session, site):
+    reextractor = Reextractor(site, session)
+
+    assert reextractor.reextract(_target(session, "a2")) == MISSING
+
+    site.pages["https://other.org/news/2"] = "<html>no article</html>"
+    site.extract_content = lambda url, html=None: {"title": None, "content": ""}
+    assert reextractor.reextract(_target(session, "a2")) == FAILED
+    assert session.get(ArticleFetchState, "a2") is None
+
+
+def test_force_reruns_everything(session, site):
+    changed = []
+    Reextractor(site, session).reextract(_target(session))
+
+    forced = Reextractor(site, session, lambda *args: changed.append(args), force=True)
+    stats = forced.run([_target(session)])
+
+    assert stats.outcomes[CHANGED] == 1
+    assert stats.skipped_fraction == 0
+    assert len(changed) == 1
@@ -1,21 +1,22 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
+import pandas as pd
 import pytest
+from sqlalchemy import text
 
-from src.models import (
-    Article,
-    ArticleEntity,
-    ArticleLabel,
-    CandidateLink,
-    Source,
-)
+from src.models import Article, ArticleEntity, ArticleLabel, CandidateLink, Source
 from src.reporting.county_report import (
+    REPORT_COLUMNS,
     CountyReportConfig,
+    _build_report_query,
     _clean_counties,
     generate_county_report,
+    iter_county_report,
+    write_county_report,
 )
+from src.reporting.csv_writer import DEFAULT_REPORT_CSV_ENCODING, write_report_csv
 
 
 def _add_base_records(
@@ -132,3 +133,176 @@ def test_clean_counties_requires_non_empty_values():
 
     cleaned = _clean_counties([" Boone ", "", "Callaway"])
     assert cleaned == ["Boone", "Callaway"]
+
+
+def _add_articles(reporting_db, count: int, **article_fields) -> list[Article]:
+    source = Source(
+        id="source-1",
+        host="example.com",
+        host_norm="example.com",
+        county="Boone",
+    )
+    candidate = CandidateLink(
+        id="candidate-1",
+        url="https://example.com/",
+        source="Example Publisher",
+        status="processed",
+        source_county="Boone",
+        source_id=source.id,
+    )
+    articles = [
+        Article(
+            id=f"article-{index}",
+            candidate_link_id=candidate.id,
+            publish_date=datetime(2024, 9, 1) + timedelta(hours=index),
+            url=f"https://example.com/article-{index}",
+            title=f"Story {index}",
+            status="cleaned",
+            **article_fields,
+        )
+        for index in range(count)
+    ]
+    reporting_db.session.add_all([source, candidate, *articles])
+    reporting_db.session.commit()
+    return articles
+
+
+def _report_ids(reporting_db_url) -> list[str]:
+    config = CountyReportConfig(
+        counties=["Boone"],
+        start_date=datetime(2024, 8, 1),
+        database_url=reporting_db_url,
+    )
+    return generate_county_report(config)["article_id"].tolist()
+
+
+@pytest.mark.parametrize(
+    ("meta", "wire"),
+    [
+        ({"byline": {"is_wire_content": True}}, None),
+        (None, {"provider": "Associated Press"}),
+    ],
+)
+def test_generate_county_report_excludes_wire_articles(
+    reporting_db,
+    reporting_db_url,
+    meta,
+    wire,
+):
+    articles = _add_articles(reporting_db, 2)
+    articles[0].meta = meta
+    articles[0].wire = wire
+    reporting_db.session.commit()
+
+    flags = dict(
+        reporting_db.session.execute(text("SELECT id, is_wire FROM articles")).all()
+    )
+    assert flags == {"article-0": 1, "article-1": 0}
+    assert _report_ids(reporting_db_url) == ["article-1"]
+
+
+def test_is_wire_flag_follows_raw_sql_updates(reporting_db, reporting_db_url):
+    _add_articles(reporting_db, 1, wire={"provider": "Reuters"})
+    assert _report_ids(reporting_db_url) == []
+
+    with reporting_db.engine.begin() as connection:
+        connection.execute(
+            text("UPDATE articles SET wire = :wire WHERE id = 'article-0'"),
+            {"wire": '{"provider": ""}'},
+        )
+
+    assert _report_ids(reporting_db_url) == ["article-0"]
+
+
+def test_iter_county_report_yields_bounded_chunks(reporting_db, reporting_db_url):
+    _add_articles(reporting_db, 5)
+    config = CountyReportConfig(
+        counties=["Boone"],
+        start_date=datetime(2024, 8, 1),
+        database_url=reporting_db_url,
+    )
+
+    chunks = list(iter_county_report(config, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert pd.concat(chunks)["article_id"].tolist() == [
+        f"article-{index}" for index in range(4, -1, -1)
+    ]
+
+
+def test_write_county_report_csv_matches_dataframe_export(
+    reporting_db,
+    reporting_db_url,
+    tmp_path,
+):
+    articles = _add_articles(reporting_db, 5, author="Jane Doe")
+    reporting_db.session.add(
+        ArticleEntity(
+            article_id=articles[2].id,
+            entity_text="Columbia",
+            entity_norm="columbia",
+            entity_label="CITY",
+            extractor_version="1.0",
+        )
+    )
+    reporting_db.session.commit()
+    config = CountyReportConfig(
+        counties=["Boone"],
+        start_date=datetime(2024, 8, 1),
+        database_url=reporting_db_url,
+    )
+    streamed_path = tmp_path / "streamed.csv"
+    expected_path = tmp_path / "expected.csv"
+
+    rows_written = write_county_report(config, streamed_path, chunk_size=2)
+    write_report_csv(generate_county_report(config), expected_path)
+
+    assert rows_written == 5
+    assert streamed_path.read_bytes() == expected_path.read_bytes()
+    assert "Columbia [CITY]" in streamed_path.read_text(
+        encoding=DEFAULT_REPORT_CSV_ENCODING
+    )
+
+
+def test_write_county_report_parquet_round_trip(
+    reporting_db,
+    reporting_db_url,
+    tmp_path,
+):
+    pytest.importorskip("pyarrow")
+    _add_articles(reporting_db, 3)
+    config = CountyReportConfig(
+        counties=["Boone"],
+        start_date=datetime(2024, 8, 1),
+        database_url=reporting_db_url,
+    )
+    output_path = tmp_path / "report.parquet"
+
+    rows_written = write_county_report(config, output_path, chunk_size=2)
+
+    result = pd.read_parquet(output_path)
+    assert rows_written == 3
+    assert list(result.columns) == list(REPORT_COLUMNS)
+    assert result.to_dict("records") == generate_county_report(config).to_dict(
+        "records"
+    )
+
+
+def test_write_county_report_rejects_unknown_format(tmp_path):
+    config = CountyReportConfig(counties=["Boone"], start_date=datetime(2024, 8, 1))
+
+    with pytest.raises(ValueError, match="Unsupported report format"):
+        write_county_report(config, tmp_path / "report.xlsx", output_format="xlsx")
+
+
+def test_build_report_query_uses_json_filter_without_is_wire_column():
+    config = CountyReportConfig(counties=["Boone"], start_date=datetime(2024, 8, 1))
+
+    indexed_query, indexed_params = _build_report_query(config)
+    legacy_query, legacy_params = _build_report_query(config, has_is_wire=False)
+
+    assert "a.is_wire = :not_wire" in indexed_query.text
+    assert "json_extract" not in indexed_query.text
+    assert indexed_params["not_wire"] is False
+    assert "json_extract(a.metadata" in legacy_query.text
+    assert "not_wire" not in legacy_params
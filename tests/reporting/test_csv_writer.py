@@ -9,6 +9,7 @@ import pytest
 from src.reporting.csv_writer import (
     DEFAULT_REPORT_CSV_ENCODING,
     write_report_csv,
+    write_report_csv_chunks,
 )
 
 
@@ -77,3 +78,35 @@ def test_write_report_csv_respects_index_flag(
     parts = contents.split(",")
     assert parts[0] == ""
     assert parts[1:3] == ["article_id", "title"]
+
+
+def test_write_report_csv_chunks_matches_single_write(
+    tmp_path: Path,
+    sample_dataframe: pd.DataFrame,
+) -> None:
+    expected_path = tmp_path / "expected.csv"
+    chunked_path = tmp_path / "nested" / "chunked.csv"
+    write_report_csv(sample_dataframe, expected_path)
+
+    rows_written = write_report_csv_chunks(
+        (sample_dataframe.iloc[[index]] for index in range(len(sample_dataframe))),
+        chunked_path,
+        columns=sample_dataframe.columns,
+    )
+
+    assert rows_written == 2
+    assert chunked_path.read_bytes() == expected_path.read_bytes()
+
+
+def test_write_report_csv_chunks_writes_header_for_empty_input(
+    tmp_path: Path,
+) -> None:
+    output_path = tmp_path / "empty.csv"
+
+    rows_written = write_report_csv_chunks(
+        iter(()), output_path, columns=["article_id", "title"]
+    )
+
+    assert rows_written == 0
+    contents = output_path.read_text(encoding=DEFAULT_REPORT_CSV_ENCODING)
+    assert contents.splitlines() == ["article_id,title"]
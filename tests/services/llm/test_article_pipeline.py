@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+import time
 import types
 from datetime import datetime
 from pathlib import Path
@@ -242,3 +244,53 @@ def test_load_prompt_template_reads_file(tmp_path: Path) -> None:
 def test_load_prompt_template_missing_raises() -> None:
     with pytest.raises(FileNotFoundError):
         ArticleLLMPipeline.load_prompt_template("~/does-not-exist.txt")
+
+
+class _ThreadedOrchestrator:
+    """Orchestrator stub whose latency varies per article to reorder completion."""
+
+    def __init__(self) -> None:
+        self.threads: set[str] = set()
+
+    def generate(self, prompt: str, config: Any | None = None) -> OrchestrationResult:
+        article_id = str(config.metadata["article_id"]) if config else ""
+        # Earlier articles finish last so ordering must come from the pipeline
+        time.sleep(0.02 * (5 - int(article_id.split("-")[1])))
+        self.threads.add(threading.current_thread().name)
+        return _make_success(content=f"summary {article_id}")
+
+
+def test_run_concurrent_preserves_order_and_commits_incrementally() -> None:
+    articles = [_make_article(id=f"a-{index}", meta={}) for index in range(5)]
+    session = _FakeSession(articles)
+    orchestrator = _ThreadedOrchestrator()
+    session_typed = session  # type: ignore[assignment]
+    orchestrator_typed = orchestrator  # type: ignore[assignment]
+    pipeline = ArticleLLMPipeline(session_typed, orchestrator_typed)
+
+    results = pipeline.run(concurrency=3, commit_every=2)
+
+    assert [result.article_id for result in results] == [
+        f"a-{index}" for index in range(5)
+    ]
+    assert all(result.success for result in results)
+    assert articles[4].meta["llm"]["summary"] == "summary a-4"
+    assert len(orchestrator.threads) > 1
+    # Two incremental commits (after 2 and 4 articles) plus the final commit
+    assert session.commit_calls == 3
+
+
+def test_run_reports_cached_results() -> None:
+    article = _make_article()
+    session = _FakeSession([article])
+    cached = _make_success(content="From cache")
+    cached.cached = True
+    orchestrator = _DummyOrchestrator([cached])
+    session_typed = session  # type: ignore[assignment]
+    orchestrator_typed = orchestrator  # type: ignore[assignment]
+    pipeline = ArticleLLMPipeline(session_typed, orchestrator_typed)
+
+    results = pipeline.run(dry_run=True)
+
+    assert results[0].cached is True
+    assert results[0].content == "From cache"
@@ -0,0 +1,83 @@
+import threading
+
+from src.services.llm.limits import ProviderLimiterRegistry, ProviderRateLimiter
+from src.services.llm.settings import ProviderLimits, _parse_provider_limits
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_rate_limiter_paces_requests_per_minute():
+    clock = _FakeClock()
+    limiter = ProviderRateLimiter(
+        ProviderLimits(requests_per_minute=120),
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+    for _ in range(3):
+        with limiter.slot():
+            pass
+
+    assert clock.sleeps == [0.5, 0.5]
+
+
+def test_rate_limiter_defer_blocks_until_cooldown():
+    clock = _FakeClock()
+    limiter = ProviderRateLimiter(ProviderLimits(), clock=clock, sleep=clock.sleep)
+
+    limiter.defer(3.0)
+    waited = limiter.acquire()
+    limiter.release()
+
+    assert waited == 3.0
+    assert clock.now == 3.0
+
+
+def test_rate_limiter_caps_concurrency():
+    limiter = ProviderRateLimiter(ProviderLimits(max_concurrency=1))
+    limiter.acquire()
+    acquired = threading.Event()
+
+    def worker() -> None:
+        limiter.acquire()
+        acquired.set()
+        limiter.release()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    assert not acquired.wait(0.05)
+    limiter.release()
+    assert acquired.wait(1.0)
+    thread.join()
+
+
+def test_registry_uses_per_provider_limits_and_default():
+    registry = ProviderLimiterRegistry(
+        {"openai-gpt4.1": ProviderLimits(max_concurrency=4)},
+    )
+
+    assert registry.get("openai-gpt4.1").limits.max_concurrency == 4
+    assert registry.get("gemini-1.5-flash").limits == ProviderLimits()
+    assert registry.get("openai-gpt4.1") is registry.get("openai-gpt4.1")
+
+
+def test_parse_provider_limits():
+    limits = _parse_provider_limits(
+        "openai-gpt4.1=4:300, gemini-1.5-flash=:600,bad=x,empty="
+    )
+
+    assert limits == {
+        "openai-gpt4.1": ProviderLimits(max_concurrency=4, requests_per_minute=300),
+        "gemini-1.5-flash": ProviderLimits(requests_per_minute=600),
+    }
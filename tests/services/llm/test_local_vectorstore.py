@@ -0,0 +1,120 @@
+"""Tests for the file-backed local vector store."""
+
+import numpy as np
+import pytest
+
+from src.services.llm.local_vectorstore import HashingEmbedder, LocalVectorStore
+from src.services.llm.settings import LLMSettings, VectorStoreSettings
+from src.services.llm.vectorstores import VectorStoreFactory
+
+STORY = (
+    "JEFFERSON CITY, Mo. — Missouri lawmakers on Tuesday approved a budget "
+    "that expands rural broadband grants and raises teacher pay across the state."
+)
+
+
+def _random_vectors(count: int, dim: int = 16, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(size=(count, dim)).astype(np.float32)
+
+
+def test_brute_force_search_returns_nearest_neighbours(tmp_path):
+    store = LocalVectorStore(tmp_path, dim=16, flush_rows=10)
+    vectors = _random_vectors(25)
+    store.add([f"id-{i}" for i in range(25)], vectors)
+
+    hits = store.search(vectors[7], k=3)
+
+    assert hits[0].id == "id-7"
+    assert hits[0].score == pytest.approx(1.0, abs=1e-5)
+    assert len(hits) == 3
+    assert len(store) == 25
+
+
+def test_segments_persist_and_reload(tmp_path):
+    store = LocalVectorStore(tmp_path, dim=16, dtype="float16", flush_rows=4)
+    vectors = _random_vectors(10)
+    store.add([f"id-{i}" for i in range(10)], vectors, [{"n": i} for i in range(10)])
+    store.flush()
+
+    reopened = LocalVectorStore(tmp_path)
+
+    assert reopened.dim == 16
+    assert reopened.dtype == np.float16
+    assert len(reopened) == 10
+    hit = reopened.search(vectors[3], k=1)[0]
+    assert hit.id == "id-3"
+    assert hit.metadata == {"n": 3}
+
+
+def test_compact_merges_segments_and_keeps_latest_row(tmp_path):
+    store = LocalVectorStore(tmp_path, dim=16, flush_rows=2)
+    vectors = _random_vectors(4)
+    store.add(["a", "b", "c", "d"], vectors)
+    store.add(["a"], vectors[3:4], [{"version": 2}])
+    store.flush()
+
+    store.compact()
+
+    assert len(list(tmp_path.glob("seg-*.vec"))) == 1
+    assert len(store) == 4
+    hits = {hit.id: hit for hit in store.search(vectors[3], k=2)}
+    assert set(hits) == {"a", "d"}
+    assert hits["a"].metadata == {"version": 2}
+    assert hits["a"].score == pytest.approx(1.0, abs=1e-5)
+
+
+def test_ivf_index_finds_exact_match_and_unindexed_tail(tmp_path):
+    store = LocalVectorStore(tmp_path, dim=16, flush_rows=100)
+    vectors = _random_vectors(400)
+    store.add([f"id-{i}" for i in range(400)], vectors)
+    store.build_ivf(nlist=8, iterations=5)
+
+    tail = _random_vectors(1, seed=99)
+    store.add(["tail"], tail)
+
+    assert store.search(vectors[123], k=1, nprobe=8)[0].id == "id-123"
+    assert store.search(tail[0], k=1, nprobe=1)[0].id == "tail"
+    assert (tmp_path / "ivf.npz").exists()
+    assert LocalVectorStore(tmp_path).search(vectors[5], k=1, nprobe=8)[0].id == "id-5"
+
+
+def test_store_embeds_responses_for_near_duplicate_lookup(tmp_path):
+    store = LocalVectorStore(tmp_path, dim=256)
+    store.store(prompt="p1", response=STORY, metadata={"article_id": "a1"})
+    store.store(
+        prompt="p2",
+        response=STORY.replace("Tuesday", "Wednesday"),
+        metadata={"article_id": "a2"},
+    )
+    store.store(
+        prompt="p3",
+        response="High school football scores from Friday night in Boone County.",
+        metadata={"article_id": "a3"},
+    )
+
+    hits = store.similar_to("a1", k=2, min_score=0.8)
+
+    assert [hit.id for hit in hits] == ["a2"]
+    assert hits[0].metadata["response_excerpt"].startswith("JEFFERSON CITY")
+
+
+def test_rejects_mismatched_dimensions(tmp_path):
+    store = LocalVectorStore(tmp_path, dim=8)
+    with pytest.raises(ValueError):
+        store.add(["x"], np.zeros((1, 4), dtype=np.float32))
+    with pytest.raises(ValueError):
+        LocalVectorStore(tmp_path / "other", dim=8, embedder=HashingEmbedder(16))
+
+
+def test_factory_creates_local_store(tmp_path):
+    settings = LLMSettings(
+        vector_store=VectorStoreSettings(
+            provider="local",
+            options={"local_path": str(tmp_path), "local_vector_store_dim": "32"},
+        )
+    )
+
+    store = VectorStoreFactory.create(settings)
+
+    assert isinstance(store, LocalVectorStore)
+    assert store.dim == 32
@@ -2,6 +2,8 @@ from typing import Optional
 
 import pytest
 
+from src.services.llm.cache import PromptResponseCache
+from src.services.llm.limits import ProviderLimiterRegistry
 from src.services.llm.orchestrator import LLMOrchestrator, LLMTaskConfig
 from src.services.llm.providers import (
     LLMConfigurationError,
@@ -273,3 +275,87 @@ def test_vector_store_failure_is_swallowed(caplog):
     assert result.succeeded
     assert len(vector_store.calls) == 1
     assert any("Vector store store() failed" in message for message in caplog.messages)
+
+
+class FlakyProvider(FakeProvider):
+    """Raise a Retry-After rate limit a fixed number of times, then succeed."""
+
+    def __init__(self, settings: LLMSettings, *, failures: int, retry_after):
+        super().__init__(settings, name="flaky")
+        self._remaining = failures
+        self._retry_after = retry_after
+
+    def generate(self, prompt: str, **kwargs) -> LLMProviderResponse:
+        if self._remaining:
+            self._remaining -= 1
+            self.calls.append({"prompt": prompt, "rate_limited": True})
+            raise LLMRateLimitError("slow down", retry_after=self._retry_after)
+        return super().generate(prompt, **kwargs)
+
+
+def _limiters(sleeps: list[float]) -> ProviderLimiterRegistry:
+    clock = {"now": 0.0}
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    return ProviderLimiterRegistry(clock=lambda: clock["now"], sleep=sleep)
+
+
+def test_generate_retries_rate_limit_with_retry_after():
+    sleeps: list[float] = []
+    provider = FlakyProvider(_settings(), failures=1, retry_after=2.0)
+    orchestrator = LLMOrchestrator(
+        _settings(),
+        [provider],
+        limiters=_limiters(sleeps),
+    )
+
+    result = orchestrator.generate("PROMPT")
+
+    assert result.succeeded
+    assert result.failures == []
+    assert sleeps == [2.0]
+    assert len(provider.calls) == 2
+
+
+def test_generate_falls_back_when_retry_after_exceeds_max_wait():
+    sleeps: list[float] = []
+    settings = _settings()
+    settings.rate_limit_max_wait = 5.0
+    flaky = FlakyProvider(settings, failures=1, retry_after=120.0)
+    orchestrator = LLMOrchestrator(
+        settings,
+        [flaky, _provider("backup")],
+        limiters=_limiters(sleeps),
+    )
+
+    result = orchestrator.generate("PROMPT")
+
+    assert result.provider == "backup"
+    assert [failure.error_type for failure in result.failures] == ["rate_limit"]
+    assert sleeps == []
+
+
+def test_generate_serves_repeat_prompts_from_cache(tmp_path):
+    cache = PromptResponseCache(tmp_path / "cache.sqlite3")
+    provider = _provider("cached")
+    orchestrator = LLMOrchestrator(_settings(), [provider], cache=cache)
+
+    first = orchestrator.generate("PROMPT")
+    second = orchestrator.generate("PROMPT")
+
+    assert first.cached is False
+    assert second.cached is True
+    assert second.content == first.content
+    assert len(provider.calls) == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+    # The cache persists across orchestrator instances
+    reopened = PromptResponseCache(tmp_path / "cache.sqlite3")
+    fresh_provider = _provider("cached")
+    orchestrator = LLMOrchestrator(_settings(), [fresh_provider], cache=reopened)
+    assert orchestrator.generate("PROMPT").cached is True
+    assert fresh_provider.calls == []
@@ -13,6 +13,7 @@ from src.ml.article_classifier import Prediction
 # Article imported previously for casting; not required after test refactor
 from src.services.classification_service import (
     ArticleClassificationService,
+    ArticleText,
     ClassificationStats,
     _batch_iter,
 )
@@ -405,6 +406,140 @@ def test_apply_classification_handles_none_statuses(monkeypatch):
     assert "wire" in excluded
 
 
+def _make_article_text(article_id: str, content: str | None = "Body") -> ArticleText:
+    return ArticleText(
+        id=article_id,
+        url=f"https://example.com/{article_id}",
+        content=content,
+        text=None,
+        title=None,
+    )
+
+
+def test_streaming_resumes_from_last_claimed_key(monkeypatch):
+    service = _make_service()
+    created = datetime(2024, 1, 1)
+    claims = [
+        [("b", created), ("a", created)],
+        [("c", datetime(2023, 12, 31))],
+        [],
+    ]
+    seen_cursors: list[Any] = []
+
+    def fake_claim(
+        session,
+        statuses,
+        label_version,
+        limit,
+        include_existing,
+        excluded,
+        after=None,
+    ):
+        assert session is service.session
+        seen_cursors.append(after)
+        return claims.pop(0)
+
+    monkeypatch.setattr(service, "_claim_article_ids", fake_claim)
+    monkeypatch.setattr(
+        service,
+        "_load_article_texts",
+        lambda session, ids: [_make_article_text(article_id) for article_id in ids],
+    )
+
+    saved_calls = []
+    monkeypatch.setattr(
+        "src.services.classification_service.save_article_classification",
+        lambda session, **kwargs: saved_calls.append(kwargs["article_id"]),
+    )
+
+    class EchoClassifier(DummyClassifier):
+        def predict_batch(self, texts, *, top_k: int = 2):
+            self.calls.append((list(texts), top_k))
+            return [[Prediction(label="Local", score=1.0)] for _ in texts]
+
+    classifier = EchoClassifier([])
+    stats = service.apply_classification_streaming(
+        classifier,
+        label_version="v1",
+        batch_size=2,
+    )
+
+    assert seen_cursors == [None, (created, "a"), (datetime(2023, 12, 31), "c")]
+    assert saved_calls == ["b", "a", "c"]
+    assert stats.processed == 3
+    assert stats.labeled == 3
+    assert service.session.commit.call_count == 2  # type: ignore[attr-defined]
+
+
+def test_streaming_prefetches_on_second_session(monkeypatch):
+    service = _make_service()
+    second_session = MagicMock(spec=Session)
+    created = datetime(2024, 1, 1)
+    claims = {
+        id(service.session): [[("a", created)], []],
+        id(second_session): [[("b", created)], []],
+    }
+    claim_order: list[str] = []
+
+    def fake_claim(session, *_args, **_kwargs):
+        claim_order.append("main" if session is service.session else "second")
+        return claims[id(session)].pop(0)
+
+    monkeypatch.setattr(service, "_claim_article_ids", fake_claim)
+    monkeypatch.setattr(
+        service,
+        "_load_article_texts",
+        lambda session, ids: [_make_article_text(article_id) for article_id in ids],
+    )
+
+    saved: list[tuple[Any, str]] = []
+    monkeypatch.setattr(
+        "src.services.classification_service.save_article_classification",
+        lambda session, **kwargs: saved.append((session, kwargs["article_id"])),
+    )
+
+    classifier = DummyClassifier([[Prediction(label="Local", score=1.0)]])
+    stats = service.apply_classification_streaming(
+        classifier,
+        label_version="v1",
+        batch_size=1,
+        session_factory=lambda: second_session,
+    )
+
+    # Batch "b" is claimed on the second session before batch "a" is saved
+    assert claim_order[:2] == ["main", "second"]
+    assert saved == [(service.session, "a"), (second_session, "b")]
+    assert stats.labeled == 2
+    second_session.close.assert_called_once()
+
+
+def test_streaming_counts_classifier_errors_and_empty_text(monkeypatch):
+    service = _make_service()
+    created = datetime(2024, 1, 1)
+    claims = [[("a", created), ("b", created)], []]
+
+    monkeypatch.setattr(
+        service, "_claim_article_ids", lambda *_args, **_kwargs: claims.pop(0)
+    )
+    monkeypatch.setattr(
+        service,
+        "_load_article_texts",
+        lambda session, ids: [
+            _make_article_text("a", content="  "),
+            _make_article_text("b"),
+        ],
+    )
+
+    classifier = DummyClassifier([], error=RuntimeError("boom"))
+    stats = service.apply_classification_streaming(classifier, label_version="v1")
+
+    assert stats.processed == 2
+    assert stats.skipped == 1
+    assert stats.errors == 1
+    assert stats.labeled == 0
+    service.session.rollback.assert_called()  # type: ignore[attr-defined]
+
+
 def test_batch_iter_requires_positive_size():
     articles = [_make_article(id="a")]  # type: ignore[arg-type]
     with pytest.raises(ValueError):
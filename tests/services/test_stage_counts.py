@@ -0,0 +1,247 @@
+"""Tests for the pipeline stage counters."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+from src.models import Article, ArticleEntity, CandidateLink
+from src.models.database import DatabaseManager
+from src.services.stage_counts import STAGES, StageCounter
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'stage_counts.db'}")
+    yield manager
+    manager.close()
+
+
+def _seed(db: DatabaseManager) -> None:
+    with db.get_session() as session:
+        links = []
+        for index, status in enumerate(
+            ["discovered", "discovered", "article", "article", "article"]
+        ):
+            link = CandidateLink(
+                url=f"https://example.com/story-{index}",
+                source="Example",
+                status=status,
+                discovered_at=datetime.utcnow(),
+            )
+            session.add(link)
+            links.append(link)
+        session.flush()
+
+        # One extracted article without entities, one classified with one
+        extracted = Article(
+            candidate_link_id=links[2].id,
+            url=links[2].url,
+            content="Body",
+            status="extracted",
+        )
+        classified = Article(
+            candidate_link_id=links[3].id,
+            url=links[3].url,
+            content="Body",
+            status="classified",
+            primary_label="local",
+        )
+        session.add_all([extracted, classified])
+        session.flush()
+        session.add(
+            ArticleEntity(
+                article_id=classified.id,
+                entity_text="Columbia",
+                entity_norm="columbia",
+                entity_label="GPE",
+            )
+        )
+        session.commit()
+
+
+EXPECTED = {
+    "verification": 2,
+    "extraction": 1,
+    "cleaning": 1,
+    "analysis": 1,
+    "entity_extraction": 1,
+}
+
+
+def _add_delta(db: DatabaseManager, stage: str, delta: int) -> None:
+    with db.engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO pipeline_stage_count_deltas (stage, delta) "
+                "VALUES (:stage, :delta)"
+            ),
+            {"stage": stage, "delta": delta},
+        )
+
+
+def test_poll_mode_uses_exact_counts(db):
+    _seed(db)
+    counter = StageCounter(db)
+
+    assert counter.mode == "poll"
+    assert counter.get_counts() == EXPECTED
+    assert counter.get_counts(["cleaning"]) == {"cleaning": 1}
+    assert counter.stats["exact_counts"] == len(STAGES) + 1
+    assert counter.maintain() is None
+
+
+def test_counter_mode_reads_counts_plus_deltas(db):
+    _seed(db)
+    counter = StageCounter(db)
+    counter._mode = "triggers"
+    counter._listener = object()  # no LISTEN on SQLite
+
+    # First read reconciles the stages that have no counter row yet
+    assert counter.get_counts() == EXPECTED
+    assert counter.stats["reconciles"] == 1
+
+    _add_delta(db, "verification", 3)
+    _add_delta(db, "verification", -1)
+    exact_before = counter.stats["exact_counts"]
+    assert counter.get_counts(["verification"]) == {"verification": 4}
+    assert counter.stats["exact_counts"] == exact_before
+
+    assert counter.fold() == dict.fromkeys(STAGES, 0) | {"verification": 2}
+    with db.engine.connect() as conn:
+        remaining = conn.execute(
+            text("SELECT COUNT(*) FROM pipeline_stage_count_deltas")
+        ).scalar()
+    assert remaining == 0
+    assert counter.get_counts(["verification"]) == {"verification": 4}
+
+
+def test_reconcile_corrects_drift(db):
+    _seed(db)
+    counter = StageCounter(db, reconcile_interval=60, clock=lambda: 0.0)
+    counter._mode = "triggers"
+    counter._listener = object()
+    counter.reconcile()
+
+    # A missed trigger (e.g. a candidate_link_id rewrite) leaves drift
+    _add_delta(db, "cleaning", 5)
+    assert counter.get_counts(["cleaning"]) == {"cleaning": 6}
+
+    drift = counter.reconcile(["cleaning"])
+
+    assert drift == {"cleaning": -5}
+    assert counter.get_counts(["cleaning"]) == {"cleaning": 1}
+    with db.engine.connect() as conn:
+        stored = conn.execute(
+            text(
+                "SELECT pending, last_drift FROM pipeline_stage_counts "
+                "WHERE stage = 'cleaning'"
+            )
+        ).one()
+    assert tuple(stored) == (1, -5)
+
+
+def test_maintain_folds_until_reconcile_is_due(db):
+    _seed(db)
+    now = [0.0]
+    counter = StageCounter(db, reconcile_interval=60, clock=lambda: now[0])
+    counter._mode = "triggers"
+    counter._listener = object()
+
+    assert counter.maintain() == dict.fromkeys(STAGES, 0)
+    _add_delta(db, "analysis", 2)
+    assert counter.maintain() is None
+    assert counter.stats["folds"] == 1
+
+    now[0] = 61.0
+    assert counter.maintain()["analysis"] == -2
+    assert counter.stats["reconciles"] == 2
+
+
+def test_wait_for_work_returns_on_notification(db):
+    class FakeListener:
+        def __init__(self, payloads):
+            self.payloads = payloads
+            self.timeouts = []
+
+        def wait(self, timeout):
+            self.timeouts.append(timeout)
+            return self.payloads
+
+    slept = []
+    counter = StageCounter(db, sleep=slept.append)
+    counter._mode = "triggers"
+
+    counter._listener = FakeListener(["extraction", "extraction"])
+    assert counter.wait_for_work(30) is True
+    assert counter.stats["wakeups"] == 1
+
+    counter._listener = FakeListener([])
+    assert counter.wait_for_work(30) is False
+    assert counter._listener.timeouts == [30]
+    assert slept == []
+
+
+def test_wait_for_work_sleeps_without_triggers(db):
+    slept = []
+    counter = StageCounter(db, sleep=slept.append)
+
+    assert counter.wait_for_work(5) is False
+    assert slept == [5]
+
+
+def test_listener_starts_on_connection_left_in_transaction(db):
+    class FakeDriver:
+        """Mimics psycopg2: autocommit cannot change inside a transaction."""
+
+        def __init__(self):
+            self.in_transaction = True  # pool pre-ping ran a SELECT 1
+            self._autocommit = False
+
+        def rollback(self):
+            self.in_transaction = False
+
+        @property
+        def autocommit(self):
+            return self._autocommit
+
+        @autocommit.setter
+        def autocommit(self, value):
+            if self.in_transaction:
+                raise RuntimeError("set_session cannot be used inside a transaction")
+            self._autocommit = value
+
+    class FakeCursor:
+        def __init__(self, executed):
+            self.executed = executed
+
+        def execute(self, sql):
+            self.executed.append(sql)
+
+        def close(self):
+            pass
+
+    class FakeRaw:
+        def __init__(self):
+            self.driver_connection = FakeDriver()
+            self.executed = []
+            self.detached = False
+
+        def detach(self):
+            self.detached = True
+
+        def cursor(self):
+            return FakeCursor(self.executed)
+
+    raw = FakeRaw()
+    counter = StageCounter(db)
+    counter.engine = type("Engine", (), {"raw_connection": lambda self: raw})()
+
+    counter._ensure_listener()
+
+    assert counter._listener is not None
+    assert raw.detached
+    assert raw.driver_connection.autocommit is True
+    assert raw.executed == ["LISTEN pipeline_work"]
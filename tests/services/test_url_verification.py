@@ -756,3 +756,144 @@ def test_main_runs_verification_loop(monkeypatch: pytest.MonkeyPatch) -> None:
     assert exit_code == 0
     assert called["max_batches"] == 3
     assert called["params"] == (5, 2)
+
+
+def _candidate_links_engine(rows: list[tuple[str, str, str | None]]):
+    from sqlalchemy import create_engine, text
+
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE candidate_links (id TEXT PRIMARY KEY, url TEXT, "
+                "status TEXT, processed_at TIMESTAMP, error_message TEXT)"
+            )
+        )
+        for candidate_id, url, error_message in rows:
+            conn.execute(
+                text(
+                    "INSERT INTO candidate_links (id, url, status, error_message) "
+                    "VALUES (:id, :url, 'discovered', :error)"
+                ),
+                {"id": candidate_id, "url": url, "error": error_message},
+            )
+    return engine
+
+
+def _candidate_statuses(engine) -> dict[str, tuple[str, str | None, bool]]:
+    from sqlalchemy import text
+
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT id, status, error_message, processed_at FROM candidate_links")
+        )
+        return {row[0]: (row[1], row[2], row[3] is not None) for row in rows}
+
+
+def test_update_candidate_statuses_matches_single_row_semantics(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = _service()
+    engine = _candidate_links_engine(
+        [("a", "https://example.com/a", "old error"), ("b", "https://x/b", None)]
+    )
+    monkeypatch.setattr(service, "db", SimpleNamespace(engine=engine))
+
+    service.update_candidate_statuses(
+        [("a", "article", None), ("b", "verification_failed", "HTTP 500")]
+    )
+
+    assert _candidate_statuses(engine) == {
+        "a": ("article", "old error", True),
+        "b": ("verification_failed", "HTTP 500", True),
+    }
+
+
+def test_process_batch_concurrent_flushes_statuses_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = _service(run_http_precheck=True)
+    candidates = [
+        {"id": "1", "url": "https://one.example.com/news/story-1"},
+        {"id": "2", "url": "https://two.example.com/news/story-2"},
+        {"id": "3", "url": "https://one.example.com/photo-gallery/fair"},
+    ]
+    engine = _candidate_links_engine([(c["id"], c["url"], None) for c in candidates])
+    monkeypatch.setattr(
+        service,
+        "db",
+        SimpleNamespace(engine=engine, get_session=service.db.get_session),
+    )
+
+    def fake_health(url: str) -> tuple[bool, int | None, str | None, int]:
+        if "two." in url:
+            return False, 503, "HTTP 503", 3
+        return True, 200, None, 1
+
+    flushes: list[int] = []
+    original_flush = service.update_candidate_statuses
+
+    def counting_flush(updates):
+        flushes.append(len(updates))
+        original_flush(updates)
+
+    monkeypatch.setattr(service, "_check_http_health", fake_health)
+    monkeypatch.setattr(service, "update_candidate_statuses", counting_flush)
+    monkeypatch.setattr(
+        service,
+        "update_candidate_status",
+        lambda *_: pytest.fail("per-row update should not run"),
+    )
+
+    metrics = service.process_batch_concurrent(candidates, concurrency=4)
+
+    assert flushes == [3]
+    assert metrics["total_processed"] == 3
+    assert metrics["verified_articles"] == 1
+    assert metrics["verified_non_articles"] == 1
+    assert metrics["verification_errors"] == 1
+    assert _candidate_statuses(engine) == {
+        "1": ("article", None, True),
+        "2": ("verification_failed", "HTTP 503", True),
+        "3": ("not_article", None, True),
+    }
+
+
+def test_run_verification_loop_uses_concurrent_mode(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = _service(batch_size=2)
+    batches = [[{"id": "1", "url": "https://example.com/1"}]]
+    calls: list[dict[str, Any]] = []
+
+    def fake_concurrent(candidates, **kwargs):
+        calls.append(kwargs)
+        return {
+            "total_processed": len(candidates),
+            "verified_articles": 1,
+            "verified_non_articles": 0,
+            "verification_errors": 0,
+            "total_time_ms": 0.0,
+            "batch_time_seconds": 0.0,
+            "avg_verification_time_ms": 0.0,
+        }
+
+    monkeypatch.setattr(
+        service,
+        "get_unverified_urls",
+        lambda limit: batches.pop(0) if batches else [],
+    )
+    monkeypatch.setattr(service, "process_batch_concurrent", fake_concurrent)
+    monkeypatch.setattr(
+        service,
+        "process_batch",
+        lambda *_: pytest.fail("sequential path should not run"),
+    )
+    monkeypatch.setattr(service, "save_telemetry_summary", lambda *_, **__: None)
+    monkeypatch.setattr(url_verification.time, "sleep", lambda *_: None)
+
+    service.run_verification_loop(
+        exit_on_idle=True, concurrency=8, per_host_concurrency=3
+    )
+
+    assert calls == [{"concurrency": 8, "per_host_concurrency": 3}]
@@ -344,3 +344,82 @@ class TestWireDetectionPerformance:
             assert result["http_attempts"] == 0
             # Fast response indicates no HTTP call was made
             assert result["verification_time_ms"] < 50
+
+
+class TestWirePatternReuse:
+    """Test that compiled wire patterns are shared across URLs."""
+
+    def test_patterns_loaded_once_across_verify_calls(self, service):
+        """Repeated verify_url calls reuse the compiled matcher."""
+        with patch(
+            "src.utils.content_type_detector.ContentTypeDetector."
+            "_get_wire_service_patterns"
+        ) as mock_patterns:
+            mock_patterns.return_value = [(r"/ap-", "Associated Press", False)]
+
+            for i in range(5):
+                service.verify_url(f"https://example.com/ap-news/story-{i}")
+                service.verify_url(f"https://example.com/local/story-{i}")
+
+            assert mock_patterns.call_count == 1
+
+    def test_screen_urls_settles_filtered_urls_only(self, service):
+        """Batch screening returns results for wire and non-article URLs."""
+        with patch(
+            "src.utils.content_type_detector.ContentTypeDetector."
+            "_get_wire_service_patterns"
+        ) as mock_patterns:
+            mock_patterns.return_value = [(r"/stacker/", "Stacker", False)]
+
+            with patch.object(
+                service.sniffer,
+                "guess",
+                side_effect=RuntimeError("Should not be called"),
+            ):
+                screened = service.screen_urls(
+                    [
+                        "https://example.com/stacker/story",
+                        "https://example.com/photo-gallery/fair",
+                        "https://example.com/local/news/story",
+                    ]
+                )
+
+            assert screened[0]["wire_filtered"] is True
+            assert screened[0]["wire_service"] == "Stacker"
+            assert screened[1]["pattern_filtered"] is True
+            assert screened[1]["storysniffer_result"] is False
+            assert screened[2] is None
+
+    def test_process_batch_skips_verify_for_screened_urls(self, service):
+        """Only URLs left after screening reach verify_url."""
+        with patch(
+            "src.utils.content_type_detector.ContentTypeDetector."
+            "_get_wire_service_patterns"
+        ) as mock_patterns:
+            mock_patterns.return_value = [(r"/wire/", "Wire Service", False)]
+            verified = []
+
+            def fake_verify(url):
+                verified.append(url)
+                return {"storysniffer_result": True, "verification_time_ms": 1.0}
+
+            with (
+                patch.object(service, "verify_url", side_effect=fake_verify),
+                patch.object(service, "update_candidate_status") as mock_update,
+            ):
+                metrics = service.process_batch(
+                    [
+                        {"id": "1", "url": "https://example.com/wire/story"},
+                        {"id": "2", "url": "https://example.com/tag/schools"},
+                        {"id": "3", "url": "https://example.com/local/story"},
+                    ]
+                )
+
+            assert verified == ["https://example.com/local/story"]
+            assert metrics["verified_articles"] == 1
+            assert metrics["verified_non_articles"] == 2
+            assert [c.args[1] for c in mock_update.call_args_list] == [
+                "wire",
+                "not_article",
+                "article",
+            ]
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+import time
+from types import SimpleNamespace
 
-from src.services.url_verification_worker import AsyncVerificationWorker
+import pytest
+
+from src.services.url_verification_worker import (
+    AsyncVerificationWorker,
+    ConcurrentBatchVerifier,
+    guess_many,
+)
 
 
 def test_worker_sheds_when_backlog_exceeds_threshold() -> None:
@@ -190,3 +199,119 @@ def test_worker_captures_sync_processor_exception() -> None:
         assert worker.stats.accepted == 2
 
     asyncio.run(scenario())
+
+
+def test_guess_many_matches_storysniffer_guess() -> None:
+    storysniffer = pytest.importorskip("storysniffer")
+    sniffer = storysniffer.StorySniffer()
+    urls = [
+        "https://www.example.com/news/local/city-council-approves-budget",
+        "https://www.example.com/",
+        "https://www.facebook.com/somepage",
+        "https://careers.example.com/jobs/reporter",
+        "https://www.example.com/logo.png",
+        "https://www.example.com/story/2024/05/01/flood-warning-issued.html",
+        "https://www.example.com/tag/politics/",
+        "https://www.example.com/sports",
+        "",
+    ]
+
+    assert guess_many(sniffer, urls) == [
+        (bool(sniffer.guess(url)), None) for url in urls
+    ]
+
+
+def test_guess_many_falls_back_to_guess_per_url() -> None:
+    def guess(url: str) -> bool:
+        if "bad" in url:
+            raise RuntimeError("sniffer exploded")
+        return "news" in url
+
+    sniffer = SimpleNamespace(guess=guess)
+
+    assert guess_many(sniffer, ["https://a/news", "https://a/bad", "https://a/x"]) == [
+        (True, None),
+        (None, "sniffer exploded"),
+        (False, None),
+    ]
+
+
+class _FakeVerificationService:
+    def __init__(self, delay: float = 0.02) -> None:
+        self.run_http_precheck = True
+        self.sniffer = SimpleNamespace(guess=lambda url: "story" in url)
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active: dict[str, int] = {}
+        self.max_per_host: dict[str, int] = {}
+        self.max_total = 0
+
+    def screen_urls(self, urls):
+        return [
+            {"url": url, "wire_filtered": True} if "/wire/" in url else None
+            for url in urls
+        ]
+
+    @staticmethod
+    def _new_result(url: str) -> dict:
+        return {
+            "url": url,
+            "storysniffer_result": None,
+            "verification_time_ms": 0.0,
+            "error": None,
+            "http_status": None,
+            "http_attempts": 0,
+        }
+
+    def _check_http_health(self, url: str):
+        host = url.split("/")[2]
+        with self.lock:
+            self.active[host] = self.active.get(host, 0) + 1
+            self.max_per_host[host] = max(
+                self.max_per_host.get(host, 0), self.active[host]
+            )
+            self.max_total = max(self.max_total, sum(self.active.values()))
+        time.sleep(self.delay)
+        with self.lock:
+            self.active[host] -= 1
+        if "missing" in url:
+            return False, 404, "HTTP 404", 1
+        if "explode" in url:
+            raise RuntimeError("connection reset")
+        return True, 200, None, 1
+
+
+def test_concurrent_batch_verifier_caps_requests_per_host() -> None:
+    service = _FakeVerificationService()
+    urls = [f"https://host{i % 3}.test/story-{i}" for i in range(18)]
+
+    results = ConcurrentBatchVerifier(
+        service, concurrency=6, per_host_concurrency=1
+    ).verify(urls)
+
+    assert all(result["storysniffer_result"] is True for result in results)
+    assert max(service.max_per_host.values()) == 1
+    assert service.max_total > 1
+
+
+def test_concurrent_batch_verifier_preserves_result_fields() -> None:
+    service = _FakeVerificationService(delay=0)
+    urls = [
+        "https://a.test/wire/story",
+        "https://a.test/story-1",
+        "https://b.test/missing",
+        "https://c.test/explode",
+        "https://c.test/section",
+    ]
+
+    results = ConcurrentBatchVerifier(service, concurrency=4).verify(urls)
+
+    assert results[0] == {"url": urls[0], "wire_filtered": True}
+    assert results[1]["storysniffer_result"] is True
+    assert results[1]["http_status"] == 200
+    assert results[2]["error"] == "HTTP 404"
+    assert results[2]["storysniffer_result"] is None
+    assert results[3]["error"] == "connection reset"
+    assert results[3]["http_attempts"] == 0
+    assert results[4]["storysniffer_result"] is False
+    assert results[4]["error"] is None
@@ -3,7 +3,7 @@ import types
 from unittest.mock import Mock
 
 import pytest
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, QueuePool
 
 from src.models import cloud_sql_connector
 
@@ -100,3 +100,27 @@ def test_create_engine_sets_defaults_without_poolclass(monkeypatch, stub_connect
     connector_cls.assert_called_once()
     creator = captured_kwargs["creator"]
     assert creator() is connector_instance.connect.return_value
+
+
+def test_create_engine_keeps_pool_kwargs_for_queue_pool(monkeypatch, stub_connector):
+    captured_kwargs: dict[str, object] = {}
+
+    def fake_create_engine(url: str, **kwargs):
+        captured_kwargs.update(kwargs)
+        return "engine"
+
+    monkeypatch.setattr("sqlalchemy.create_engine", fake_create_engine)
+
+    cloud_sql_connector.create_cloud_sql_engine(
+        instance_connection_name="project:region:instance",
+        user="dbuser",
+        password="dbpass",
+        database="db",
+        poolclass=QueuePool,
+        pool_size=3,
+        pool_recycle=1800,
+    )
+
+    assert captured_kwargs["poolclass"] is QueuePool
+    assert captured_kwargs["pool_size"] == 3
+    assert captured_kwargs["pool_recycle"] == 1800
@@ -618,3 +618,30 @@ class TestFeatureFlagProcessing:
         assert "cleaning_pending" in counts
         assert "analysis_pending" in counts
         assert "entity_extraction_pending" in counts
+
+
+class TestStageRuntimeSelection:
+    """Test that STAGE_RUNTIME picks subprocess or warm stage workers."""
+
+    def test_subprocess_runtime_forks_cli(self, mock_subprocess):
+        """Default runtime keeps forking a CLI subprocess per step."""
+        with patch.object(continuous_processor, "STAGE_RUNTIME", "subprocess"):
+            assert continuous_processor.process_cleaning(5) is True
+
+        mock_subprocess.assert_called_once()
+
+    def test_warm_runtime_dispatches_to_stage_worker(self, mock_subprocess):
+        """Warm runtime sends the same command to the stage's worker."""
+        runtime = MagicMock()
+        runtime.run.return_value = True
+
+        with (
+            patch.object(continuous_processor, "STAGE_RUNTIME", "warm"),
+            patch.object(continuous_processor, "_STAGE_RUNTIME", runtime),
+        ):
+            assert continuous_processor.process_cleaning(5) is True
+
+        mock_subprocess.assert_not_called()
+        stage, command, _description = runtime.run.call_args[0]
+        assert stage == "cleaning"
+        assert command[:3] == ["clean-articles", "--limit", "5"]
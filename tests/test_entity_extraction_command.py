@@ -63,11 +63,20 @@ def mock_gazetteer():
 
 @pytest.fixture
 def mock_save_entities():
-    """Mock save_article_entities function."""
-    with patch("src.cli.commands.entity_extraction.save_article_entities") as mock:
+    """Mock save_article_entities_bulk function."""
+    with patch("src.cli.commands.entity_extraction.save_article_entities_bulk") as mock:
         yield mock
 
 
+def _saved_article_ids(mock_save):
+    """Article ids passed to every bulk save, in call order."""
+    return [
+        article_id
+        for call in mock_save.call_args_list
+        for article_id, _entities, _text_hash in call[0][1]
+    ]
+
+
 class TestEntityExtractionCommand:
     """Test suite for entity extraction command."""
 
@@ -140,10 +149,13 @@ class TestEntityExtractionCommand:
         attach_mock.assert_called_once()
         mock_save_entities.assert_called_once()
 
-        # Verify save_article_entities received correct data
+        # Verify save_article_entities_bulk received correct data
         save_call_args = mock_save_entities.call_args
-        assert save_call_args[0][1] == article_id  # article_id
-        assert save_call_args[0][3] == "test-v1"  # extractor_version
+        assert save_call_args[0][1] == [
+            (article_id, attach_mock.return_value, "hash123")
+        ]
+        assert save_call_args[0][2] == "test-v1"  # extractor_version
+        assert save_call_args[1]["autocommit"] is False
 
     def test_multiple_articles_extraction(
         self, mock_db_manager, mock_entity_extractor, mock_gazetteer, mock_save_entities
@@ -178,7 +190,7 @@ class TestEntityExtractionCommand:
 
         # Verify
         assert result == 0
-        assert mock_save_entities.call_count == 3
+        assert _saved_article_ids(mock_save_entities) == [a[0] for a in articles]
 
     def test_entity_extraction_with_source_filter(
         self, mock_db_manager, mock_entity_extractor, mock_gazetteer, mock_save_entities
@@ -273,10 +285,7 @@ class TestEntityExtractionCommand:
     def test_entity_extraction_commits_in_batches(
         self, mock_db_manager, mock_entity_extractor, mock_gazetteer, mock_save_entities
     ):
-        """Test entity extraction commits after each article.
-
-        Commits happen via save_article_entities which is called once per article.
-        """
+        """Test entity extraction saves and commits once per source batch."""
         # Setup mock session with 25 articles
         articles = [
             (
@@ -306,9 +315,10 @@ class TestEntityExtractionCommand:
 
         # Verify
         assert result == 0
-        # save_article_entities commits internally after each article
-        # With 25 articles, we should have 25 calls to save_article_entities
+        # Every article comes from its own source, so 25 bulk saves of one
         assert mock_save_entities.call_count == 25
+        assert len(_saved_article_ids(mock_save_entities)) == 25
+        assert mock_session.commit.call_count == 25
 
     def test_entity_extraction_partial_failure(
         self, mock_db_manager, mock_entity_extractor, mock_gazetteer, mock_save_entities
@@ -352,7 +362,10 @@ class TestEntityExtractionCommand:
         # Verify: should have 1 error but return error code
         assert result == 1
         # Should save entities for 2 successful articles
-        assert mock_save_entities.call_count == 2
+        assert _saved_article_ids(mock_save_entities) == [
+            articles[0][0],
+            articles[2][0],
+        ]
 
     def test_entity_extraction_query_structure(
         self, mock_db_manager, mock_entity_extractor
@@ -0,0 +1,139 @@
+"""Tests for orchestration/stage_runtime.py"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+repo_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(repo_root))
+
+from orchestration.stage_runtime import StageRuntime, StageWorker  # noqa: E402
+from src.utils.stage_resources import stage_resource  # noqa: E402
+
+_LOADS: list[str] = []
+
+
+def _echo_runner(command):
+    """Return the first argument as the exit code, or misbehave on request."""
+    action = command[0]
+    if action == "crash":
+        os._exit(7)
+    if action == "hang":
+        import time
+
+        time.sleep(30)
+    if action == "exit":
+        raise SystemExit(int(command[1]))
+    if action == "raise":
+        raise RuntimeError("boom")
+    if action == "resource":
+        stage_resource("model", lambda: _LOADS.append("load") or object())
+        return 0
+    return int(action)
+
+
+@pytest.fixture
+def worker():
+    stage_worker = StageWorker(
+        "test", runner=_echo_runner, start_method="fork", task_timeout=10
+    )
+    yield stage_worker
+    stage_worker.stop()
+
+
+def test_worker_is_reused_across_commands(worker):
+    first = worker.run(["0"])
+    pid = worker.pid
+    second = worker.run(["3"])
+
+    assert first.ok is True
+    assert second.returncode == 3
+    assert second.ok is False
+    assert worker.pid == pid
+    assert worker.starts == 1
+
+
+def test_worker_keeps_stage_resources_resident(worker):
+    worker.run(["resource"])
+    result = worker.run(["resource"])
+
+    assert result.resources["enabled"] is True
+    assert result.resources["loads"] == 1
+    assert result.resources["hits"] == 1
+    # The parent process never loads the resource itself
+    assert _LOADS == []
+
+
+def test_handler_exceptions_and_exits_do_not_kill_worker(worker):
+    raised = worker.run(["raise"])
+    exited = worker.run(["exit", "4"])
+    pid = worker.pid
+
+    assert raised.returncode == 1
+    assert exited.returncode == 4
+    assert worker.is_alive()
+    assert worker.run(["0"]).ok
+    assert worker.pid == pid
+
+
+def test_crashed_worker_is_restarted(worker):
+    worker.run(["0"])
+    first_pid = worker.pid
+
+    crashed = worker.run(["crash"])
+    assert crashed.crashed is True
+    assert crashed.returncode == 7
+    assert worker.crashes == 1
+
+    recovered = worker.run(["0"])
+    assert recovered.ok is True
+    assert worker.pid != first_pid
+    assert worker.starts == 2
+
+
+def test_hung_worker_is_terminated():
+    stage_worker = StageWorker(
+        "test", runner=_echo_runner, start_method="fork", task_timeout=0.5
+    )
+    try:
+        result = stage_worker.run(["hang"])
+        assert result.timed_out is True
+        assert stage_worker.is_alive() is False
+        assert stage_worker.run(["0"]).ok is True
+    finally:
+        stage_worker.stop()
+
+
+def test_worker_recycles_after_max_tasks():
+    stage_worker = StageWorker(
+        "test", runner=_echo_runner, start_method="fork", max_tasks=2
+    )
+    try:
+        stage_worker.run(["0"])
+        stage_worker.run(["0"])
+        stage_worker.run(["0"])
+        assert stage_worker.starts == 2
+    finally:
+        stage_worker.stop()
+
+
+def test_runtime_keeps_one_worker_per_stage():
+    runtime = StageRuntime(
+        lambda stage: StageWorker(stage, runner=_echo_runner, start_method="fork")
+    )
+    try:
+        assert runtime.run("cleaning", ["0"], "Cleaning") is True
+        assert runtime.run("analysis", ["2"], "Analysis") is False
+        assert runtime.run("cleaning", ["0"], "Cleaning") is True
+
+        stats = runtime.stats()
+        assert set(stats) == {"cleaning", "analysis"}
+        assert stats["cleaning"]["starts"] == 1
+        assert stats["cleaning"]["tasks_since_start"] == 2
+    finally:
+        runtime.shutdown()
+    assert runtime.stats() == {}
@@ -0,0 +1,98 @@
+"""Tests for the compiled persistent boilerplate patterns."""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.boilerplate_matcher import PersistentPatternSet, compile_literal_trie
+from src.utils.content_cleaner_balanced import BalancedBoundaryContentCleaner
+
+
+def _pattern(text, confidence=0.9, occurrences=5):
+    return {
+        "text_content": text,
+        "pattern_type": "footer",
+        "confidence_score": confidence,
+        "occurrences_total": occurrences,
+        "removal_reason": "Footer",
+    }
+
+
+def _remove_one_pattern_at_a_time(text, patterns):
+    """Removal as the cleaner did it before patterns were compiled."""
+    removals = []
+    for pattern in patterns:
+        pattern_text = pattern["text_content"]
+        if pattern_text in text:
+            position = text.find(pattern_text)
+            text = text.replace(pattern_text, "")
+            removals.append((pattern_text, position))
+    return text, removals
+
+
+def test_compile_literal_trie_prefers_longest_literal():
+    regex = compile_literal_trie(["Subscribe", "Subscribe today", "Sign in", ""])
+
+    assert regex.findall("Subscribe today. Sign in. Subscribe!") == [
+        "Subscribe today",
+        "Sign in",
+        "Subscribe",
+    ]
+    assert regex.search("Subscriber") is not None
+    assert compile_literal_trie(["", ""]) is None
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_remove_matches_one_pattern_at_a_time(seed):
+    rng = random.Random(seed)
+    # Distinct leading words keep the patterns from overlapping one another
+    patterns = [
+        _pattern(f"{word} " + " ".join(rng.choices(["news", "ads", "more"], k=4)))
+        for word in ("Subscribe", "Follow", "Copyright", "Advertise", "Contact")
+    ]
+    pieces = [f"Paragraph {index}." for index in range(8)]
+    for pattern in rng.choices(patterns, k=5):
+        pieces.insert(rng.randrange(len(pieces) + 1), pattern["text_content"])
+    text = " ".join(pieces)
+
+    cleaned, removals = PersistentPatternSet(removable=patterns).remove(text)
+
+    expected_text, expected_removals = _remove_one_pattern_at_a_time(text, patterns)
+    assert cleaned == expected_text
+    assert [(r["text"], r["position"]) for r in removals] == expected_removals
+
+
+def test_remove_without_patterns_returns_text_unchanged():
+    assert PersistentPatternSet(removable=[]).remove("Body") == ("Body", [])
+
+
+def test_cleaner_compiles_domain_patterns_once_per_version():
+    cleaner = BalancedBoundaryContentCleaner(db_path=":memory:")
+    footer = "Copyright 2025 Example Media. All rights reserved."
+    short_cta = "Read more"
+
+    with (
+        patch.object(
+            cleaner.telemetry,
+            "get_persistent_patterns",
+            return_value=[_pattern(short_cta), _pattern(footer)],
+        ) as get_patterns,
+        patch.object(cleaner.telemetry, "log_wire_detection"),
+        patch.object(
+            cleaner, "_detect_wire_service_in_pattern", return_value=None
+        ) as detect_wire,
+    ):
+        for index in range(3):
+            result = cleaner._remove_persistent_patterns(
+                f"Story {index}. {short_cta} {footer}", "example.com"
+            )
+            # Short patterns are only removed when high-confidence
+            assert result["cleaned_text"] == f"Story {index}. {short_cta} "
+
+        assert get_patterns.call_count == 1
+        assert detect_wire.call_count == 2
+
+        cleaner.telemetry._bump_persistent_patterns_version("example.com")
+        cleaner._remove_persistent_patterns("Story.", "example.com")
+        assert get_patterns.call_count == 2
@@ -0,0 +1,157 @@
+"""Tests for memoized byline cleaning."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, func, select
+
+from src.models import Base, BylineCleaningCache
+from src.utils.byline_cache import BylineCache, BylineCacheStore, byline_cache_key
+from src.utils.byline_cleaner import BylineCleaner
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'cache.db'}")
+    Base.metadata.create_all(engine, tables=[BylineCleaningCache.__table__])
+    yield engine
+    engine.dispose()
+
+
+def _stored_rows(engine) -> int:
+    with engine.connect() as conn:
+        return conn.execute(
+            select(func.count()).select_from(BylineCleaningCache.__table__)
+        ).scalar()
+
+
+def _cleaner(cache=None):
+    return BylineCleaner(enable_telemetry=False, cache=cache or BylineCache(100))
+
+
+def test_repeat_byline_skips_pipeline_and_restores_wire_state():
+    cleaner = _cleaner()
+    first = cleaner.clean_byline("Associated Press", return_json=True)
+
+    with patch.object(cleaner, "_clean_byline_uncached") as pipeline:
+        cleaner.clean_byline("By Jane Doe")  # different byline resets state
+        pipeline.return_value = {"authors": []}
+        second = cleaner.clean_byline("  Associated   Press ", return_json=True)
+        authors = cleaner.clean_byline("Associated Press")
+
+    assert pipeline.call_count == 1  # only "By Jane Doe" missed
+    assert second == first
+    assert authors == first["authors"]
+    assert cleaner.get_detected_wire_services() == ["The Associated Press"]
+    stats = cleaner.get_cache_stats()
+    assert (stats["hits"], stats["misses"]) == (2, 2)
+
+
+def test_cached_results_are_isolated_from_caller_mutation():
+    cleaner = _cleaner()
+    result = cleaner.clean_byline("By Jane Doe", return_json=True)
+    result["authors"].append("Mutated")
+
+    assert cleaner.clean_byline("By Jane Doe") == ["Jane Doe"]
+
+
+def test_source_names_are_part_of_the_key():
+    key = byline_cache_key("By Jane Doe", "Daily Star", None, "v1")
+
+    assert key != byline_cache_key("By Jane Doe", None, None, "v1")
+    assert key != byline_cache_key("By Jane Doe", "Daily Star", None, "v2")
+    assert key == byline_cache_key(" By  Jane Doe", "Daily Star", None, "v1")
+    assert key != byline_cache_key("By Jane Doe", "Daily Star", None, "v1", "names")
+
+
+def test_error_results_are_not_cached():
+    cleaner = _cleaner()
+
+    with patch.object(
+        cleaner, "_extract_special_contributor", side_effect=RuntimeError("db down")
+    ):
+        assert cleaner.clean_byline("By Jane Doe") == []
+
+    assert cleaner.clean_byline("By Jane Doe") == ["Jane Doe"]
+    assert cleaner.get_cache_stats()["size"] == 1
+
+
+def test_cache_hit_records_single_telemetry_step():
+    cleaner = BylineCleaner(enable_telemetry=False, cache=BylineCache(100))
+    cleaner.clean_byline("By Jane Doe")
+
+    with (
+        patch.object(cleaner.telemetry, "log_transformation_step") as step,
+        patch.object(cleaner.telemetry, "finalize_cleaning_session") as finalize,
+    ):
+        cleaner.clean_byline("By Jane Doe", article_id="article-1")
+
+    step.assert_called_once()
+    assert step.call_args.kwargs["transformation_type"] == "cache_hit"
+    assert finalize.call_args.kwargs["cleaning_method"] == "standard_pipeline"
+
+
+def test_persistent_store_shares_results_across_cleaners(engine):
+    writer = _cleaner(BylineCache(100, BylineCacheStore(engine)))
+    expected = writer.clean_bulk_bylines(
+        ["By Jane Doe", "Associated Press", "By Jane Doe"], return_json=True
+    )
+
+    assert _stored_rows(engine) == 2
+
+    reader = _cleaner(BylineCache(100, BylineCacheStore(engine)))
+    with patch.object(reader, "_clean_byline_uncached") as pipeline:
+        results = reader.clean_bulk_bylines(
+            ["By Jane Doe", "Associated Press"], return_json=True
+        )
+
+    pipeline.assert_not_called()
+    assert results == expected[:2]
+    assert reader.get_cache_stats()["persistent_hits"] == 2
+
+    # Another worker saving the same keys keeps the first rows
+    store = writer.cache.store
+    store.save_many(store.load_many(list(writer.cache._entries)))
+    assert not store.disabled
+    assert _stored_rows(engine) == 2
+
+
+def test_missing_table_falls_back_to_memory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'empty.db'}")
+    cleaner = _cleaner(BylineCache(100, BylineCacheStore(engine)))
+
+    assert cleaner.clean_byline("By Jane Doe") == ["Jane Doe"]
+    assert cleaner.clean_byline("By Jane Doe") == ["Jane Doe"]
+    stats = cleaner.get_cache_stats()
+    assert stats["persistent"] is False
+    assert stats["hits"] == 1
+    engine.dispose()
+
+
+def test_lru_evicts_oldest_entries():
+    cache = BylineCache(2)
+    for name in ("a", "b", "c"):
+        cache.put(byline_cache_key(name, None, None, "v1"), {"result": name})
+
+    assert cache.get(byline_cache_key("a", None, None, "v1")) is None
+    assert cache.get(byline_cache_key("c", None, None, "v1")) == {"result": "c"}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_name_list_changes_invalidate_persisted_results(engine):
+    def cleaner_with(publications):
+        cleaner = _cleaner(BylineCache(100, BylineCacheStore(engine)))
+        cleaner._store_publication_names(publications, time.time())
+        cleaner._store_organization_names(set(), time.time())
+        return cleaner
+
+    byline = "Jane Doe, Lakeshore Ledger"
+    before = cleaner_with(set()).clean_byline(byline)
+    assert "Lakeshore Ledger" in before
+
+    # A worker loading the new publication list must not reuse the old rows
+    after = cleaner_with({"lakeshore ledger"})
+    assert after.clean_byline(byline) == ["Jane Doe"]
+    assert after.get_cache_stats()["persistent_hits"] == 0
+    assert _stored_rows(engine) == 2
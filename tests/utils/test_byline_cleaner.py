@@ -640,18 +640,21 @@ def test_format_result_skips_wire_matching_source():
     assert result["is_wire_content"] is False
 
 
-def test_clean_bulk_bylines_invokes_cleaner_per_entry():
+def test_clean_bulk_bylines_cleans_each_distinct_byline_once():
     cleaner = BylineCleaner(enable_telemetry=False)
 
     with patch.object(
         cleaner,
-        "clean_byline",
-        side_effect=[["Jane Doe"], ["John Smith"]],
-    ) as mock_clean:
-        results = cleaner.clean_bulk_bylines(["By Jane Doe", "By John Smith"])
+        "_clean_byline_uncached",
+        wraps=cleaner._clean_byline_uncached,
+    ) as pipeline:
+        results = cleaner.clean_bulk_bylines(
+            ["By Jane Doe", "By John Smith", "By  Jane Doe ", "By Jane Doe"]
+        )
 
-    assert results == [["Jane Doe"], ["John Smith"]]
-    assert mock_clean.call_count == 2
+    assert results == [["Jane Doe"], ["John Smith"], ["Jane Doe"], ["Jane Doe"]]
+    assert pipeline.call_count == 2
+    assert cleaner.get_cache_stats()["misses"] == 2
 
 
 def test_is_url_fragment_detects_malformed_www():
@@ -0,0 +1,128 @@
+"""Tests for the combined byline matchers."""
+
+import time
+
+import pytest
+
+from src.utils.byline_cleaner import BylineCleaner
+from src.utils.byline_matcher import (
+    NameSpanIndex,
+    WireServiceMatcher,
+    compile_alternation,
+)
+
+NAMES = {
+    "the missouri independent",
+    "columbia daily tribune",
+    "boone county sheriff office",
+    "daily tribune",
+    "fox news",
+    "hickman high school",
+}
+
+
+def _spans_one_name_at_a_time(text_words, names):
+    """Name matching as the cleaner did it before the n-gram index."""
+    spans = []
+    for name in names:
+        name_words = name.split()
+        if len(name_words) < 2:
+            continue
+        subsequences = [name_words]
+        if len(name_words) >= 3:
+            subsequences += [
+                name_words[start : start + size]
+                for size in range(2, len(name_words))
+                for start in range(len(name_words) - size + 1)
+            ]
+        for words in subsequences:
+            for start in range(len(text_words) - len(words) + 1):
+                if text_words[start : start + len(words)] == words:
+                    spans.append((start, len(words)))
+    return sorted(spans)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "jane doe the missouri independent",
+        "jane doe, missouri independent",
+        "staff columbia daily tribune daily tribune",
+        "deputy boone county sheriff office county sheriff",
+        "john smith",
+    ],
+)
+@pytest.mark.parametrize("max_indexed_words", [12, 3])
+def test_name_index_matches_one_name_at_a_time_scan(text, max_indexed_words):
+    index = NameSpanIndex(NAMES, ["fox news"], max_indexed_words=max_indexed_words)
+    words = text.split()
+
+    found = sorted(
+        (span.start, span.length)
+        for span in index.find(words)
+        for _ in range(span.count)
+    )
+
+    assert found == _spans_one_name_at_a_time(words, NAMES)
+
+
+def test_name_index_flags_wire_services_and_orders_longest_first():
+    index = NameSpanIndex(NAMES, ["fox news", "ap"])
+
+    spans = index.find("fox news columbia daily tribune".split())
+
+    assert [(span.start, span.length) for span in spans] == [
+        (0, 2),
+        (2, 3),
+        (2, 2),
+        (3, 2),
+    ]
+    assert spans[0].wire_service == "fox news"
+    assert spans[1].wire_service is None
+    # "daily tribune" is a name and a sub-phrase of "columbia daily tribune"
+    assert spans[3].count == 2
+
+
+def test_wire_matcher_prefers_longest_prefix():
+    matcher = WireServiceMatcher(BylineCleaner.WIRE_SERVICES)
+
+    assert matcher.prefix("fox news john smith") == "fox news"
+    assert matcher.prefix("ap") == "ap"
+    assert matcher.prefix("apple daily") is None
+    assert matcher.full("the associated press") == "the associated press"
+    assert matcher.suffix("trisha easto usa today") == "USA TODAY"
+    assert matcher.suffix("jane doe the missouri independent") == (
+        "The Missouri Independent"
+    )
+    assert matcher.suffix("jane doe") is None
+
+
+def test_compile_alternation_matches_any_pattern():
+    combined = compile_alternation([r"^by\s+(.+)$", r"@\w+"])
+
+    assert combined.search("reach her @jdoe")
+    assert combined.search("by jane doe")
+    assert not combined.search("jane doe")
+
+
+def test_name_index_is_reused_until_name_sets_change():
+    cleaner = BylineCleaner(enable_telemetry=False)
+    cleaner._store_publication_names({"columbia daily tribune"}, time.time())
+    cleaner._store_organization_names({"hickman high school"}, time.time())
+
+    first = cleaner._get_name_index()
+    assert cleaner._get_name_index() is first
+    assert (
+        cleaner._filter_organization_words("Jane Doe Columbia Daily Tribune")
+        == "Jane Doe"
+    )
+
+    # A reload is detected even when the new set has the same size (and,
+    # after the old one is freed, possibly the same id)
+    cleaner._store_organization_names({"rock bridge high school"}, time.time())
+    second = cleaner._get_name_index()
+    assert second is not first
+    assert (
+        cleaner._filter_organization_words("Jane Doe Rock Bridge High School")
+        == "Jane Doe"
+    )
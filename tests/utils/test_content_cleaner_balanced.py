@@ -49,6 +49,12 @@ class _StubTelemetry:
     def get_persistent_patterns(self, domain):
         return self._patterns
 
+    def persistent_patterns_version(self, domain):
+        return 0
+
+    def persistent_patterns_fingerprint(self, domain):
+        return None
+
     def log_wire_detection(self, **kwargs):
         self.log_summary["wire"].append(kwargs)
 
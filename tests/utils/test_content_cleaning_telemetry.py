@@ -631,6 +631,91 @@ class TestTelemetryPersistence:
 
         assert store.submitted == []
 
+    def test_persistent_patterns_version_tracks_pattern_set_changes(
+        self, telemetry_store
+    ):
+        store, _ = telemetry_store
+        telemetry = ContentCleaningTelemetry(enable_telemetry=True, store=store)
+
+        def record_removal(boundary_score: float) -> None:
+            telemetry.start_cleaning_session("example.com", article_count=1)
+            telemetry.log_segment_detection(
+                segment_text="Subscribe for full access",
+                boundary_score=boundary_score,
+                occurrences=1,
+                pattern_type="subscription",
+                position_consistency=1.0,
+                segment_length=25,
+                article_ids=["1"],
+                was_removed=True,
+                removal_reason="paywall",
+            )
+            telemetry.finalize_cleaning_session(
+                rough_candidates_found=0,
+                segments_detected=1,
+                total_removable_chars=25,
+                removal_percentage=1.0,
+            )
+            store.flush()
+
+        assert telemetry.persistent_patterns_version("example.com") == 0
+
+        record_removal(0.8)
+        assert telemetry.persistent_patterns_version("example.com") == 1
+
+        # Seeing a known pattern again only updates its counters
+        record_removal(0.8)
+        assert telemetry.persistent_patterns_version("example.com") == 1
+
+        record_removal(0.9)
+        assert telemetry.persistent_patterns_version("example.com") == 2
+        assert telemetry.persistent_patterns_version("other.com") == 0
+
+    def test_cleaner_sees_patterns_stored_by_another_collector(self, telemetry_store):
+        from src.utils.content_cleaner_balanced import BalancedBoundaryContentCleaner
+
+        store, _ = telemetry_store
+        pattern = "Subscribe today for unlimited access to local news. " * 3
+        article = f"Council met Tuesday. {pattern}The budget passed."
+        cleaner = BalancedBoundaryContentCleaner(
+            db_path=":memory:", persistent_pattern_refresh_seconds=0
+        )
+        cleaner.telemetry = ContentCleaningTelemetry(enable_telemetry=True, store=store)
+        assert (
+            cleaner._remove_persistent_patterns(article, "example.com")["removals"]
+            == []
+        )
+
+        # A different worker learns the pattern
+        other = ContentCleaningTelemetry(enable_telemetry=True, store=store)
+        other.start_cleaning_session("example.com", article_count=3)
+        other.log_segment_detection(
+            segment_text=pattern,
+            boundary_score=0.9,
+            occurrences=3,
+            pattern_type="subscription",
+            position_consistency=1.0,
+            segment_length=len(pattern),
+            article_ids=["1", "2", "3"],
+            was_removed=True,
+            removal_reason="paywall",
+        )
+        other.finalize_cleaning_session(
+            rough_candidates_found=1,
+            segments_detected=1,
+            total_removable_chars=len(pattern),
+            removal_percentage=50.0,
+        )
+        store.flush()
+
+        result = cleaner._remove_persistent_patterns(article, "example.com")
+        assert pattern not in result["cleaned_text"]
+        assert len(result["removals"]) == 1
+
+        cleaner.persistent_pattern_refresh_seconds = 3600
+        cached = cleaner._get_persistent_pattern_set("example.com")
+        assert cleaner._get_persistent_pattern_set("example.com") is cached
+
     def test_finalize_persists_and_updates_patterns(self, telemetry_store):
         store, conn = telemetry_store
         telemetry = ContentCleaningTelemetry(
@@ -788,3 +873,104 @@ class TestTelemetryPersistence:
 
         telemetry.flush()
         telemetry.shutdown(wait=True)
+
+
+class TestSegmentSampling:
+    """Covers sampled rejection detail with exact per-outcome counts."""
+
+    @staticmethod
+    def _log(telemetry, text, was_removed, pattern_type="rejected"):
+        telemetry.log_segment_detection(
+            segment_text=text,
+            boundary_score=0.2,
+            occurrences=3,
+            pattern_type=pattern_type,
+            position_consistency=0.0,
+            segment_length=len(text),
+            article_ids={"1", "2", "3"},
+            was_removed=was_removed,
+        )
+
+    def test_rejected_segments_are_counted_but_not_kept(self, telemetry_store):
+        store, conn = telemetry_store
+        telemetry = ContentCleaningTelemetry(
+            store=store,
+            rejected_segment_sample_rate=0.0,
+        )
+        telemetry.start_cleaning_session("example.com", article_count=3)
+
+        for index in range(50):
+            self._log(telemetry, f"fragment {index}", was_removed=False)
+        self._log(telemetry, "Subscribe today.", True, pattern_type="subscription")
+
+        assert [s["pattern_type"] for s in telemetry.detected_segments] == [
+            "subscription"
+        ]
+        assert telemetry.detected_segments[0]["detection_number"] == 51
+        article_ids = json.loads(telemetry.detected_segments[0]["article_ids_json"])
+        assert sorted(article_ids) == ["1", "2", "3"]
+
+        telemetry.finalize_cleaning_session(
+            rough_candidates_found=51,
+            segments_detected=1,
+            total_removable_chars=16,
+            removal_percentage=1.0,
+        )
+        store.flush()
+
+        rows = conn.execute(
+            """
+            SELECT pattern_type, was_removed, detection_count, detailed_count,
+                   total_occurrences
+            FROM content_cleaning_segment_counts
+            ORDER BY pattern_type
+            """
+        ).fetchall()
+        assert rows == [("rejected", 0, 50, 0, 150), ("subscription", 1, 1, 1, 3)]
+
+        summary = telemetry.get_domain_telemetry_summary("example.com")
+        breakdown = {row["pattern_type"]: row for row in summary["pattern_breakdown"]}
+        assert breakdown["rejected"]["detection_count"] == 50
+        assert breakdown["subscription"]["removed_count"] == 1
+
+    def test_sampling_is_deterministic_per_text(self):
+        telemetry = ContentCleaningTelemetry(rejected_segment_sample_rate=0.25)
+        texts = [f"candidate {index}" for index in range(2000)]
+
+        first = [telemetry._sample_rejected_segment(text) for text in texts]
+        second = [telemetry._sample_rejected_segment(text) for text in texts]
+
+        assert first == second
+        assert 400 < sum(first) < 600
+
+    def test_sample_rate_must_be_a_fraction(self):
+        with pytest.raises(ValueError):
+            ContentCleaningTelemetry(rejected_segment_sample_rate=1.5)
+
+    def test_counts_are_written_through_telemetry_store(self, tmp_path):
+        from src.telemetry.store import TelemetryStore
+
+        store = TelemetryStore(f"sqlite:///{tmp_path / 't.db'}", async_writes=False)
+        telemetry = ContentCleaningTelemetry(
+            store=store, rejected_segment_sample_rate=1.0
+        )
+        telemetry.start_cleaning_session("example.com", article_count=2)
+        self._log(telemetry, "fragment a", was_removed=False)
+        self._log(telemetry, "fragment b", was_removed=False)
+        telemetry.finalize_cleaning_session(
+            rough_candidates_found=2,
+            segments_detected=0,
+            total_removable_chars=0,
+            removal_percentage=0.0,
+        )
+
+        with store.connection() as conn:
+            segments = conn.execute(
+                "SELECT COUNT(*) FROM content_cleaning_segments"
+            ).fetchone()[0]
+            counts = conn.execute(
+                "SELECT detection_count, detailed_count "
+                "FROM content_cleaning_segment_counts"
+            ).fetchall()
+        assert segments == 2
+        assert [tuple(row) for row in counts] == [(2, 2)]
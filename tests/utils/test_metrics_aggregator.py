@@ -0,0 +1,211 @@
+"""Tests for the buffered metrics aggregator and its exporters."""
+
+import io
+import threading
+import urllib.error
+import urllib.request
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from src.utils.metrics import CloudMonitoringExporter, MetricsClient
+from src.utils.metrics_aggregator import (
+    FileExporter,
+    MetricsAggregator,
+    StdoutExporter,
+    render_prometheus,
+    series_key,
+    start_http_server,
+)
+
+
+@pytest.fixture
+def aggregator():
+    return MetricsAggregator(buckets=(0.1, 1.0), background=False)
+
+
+def test_counters_sum_across_threads(aggregator):
+    def work():
+        for _ in range(1000):
+            aggregator.increment("articles_extracted", labels={"success": "true"})
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    snapshot = aggregator.collect()
+    key = series_key("articles_extracted", {"success": "true"})
+    assert snapshot.counters == {key: 4000}
+
+
+def test_labels_are_order_independent_and_stringified(aggregator):
+    aggregator.increment("hits", 2, {"b": 1, "a": "x"})
+    aggregator.increment("hits", 3, {"a": "x", "b": "1"})
+
+    assert aggregator.collect().counters == {("hits", (("a", "x"), ("b", "1"))): 5}
+
+
+def test_gauge_keeps_latest_value_across_threads(aggregator):
+    aggregator.set_gauge("queue_depth", 5, {"queue": "q"})
+    thread = threading.Thread(
+        target=aggregator.set_gauge, args=("queue_depth", 7, {"queue": "q"})
+    )
+    thread.start()
+    thread.join()
+
+    assert aggregator.collect().gauges == {series_key("queue_depth", {"queue": "q"}): 7}
+
+
+def test_histogram_buckets_and_prometheus_text(aggregator):
+    for value in (0.05, 0.5, 0.5, 3.0):
+        aggregator.observe("processing_time_seconds", value, {"stage": "extract"})
+    aggregator.increment("articles_discovered", 4)
+    aggregator.set_gauge("pipeline_success_rate", 0.95)
+
+    text = aggregator.render()
+
+    assert "# TYPE articles_discovered counter\narticles_discovered 4\n" in text
+    assert "pipeline_success_rate 0.95" in text
+    assert "# TYPE processing_time_seconds histogram" in text
+    assert 'processing_time_seconds_bucket{stage="extract",le="0.1"} 1' in text
+    assert 'processing_time_seconds_bucket{stage="extract",le="1.0"} 3' in text
+    assert 'processing_time_seconds_bucket{stage="extract",le="+Inf"} 4' in text
+    assert 'processing_time_seconds_sum{stage="extract"} 4.05' in text
+    assert 'processing_time_seconds_count{stage="extract"} 4' in text
+
+
+def test_flush_exports_to_every_exporter_despite_failures(aggregator, tmp_path):
+    broken = Mock()
+    broken.export.side_effect = RuntimeError("exporter down")
+    stream = io.StringIO()
+    path = tmp_path / "textfile" / "crawler.prom"
+    aggregator.exporters = [broken, StdoutExporter(stream), FileExporter(path)]
+    aggregator.increment("articles_discovered", 3)
+
+    snapshot = aggregator.flush()
+
+    broken.export.assert_called_once_with(snapshot)
+    assert stream.getvalue() == render_prometheus(snapshot)
+    assert path.read_text() == render_prometheus(snapshot)
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_background_thread_flushes_on_interval():
+    exported = threading.Event()
+    exporter = Mock()
+    exporter.export.side_effect = lambda snapshot: exported.set()
+    aggregator = MetricsAggregator([exporter], flush_interval=0.01)
+
+    aggregator.increment("ticks")
+
+    assert exported.wait(5)
+    aggregator.close()
+
+
+def test_http_endpoint_serves_metrics(aggregator):
+    aggregator.increment("articles_discovered", 2, {"source": "example.com"})
+    server = start_http_server(aggregator, port=0)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with urllib.request.urlopen(f"{base}/metrics", timeout=5) as response:
+            body = response.read().decode()
+            content_type = response.headers["Content-Type"]
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"{base}/other", timeout=5)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert content_type.startswith("text/plain")
+    assert 'articles_discovered{source="example.com"} 2' in body
+
+
+def test_client_with_aggregator_records_without_api_calls(aggregator):
+    client = MetricsClient(enabled=False, aggregator=aggregator)
+
+    client.record_articles_extracted(count=3, source="example.com")
+    client.record_queue_depth("verification_pending", 12)
+    client.record_processing_time("discovery", 0.5)
+
+    snapshot = aggregator.collect()
+    key = series_key("articles_extracted", {"success": "true", "source": "example.com"})
+    assert snapshot.counters == {key: 3}
+    assert snapshot.gauges == {
+        series_key("queue_depth", {"queue": "verification_pending"}): 12.0
+    }
+    timings = snapshot.histograms[
+        series_key("processing_time_seconds", {"stage": "discovery"})
+    ]
+    assert timings.count == 1
+
+
+def test_cloud_exporter_sends_deltas_in_batches(aggregator):
+    with (
+        patch("src.utils.metrics.monitoring_v3") as monitoring,
+        patch("src.utils.metrics.distribution_pb2") as distribution_pb2,
+    ):
+        monitoring.TimeSeries.side_effect = lambda: MagicMock()
+        client = MetricsClient(enabled=False)
+        client.enabled = True
+        client.client = Mock()
+        client.project_name = "projects/test"
+        exporter = CloudMonitoringExporter(client)
+        exporter.BATCH_SIZE = 2
+
+        for source in ("a", "b", "c"):
+            aggregator.increment("articles_discovered", 5, {"source": source})
+        aggregator.observe("processing_time_seconds", 0.5)
+        exporter.export(aggregator.collect())
+
+        assert client.client.create_time_series.call_count == 2
+        assert (
+            sum(
+                len(call.kwargs["time_series"])
+                for call in client.client.create_time_series.call_args_list
+            )
+            == 4
+        )
+
+        client.client.create_time_series.reset_mock()
+        aggregator.increment("articles_discovered", 2, {"source": "a"})
+        aggregator.observe("processing_time_seconds", 1.5)
+        exporter.export(aggregator.collect())
+
+    (call,) = client.client.create_time_series.call_args_list
+    assert len(call.kwargs["time_series"]) == 2
+    values = [args[0]["value"] for args, _ in monitoring.Point.call_args_list[-2:]]
+    assert values[0] == {"int64_value": 2}
+    distribution = distribution_pb2.Distribution.call_args.kwargs
+    assert distribution["count"] == 1
+    assert distribution["mean"] == 1.5
+    assert distribution["bucket_counts"] == [0, 0, 1]
+
+
+def test_cloud_exporter_resends_only_failed_batches(aggregator):
+    with (
+        patch("src.utils.metrics.monitoring_v3") as monitoring,
+        patch("src.utils.metrics.distribution_pb2"),
+    ):
+        monitoring.TimeSeries.side_effect = lambda: MagicMock()
+        client = MetricsClient(enabled=False)
+        client.enabled = True
+        client.client = Mock()
+        client.client.create_time_series.side_effect = [None, RuntimeError("quota")]
+        client.project_name = "projects/test"
+        exporter = CloudMonitoringExporter(client)
+        exporter.BATCH_SIZE = 2
+
+        for source in ("a", "b", "c"):
+            aggregator.increment("articles_discovered", 5, {"source": source})
+        with pytest.raises(RuntimeError):
+            exporter.export(aggregator.collect())
+
+        client.client.create_time_series.reset_mock(side_effect=True)
+        exporter.export(aggregator.collect())
+
+    (call,) = client.client.create_time_series.call_args_list
+    assert len(call.kwargs["time_series"]) == 1
+    values = [args[0]["value"] for args, _ in monitoring.Point.call_args_list]
+    assert values == [{"int64_value": 5}] * 4
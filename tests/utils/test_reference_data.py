@@ -0,0 +1,165 @@
+"""Tests for the process-wide reference data registry."""
+
+from contextlib import contextmanager
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.models import Base, LocalBroadcasterCallsign, Source, WireService
+from src.utils.byline_cleaner import BylineCleaner
+from src.utils.content_type_detector import ContentTypeDetector
+from src.utils.reference_data import ReferenceDataRegistry, load_reference_snapshot
+
+
+@pytest.fixture
+def reference_db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+
+    with Session() as session:
+        session.add_all(
+            [
+                WireService(
+                    pattern=r"\(AP\)",
+                    pattern_type="content",
+                    service_name="Associated Press",
+                    priority=10,
+                ),
+                WireService(
+                    pattern=r"apnews\.com",
+                    pattern_type="url",
+                    service_name="Associated Press",
+                    priority=20,
+                ),
+                WireService(
+                    pattern=r"retired",
+                    pattern_type="url",
+                    service_name="Old",
+                    active=False,
+                ),
+                LocalBroadcasterCallsign(callsign="KMIZ", dataset="missouri"),
+                LocalBroadcasterCallsign(callsign="WFMZ", dataset="lehigh"),
+                Source(
+                    id="s1",
+                    host="columbiamissourian.com",
+                    host_norm="columbiamissourian.com",
+                    canonical_name="Columbia Missourian",
+                ),
+            ]
+        )
+        session.commit()
+
+    @contextmanager
+    def session_factory():
+        with Session() as session:
+            yield session
+
+    yield Session, session_factory
+    engine.dispose()
+
+
+def test_load_reference_snapshot_groups_tables(reference_db):
+    Session, _ = reference_db
+
+    with Session() as session:
+        snapshot = load_reference_snapshot(session)
+
+    assert snapshot.wire_service_patterns("url") == [
+        (r"apnews\.com", "Associated Press", False)
+    ]
+    assert len(snapshot.wire_service_patterns()) == 2
+    assert snapshot.local_broadcaster_callsigns("lehigh") == {"WFMZ"}
+    assert snapshot.publication_canonical_names() == ("Columbia Missourian",)
+    assert snapshot.wire_reporters == {}
+    assert snapshot.unavailable == frozenset()
+    with pytest.raises(TypeError):
+        snapshot.callsigns["missouri"] = frozenset()
+
+
+def test_registry_loads_once_and_counts_saved_queries(reference_db):
+    _, session_factory = reference_db
+    registry = ReferenceDataRegistry(session_factory)
+
+    snapshots = [registry.snapshot() for _ in range(100)]
+    for snapshot in snapshots:
+        ContentTypeDetector(reference_data=snapshot)._get_wire_service_patterns(
+            pattern_type="url"
+        )
+
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+    stats = registry.stats(articles=100)
+    assert stats["reloads"] == 1
+    assert stats["lookups"] == 100
+    assert stats["queries_saved"] == 100 - stats["queries"]
+    assert stats["queries_saved_per_1000_articles"] == stats["queries_saved"] * 10
+
+
+def test_refresh_reloads_only_when_tables_change(reference_db):
+    Session, session_factory = reference_db
+    registry = ReferenceDataRegistry(
+        session_factory, refresh_interval=0, background=False
+    )
+    first = registry.snapshot()
+
+    assert registry.snapshot() is first
+    assert registry.stats()["version_checks"] >= 1
+
+    with Session() as session:
+        session.add(
+            WireService(
+                pattern=r"\(Reuters\)",
+                pattern_type="content",
+                service_name="Reuters",
+                updated_at=datetime(2030, 1, 1),
+            )
+        )
+        session.commit()
+
+    second = registry.snapshot()
+    assert second is not first
+    assert len(second.wire_service_patterns("content")) == 2
+    assert len(first.wire_service_patterns("content")) == 1
+
+
+def test_unavailable_database_yields_empty_snapshot():
+    @contextmanager
+    def broken_session():
+        raise RuntimeError("database down")
+        yield  # pragma: no cover
+
+    registry = ReferenceDataRegistry(broken_session)
+    snapshot = registry.snapshot()
+
+    assert snapshot.wire_service_patterns() == []
+    assert "wire_services" in snapshot.unavailable
+
+
+def test_detector_reads_snapshot_instead_of_session(reference_db):
+    _, session_factory = reference_db
+    snapshot = ReferenceDataRegistry(session_factory).snapshot()
+    session = MagicMock()
+
+    detector = ContentTypeDetector(session=session, reference_data=snapshot)
+
+    assert detector._get_local_broadcaster_callsigns() == {"KMIZ"}
+    assert detector._get_wire_service_patterns(pattern_type="content") == [
+        (r"\(AP\)", "Associated Press", False)
+    ]
+    assert not detector._is_wire_services_own_domain("https://example.com/a")
+    session.query.assert_not_called()
+
+
+def test_byline_cleaner_expands_names_once_per_snapshot(reference_db):
+    _, session_factory = reference_db
+    registry = ReferenceDataRegistry(session_factory)
+    cleaner = BylineCleaner(enable_telemetry=False, reference_data=registry)
+
+    names = cleaner.get_publication_names()
+
+    assert {"columbia missourian", "columbia", "missourian"} <= names
+    assert cleaner.get_publication_names() is names
+    assert cleaner.get_organization_names() == set()
@@ -0,0 +1,57 @@
+"""Tests for process-resident stage resources."""
+
+import pytest
+
+from src.utils import stage_resources
+from src.utils.stage_resources import (
+    discard_stage_resource,
+    enable_stage_resources,
+    stage_resource,
+    stage_resource_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_stage_resources():
+    enable_stage_resources(False)
+    stage_resources._stats.update(hits=0, loads=0, load_seconds=0.0)
+    yield
+    enable_stage_resources(False)
+
+
+def test_stage_resource_calls_factory_every_time_when_disabled():
+    built = []
+
+    first = stage_resource("model", lambda: built.append(1) or object())
+    second = stage_resource("model", lambda: built.append(1) or object())
+
+    assert first is not second
+    assert len(built) == 2
+    assert stage_resource_stats()["loads"] == 0
+
+
+def test_stage_resource_is_resident_when_enabled():
+    enable_stage_resources()
+    built = []
+
+    first = stage_resource(("classifier", "models"), lambda: built.append(1) or [])
+    second = stage_resource(("classifier", "models"), lambda: built.append(1) or [])
+
+    assert first is second
+    assert len(built) == 1
+    stats = stage_resource_stats()
+    assert stats["hits"] == 1
+    assert stats["loads"] == 1
+    assert stats["resident"] == [repr(("classifier", "models"))]
+
+
+def test_discard_and_disable_drop_resident_objects():
+    enable_stage_resources()
+    first = stage_resource("cleaner", object)
+    discard_stage_resource("cleaner")
+    second = stage_resource("cleaner", object)
+
+    assert first is not second
+
+    enable_stage_resources(False)
+    assert stage_resource_stats()["resident"] == []
@@ -2,6 +2,7 @@
 
 from src.utils.url_classifier import (
     COMPILED_NON_ARTICLE_PATTERNS,
+    WireURLMatcher,
     classify_url_batch,
     is_likely_article_url,
 )
@@ -278,3 +279,67 @@ class TestCompiledPatterns:
                 pattern.search(path) for pattern in COMPILED_NON_ARTICLE_PATTERNS
             )
             assert matched, f"Expected pattern coverage for {category}"
+
+
+class TestWireURLMatcher:
+    """Tests for the compiled wire URL matcher."""
+
+    def test_first_pattern_in_priority_order_wins(self):
+        """A URL matching several patterns reports the highest priority one."""
+        matcher = WireURLMatcher(
+            lambda: [
+                (r"/world/", "Wire Service", False),
+                (r"/ap-", "Associated Press", False),
+            ]
+        )
+
+        assert matcher.match("https://example.com/ap-news/world/story") == (
+            "Wire Service"
+        )
+        assert matcher.match("https://example.com/AP-news/story") == (
+            "Associated Press"
+        )
+        assert matcher.match("https://example.com/local/story") is None
+
+    def test_respects_case_sensitive_flag(self):
+        """Case-sensitive patterns only match the exact case."""
+        matcher = WireURLMatcher(lambda: [(r"/CNN/", "CNN", True)])
+
+        assert matcher.match("https://example.com/CNN/story") == "CNN"
+        assert matcher.match("https://example.com/cnn/story") is None
+
+    def test_reloads_only_after_refresh_interval(self):
+        """Patterns are loaded once and reused until the interval elapses."""
+        now = [0.0]
+        calls = []
+
+        def loader():
+            calls.append(now[0])
+            return [(r"/stacker/", "Stacker", False)]
+
+        matcher = WireURLMatcher(loader, refresh_interval=60, clock=lambda: now[0])
+
+        for _ in range(10):
+            matcher.match("https://example.com/stacker/story")
+        assert calls == [0.0]
+
+        now[0] = 61.0
+        matcher.match("https://example.com/local/story")
+        assert calls == [0.0, 61.0]
+        assert matcher.loads == 2
+
+    def test_skips_invalid_patterns(self):
+        """An invalid regex does not disable the remaining patterns."""
+        matcher = WireURLMatcher(
+            lambda: [(r"/ap-(", "Broken", False), (r"/reuters-", "Reuters", False)]
+        )
+
+        assert matcher.match("https://example.com/reuters-world/story") == "Reuters"
+        assert matcher.pattern_count == 1
+
+    def test_backreference_patterns_still_match(self):
+        """Patterns that cannot be combined fall back to per-pattern search."""
+        matcher = WireURLMatcher(lambda: [(r"/(ap)/\1-", "AP", False)])
+
+        assert matcher.match("https://example.com/ap/ap-story") == "AP"
+        assert matcher.match("https://example.com/ap/xx-story") is None